@@ -0,0 +1,38 @@
+"""Add safety_verdicts cache table.
+
+Revision ID: 005_safety_verdicts
+Revises: 004_public_demo_runs
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "005_safety_verdicts"
+down_revision: Union[str, None] = "004_public_demo_runs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "safety_verdicts",
+        sa.Column("shield_id", sa.String(length=255), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("safe", sa.Boolean(), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=True),
+        sa.Column("category", sa.String(length=128), nullable=True),
+        sa.Column("severity", sa.String(length=32), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("shield_id", "content_hash"),
+    )
+    op.create_index("ix_safety_verdicts_expires_at", "safety_verdicts", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_safety_verdicts_expires_at", table_name="safety_verdicts")
+    op.drop_table("safety_verdicts")
@@ -0,0 +1,31 @@
+"""Add rate_limit_buckets table for cross-process provider pacing.
+
+Revision ID: 006_rate_limit_buckets
+Revises: 005_safety_verdicts
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "006_rate_limit_buckets"
+down_revision: Union[str, None] = "005_safety_verdicts"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("key", sa.String(length=255), nullable=False),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("rate_limit_buckets")
@@ -0,0 +1,105 @@
+"""Add artifact_keys lookup index and backfill it from artifact metadata.
+
+Revision ID: 007_artifact_keys
+Revises: 006_rate_limit_buckets
+Create Date: 2026-10-18
+"""
+
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "007_artifact_keys"
+down_revision: Union[str, None] = "006_rate_limit_buckets"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _keys_for(
+    artifact_type: str, content: str | None, meta: dict[str, Any]
+) -> list[tuple[str, str]]:
+    keys: list[tuple[str, str]] = []
+    if artifact_type == "clip_manifest" and meta.get("type") == "task_metadata_mapping":
+        if meta.get("idempotency_key"):
+            keys.append(("sora_idempotency", str(meta["idempotency_key"])))
+        try:
+            mapping = json.loads(content or "{}")
+        except (TypeError, ValueError):
+            mapping = {}
+        if isinstance(mapping, dict):
+            keys.extend(("sora_task", str(task_id)) for task_id in mapping)
+    elif artifact_type == "published_url" and meta.get("video_url"):
+        keys.append(("publish_video_url", str(meta["video_url"])))
+    elif artifact_type == "vision_analysis" and meta.get("cache_key"):
+        keys.append(("vision_cache", str(meta["cache_key"])))
+    # Same normalization as repositories.artifact_index_key: long keys are hashed.
+    return [
+        (kind, key if len(key) <= 255 else "sha256:" + hashlib.sha256(key.encode()).hexdigest())
+        for kind, key in keys
+    ]
+
+
+def upgrade() -> None:
+    op.create_table(
+        "artifact_keys",
+        sa.Column("run_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("kind", sa.String(length=64), nullable=False),
+        sa.Column("key", sa.String(length=255), nullable=False),
+        sa.Column("artifact_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["run_id"], ["runs.id"]),
+        sa.ForeignKeyConstraint(["artifact_id"], ["artifacts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("run_id", "kind", "key"),
+    )
+    op.create_index("ix_artifact_keys_kind_key", "artifact_keys", ["kind", "key"])
+
+    # Backfill keys for artifacts written before the index existed. Oldest first,
+    # so a key shared by several artifacts ends up pointing at the newest one.
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            "SELECT id, run_id, artifact_type, content, metadata, created_at FROM artifacts "
+            "WHERE artifact_type IN ('clip_manifest', 'published_url', 'vision_analysis') "
+            "ORDER BY created_at"
+        )
+    )
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    index: dict[tuple[Any, str, str], dict[str, Any]] = {}
+    for row in rows.mappings():
+        meta = row["metadata"]
+        if isinstance(meta, str):
+            try:
+                meta = json.loads(meta)
+            except ValueError:
+                meta = {}
+        for kind, key in _keys_for(row["artifact_type"], row["content"], meta or {}):
+            index[(row["run_id"], kind, key)] = {
+                "run_id": row["run_id"],
+                "kind": kind,
+                "key": key,
+                "artifact_id": row["id"],
+                "created_at": row["created_at"] or now,
+            }
+    if index:
+        op.bulk_insert(
+            sa.table(
+                "artifact_keys",
+                sa.column("run_id"),
+                sa.column("kind"),
+                sa.column("key"),
+                sa.column("artifact_id"),
+                sa.column("created_at"),
+            ),
+            list(index.values()),
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_artifact_keys_kind_key", table_name="artifact_keys")
+    op.drop_table("artifact_keys")
@@ -0,0 +1,61 @@
+"""Add run_budget_counters (hourly run counts per scope) and backfill the last day.
+
+Revision ID: 008_run_budget_counters
+Revises: 007_artifact_keys
+Create Date: 2026-10-18
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "008_run_budget_counters"
+down_revision: Union[str, None] = "007_artifact_keys"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "run_budget_counters",
+        sa.Column("scope", sa.String(length=255), nullable=False),
+        sa.Column("hour", sa.DateTime(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "hour"),
+    )
+
+    # Seed the rolling window so the budget guard doesn't reset on deploy.
+    bind = op.get_bind()
+    since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=25)
+    rows = bind.execute(
+        sa.text("SELECT workflow_name, user_id, created_at FROM runs WHERE created_at >= :since"),
+        {"since": since},
+    )
+    counts: dict[tuple[str, datetime], int] = {}
+    for row in rows.mappings():
+        created_at = row["created_at"]
+        if isinstance(created_at, str):  # SQLite returns text for raw queries
+            created_at = datetime.fromisoformat(created_at)
+        hour = created_at.replace(minute=0, second=0, microsecond=0)
+        scopes = ["all", f"workflow:{row['workflow_name']}"[:255]]
+        if row["user_id"]:
+            scopes.append(f"user:{row['user_id']}"[:255])
+        for scope in scopes:
+            counts[(scope, hour)] = counts.get((scope, hour), 0) + 1
+    if counts:
+        op.bulk_insert(
+            sa.table(
+                "run_budget_counters",
+                sa.column("scope"),
+                sa.column("hour"),
+                sa.column("count"),
+            ),
+            [{"scope": scope, "hour": hour, "count": n} for (scope, hour), n in counts.items()],
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("run_budget_counters")
@@ -0,0 +1,89 @@
+"""Store large artifact bodies compressed in artifact_contents.
+
+Revision ID: 009_artifact_contents
+Revises: 008_run_budget_counters
+Create Date: 2026-10-18
+"""
+
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "009_artifact_contents"
+down_revision: Union[str, None] = "008_run_budget_counters"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same default as settings.artifact_inline_content_max_bytes.
+INLINE_MAX_BYTES = 4096
+BATCH_SIZE = 200
+
+
+def upgrade() -> None:
+    op.add_column("artifacts", sa.Column("content_size", sa.Integer(), nullable=True))
+    op.add_column("artifacts", sa.Column("content_encoding", sa.String(length=16), nullable=True))
+    op.create_table(
+        "artifact_contents",
+        sa.Column("artifact_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("encoding", sa.String(length=16), nullable=False),
+        sa.Column("data", sa.LargeBinary(), nullable=False),
+        sa.ForeignKeyConstraint(["artifact_id"], ["artifacts.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("artifact_id"),
+    )
+
+    # Move existing large bodies out of line in batches; record sizes for the rest.
+    bind = op.get_bind()
+    contents = sa.table(
+        "artifact_contents",
+        sa.column("artifact_id"),
+        sa.column("encoding"),
+        sa.column("data"),
+    )
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, content FROM artifacts "
+                "WHERE content IS NOT NULL AND content_size IS NULL LIMIT :limit"
+            ),
+            {"limit": BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        out_of_line = []
+        for artifact_id, content in rows:
+            encoded = content.encode("utf-8")
+            if len(encoded) <= INLINE_MAX_BYTES:
+                bind.execute(
+                    sa.text("UPDATE artifacts SET content_size = :size WHERE id = :id"),
+                    {"size": len(encoded), "id": artifact_id},
+                )
+                continue
+            out_of_line.append(
+                {"artifact_id": artifact_id, "encoding": "zlib", "data": zlib.compress(encoded)}
+            )
+            bind.execute(
+                sa.text(
+                    "UPDATE artifacts SET content = NULL, content_size = :size, "
+                    "content_encoding = 'zlib' WHERE id = :id"
+                ),
+                {"size": len(encoded), "id": artifact_id},
+            )
+        if out_of_line:
+            op.bulk_insert(contents, out_of_line)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT artifact_id, data FROM artifact_contents")).all()
+    for artifact_id, data in rows:
+        bind.execute(
+            sa.text("UPDATE artifacts SET content = :content WHERE id = :id"),
+            {"content": zlib.decompress(data).decode("utf-8"), "id": artifact_id},
+        )
+    op.drop_table("artifact_contents")
+    op.drop_column("artifacts", "content_encoding")
+    op.drop_column("artifacts", "content_size")
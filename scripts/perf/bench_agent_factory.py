@@ -0,0 +1,60 @@
+"""
+Microbenchmark for config-driven agent construction.
+
+Measures `create_agent` cost per node with a cold cache (every call re-reads YAML
+and rebuilds tools) versus the warm path (cached config + bound tool prototypes).
+No Llama Stack server is needed: the Agent is built against a mock client.
+
+Usage:
+    PYTHONPATH=src python scripts/perf/bench_agent_factory.py --iterations 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+# Real Agent construction (not the fake stub), fake providers for tools.
+os.environ.setdefault("LLAMA_STACK_PROVIDER", "real")
+os.environ.setdefault("SORA_PROVIDER", "fake")
+os.environ.setdefault("REMOTION_PROVIDER", "fake")
+os.environ.setdefault("UPLOAD_POST_PROVIDER", "fake")
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+
+from myloware.agents.factory import clear_agent_cache, create_agent  # noqa: E402
+
+ROLES = ("ideator", "producer", "editor", "publisher")
+
+
+def _bench(iterations: int, *, cold: bool) -> float:
+    client = MagicMock()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        run_id = str(uuid4())
+        for role in ROLES:
+            if cold:
+                clear_agent_cache()
+            create_agent(client, "aismr", role, vector_db_id="kb", run_id=run_id)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(ROLES))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark create_agent overhead.")
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    cold = _bench(args.iterations, cold=True)
+    clear_agent_cache()
+    warm = _bench(args.iterations, cold=False)
+
+    print(f"create_agent cold: {cold * 1e6:9.1f} us/agent")
+    print(f"create_agent warm: {warm * 1e6:9.1f} us/agent")
+    print(f"speedup:           {cold / warm:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
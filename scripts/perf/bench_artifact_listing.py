@@ -0,0 +1,136 @@
+"""
+Benchmark ArtifactRepository.get_by_run_async on a run with many artifacts.
+
+Seeds one run with ``--artifacts`` artifacts shaped like a real production run
+(agent transcripts, ideation markdown, clip manifests and bodiless VIDEO_CLIP
+rows), then times ``get_by_run_async`` and records peak Python allocations
+(tracemalloc) for:
+
+  before        bodies stored inline and loaded with every listing (old behaviour)
+  list          the default listing: bodies deferred, nothing out of line loaded
+  with_content  listing that eager-loads bodies, decompressing large ones
+
+Usage:
+    PYTHONPATH=src python scripts/perf/bench_artifact_listing.py --artifacts 200 --iterations 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import time
+import tracemalloc
+
+import anyio
+import structlog
+
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("LLAMA_STACK_PROVIDER", "fake")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from myloware.config import settings  # noqa: E402
+from myloware.storage.models import ArtifactType, Base  # noqa: E402
+from myloware.storage.repositories import ArtifactRepository, RunRepository  # noqa: E402
+
+TRANSCRIPT = "assistant: Here is the shot list for clip {i} with camera notes.\n" * 400
+IDEAS = "## Idea {i}\n\n- hook: a puppy discovers snow\n- beats: wonder, zoomies, nap\n" * 80
+MANIFEST = '{{"task_{i}": {{"topic": "puppies", "sign": "aries", "video_index": {i}}}}}' * 40
+
+
+async def _seed(session_factory, count: int):  # type: ignore[no-untyped-def]
+    async with session_factory() as session:
+        run = await RunRepository(session).create_async("motivational", "bench")
+        repo = ArtifactRepository(session)
+        for i in range(count):
+            kind = i % 4
+            if kind == 0:
+                await repo.create_async(
+                    run.id, "producer", ArtifactType.PRODUCER_OUTPUT, content=TRANSCRIPT.format(i=i)
+                )
+            elif kind == 1:
+                await repo.create_async(
+                    run.id, "ideator", ArtifactType.IDEAS, content=IDEAS.format(i=i)
+                )
+            elif kind == 2:
+                await repo.create_async(
+                    run.id,
+                    "producer",
+                    ArtifactType.CLIP_MANIFEST,
+                    content=MANIFEST.format(i=i),
+                    metadata={"type": "task_metadata_mapping", "task_count": 1},
+                )
+            else:
+                await repo.create_async(
+                    run.id,
+                    "producer",
+                    ArtifactType.VIDEO_CLIP,
+                    uri=f"https://cdn.bench/clip_{i}.mp4",
+                    metadata={"task_id": f"task_{i}"},
+                )
+        await session.commit()
+        return run.id
+
+
+async def _measure(session_factory, run_id, iterations: int, with_content: bool):  # type: ignore[no-untyped-def]
+    latencies: list[float] = []
+    peaks: list[int] = []
+    for _ in range(iterations):
+        async with session_factory() as session:
+            repo = ArtifactRepository(session)
+            tracemalloc.start()
+            start = time.perf_counter()
+            artifacts = await repo.get_by_run_async(run_id, with_content=with_content)
+            if with_content:
+                for artifact in artifacts:
+                    _ = artifact.content
+            latencies.append(time.perf_counter() - start)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+    return latencies, peaks
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark artifact listing for one run.")
+    parser.add_argument("--artifacts", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    os.makedirs(".tmp", exist_ok=True)
+    path = ".tmp/bench_artifact_listing.db"
+    if os.path.exists(path):
+        os.remove(path)
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    threshold = settings.artifact_inline_content_max_bytes
+    # Everything inline reproduces the old storage; listing with bodies loads all of it.
+    settings.artifact_inline_content_max_bytes = 1 << 30
+    inline_run = await _seed(session_factory, args.artifacts)
+    settings.artifact_inline_content_max_bytes = threshold
+    split_run = await _seed(session_factory, args.artifacts)
+
+    print(f"artifacts={args.artifacts} iterations={args.iterations} inline_max={threshold}B")
+    for label, run_id, with_content in (
+        ("before", inline_run, True),
+        ("list", split_run, False),
+        ("with_content", split_run, True),
+    ):
+        await _measure(session_factory, run_id, 3, with_content)  # warm up
+        latencies, peaks = await _measure(session_factory, run_id, args.iterations, with_content)
+        ms = sorted(s * 1000 for s in latencies)
+        print(
+            f"  {label:<13} p50={statistics.median(ms):6.2f}ms "
+            f"p95={ms[int(len(ms) * 0.95) - 1]:6.2f}ms "
+            f"peak_mem={statistics.median(peaks) / 1024:8.1f}KiB"
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -0,0 +1,104 @@
+"""
+Benchmark concurrent agent turns: to_thread-wrapped sync Agent vs native AsyncAgent.
+
+Both paths run against a fake streaming Responses backend whose model call
+takes --latency seconds. The sync path mirrors the old node code
+(``anyio.to_thread.run_sync(create_turn_collecting_tool_responses, ...)``) and is
+capped by the anyio thread limiter (40 by default); the async path streams on
+the event loop and scales with --turns.
+
+Usage:
+    PYTHONPATH=src python scripts/perf/bench_async_agent_turns.py --turns 500 --latency 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from types import SimpleNamespace
+from typing import Any, Iterator
+
+import anyio
+from llama_stack_client.lib.agents.agent import Agent
+
+from myloware.agents.async_agent import AsyncAgent
+from myloware.workflows.langgraph.agent_io import (
+    create_turn_collecting_tool_responses,
+    create_turn_collecting_tool_responses_async,
+)
+
+
+def _events(latency: float) -> list[Any]:
+    response = SimpleNamespace(id="resp", output_text="ok")
+    return [
+        SimpleNamespace(type="response.in_progress", response=response),
+        SimpleNamespace(type="response.output_text.delta", delta="ok"),
+        SimpleNamespace(type="response.completed", response=response, _latency=latency),
+    ]
+
+
+class _SyncBackend:
+    def __init__(self, latency: float) -> None:
+        self.responses = SimpleNamespace(create=self._create)
+        self._latency = latency
+
+    def _create(self, **_kwargs: Any) -> Iterator[Any]:
+        for event in _events(self._latency):
+            if getattr(event, "_latency", 0):
+                time.sleep(event._latency)
+            yield event
+
+
+class _AsyncBackend:
+    def __init__(self, latency: float) -> None:
+        self.responses = SimpleNamespace(create=self._create)
+        self._latency = latency
+
+    async def _create(self, **_kwargs: Any) -> Any:
+        async def _stream():
+            for event in _events(self._latency):
+                if getattr(event, "_latency", 0):
+                    await anyio.sleep(event._latency)
+                yield event
+
+        return _stream()
+
+
+async def _bench_sync(turns: int, latency: float) -> float:
+    agent = Agent(_SyncBackend(latency), model="m", instructions="i")
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for _ in range(turns):
+            tg.start_soon(
+                anyio.to_thread.run_sync, create_turn_collecting_tool_responses, agent, [], "s"
+            )
+    return time.perf_counter() - start
+
+
+async def _bench_async(turns: int, latency: float) -> float:
+    agent = AsyncAgent(_AsyncBackend(latency), model="m", instructions="i")
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for _ in range(turns):
+            tg.start_soon(create_turn_collecting_tool_responses_async, agent, [], "s")
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark concurrent agent turns.")
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    sync_elapsed = await _bench_sync(args.turns, args.latency)
+    async_elapsed = await _bench_async(args.turns, args.latency)
+
+    print(f"{args.turns} turns @ {args.latency * 1000:.0f} ms model latency")
+    print(f"to_thread sync Agent: {sync_elapsed:8.2f} s ({args.turns / sync_elapsed:8.1f} turns/s)")
+    print(
+        f"native AsyncAgent:    {async_elapsed:8.2f} s ({args.turns / async_elapsed:8.1f} turns/s)"
+    )
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -0,0 +1,121 @@
+"""
+Benchmark DB-backed health/chat paths: blocking sync sessions vs async sessions.
+
+The "sync" column reproduces the old route bodies (sync ``get_engine()`` /
+``get_session()`` called from async handlers, or a sync session dependency run
+in the threadpool). The "async" column drives the current health routes through
+the ASGI app with httpx, so every query goes through the async engine. The chat
+route is rate limited, so its session lookup is compared at the repository
+level (threadpool sync session vs ``get_session_async``).
+
+Point DATABASE_URL at Postgres to see pool effects; the default SQLite file is
+only a smoke check.
+
+Usage:
+    PYTHONPATH=src python scripts/perf/bench_async_db_routes.py --requests 500 --concurrency 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Awaitable, Callable
+
+import anyio
+import httpx
+from sqlalchemy import text
+
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("LLAMA_STACK_PROVIDER", "fake")
+os.environ.setdefault("DATABASE_URL", "sqlite:///./.tmp/bench_async_db_routes.db")
+os.environ.setdefault("API_KEY", "bench-key")
+
+from myloware.api.server import app  # noqa: E402
+from myloware.storage.database import (  # noqa: E402
+    get_async_session_factory,
+    get_engine,
+    get_session,
+    init_db,
+)
+from myloware.storage.repositories import ChatSessionRepository  # noqa: E402
+from myloware.workflows.cleanup import get_stuck_runs  # noqa: E402
+
+
+async def _hammer(total: int, concurrency: int, call: Callable[[], Awaitable[None]]) -> float:
+    limiter = anyio.Semaphore(concurrency)
+
+    async def _one() -> None:
+        async with limiter:
+            await call()
+
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for _ in range(total):
+            tg.start_soon(_one)
+    return time.perf_counter() - start
+
+
+async def _sync_db_health() -> None:
+    with get_engine().connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+async def _sync_stuck_runs() -> None:
+    get_stuck_runs(timeout_minutes=60)
+
+
+async def _sync_chat_session_lookup() -> None:
+    def _lookup() -> None:
+        with get_session() as session:
+            ChatSessionRepository(session).get_session("bench-user")
+
+    await anyio.to_thread.run_sync(_lookup)
+
+
+async def _async_chat_session_lookup() -> None:
+    SessionLocal = get_async_session_factory()
+    async with SessionLocal() as session:
+        await ChatSessionRepository(session).get_session_async("bench-user")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark sync vs async DB routes.")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    os.makedirs(".tmp", exist_ok=True)
+    init_db()
+
+    transport = httpx.ASGITransport(app=app)
+    headers = {"X-API-Key": os.environ["API_KEY"]}
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", headers=headers
+    ) as c:
+
+        def _get(path: str) -> Callable[[], Awaitable[None]]:
+            async def _call() -> None:
+                await c.get(path)
+
+            return _call
+
+        cases = [
+            ("/health/db", _sync_db_health, _get("/health/db")),
+            ("/health/stuck-runs", _sync_stuck_runs, _get("/health/stuck-runs")),
+            ("chat session lookup", _sync_chat_session_lookup, _async_chat_session_lookup),
+        ]
+
+        print(f"{args.requests} requests, concurrency {args.concurrency}")
+        print(f"{'path':<22}{'sync req/s':>14}{'async req/s':>14}")
+        for name, sync_call, async_call in cases:
+            sync_elapsed = await _hammer(args.requests, args.concurrency, sync_call)
+            async_elapsed = await _hammer(args.requests, args.concurrency, async_call)
+            print(
+                f"{name:<22}{args.requests / sync_elapsed:>14.1f}"
+                f"{args.requests / async_elapsed:>14.1f}"
+            )
+
+
+if __name__ == "__main__":
+    anyio.run(main)
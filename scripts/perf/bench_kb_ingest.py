@@ -0,0 +1,112 @@
+"""
+Benchmark for knowledge base ingestion parallelism.
+
+Runs a full `sync_project_knowledge` rebuild against an in-memory fake Llama
+Stack client whose file upload sleeps for a fixed latency (simulating the
+network round trip + server-side processing), once per `kb_parallel_reads`
+value. Upload is latency-bound, so ingestion time should drop roughly
+linearly with parallelism until it reaches the number of documents.
+
+Usage:
+    PYTHONPATH=src python scripts/perf/bench_kb_ingest.py --documents 64 --latency 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import logging
+import os
+import time
+from types import SimpleNamespace
+
+import structlog
+
+os.environ.setdefault("LLAMA_STACK_PROVIDER", "fake")
+
+from myloware.config import settings  # noqa: E402
+from myloware.knowledge.loader import content_digest  # noqa: E402
+from myloware.knowledge.setup import sync_project_knowledge  # noqa: E402
+
+
+class FakeVectorStoreClient:
+    """Files + vector store API with a fixed per-upload latency."""
+
+    def __init__(self, latency: float) -> None:
+        ids = itertools.count(1)
+        stores: dict[str, list[str]] = {}
+
+        def _upload(*, file, purpose):  # type: ignore[no-untyped-def]
+            time.sleep(latency)
+            return SimpleNamespace(id=f"file-{next(ids)}")
+
+        def _create(*, name, file_ids=None, **_kw):  # type: ignore[no-untyped-def]
+            stores[name] = list(file_ids or [])
+            return SimpleNamespace(id=name)
+
+        self.files = SimpleNamespace(create=_upload, delete=lambda _file_id: None)
+        self.vector_stores = SimpleNamespace(
+            create=_create,
+            list=lambda: [SimpleNamespace(id=k, name=k) for k in stores],
+            delete=lambda store_id: stores.pop(store_id, None),
+            files=SimpleNamespace(
+                create=lambda *, vector_store_id, file_id: stores[vector_store_id].append(file_id),
+                list=lambda vector_store_id: list(stores[vector_store_id]),
+            ),
+            file_batches=SimpleNamespace(
+                create=lambda *, vector_store_id, file_ids: stores[vector_store_id].extend(file_ids)
+            ),
+        )
+
+
+def _corpus(count: int) -> tuple[list[dict], dict]:
+    docs = []
+    files = []
+    for i in range(count):
+        text = f"Document {i}\n" + "lorem ipsum " * 200
+        path = f"data/knowledge/doc_{i:04d}.md"
+        docs.append(
+            {
+                "id": f"doc_{i}",
+                "content": text,
+                "metadata": {"filename": f"doc_{i:04d}.md", "source_path": path},
+            }
+        )
+        files.append({"path": path, "size": len(text), "sha256": content_digest(text)})
+    return docs, {"hash": f"bench-{count}", "files": files}
+
+
+def _bench(documents: int, latency: float, parallelism: int, batch_size: int) -> float:
+    settings.kb_parallel_reads = parallelism
+    settings.kb_upload_batch_size = batch_size
+    docs, manifest = _corpus(documents)
+    client = FakeVectorStoreClient(latency)
+    start = time.perf_counter()
+    result = sync_project_knowledge(client, "bench", docs, manifest, force_reingest=True)
+    elapsed = time.perf_counter() - start
+    assert result.uploaded == documents, result
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--documents", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per upload")
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--parallelism", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    print(f"documents={args.documents} upload_latency={args.latency * 1000:.0f}ms")
+    baseline: float | None = None
+    for workers in args.parallelism:
+        elapsed = _bench(args.documents, args.latency, workers, args.batch_size)
+        baseline = baseline or elapsed
+        print(
+            f"  parallel_reads={workers:3d}: {elapsed:7.3f}s "
+            f"({args.documents / elapsed:7.1f} docs/s, speedup x{baseline / elapsed:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Load test for the public demo status endpoint under many concurrent pollers.
+
+Creates one public demo run that is rendering (an editor_output artifact with a
+render job id), then has ``--pollers`` clients each poll
+GET /v1/public/demo/runs/{token} for ``--rounds`` rounds, revalidating with
+If-None-Match like the browser does. The Remotion progress lookup is replaced
+by a fake with fixed latency that counts calls, so the report shows how many
+Remotion requests the load produced (should stay ~1 per progress TTL window,
+independent of poller count), the 304 ratio and latency percentiles.
+
+Usage:
+    PYTHONPATH=src python scripts/perf/bench_public_demo_status.py --pollers 1000 --rounds 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import time
+
+import anyio
+import httpx
+import structlog
+
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("LLAMA_STACK_PROVIDER", "fake")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///./.tmp/bench_public_demo_status.db")
+os.environ.setdefault("PUBLIC_DEMO_ENABLED", "true")
+os.environ.setdefault("REMOTION_PROVIDER", "real")
+os.environ.setdefault("REMOTION_SERVICE_URL", "http://remotion.bench")
+
+from myloware.api.routes import public_demo  # noqa: E402
+from myloware.api.server import app  # noqa: E402
+from myloware.storage.database import get_async_session_factory, init_async_db  # noqa: E402
+from myloware.storage.models import ArtifactType  # noqa: E402
+from myloware.storage.repositories import ArtifactRepository, RunRepository  # noqa: E402
+
+remotion_calls = 0
+
+
+def _fake_remotion(latency: float):  # type: ignore[no-untyped-def]
+    async def _fetch(render_job_id: str) -> tuple[str | None, int | None]:
+        global remotion_calls
+        remotion_calls += 1
+        await anyio.sleep(latency)
+        return "rendering", 42
+
+    return _fetch
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _create_rendering_run() -> str:
+    async with get_async_session_factory()() as session:
+        run = await RunRepository(session).create_async(
+            "motivational", "bench", public_demo=True, public_token=f"bench-{time.time_ns()}"
+        )
+        run.status = "awaiting_render"
+        await ArtifactRepository(session).create_async(
+            run.id,
+            "editor",
+            ArtifactType.EDITOR_OUTPUT,
+            metadata={"render_job_id": "bench-job"},
+        )
+        await session.commit()
+        return str(run.public_token)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark public demo status polling.")
+    parser.add_argument("--pollers", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--interval", type=float, default=1.0, help="Seconds between rounds")
+    parser.add_argument("--remotion-latency", type=float, default=0.1)
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    os.makedirs(".tmp", exist_ok=True)
+    await init_async_db()
+    public_demo._fetch_render_progress = _fake_remotion(args.remotion_latency)
+    token = await _create_rendering_run()
+
+    latencies: list[float] = []
+    not_modified = 0
+    etags: dict[int, str] = {}
+
+    async def _poll(client: httpx.AsyncClient, poller: int) -> None:
+        nonlocal not_modified
+        headers = {"If-None-Match": etags[poller]} if poller in etags else {}
+        start = time.perf_counter()
+        resp = await client.get(f"/v1/public/demo/runs/{token}", headers=headers)
+        latencies.append(time.perf_counter() - start)
+        if resp.status_code == 304:
+            not_modified += 1
+        elif resp.status_code == 200:
+            etags[poller] = resp.headers["etag"]
+
+    transport = httpx.ASGITransport(app=app)
+    print(
+        f"pollers={args.pollers} rounds={args.rounds} "
+        f"progress_ttl={public_demo.settings.public_demo_render_progress_ttl_seconds}s"
+    )
+    started = time.perf_counter()
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for round_no in range(1, args.rounds + 1):
+            round_start = time.perf_counter()
+            async with anyio.create_task_group() as tg:
+                for poller in range(args.pollers):
+                    tg.start_soon(_poll, client, poller)
+            print(f"  round {round_no}: {time.perf_counter() - round_start:6.2f}s")
+            await anyio.sleep(args.interval)
+    elapsed = time.perf_counter() - started
+
+    ms = [s * 1000 for s in latencies]
+    total = len(latencies)
+    print(
+        f"requests={total} remotion_calls={remotion_calls} "
+        f"({remotion_calls / elapsed:.2f}/s over {elapsed:.1f}s) "
+        f"not_modified={not_modified / total:.0%}"
+    )
+    print(
+        f"latency p50={statistics.median(ms):.1f}ms p95={_percentile(ms, 95):.1f}ms "
+        f"p99={_percentile(ms, 99):.1f}ms"
+    )
+
+
+if __name__ == "__main__":
+    anyio.run(main)
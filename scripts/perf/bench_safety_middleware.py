@@ -0,0 +1,96 @@
+"""
+Benchmark safety middleware overhead per route policy.
+
+Each route is hit through two ASGI apps with identical no-op handlers, one with
+``safety_shield_middleware`` installed and one without; the difference is the
+middleware's cost. The shield is stubbed with an instant verdict so the numbers
+cover routing, body read, field extraction and the keyword screen only.
+
+Usage:
+    PYTHONPATH=src python scripts/perf/bench_safety_middleware.py --requests 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+
+import anyio
+import httpx
+from fastapi import FastAPI
+
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("LLAMA_STACK_PROVIDER", "real")
+
+from myloware.api.middleware import safety  # noqa: E402
+from myloware.config import settings  # noqa: E402
+
+BRIEF = "A calm sunrise over the mountains with a motivational voice-over. " * 8
+
+CASES: list[tuple[str, str, bytes]] = [
+    ("webhooks (skip)", "/v1/webhooks/sora", json.dumps({"id": "x", "status": "done"}).encode()),
+    (
+        "run_start (fields)",
+        "/v2/runs/start",
+        json.dumps({"workflow": "aismr", "brief": BRIEF, "user_id": "u"}).encode(),
+    ),
+    ("run_approve (no text)", "/v2/runs/abc/approve", json.dumps({"approved": True}).encode()),
+    (
+        "run_reject (comment)",
+        "/v2/runs/abc/reject",
+        json.dumps({"approved": False, "comment": "too dark"}).encode(),
+    ),
+    ("default (raw body)", "/v1/other", json.dumps({"text": BRIEF}).encode()),
+]
+
+
+def _build_app(with_middleware: bool) -> FastAPI:
+    app = FastAPI()
+    if with_middleware:
+        app.middleware("http")(safety.safety_shield_middleware)
+
+    async def handler() -> dict[str, bool]:
+        return {"ok": True}
+
+    for _, path, _ in CASES:
+        app.add_api_route(path, handler, methods=["POST"])
+    return app
+
+
+async def _time(app: FastAPI, path: str, body: bytes, total: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        for _ in range(total):
+            await client.post(path, content=body, headers={"content-type": "application/json"})
+        return time.perf_counter() - start
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark safety middleware per route.")
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    settings.enable_safety_shields = True
+
+    async def instant_check(_content: str) -> safety.SafetyVerdict:
+        return safety.SafetyVerdict(safe=True)
+
+    safety.check_content_safety = instant_check  # type: ignore[assignment]
+    safety.compile_safety_policies()
+
+    bare, guarded = _build_app(False), _build_app(True)
+    print(f"{args.requests} sequential requests per route")
+    print(f"{'route':<24}{'bare us/req':>14}{'guarded us/req':>16}{'overhead us':>14}")
+    for name, path, body in CASES:
+        bare_s = await _time(bare, path, body, args.requests)
+        guarded_s = await _time(guarded, path, body, args.requests)
+        per_bare = bare_s / args.requests * 1e6
+        per_guarded = guarded_s / args.requests * 1e6
+        print(f"{name:<24}{per_bare:>14.1f}{per_guarded:>16.1f}{per_guarded - per_bare:>14.1f}")
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -0,0 +1,93 @@
+"""
+Latency of a burst of concurrent POST /v1/runs/start requests.
+
+Drives the ASGI app with httpx (no network) using the DB job dispatcher, so
+each request creates a run and enqueues ``run.execute`` exactly as in
+production. Reports p50/p95/p99 and the maximum over the burst.
+
+Point DATABASE_URL at Postgres (postgresql+asyncpg://...) to measure pool
+pressure; the default SQLite file is a smoke check.
+
+Usage:
+    PYTHONPATH=src python scripts/perf/bench_start_run_burst.py --burst 200 --rounds 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import time
+
+import anyio
+import httpx
+import structlog
+
+os.environ.setdefault("ENVIRONMENT", "test")
+os.environ.setdefault("LLAMA_STACK_PROVIDER", "fake")
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///./.tmp/bench_start_run_burst.db")
+os.environ.setdefault("API_KEY", "bench-key")
+os.environ.setdefault("WORKFLOW_DISPATCHER", "db")
+os.environ.setdefault("ENABLE_SAFETY_SHIELDS", "false")
+os.environ.setdefault("RUN_RATE_LIMIT", "1000000/minute")
+os.environ.setdefault("MAX_RUNS_LAST_24H", "0")
+os.environ.setdefault("DAILY_COST_BUDGET_USD", "0")
+
+from myloware.api.server import app  # noqa: E402
+from myloware.storage.database import init_async_db  # noqa: E402
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _burst(client: httpx.AsyncClient, size: int) -> tuple[list[float], int]:
+    latencies: list[float] = []
+    errors = 0
+
+    async def _one() -> None:
+        nonlocal errors
+        start = time.perf_counter()
+        resp = await client.post("/v1/runs/start", json={"workflow": "aismr", "brief": "burst"})
+        latencies.append(time.perf_counter() - start)
+        if resp.status_code != 200:
+            errors += 1
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(size):
+            tg.start_soon(_one)
+    return latencies, errors
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark a burst of run starts.")
+    parser.add_argument("--burst", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    os.makedirs(".tmp", exist_ok=True)
+    await init_async_db()
+
+    transport = httpx.ASGITransport(app=app)
+    headers = {"X-API-Key": os.environ["API_KEY"]}
+    print(f"database={os.environ['DATABASE_URL'].split('://')[0]} burst={args.burst}")
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", headers=headers, timeout=60.0
+    ) as client:
+        for round_no in range(1, args.rounds + 1):
+            latencies, errors = await _burst(client, args.burst)
+            ms = [s * 1000 for s in latencies]
+            print(
+                f"  round {round_no}: p50={statistics.median(ms):7.1f}ms "
+                f"p95={_percentile(ms, 95):7.1f}ms p99={_percentile(ms, 99):7.1f}ms "
+                f"max={max(ms):7.1f}ms errors={errors}"
+            )
+
+
+if __name__ == "__main__":
+    anyio.run(main)
@@ -10,20 +10,27 @@ Safety should be handled separately:
 """
 
 from myloware.agents.factory import (
+    clear_agent_cache,
     create_agent,
+    create_async_agent,
     create_file_search_tool_config,
     create_persona_agent,
     create_rag_tool_config,
 )
-from myloware.agents.supervisor import create_supervisor_agent
+from myloware.agents.async_agent import AsyncAgent
+from myloware.agents.supervisor import create_async_supervisor_agent, create_supervisor_agent
 
 __all__ = [
     # Config-driven agent creation (recommended)
     "create_agent",
+    "create_async_agent",
+    "AsyncAgent",
     # Low-level factory functions
     "create_persona_agent",
     "create_rag_tool_config",
     "create_file_search_tool_config",
+    "clear_agent_cache",
     # Supervisor (has custom tools)
     "create_supervisor_agent",
+    "create_async_supervisor_agent",
 ]
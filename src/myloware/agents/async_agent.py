@@ -0,0 +1,216 @@
+"""Native async agent for Llama Stack 0.3.x.
+
+The SDK's sync ``Agent`` blocks a thread for the whole model call, so running it
+under ``anyio.to_thread`` caps concurrent turns at the thread limiter size. The
+SDK also ships an ``AsyncAgent``, but in 0.3.x it iterates the Responses stream
+synchronously and calls a missing ``initialize()``, so it can't drive
+``AsyncLlamaStackClient``.
+
+``AsyncAgent`` here mirrors the sync turn loop (Responses API stream →
+TurnEventSynthesizer → client-side tool execution → continue) on the event loop:
+- Model calls stream through ``AsyncLlamaStackClient.responses.create``
+- MyloWare tools with ``async_run_impl`` run natively on the loop
+- Sync-only tools run via ``anyio.to_thread`` for the duration of the tool call only
+"""
+
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Dict, List
+from uuid import uuid4
+
+import anyio
+from llama_stack_client.lib.agents.agent import AgentUtils, ToolResponsePayload, ToolUtils
+from llama_stack_client.lib.agents.client_tool import ClientTool
+from llama_stack_client.lib.agents.event_synthesizer import TurnEventSynthesizer
+from llama_stack_client.lib.agents.turn_events import (
+    AgentStreamChunk,
+    StepCompleted,
+    StepStarted,
+    ToolExecutionStepResult,
+    TurnFailed,
+)
+from llama_stack_client.lib.agents.types import CompletionMessage, ToolCall
+
+from myloware.llama_clients import close_stream
+from myloware.observability.logging import get_logger
+from myloware.tools.base import MylowareBaseTool
+
+logger = get_logger(__name__)
+
+__all__ = ["AsyncAgent"]
+
+
+def _has_native_async(tool: ClientTool) -> bool:
+    """True if the tool's async entrypoint doesn't block (overrides async_run_impl)."""
+    if not isinstance(tool, MylowareBaseTool):
+        return False
+    return type(tool).async_run_impl is not MylowareBaseTool.async_run_impl
+
+
+class AsyncAgent:
+    """Async counterpart of ``llama_stack_client.lib.agents.agent.Agent``.
+
+    Same constructor shape and turn semantics; ``create_session``/``delete_session``
+    and ``create_turn`` are coroutines and turns stream as an async iterator.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        model: str,
+        instructions: str,
+        tools: List[Any] | None = None,
+        extra_headers: Dict[str, str] | None = None,
+    ) -> None:
+        self.client = client
+        self.extra_headers = extra_headers
+        self._model = model
+        self._instructions = instructions
+
+        self._tools, client_tools = AgentUtils.normalize_tools(tools)
+        self.client_tools = {tool.get_name(): tool for tool in client_tools}
+
+        self.sessions: List[str] = []
+
+    async def create_session(self, session_name: str) -> str:
+        conversation = await self.client.conversations.create(
+            extra_headers=self.extra_headers,
+            metadata={"name": session_name},
+        )
+        self.sessions.append(conversation.id)
+        return conversation.id
+
+    async def delete_session(self, session_id: str) -> None:
+        await self.client.conversations.delete(conversation_id=session_id)
+        if session_id in self.sessions:
+            self.sessions.remove(session_id)
+
+    async def create_turn(
+        self,
+        messages: List[Dict[str, Any]],
+        session_id: str,
+        stream: bool = True,
+    ) -> AsyncIterator[AgentStreamChunk] | Any:
+        if stream:
+            return self._create_turn_streaming(messages, session_id)
+
+        last_chunk: AgentStreamChunk | None = None
+        async for chunk in self._create_turn_streaming(messages, session_id):
+            last_chunk = chunk
+        if not last_chunk or not last_chunk.response:
+            raise RuntimeError("Turn did not complete")
+        return last_chunk.response
+
+    async def _create_turn_streaming(
+        self,
+        messages: List[Dict[str, Any]],
+        session_id: str,
+    ) -> AsyncIterator[AgentStreamChunk]:
+        turn_id = f"turn_{uuid4().hex[:12]}"
+        synthesizer = TurnEventSynthesizer(session_id=session_id, turn_id=turn_id)
+
+        while True:
+            raw_stream = await self.client.responses.create(
+                model=self._model,
+                instructions=self._instructions,
+                conversation=session_id,
+                input=messages,
+                tools=self._tools,
+                stream=True,
+                extra_headers=self.extra_headers,
+            )
+
+            function_calls_to_execute: List[ToolCall] = []
+
+            try:
+                async for raw_event in raw_stream:
+                    # The synthesizer is a sync generator over an iterable; feed it one
+                    # event at a time so the async stream is never buffered.
+                    for event in synthesizer.process_raw_stream((raw_event,)):
+                        if isinstance(event, TurnFailed):
+                            yield AgentStreamChunk(event=event)
+                            return
+
+                        if isinstance(event, StepCompleted) and event.step_type == "inference":
+                            if event.result.function_calls:
+                                function_calls_to_execute = event.result.function_calls
+
+                        yield AgentStreamChunk(event=event)
+            finally:
+                # Frees the llama_stack guard slot when the turn stops mid-stream.
+                await close_stream(raw_stream)
+
+            if not function_calls_to_execute:
+                response = synthesizer.last_response
+                if not response:
+                    raise RuntimeError("No response available")
+                for event in synthesizer.finish_turn():
+                    yield AgentStreamChunk(event=event, response=response)
+                break
+
+            tool_step_id = f"{turn_id}_step_{synthesizer.step_counter}"
+            synthesizer.step_counter += 1
+
+            yield AgentStreamChunk(
+                event=StepStarted(
+                    step_id=tool_step_id,
+                    step_type="tool_execution",
+                    turn_id=turn_id,
+                    metadata={"server_side": False},
+                )
+            )
+
+            tool_responses = await self._run_tool_calls(function_calls_to_execute)
+
+            yield AgentStreamChunk(
+                event=StepCompleted(
+                    step_id=tool_step_id,
+                    step_type="tool_execution",
+                    turn_id=turn_id,
+                    result=ToolExecutionStepResult(
+                        step_id=tool_step_id,
+                        tool_calls=function_calls_to_execute,
+                        tool_responses=tool_responses,
+                    ),
+                )
+            )
+
+            messages = [
+                {
+                    "type": "function_call_output",
+                    "call_id": payload["call_id"],
+                    "output": payload["content"],
+                }
+                for payload in tool_responses
+            ]
+
+    async def _run_tool_calls(self, tool_calls: List[ToolCall]) -> List[ToolResponsePayload]:
+        responses: List[ToolResponsePayload] = []
+        for tool_call in tool_calls:
+            raw_result = await self._run_single_tool(tool_call)
+            responses.append(ToolUtils.normalize_tool_response(raw_result))
+        return responses
+
+    async def _run_single_tool(self, tool_call: ToolCall) -> Any:
+        tool = self.client_tools.get(tool_call.tool_name)
+        if tool is None:
+            return {
+                "call_id": tool_call.call_id,
+                "tool_name": tool_call.tool_name,
+                "content": f"Unknown tool `{tool_call.tool_name}` was called.",
+            }
+
+        message_history = [
+            CompletionMessage(
+                role="assistant",
+                content=tool_call.arguments,
+                tool_calls=[tool_call],
+                stop_reason="end_of_turn",
+            )
+        ]
+        if _has_native_async(tool):
+            return await tool.async_run(message_history)
+
+        logger.debug("Running sync-only tool %s in a worker thread", tool_call.tool_name)
+        return await anyio.to_thread.run_sync(tool.run, message_history)
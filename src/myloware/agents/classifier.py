@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import re
 from typing import Literal, Optional
 
+from cachetools import TTLCache  # type: ignore
+from prometheus_client import Counter
+from pydantic import BaseModel, Field
+
 from myloware.backends.protocols import AsyncChatBackend, SyncChatBackend
+from myloware.config import settings
 from myloware.observability.logging import get_logger
-from pydantic import BaseModel, Field
 
 logger = get_logger("agents.classifier")
 
@@ -63,24 +68,139 @@ Return a JSON object with keys: intent, project, run_id, gate, custom_object, sk
 """
 
 
-def classify_request(
-    backend: SyncChatBackend,
-    user_message: str,
-    model: str = "openai/gpt-4o-mini",
-) -> ClassificationResult:
-    """Classify a user request using a chat backend with JSON output.
+# ---------------------------------------------------------------------------
+# Fast path: rule grammar + LLM result cache
+# ---------------------------------------------------------------------------
 
-    Raises:
-        RuntimeError: If classification fails (fail fast - no fallbacks).
+CLASSIFIER_REQUESTS = Counter(
+    "myloware_classifier_requests_total",
+    "Chat request classifications by source (rules, cache, llm)",
+    ["source"],
+)
+
+# Rule matches at or above this confidence skip the LLM entirely.
+RULE_CONFIDENCE_THRESHOLD = 0.9
+# Longer messages are left to the LLM; the grammar only covers short commands.
+_RULE_MAX_LENGTH = 120
+
+_UUID_RE = re.compile(
+    r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.IGNORECASE
+)
+_GATE_RE = re.compile(r"\b(ideation|publish)\b")
+_PROJECT_RE = re.compile(r"\b(aismr|asmr|motivational|motivation)\b")
+_PROJECT_ALIASES: dict[str, ProjectName] = {
+    "aismr": "aismr",
+    "asmr": "aismr",
+    "motivational": "motivational",
+    "motivation": "motivational",
+}
+_NEGATION_RE = re.compile(r"\b(don'?t|do not|not|never|cancel|stop|reject|deny)\b")
+_OBJECT_RE = re.compile(r"\babout (?:an? |the )?([a-z0-9][a-z0-9 '-]{0,39})$")
+
+# (intent, pattern, base confidence). Patterns run against the normalized message.
+_INTENT_RULES: tuple[tuple[RequestIntent, re.Pattern[str], float], ...] = (
+    ("help", re.compile(r"^/?(help|commands|what can you do)$"), 0.95),
+    (
+        "list_runs",
+        re.compile(r"^/?(?:(?:list|show)(?: me)?(?: my| all| recent)? runs|my runs|runs)$"),
+        0.95,
+    ),
+    ("approve_gate", re.compile(r"^/?approve\b"), 0.85),
+    (
+        "check_status",
+        re.compile(r"^/?(?:status|check(?: the)? status|what(?:'s| is) the status)\b"),
+        0.85,
+    ),
+    ("start_run", re.compile(r"^/?(?:start|make|create|generate|run)\b.*\b(?:video|run)\b"), 0.8),
+)
+
+
+def normalize_message(message: str) -> str:
+    """Normalize a chat message for rule matching and cache keys."""
+    return " ".join(message.lower().split()).rstrip(".!?")
+
+
+def _project_of(text: str) -> ProjectName | None:
+    match = _PROJECT_RE.search(text)
+    return _PROJECT_ALIASES[match.group(1)] if match else None
+
+
+def rule_classify(message: str) -> ClassificationResult | None:
+    """Classify ``message`` with the deterministic grammar.
+
+    Returns None when no rule applies or the scored confidence is below
+    ``RULE_CONFIDENCE_THRESHOLD``; the caller then falls back to the LLM.
     """
-    data = backend.chat_json(
-        messages=[
-            {"role": "system", "content": CLASSIFICATION_PROMPT},
-            {"role": "user", "content": f"Classify this request: {user_message}"},
-        ],
-        model_id=model,
-    )
+    text = normalize_message(message)
+    if not text or len(text) > _RULE_MAX_LENGTH or _NEGATION_RE.search(text):
+        return None
+
+    uuid_match = _UUID_RE.search(text)
+    run_id = uuid_match.group(0) if uuid_match else None
+    gate_match = _GATE_RE.search(text)
+    gate = gate_match.group(1) if gate_match else None
+    project = _project_of(text)
+
+    # A bare project name is a request to start that project.
+    if project is not None and _PROJECT_RE.fullmatch(text):
+        return ClassificationResult(intent="start_run", project=project, confidence=0.9)
+
+    matches = [(intent, base) for intent, pattern, base in _INTENT_RULES if pattern.search(text)]
+    if len(matches) != 1:
+        return None
+    intent, confidence = matches[0]
+
+    result = ClassificationResult(intent=intent, confidence=confidence)
+    if intent == "approve_gate":
+        if gate is None:
+            return None
+        result.gate = gate
+        result.run_id = run_id
+        confidence += 0.1 if run_id else 0.05
+    elif intent == "check_status":
+        if run_id is None:
+            return None
+        result.run_id = run_id
+        confidence += 0.1
+    elif intent == "start_run":
+        if project is None:
+            return None
+        result.project = project
+        confidence += 0.1
+        object_match = _OBJECT_RE.search(text)
+        if object_match:
+            result.custom_object = object_match.group(1).strip()
+    elif run_id or gate:
+        # help / list_runs carrying entities are not the plain command.
+        return None
+
+    result.confidence = round(min(confidence, 1.0), 2)
+    if result.confidence < RULE_CONFIDENCE_THRESHOLD:
+        return None
+    return result
+
+
+_cache: TTLCache | None = None
+
+
+def _get_cache() -> TTLCache | None:
+    global _cache
+    max_entries = int(getattr(settings, "classifier_cache_max_entries", 0) or 0)
+    if max_entries <= 0:
+        return None
+    if _cache is None:
+        ttl = float(getattr(settings, "classifier_cache_ttl_seconds", 600.0))
+        _cache = TTLCache(maxsize=max_entries, ttl=ttl)
+    return _cache
+
+
+def clear_classifier_cache() -> None:
+    """Drop cached LLM classifications (tests, config reloads)."""
+    global _cache
+    _cache = None
 
+
+def _result_from_payload(data: dict) -> ClassificationResult:
     # Handle confidence - LLM might return "high", "medium", etc. instead of a number
     raw_confidence = data.get("confidence", 0.8)
     if isinstance(raw_confidence, (int, float)):
@@ -92,7 +212,7 @@ def classify_request(
     else:
         confidence = 0.8
 
-    result = ClassificationResult(
+    return ClassificationResult(
         intent=data.get("intent", "unknown"),
         project=data.get("project") or None,
         run_id=data.get("run_id") or None,
@@ -102,6 +222,26 @@ def classify_request(
         confidence=confidence,
     )
 
+
+def classify_request(
+    backend: SyncChatBackend,
+    user_message: str,
+    model: str = "openai/gpt-4o-mini",
+) -> ClassificationResult:
+    """Classify a user request using a chat backend with JSON output.
+
+    Raises:
+        RuntimeError: If classification fails (fail fast - no fallbacks).
+    """
+    data = backend.chat_json(
+        messages=[
+            {"role": "system", "content": CLASSIFICATION_PROMPT},
+            {"role": "user", "content": f"Classify this request: {user_message}"},
+        ],
+        model_id=model,
+    )
+    result = _result_from_payload(data)
+
     logger.info(
         "Classified request via LLM",
         extra={
@@ -118,7 +258,24 @@ async def classify_request_async(
     user_message: str,
     model: str = "openai/gpt-4o-mini",
 ) -> ClassificationResult:
-    """Async variant of classify_request."""
+    """Async variant of classify_request with a deterministic fast path.
+
+    Messages matching the rule grammar are answered locally; otherwise an LLM
+    classification cached for the normalized message is reused. The LLM is only
+    called on a miss. Failed LLM calls are not cached.
+    """
+    ruled = rule_classify(user_message)
+    if ruled is not None:
+        CLASSIFIER_REQUESTS.labels(source="rules").inc()
+        return ruled
+
+    cache = _get_cache()
+    key = (model, normalize_message(user_message))
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            CLASSIFIER_REQUESTS.labels(source="cache").inc()
+            return cached.model_copy(deep=True)
 
     data = await backend.chat_json_async(
         messages=[
@@ -127,31 +284,21 @@ async def classify_request_async(
         ],
         model_id=model,
     )
+    result = _result_from_payload(data)
+    CLASSIFIER_REQUESTS.labels(source="llm").inc()
 
-    raw_confidence = data.get("confidence", 0.8)
-    if isinstance(raw_confidence, (int, float)):
-        confidence = float(raw_confidence)
-    elif isinstance(raw_confidence, str):
-        confidence_map = {"high": 0.9, "medium": 0.7, "low": 0.5}
-        confidence = confidence_map.get(raw_confidence.lower(), 0.8)
-    else:
-        confidence = 0.8
-
-    result = ClassificationResult(
-        intent=data.get("intent", "unknown"),
-        project=data.get("project") or None,
-        run_id=data.get("run_id") or None,
-        gate=data.get("gate") or None,
-        custom_object=data.get("custom_object") or None,
-        skip_steps=data.get("skip_steps") or [],
-        confidence=confidence,
-    )
+    if cache is not None:
+        cache[key] = result.model_copy(deep=True)
     return result
 
 
 __all__ = [
     "ClassificationResult",
     "classify_request",
+    "classify_request_async",
+    "clear_classifier_cache",
+    "normalize_message",
+    "rule_classify",
     "ProjectName",
     "RequestIntent",
 ]
@@ -3,9 +3,12 @@
 ## Llama Stack 0.3.x Changes
 Supports two modes:
 1. Direct creation with explicit instructions (create_persona_agent)
-2. Config-driven creation from YAML files (create_agent)
+2. Config-driven creation from YAML files (create_agent, or create_async_agent
+   for native async turns on AsyncLlamaStackClient)
 
-Tools are created per-agent with run context (run_id) for webhook callbacks.
+Custom tools are built once per process as prototypes and bound to each run's
+context (run_id) with a cheap shallow copy, so per-node agent creation does not
+re-read YAML or rebuild tool clients.
 """
 
 from __future__ import annotations
@@ -15,24 +18,55 @@ from typing import Any, Dict, List
 from unittest.mock import MagicMock
 from uuid import UUID
 
-from llama_stack_client import LlamaStackClient
+from llama_stack_client import AsyncLlamaStackClient, LlamaStackClient
 from llama_stack_client.lib.agents.agent import Agent
 from llama_stack_client.lib.agents.client_tool import ClientTool
 
+from myloware.agents.async_agent import AsyncAgent
 from myloware.config import settings
 from myloware.config.provider_modes import effective_llama_stack_provider
-from myloware.config.loaders import load_agent_config
+from myloware.config.loaders import clear_agent_config_cache, load_agent_config
 from myloware.observability.logging import get_logger
 from myloware.tools import AnalyzeMediaTool, RemotionRenderTool, SoraGenerationTool, UploadPostTool
+from myloware.tools.base import MylowareBaseTool
 
 logger = get_logger(__name__)
 
 __all__ = [
     "create_agent",
+    "create_async_agent",
     "create_persona_agent",
     "create_rag_tool_config",
+    "clear_agent_cache",
 ]
 
+# Settings read by custom tool constructors. A change to any of these builds a
+# fresh prototype instead of reusing one configured for the old values.
+_TOOL_SETTINGS_FIELDS = (
+    "use_fake_providers",
+    "openai_api_key",
+    "webhook_base_url",
+    "sora_provider",
+    "remotion_provider",
+    "remotion_service_url",
+    "remotion_api_secret",
+    "remotion_allow_composition_code",
+    "remotion_sandbox_enabled",
+    "remotion_sandbox_strict",
+    "upload_post_provider",
+    "upload_post_api_key",
+    "upload_post_api_url",
+)
+
+# (tool class, settings fingerprint) -> prototype instance without run context
+_tool_prototypes: Dict[tuple[Any, tuple[str, ...]], Any] = {}
+
+
+def clear_agent_cache() -> None:
+    """Drop cached agent configs and tool prototypes."""
+    clear_agent_config_cache()
+    _tool_prototypes.clear()
+
 
 def create_persona_agent(
     client: LlamaStackClient,
@@ -142,6 +176,140 @@ def create_agent(
         YAML config fields 'input_shields' and 'output_shields' are ignored.
         Use client.safety.run_shield() for content moderation.
     """
+    spec = _resolve_agent_spec(
+        client,
+        project,
+        role,
+        vector_db_id=vector_db_id,
+        run_id=run_id,
+        custom_tools=custom_tools,
+        fake=isinstance(Agent, MagicMock),
+    )
+    if spec is None:
+        return _FakeAgent()
+
+    # Llama Stack 0.3.0 Agent ctor does not accept shields; safety handled
+    # upstream (middleware + pre-flight shields).
+    agent = Agent(client=client, **spec)
+
+    logger.info("Created %s agent with %d tools", role, len(spec["tools"]))
+    return agent
+
+
+def create_async_agent(
+    client: AsyncLlamaStackClient,
+    project: str,
+    role: str,
+    vector_db_id: str | None = None,
+    run_id: UUID | str | None = None,
+    custom_tools: List[Any] | None = None,
+) -> AsyncAgent:
+    """Create a native async agent from project config.
+
+    Same config resolution and tool binding as ``create_agent``, but the agent
+    runs turns on the event loop against ``AsyncLlamaStackClient`` instead of
+    holding a worker thread for the whole model call.
+
+    Args:
+        client: Async Llama Stack client
+        project: Project name (e.g., "aismr", "motivational")
+        role: Agent role (ideator, producer, editor, publisher, supervisor)
+        vector_db_id: Optional vector DB ID for RAG tools
+        run_id: Optional run ID for webhook-enabled tools (Sora, Remotion)
+        custom_tools: Optional additional tools to add
+
+    Returns:
+        Configured AsyncAgent
+    """
+    spec = _resolve_agent_spec(
+        client,
+        project,
+        role,
+        vector_db_id=vector_db_id,
+        run_id=run_id,
+        custom_tools=custom_tools,
+        fake=isinstance(AsyncAgent, MagicMock),
+    )
+    if spec is None:
+        return _FakeAsyncAgent()
+
+    agent = AsyncAgent(client, **spec)
+
+    logger.info("Created async %s agent with %d tools", role, len(spec["tools"]))
+    return agent
+
+
+_FAKE_AGENT_TEXT = (
+    "MyloWare is a Llama Stack native video production pipeline built with FastAPI and Python."
+)
+
+
+class _FakeResponse:
+    def __init__(self, text: str) -> None:
+        self.output_text = text
+
+
+class _FakeAgent:
+    def __init__(self) -> None:
+        self._last_session = None
+
+    def create_session(self, session_name: str | None = None) -> str:
+        self._last_session = session_name or "session"
+        return self._last_session
+
+    def create_turn(self, *args: Any, **kwargs: Any) -> Any:
+        resp = _FakeResponse(_FAKE_AGENT_TEXT)
+
+        if kwargs.get("stream"):
+            # Minimal streaming shape: yield a single chunk that carries the final response.
+            def _iter():
+                yield type("Chunk", (), {"event": None, "response": resp})()
+
+            return _iter()
+
+        return resp
+
+
+class _FakeAsyncAgent:
+    def __init__(self) -> None:
+        self._last_session = None
+
+    async def create_session(self, session_name: str | None = None) -> str:
+        self._last_session = session_name or "session"
+        return self._last_session
+
+    async def delete_session(self, session_id: str) -> None:
+        return None
+
+    async def create_turn(self, *args: Any, **kwargs: Any) -> Any:
+        resp = _FakeResponse(_FAKE_AGENT_TEXT)
+
+        if kwargs.get("stream", True):
+
+            async def _iter():
+                yield type("Chunk", (), {"event": None, "response": resp})()
+
+            return _iter()
+
+        return resp
+
+
+def _resolve_agent_spec(
+    client: Any,
+    project: str,
+    role: str,
+    *,
+    vector_db_id: str | None,
+    run_id: UUID | str | None,
+    custom_tools: List[Any] | None,
+    fake: bool,
+) -> Dict[str, Any] | None:
+    """Resolve model, instructions and bound tools for a project role.
+
+    Returns None when the fake provider should be used instead of a real agent
+    (``fake`` is True when the agent class itself is mocked, so tests that patch
+    the class still exercise the real path).
+    """
     # Load config with inheritance
     config = load_agent_config(project, role)
 
@@ -158,38 +326,10 @@ def create_agent(
     if llama_mode == "off":
         raise RuntimeError("LLAMA_STACK_PROVIDER=off: Llama Stack is disabled (fail-fast)")
 
-    if llama_mode == "fake" and not isinstance(Agent, MagicMock):
-
-        class _FakeAgent:
-            def __init__(self) -> None:
-                self._last_session = None
-
-            def create_session(self, session_name: str | None = None) -> str:
-                self._last_session = session_name or "session"
-                return self._last_session
-
-            def create_turn(self, *args: Any, **kwargs: Any) -> Any:
-                class Resp:
-                    def __init__(self, text: str) -> None:
-                        self.output_text = text
-
-                resp = Resp(
-                    "MyloWare is a Llama Stack native video production pipeline "
-                    "built with FastAPI and Python."
-                )
-
-                if kwargs.get("stream"):
-                    # Minimal streaming shape: yield a single chunk that carries the final response.
-                    def _iter():
-                        yield type("Chunk", (), {"event": None, "response": resp})()
-
-                    return _iter()
-
-                return resp
-
-        return _FakeAgent()
+    if llama_mode == "fake" and not fake:
+        return None
 
-    # Build tools list from config - tools are created per-run with context
+    # Build tools list from config - custom tools are bound to this run's context
     tools = _build_tools_from_config(
         config.get("tools", []),
         client=client,
@@ -198,7 +338,7 @@ def create_agent(
     )
 
     for idx, tool in enumerate(tools):
-        logger.info(
+        logger.debug(
             "Tool #%s type=%s module=%s callable=%s is_client_tool=%s",
             idx,
             type(tool),
@@ -226,17 +366,7 @@ def create_agent(
     if not instructions:
         raise ValueError(f"No instructions found in config for {role}")
 
-    # Llama Stack 0.3.0 Agent ctor does not accept shields; safety handled
-    # upstream (middleware + pre-flight shields).
-    agent = Agent(
-        client=client,
-        model=model,
-        instructions=instructions,
-        tools=tools,
-    )
-
-    logger.info("Created %s agent with %d tools", role, len(tools))
-    return agent
+    return {"model": model, "instructions": instructions, "tools": tools}
 
 
 def _build_tools_from_config(
@@ -247,8 +377,8 @@ def _build_tools_from_config(
 ) -> List[Any]:
     """Build tool list from config, injecting context where needed.
 
-    Tools are created fresh per-agent with full context (run_id, vector_db_id).
-    This is the Llama Stack native approach - no global caching of stateful tools.
+    Custom tools are shallow copies of per-process prototypes bound to run_id;
+    run-specific state never lives on the shared prototype.
 
     Handles:
     - builtin:: tools (RAG with hybrid search, websearch)
@@ -290,8 +420,8 @@ def _create_tool_instance(
 ) -> Any:
     """Create a tool instance from a tool name.
 
-    Custom tools (Sora, Remotion, etc.) are created fresh each time with
-    run context. This enables webhook callbacks to include run_id.
+    Custom tools (Sora, Remotion, etc.) are bound to the run context on each
+    call. This enables webhook callbacks to include run_id.
 
     Returns:
         - Tool instance for custom tools
@@ -320,41 +450,42 @@ def _create_tool_instance(
         logger.warning("Unsupported builtin tool '%s', skipping", tool_name)
         return None
 
-    # Custom MyloWare tools - create fresh instances with run context
-    # These are NOT cached because they may contain run-specific state
+    # Custom MyloWare tools - bind run context onto a shared prototype
+    tool_cls = _custom_tool_classes().get(tool_name)
+    if tool_cls is not None:
+        tool_instance = _get_tool_prototype(tool_cls).bind_run(run_id)
+        logger.debug("Bound %s to run (run_id=%s)", type(tool_instance).__name__, run_id)
+        return tool_instance
 
-    if tool_name == "sora_generate":
-        tool_instance = SoraGenerationTool(run_id=run_id)
-        # Instrumentation: verify the tool instance
-        from myloware.tools.base import MylowareBaseTool
+    # Unknown tool - pass through as string (might be registered elsewhere)
+    logger.warning("Unknown tool '%s', passing through as string", tool_name)
+    return tool_name
 
-        is_our_tool = isinstance(tool_instance, MylowareBaseTool)
-        logger.info(
-            "Created SoraGenerationTool (run_id=%s, type=%s, is MylowareBaseTool=%s, MRO=%s)",
-            run_id,
-            type(tool_instance),
-            is_our_tool,
-            tool_instance.__class__.mro(),
-        )
-        if not is_our_tool:
-            logger.error("BUG: SoraGenerationTool is not a MylowareBaseTool instance!")
-        return tool_instance
 
-    if tool_name == "remotion_render":
-        tool_instance = RemotionRenderTool(run_id=run_id)
-        logger.info("Created RemotionRenderTool (run_id=%s)", run_id)
-        return tool_instance
+def _custom_tool_classes() -> Dict[str, Any]:
+    """Map YAML tool names to MyloWare tool classes (resolved at call time)."""
+    return {
+        "sora_generate": SoraGenerationTool,
+        "remotion_render": RemotionRenderTool,
+        "upload_post": UploadPostTool,
+        "analyze_media": AnalyzeMediaTool,
+    }
 
-    if tool_name == "upload_post":
-        tool_instance = UploadPostTool(run_id=run_id)
-        logger.info("Created UploadPostTool instance (run_id=%s)", run_id)
-        return tool_instance
 
-    if tool_name == "analyze_media":
-        tool_instance = AnalyzeMediaTool(run_id=run_id)
-        logger.info("Created AnalyzeMediaTool instance (run_id=%s)", run_id)
-        return tool_instance
+def _tool_settings_fingerprint() -> tuple[str, ...]:
+    return tuple(str(getattr(settings, name, None)) for name in _TOOL_SETTINGS_FIELDS)
 
-    # Unknown tool - pass through as string (might be registered elsewhere)
-    logger.warning("Unknown tool '%s', passing through as string", tool_name)
-    return tool_name
+
+def _get_tool_prototype(tool_cls: Any) -> Any:
+    """Return the shared, run-agnostic instance of ``tool_cls`` for current settings."""
+    key = (tool_cls, _tool_settings_fingerprint())
+    prototype = _tool_prototypes.get(key)
+    if prototype is None:
+        prototype = tool_cls()
+        _tool_prototypes[key] = prototype
+        logger.info(
+            "Created %s prototype (is MylowareBaseTool=%s)",
+            getattr(tool_cls, "__name__", tool_cls),
+            isinstance(prototype, MylowareBaseTool),
+        )
+    return prototype
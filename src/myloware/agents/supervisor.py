@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import Any, List
 
+from myloware.agents.async_agent import AsyncAgent
 from myloware.agents.factory import create_persona_agent
 from myloware.agents.tools.supervisor import (
     ApproveGateTool,
@@ -11,37 +12,23 @@ from myloware.agents.tools.supervisor import (
     ListRunsTool,
     StartWorkflowTool,
 )
+from myloware.config import settings
 from myloware.config.loaders import load_agent_config
-from llama_stack_client import LlamaStackClient
+from llama_stack_client import AsyncLlamaStackClient, LlamaStackClient
 from llama_stack_client.lib.agents.agent import Agent
 from myloware.observability.logging import get_logger
 
 logger = get_logger(__name__)
 
-__all__ = ["create_supervisor_agent"]
+__all__ = ["create_supervisor_agent", "create_async_supervisor_agent"]
 
 
-def create_supervisor_agent(
-    client: LlamaStackClient,
-    model: str | None = None,
-    vector_db_id: str = "project_kb",
-    project: str = "aismr",
-) -> Agent:
-    """Create Supervisor agent with workflow management tools.
-
-    Unlike other agents, the supervisor requires runtime-instantiated custom tools
-    (StartWorkflowTool, ApproveGateTool, etc.) that can't be defined in YAML.
-    Instructions are loaded from YAML config while tools are built dynamically.
-
-    Args:
-        client: Llama Stack client
-        model: Optional model override
-        vector_db_id: Vector DB for RAG
-        project: Project name for config loading
-
-    Returns:
-        Configured supervisor Agent
-    """
+def _supervisor_spec(
+    model: str | None,
+    vector_db_id: str,
+    project: str,
+) -> tuple[str, List[Any], str | None]:
+    """Load supervisor instructions and build its runtime tools."""
     # Load instructions from YAML config
     config = load_agent_config(project, "supervisor")
     instructions = config.get("instructions", "")
@@ -69,6 +56,31 @@ def create_supervisor_agent(
 
     # Use model from config if not overridden
     model_id = model or config.get("model")
+    return instructions, tools, model_id
+
+
+def create_supervisor_agent(
+    client: LlamaStackClient,
+    model: str | None = None,
+    vector_db_id: str = "project_kb",
+    project: str = "aismr",
+) -> Agent:
+    """Create Supervisor agent with workflow management tools.
+
+    Unlike other agents, the supervisor requires runtime-instantiated custom tools
+    (StartWorkflowTool, ApproveGateTool, etc.) that can't be defined in YAML.
+    Instructions are loaded from YAML config while tools are built dynamically.
+
+    Args:
+        client: Llama Stack client
+        model: Optional model override
+        vector_db_id: Vector DB for RAG
+        project: Project name for config loading
+
+    Returns:
+        Configured supervisor Agent
+    """
+    instructions, tools, model_id = _supervisor_spec(model, vector_db_id, project)
 
     agent = create_persona_agent(
         client=client,
@@ -80,3 +92,23 @@ def create_supervisor_agent(
 
     logger.info("Supervisor agent created with %d tools", len(tools))
     return agent
+
+
+def create_async_supervisor_agent(
+    client: AsyncLlamaStackClient,
+    model: str | None = None,
+    vector_db_id: str = "project_kb",
+    project: str = "aismr",
+) -> AsyncAgent:
+    """Create the Supervisor as a native async agent (see create_supervisor_agent)."""
+    instructions, tools, model_id = _supervisor_spec(model, vector_db_id, project)
+
+    agent = AsyncAgent(
+        client,
+        model=model_id or settings.llama_stack_model,
+        instructions=instructions,
+        tools=tools,
+    )
+
+    logger.info("Async supervisor agent created with %d tools", len(tools))
+    return agent
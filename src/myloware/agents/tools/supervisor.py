@@ -7,6 +7,8 @@ from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, Iterable
 from uuid import UUID
 
+import anyio
+
 from myloware.llama_clients import get_sync_client
 from myloware.observability.logging import get_logger
 from myloware.storage.database import get_session
@@ -201,8 +203,11 @@ class StartWorkflowTool(MylowareBaseTool):
         user_id: str | None = None,
         telegram_chat_id: str | None = None,
     ) -> Dict[str, Any]:
-        # Not used by Llama Stack tool runner (expects sync). Keep for completeness.
-        return self._execute_sync(project, brief, user_id, telegram_chat_id)
+        # Used by the native AsyncAgent: the workflow start does sync DB work,
+        # so keep it off the event loop.
+        return await anyio.to_thread.run_sync(
+            self._execute_sync, project, brief, user_id, telegram_chat_id
+        )
 
     def run_impl(
         self,
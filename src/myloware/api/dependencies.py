@@ -1,4 +1,9 @@
-"""Common FastAPI dependencies for the MyloWare API."""
+"""Common FastAPI dependencies for the MyloWare API.
+
+Route handlers take database sessions from ``myloware.api.dependencies_async``.
+The sync session/repository providers below remain for callers that still run
+on the sync engine (CLI, scripts).
+"""
 
 from __future__ import annotations
 
@@ -64,21 +69,34 @@ def get_feedback_repo(session: Session = Depends(get_db_session)) -> FeedbackRep
     return FeedbackRepository(session)
 
 
-def get_llama_client() -> LlamaStackClient:
+async def get_llama_client() -> LlamaStackClient:
     """Provide a cached Llama Stack client."""
 
     return get_sync_client()
 
 
-def get_async_llama_client() -> AsyncLlamaStackClient:
+async def get_async_llama_client() -> AsyncLlamaStackClient:
     """Provide a cached async Llama Stack client."""
 
     return get_async_client()
 
 
 def get_vector_db_id(request: Request) -> str:
-    """Return the registered vector DB identifier from app state."""
-
+    """Return the registered vector DB identifier from app state.
+
+    RAG-dependent routes get a 503 while the startup knowledge base sync is
+    still running (or has failed) instead of a half-populated vector store.
+    """
+
+    status = getattr(request.app.state, "knowledge_base_status", None)
+    if status == "pending":
+        raise HTTPException(
+            status_code=503,
+            detail="Knowledge base is still initializing",
+            headers={"Retry-After": "5"},
+        )
+    if status == "failed":
+        raise HTTPException(status_code=503, detail="Knowledge base unavailable")
     return getattr(request.app.state, "vector_db_id", "project_kb_myloware")
 
 
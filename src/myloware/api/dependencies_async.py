@@ -6,7 +6,13 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from myloware.storage.database import get_async_session_factory
-from myloware.storage.repositories import ArtifactRepository, FeedbackRepository, RunRepository
+from myloware.storage.repositories import (
+    ArtifactRepository,
+    AuditLogRepository,
+    ChatSessionRepository,
+    FeedbackRepository,
+    RunRepository,
+)
 
 
 async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -38,3 +44,15 @@ async def get_async_feedback_repo(
     session: AsyncSession = Depends(get_async_db_session),
 ) -> FeedbackRepository:
     return FeedbackRepository(session)
+
+
+async def get_async_chat_session_repo(
+    session: AsyncSession = Depends(get_async_db_session),
+) -> ChatSessionRepository:
+    return ChatSessionRepository(session)
+
+
+async def get_async_audit_log_repo(
+    session: AsyncSession = Depends(get_async_db_session),
+) -> AuditLogRepository:
+    return AuditLogRepository(session)
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import re
+import time
 from dataclasses import dataclass
-from typing import Awaitable, Callable
+from typing import Any, Awaitable, Callable, Iterable
 
 from opentelemetry import trace
 from fastapi import Request
 from fastapi.responses import JSONResponse, Response
+from prometheus_client import Histogram
 
 from myloware.config import settings
 from myloware.config.provider_modes import effective_llama_stack_provider
@@ -28,6 +32,166 @@ _TOXIC_KEYWORDS = (
     "suicide",
     "racial slur",
 )
+# One compiled alternation instead of a substring scan per keyword (longest first
+# so "hate speech" wins over shorter overlaps).
+_KEYWORD_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_TOXIC_KEYWORDS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+
+_WRITE_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+SAFETY_MIDDLEWARE_SECONDS = Histogram(
+    "myloware_safety_middleware_seconds",
+    "Safety middleware time before the handler runs, by route policy",
+    ["policy"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+)
+
+
+@dataclass(frozen=True)
+class SafetyRoutePolicy:
+    """How the safety middleware treats write requests to one route.
+
+    ``path`` is a route template: ``{param}`` matches one path segment and a
+    trailing ``/**`` matches any suffix. ``fields`` are (dotted) JSON paths whose
+    string values are scanned; ``json_fields`` are scanned as compact JSON.
+    When nothing is extracted the raw body is scanned, unless ``allow_if_empty``.
+    Routes with ``skip=True`` are passed through without reading the body.
+    """
+
+    name: str
+    path: str
+    skip: bool = False
+    fields: tuple[str, ...] = ()
+    json_fields: tuple[str, ...] = ()
+    allow_if_empty: bool = False
+
+
+_HITL_POLICY_KW: dict[str, Any] = {
+    # HITL control-plane payloads are ids + booleans; running Llama Guard on the
+    # raw JSON can false-positive and stall workflows, so only scan human text.
+    "fields": ("comment", "content_override"),
+    "json_fields": ("data",),
+    "allow_if_empty": True,
+}
+
+DEFAULT_SAFETY_POLICIES: tuple[SafetyRoutePolicy, ...] = (
+    # Webhooks are signed machine-to-machine callbacks validated in their handlers;
+    # shielding their raw JSON creates false positives (e.g. Sora/Remotion).
+    SafetyRoutePolicy("webhooks", "/v1/webhooks/**", skip=True),
+    SafetyRoutePolicy("admin", "/admin/**", skip=True),
+    SafetyRoutePolicy("health", "/health/**", skip=True),
+    SafetyRoutePolicy("run_resume", "/v2/runs/{run_id}/resume", skip=True),
+    # Run starts carry structured JSON; scan only the user-authored brief.
+    SafetyRoutePolicy("run_start_v1", "/v1/runs/start", fields=("brief",)),
+    SafetyRoutePolicy("run_start_v2", "/v2/runs/start", fields=("brief",)),
+    SafetyRoutePolicy("run_approve", "/v2/runs/{run_id}/approve", **_HITL_POLICY_KW),
+    SafetyRoutePolicy("run_approve_hitl", "/v2/runs/{run_id}/approve/hitl", **_HITL_POLICY_KW),
+    SafetyRoutePolicy("run_reject", "/v2/runs/{run_id}/reject", **_HITL_POLICY_KW),
+    SafetyRoutePolicy("chat", "/v1/chat/supervisor", fields=("message",)),
+    SafetyRoutePolicy(
+        "feedback", "/v1/runs/{run_id}/feedback", fields=("comment",), allow_if_empty=True
+    ),
+    SafetyRoutePolicy("public_demo_start", "/v1/public/demo/start", fields=("brief", "name")),
+    SafetyRoutePolicy(
+        "public_demo_gate",
+        "/v1/public/demo/runs/{token}/{action}",
+        fields=("comment",),
+        allow_if_empty=True,
+    ),
+)
+
+# Unmatched write routes scan the whole decoded body.
+_DEFAULT_POLICY = SafetyRoutePolicy("default", "/**")
+
+_registered: list[SafetyRoutePolicy] = list(DEFAULT_SAFETY_POLICIES)
+_compiled: "_CompiledSafetyPolicies | None" = None
+
+
+class _CompiledSafetyPolicies:
+    """All policy templates folded into one regex; the named group that matched wins."""
+
+    def __init__(self, policies: Iterable[SafetyRoutePolicy]) -> None:
+        self.policies: dict[str, SafetyRoutePolicy] = {}
+        alternatives: list[str] = []
+        for index, policy in enumerate(policies):
+            group = f"p{index}"
+            self.policies[group] = policy
+            alternatives.append(f"(?P<{group}>{_template_to_regex(policy.path)})")
+        self._regex = re.compile("|".join(alternatives)) if alternatives else None
+
+    def resolve(self, path: str) -> SafetyRoutePolicy:
+        if self._regex is not None:
+            match = self._regex.fullmatch(path)
+            if match is not None and match.lastgroup:
+                return self.policies[match.lastgroup]
+        return _DEFAULT_POLICY
+
+
+def _template_to_regex(template: str) -> str:
+    prefix, wildcard = (template[:-3], True) if template.endswith("/**") else (template, False)
+    parts = re.split(r"(\{[^/}]+\})", prefix)
+    pattern = "".join("[^/]+" if part.startswith("{") else re.escape(part) for part in parts)
+    return pattern + ("(?:/.*)?" if wildcard else "/?")
+
+
+def register_safety_policy(policy: SafetyRoutePolicy) -> None:
+    """Add (or replace, by name) a route policy; earlier entries match first."""
+    global _compiled
+    _registered[:] = [p for p in _registered if p.name != policy.name]
+    _registered.insert(0, policy)
+    _compiled = None
+
+
+def compile_safety_policies() -> _CompiledSafetyPolicies:
+    """Compile the registered policies (called at app startup; cheap to repeat)."""
+    global _compiled
+    _compiled = _CompiledSafetyPolicies(_registered)
+    return _compiled
+
+
+def resolve_safety_policy(path: str) -> SafetyRoutePolicy:
+    """Return the policy governing ``path`` (the scan-everything default if none)."""
+    compiled = _compiled or compile_safety_policies()
+    return compiled.resolve(path)
+
+
+def _lookup(payload: Any, dotted: str) -> Any:
+    for key in dotted.split("."):
+        if not isinstance(payload, dict):
+            return None
+        payload = payload.get(key)
+    return payload
+
+
+def extract_scan_text(policy: SafetyRoutePolicy, raw_body: bytes) -> str | None:
+    """Parse ``raw_body`` once and join the policy's text fields (None if empty)."""
+    if not raw_body.lstrip().startswith(b"{"):
+        return None
+    try:
+        payload = json.loads(raw_body)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+
+    extracted: list[str] = []
+    for field in policy.fields:
+        value = _lookup(payload, field)
+        if isinstance(value, str) and value.strip():
+            extracted.append(value.strip())
+    for field in policy.json_fields:
+        value = _lookup(payload, field)
+        if value is None:
+            continue
+        try:
+            text = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        except (TypeError, ValueError):
+            text = str(value)
+        if text.strip():
+            extracted.append(text)
+    return "\n\n".join(extracted) if extracted else None
 
 
 @dataclass
@@ -44,7 +208,9 @@ async def check_content_safety(content: str) -> SafetyVerdict:
     if settings.enable_safety_shields:
         try:
             client = get_async_client()
-            result = await shield_utils.check_content_safety(
+            # Long bodies are split and checked concurrently so one slow segment
+            # does not push the whole request past the middleware timeout.
+            result = await shield_utils.check_segmented_safety(
                 client,
                 content,
                 shield_id=settings.content_safety_shield_id,
@@ -77,20 +243,19 @@ async def check_content_safety(content: str) -> SafetyVerdict:
                 return SafetyVerdict(safe=False, reason="shield_error")
             # In fake mode, fall through to keyword scan
 
-    lowered = content.lower()
-    for keyword in _TOXIC_KEYWORDS:
-        if keyword in lowered:
-            return SafetyVerdict(safe=False, reason=f"matched_keyword:{keyword}")
+    return _keyword_scan(content)
+
+
+def _keyword_scan(content: str) -> SafetyVerdict:
+    match = _KEYWORD_RE.search(content)
+    if match is not None:
+        return SafetyVerdict(safe=False, reason=f"matched_keyword:{match.group(0).lower()}")
     return SafetyVerdict(safe=True)
 
 
 async def keyword_only(content: str) -> SafetyVerdict:
     """Keyword-only safety check."""
-    lowered = content.lower()
-    for keyword in _TOXIC_KEYWORDS:
-        if keyword in lowered:
-            return SafetyVerdict(safe=False, reason=f"matched_keyword:{keyword}")
-    return SafetyVerdict(safe=True)
+    return _keyword_scan(content)
 
 
 async def safety_shield_middleware(
@@ -103,17 +268,22 @@ async def safety_shield_middleware(
     Use LLAMA_STACK_PROVIDER=fake/off for testing scenarios where shield is unavailable.
     """
 
-    if request.method not in {"POST", "PUT", "PATCH"}:
+    if request.method not in _WRITE_METHODS:
         return await call_next(request)
 
-    # Webhook endpoints are machine-to-machine callbacks. They are authenticated
-    # (signature/HMAC) and schema-validated in their handlers, and running LLM
-    # safety shields on their raw JSON payloads creates false positives that can
-    # stall workflows (e.g., blocking Sora/Remotion callbacks).
-    if str(request.url.path).startswith("/v1/webhooks/"):
+    if not settings.enable_safety_shields:
         return await call_next(request)
 
-    if not settings.enable_safety_shields:
+    path = str(request.url.path)
+    policy = resolve_safety_policy(path)
+    started = time.perf_counter()
+
+    def _observe() -> None:
+        SAFETY_MIDDLEWARE_SECONDS.labels(policy=policy.name).observe(time.perf_counter() - started)
+
+    if policy.skip:
+        # Nothing to scan: never touch the body stream.
+        _observe()
         return await call_next(request)
 
     # Skip shield when Llama Stack is non-real (for testing). Still run keyword filter.
@@ -124,63 +294,16 @@ async def safety_shield_middleware(
     # Note: _body is a private FastAPI attribute not in type hints, but needed for middleware
     # Mypy doesn't flag this as an error, but it's a runtime attribute assignment
     request._body = raw_body
-    content = raw_body.decode("utf-8", errors="ignore")
 
-    # Run-start endpoints carry structured JSON. Running Llama Guard on the raw JSON
-    # string can produce false positives (the model may refuse the JSON) and block
-    # safe briefs. Extract only the user-authored text fields for shield evaluation.
-    path = str(request.url.path)
-    if path in {"/v1/runs/start", "/v2/runs/start"}:
-        import json as _json
-
-        extracted_run_start: list[str] = []
-        try:
-            payload = _json.loads(content) if content.strip().startswith("{") else None
-        except Exception:
-            payload = None
-
-        if isinstance(payload, dict):
-            brief_val = payload.get("brief")
-            if isinstance(brief_val, str) and brief_val.strip():
-                extracted_run_start.append(brief_val.strip())
-
-        if extracted_run_start:
-            content = "\n\n".join(extracted_run_start)
-
-    # HITL control-plane endpoints carry small structured payloads (ids + booleans).
-    # Running Llama Guard on the *raw JSON* can false-positive and stall workflows.
-    # For these endpoints, extract only the human text fields (e.g. comment/override)
-    # and run safety on that.
-    if path.startswith("/v2/runs/") and (
-        path.endswith("/approve") or path.endswith("/approve/hitl") or path.endswith("/reject")
-    ):
-        import json as _json
-
-        extracted_hitl: list[str] = []
-        try:
-            payload = _json.loads(content) if content.strip().startswith("{") else None
-        except Exception:
-            payload = None
-
-        if isinstance(payload, dict):
-            for key in ("comment", "content_override"):
-                val = payload.get(key)
-                if isinstance(val, str) and val.strip():
-                    extracted_hitl.append(val.strip())
-            data_val = payload.get("data")
-            if data_val is not None:
-                try:
-                    data_text = _json.dumps(data_val, ensure_ascii=False, separators=(",", ":"))
-                except Exception:
-                    data_text = str(data_val)
-                if data_text.strip():
-                    extracted_hitl.append(data_text)
-
-        if extracted_hitl:
-            content = "\n\n".join(extracted_hitl)
-        else:
+    content: str | None = None
+    if policy.fields or policy.json_fields:
+        content = extract_scan_text(policy, raw_body)
+        if content is None and policy.allow_if_empty:
             # No free-form text in the payload; allow without a shield call.
+            _observe()
             return await call_next(request)
+    if content is None:
+        content = raw_body.decode("utf-8", errors="ignore")
 
     try:
         if skip_shield:
@@ -217,6 +340,7 @@ async def safety_shield_middleware(
         # Always fail closed - safety is critical
         verdict = SafetyVerdict(safe=False, reason="shield_error")
 
+    _observe()
     if verdict.safe:
         logger.info(
             "safety_shield_pass",
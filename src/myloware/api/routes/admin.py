@@ -11,8 +11,8 @@ from pydantic import BaseModel
 import anyio
 
 from myloware.config import settings
-from myloware.knowledge.loader import load_documents_with_manifest
-from myloware.knowledge.setup import setup_project_knowledge
+from myloware.knowledge.loader import load_documents_with_manifest, load_manifest, save_manifest
+from myloware.knowledge.setup import sync_project_knowledge
 from myloware.llama_clients import get_sync_client
 
 from myloware.api.dependencies import verify_api_key
@@ -285,8 +285,12 @@ async def resolve_dead_letter(
 
 
 @router.post("/kb/reload")
-async def reload_knowledge_base() -> dict[str, Any]:
-    """Reload knowledge base on-demand (honors unchanged manifest)."""
+async def reload_knowledge_base(request: Request) -> dict[str, Any]:
+    """Reload knowledge base on-demand, ingesting only files changed since the last sync.
+
+    A full rebuild replaces the vector store, so the new id is published on
+    ``app.state`` for the RAG dependencies along with a ready status.
+    """
 
     # KB setup uses sync client internally; wrap in thread to avoid blocking if called from async context
     client = await anyio.to_thread.run_sync(get_sync_client)
@@ -295,16 +299,35 @@ async def reload_knowledge_base() -> dict[str, Any]:
         project_id, include_global=True, read_content=True
     )
 
-    vector_db_id = await anyio.to_thread.run_sync(
-        setup_project_knowledge,
+    doc_dicts = [
+        {
+            "id": d.id,
+            "content": d.content,
+            "metadata": {**d.metadata, "filename": d.filename, "type": "knowledge"},
+        }
+        for d in documents
+    ]
+
+    sync = await anyio.to_thread.run_sync(
+        sync_project_knowledge,
         client,
         project_id,
-        documents if documents else None,
+        doc_dicts,
+        manifest,
+        load_manifest(),
     )
+    save_manifest(sync.manifest)
+
+    state = request.app.state
+    state.vector_db_id = sync.vector_store_id
+    state.knowledge_base_healthy = True
+    state.knowledge_base_error = None
+    state.knowledge_base_status = "ready"
 
     return {
         "status": "reloaded",
-        "vector_db_id": vector_db_id,
+        "vector_db_id": sync.vector_store_id,
         "doc_count": len(documents),
         "manifest_hash": manifest.get("hash"),
+        "sync": sync.manifest["last_sync"],
     }
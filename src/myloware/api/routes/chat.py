@@ -16,22 +16,23 @@ from myloware.api.schemas import ChatResponseModel, ErrorResponse
 from myloware.backends import LlamaStackBackend
 
 from myloware.api.dependencies import (
-    get_chat_session_repo,
     get_llama_client,
     get_async_llama_client,
     get_vector_db_id,
 )
+from myloware.api.dependencies_async import get_async_chat_session_repo
 from myloware.agents.classifier import (
     ClassificationResult,
     classify_request,
     classify_request_async,
 )
-from myloware.agents.supervisor import create_supervisor_agent
+from myloware.agents.supervisor import create_async_supervisor_agent
 from myloware.memory.preferences import extract_and_store_preference
 from myloware.observability.logging import get_logger
 from myloware.storage.repositories import ChatSessionRepository
 from myloware.workflows.langgraph.agent_io import (
-    create_turn_collecting_tool_responses,
+    agent_session_async,
+    create_turn_collecting_tool_responses_async,
     extract_content,
 )
 from fastapi.concurrency import run_in_threadpool
@@ -63,7 +64,7 @@ async def chat_with_supervisor(
     body: ChatRequest,
     client: LlamaStackClient = Depends(get_llama_client),
     async_client: AsyncLlamaStackClient = Depends(get_async_llama_client),
-    session_repo: ChatSessionRepository = Depends(get_chat_session_repo),
+    session_repo: ChatSessionRepository = Depends(get_async_chat_session_repo),
     vector_db_id: str = Depends(get_vector_db_id),
     stream: bool = False,
 ) -> ChatResponseModel:
@@ -129,20 +130,15 @@ async def chat_with_supervisor(
         context_str = " ".join(context_parts)
         augmented_message = f"{context_str}\n\n{body.message}" if context_parts else body.message
 
-        # Non-streaming: use supervisor agent (sync, wrapped in threads)
+        # Non-streaming: use the native async supervisor agent (no worker thread per turn)
         if not stream:
-            agent = await run_in_threadpool(create_supervisor_agent, client, None, vector_db_id)
+            agent = create_async_supervisor_agent(async_client, None, vector_db_id)
+            request_tag = request.state._id if hasattr(request.state, "_id") else "new"
+            session_name = f"user-{body.user_id}-{request_tag}"
 
-            # Create fresh session for this request
-            session_id = await run_in_threadpool(
-                agent.create_session,
-                f"user-{body.user_id}-{request.state._id if hasattr(request.state, '_id') else 'new'}",
-            )
-            logger.info("Created fresh session: %s", session_id)
-
-            try:
-                response, tool_responses = await run_in_threadpool(
-                    create_turn_collecting_tool_responses,
+            async with agent_session_async(async_client, agent, session_name) as session_id:
+                logger.info("Created fresh session: %s", session_id)
+                response, tool_responses = await create_turn_collecting_tool_responses_async(
                     agent,
                     [{"role": "user", "content": augmented_message}],
                     session_id,
@@ -161,13 +157,6 @@ async def chat_with_supervisor(
                     )
 
                 return ChatResponse(response=text, run_id=run_id)
-            finally:
-                # Clean up session (official Llama Stack pattern)
-                try:
-                    await run_in_threadpool(client.conversations.delete, conversation_id=session_id)
-                    logger.debug("Cleaned up session: %s", session_id)
-                except Exception as cleanup_exc:
-                    logger.warning("Failed to cleanup session %s: %s", session_id, cleanup_exc)
 
         # Streaming path: use async chat completions with backpressure queue
         async def stream_chunks() -> AsyncIterator[str]:
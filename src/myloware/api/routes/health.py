@@ -13,6 +13,8 @@ from sqlalchemy import text
 
 from myloware.config.settings import settings
 from myloware.llama_clients import _get_circuit_breaker
+from myloware.resilience.registry import resilience_snapshot
+from myloware.safety.verdict_cache import verdict_cache_stats
 from myloware.observability.logging import get_logger
 from myloware.workflows.langgraph.graph import check_checkpointer_health
 
@@ -49,6 +51,7 @@ async def health_check(
         "degraded_mode": degraded_mode,
         "provider_modes": provider_modes,
         "knowledge_base_healthy": getattr(request.app.state, "knowledge_base_healthy", None),
+        "knowledge_base_status": getattr(request.app.state, "knowledge_base_status", None),
         "shields_available": getattr(request.app.state, "shields_available", None),
         "vector_db_id": getattr(request.app.state, "vector_db_id", None),
         "render_sandbox_enabled": getattr(request.app.state, "remotion_sandbox_enabled", None),
@@ -71,6 +74,28 @@ async def health_check(
     return payload
 
 
+@router.get("/health/ready")
+async def readiness_check(request: Request) -> JSONResponse:
+    """Readiness probe: 200 once startup (database + knowledge base sync) is done.
+
+    /health stays a liveness probe and answers as soon as the app is up; this
+    endpoint returns 503 while the background KB sync is pending or has failed.
+    """
+    state = request.app.state
+    kb_status = getattr(state, "knowledge_base_status", None)
+    database_ready = getattr(state, "database_ready", None)
+    ready = kb_status in ("ready", "skipped") and database_ready is not False
+    content: Dict[str, Any] = {
+        "status": "ready" if ready else "not_ready",
+        "knowledge_base": kb_status or "unknown",
+        "database_ready": database_ready,
+    }
+    if kb_status == "failed":
+        content["knowledge_base_error"] = getattr(state, "knowledge_base_error", None)
+    headers = None if ready else {"Retry-After": "5"}
+    return JSONResponse(content=content, status_code=200 if ready else 503, headers=headers)
+
+
 @router.get("/health/langgraph")
 async def langgraph_health(request: Request) -> JSONResponse:
     """Check LangGraph checkpointer connectivity."""
@@ -89,16 +114,16 @@ async def db_health_check() -> JSONResponse:
 
     Returns 200 if database is healthy, 503 otherwise.
     """
-    from myloware.storage.database import get_engine
+    from myloware.storage.database import get_async_engine
 
     checks: Dict[str, Any] = {"database": "unknown"}
     status_code = 200
 
     try:
         # Check database connectivity
-        engine = get_engine()
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        engine = get_async_engine()
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
             checks["database"] = "healthy"
     except Exception as exc:
         logger.error("Database health check failed: %s", exc)
@@ -112,10 +137,11 @@ async def db_health_check() -> JSONResponse:
         from alembic.script import ScriptDirectory
         from alembic.runtime.migration import MigrationContext
 
-        engine = get_engine()
-        with engine.connect() as conn:
-            context = MigrationContext.configure(conn)
-            current_rev = context.get_current_revision()
+        engine = get_async_engine()
+        async with engine.connect() as conn:
+            current_rev = await conn.run_sync(
+                lambda sync_conn: MigrationContext.configure(sync_conn).get_current_revision()
+            )
 
             alembic_cfg = Config("alembic.ini")
             script = ScriptDirectory.from_config(alembic_cfg)
@@ -147,9 +173,9 @@ async def get_stuck_runs_endpoint(
     Returns:
         Dict with stuck run details
     """
-    from myloware.workflows.cleanup import get_stuck_runs
+    from myloware.workflows.cleanup import get_stuck_runs_async
 
-    stuck = get_stuck_runs(timeout_minutes=timeout_minutes)
+    stuck = await get_stuck_runs_async(timeout_minutes=timeout_minutes)
     return {
         "timeout_minutes": timeout_minutes,
         "stuck_runs": stuck,
@@ -164,6 +190,9 @@ async def cleanup_stuck_runs_endpoint(
 ) -> Dict[str, Any]:
     """Timeout stuck runs that have been waiting too long.
 
+    Unless dry_run is set, also prunes run budget counters older than the
+    budget window and expired safety verdicts.
+
     Args:
         timeout_minutes: Minutes after which a waiting run is considered stuck
         dry_run: If True (default), only report what would be done
@@ -171,14 +200,22 @@ async def cleanup_stuck_runs_endpoint(
     Returns:
         Dict with cleanup results
     """
-    from myloware.workflows.cleanup import timeout_stuck_runs
+    from myloware.workflows.cleanup import (
+        prune_run_budget_counters_async,
+        purge_expired_safety_verdicts_async,
+        timeout_stuck_runs_async,
+    )
 
-    timed_out = timeout_stuck_runs(timeout_minutes=timeout_minutes, dry_run=dry_run)
+    timed_out = await timeout_stuck_runs_async(timeout_minutes=timeout_minutes, dry_run=dry_run)
+    pruned_budget_counters = 0 if dry_run else await prune_run_budget_counters_async()
+    purged_safety_verdicts = 0 if dry_run else await purge_expired_safety_verdicts_async()
     return {
         "timeout_minutes": timeout_minutes,
         "dry_run": dry_run,
         "timed_out_run_ids": [str(rid) for rid in timed_out],
         "count": len(timed_out),
+        "pruned_budget_counters": pruned_budget_counters,
+        "purged_safety_verdicts": purged_safety_verdicts,
     }
 
 
@@ -190,7 +227,7 @@ async def full_health_check(request: "Request") -> JSONResponse:
     Exposes degraded state (e.g., knowledge base failures) for monitoring.
     """
     import httpx
-    from myloware.storage.database import get_engine
+    from myloware.storage.database import get_async_engine
 
     provider_modes = {
         "llama_stack": settings.llama_stack_provider,
@@ -221,13 +258,15 @@ async def full_health_check(request: "Request") -> JSONResponse:
         "safety_shield": "unknown",
         "knowledge_base": "unknown",
         "llama_stack_circuit": circuit_breaker_state,
+        "upstreams": resilience_snapshot(),
+        "safety_verdict_cache": verdict_cache_stats(),
     }
 
     # Check database
     try:
-        engine = get_engine()
-        with engine.connect() as conn:
-            conn.execute(text("SELECT 1"))
+        engine = get_async_engine()
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
             checks["database"] = "healthy"
     except Exception as exc:
         logger.error("Database health check failed: %s", exc)
@@ -277,7 +316,9 @@ async def full_health_check(request: "Request") -> JSONResponse:
             kb_healthy = getattr(app_state, "knowledge_base_healthy", None)
             kb_error = getattr(app_state, "knowledge_base_error", None)
 
-            if kb_healthy is True:
+            if getattr(app_state, "knowledge_base_status", None) == "pending":
+                checks["knowledge_base"] = "initializing"
+            elif kb_healthy is True:
                 checks["knowledge_base"] = "healthy"
             elif kb_healthy is False:
                 checks["knowledge_base"] = "degraded"
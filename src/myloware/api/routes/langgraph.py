@@ -223,6 +223,13 @@ async def start_run(
                 status_code=429,
                 detail="Run budget exceeded (max_runs_last_24h). Please retry later.",
             )
+        if settings.max_runs_per_user_last_24h and body.user_id:
+            user_count = await run_repo.count_runs_since_async(window_start, user_id=body.user_id)
+            if user_count >= settings.max_runs_per_user_last_24h:
+                raise HTTPException(
+                    status_code=429,
+                    detail="Run budget exceeded for this user (max_runs_per_user_last_24h).",
+                )
         estimated_cost = (recent_count + 1) * settings.estimated_cost_per_run_usd
         if settings.daily_cost_budget_usd and estimated_cost > settings.daily_cost_budget_usd:
             raise HTTPException(
@@ -41,7 +41,7 @@ def _require_media_token(request: Request | None) -> None:
         raise HTTPException(status_code=401, detail="Unauthorized")
 
 
-def _is_safe_filename(name: str, *, suffix: str | None = None) -> bool:
+def _is_safe_filename(name: str, *, suffix: str | tuple[str, ...] | None = None) -> bool:
     if not name or name.strip() != name:
         return False
     if name in {".", ".."}:
@@ -55,8 +55,13 @@ def _is_safe_filename(name: str, *, suffix: str | None = None) -> bool:
     return True
 
 
+def _transcoded_media_type(filename: str) -> str:
+    # Keyframes and contact sheets are published next to the clip they preview.
+    return "image/jpeg" if filename.endswith(".jpg") else "video/mp4"
+
+
 def _resolve_transcoded_path(filename: str) -> Path:
-    if not _is_safe_filename(filename, suffix=".mp4"):
+    if not _is_safe_filename(filename, suffix=(".mp4", ".jpg")):
         raise HTTPException(status_code=400, detail="Invalid filename")
     base = Path(TRANSCODED_DIR).resolve()
     candidate = (base / filename).resolve()
@@ -255,7 +260,7 @@ async def head_transcoded_video(filename: str, request: Request) -> Response:
                     content_length = int(total)
             return Response(
                 content=b"",
-                media_type="video/mp4",
+                media_type=_transcoded_media_type(filename),
                 headers={
                     "Content-Length": str(content_length),
                     "Content-Disposition": f'inline; filename="{filename}"',
@@ -277,7 +282,7 @@ async def head_transcoded_video(filename: str, request: Request) -> Response:
     file_size = filepath.stat().st_size
     return Response(
         content=b"",
-        media_type="video/mp4",
+        media_type=_transcoded_media_type(filename),
         headers={
             "Content-Length": str(file_size),
             "Content-Disposition": f'inline; filename="{filename}"',
@@ -333,7 +338,7 @@ async def get_transcoded_video(filename: str, request: Request) -> Response:
             return StreamingResponse(
                 _iter_bytes(),
                 status_code=upstream.status_code,
-                media_type="video/mp4",
+                media_type=_transcoded_media_type(filename),
                 headers=response_headers,
             )
         except httpx.HTTPStatusError as exc:
@@ -360,7 +365,7 @@ async def get_transcoded_video(filename: str, request: Request) -> Response:
     logger.info("Serving transcoded video: %s", filename)
     return FileResponse(
         filepath,
-        media_type="video/mp4",
+        media_type=_transcoded_media_type(filename),
         filename=filename,
         headers={
             "Cache-Control": "public, max-age=3600",
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import re
 import secrets
 from datetime import datetime, timedelta, timezone
 from urllib.parse import urlparse
 from typing import Any, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from cachetools import TTLCache  # type: ignore
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from prometheus_client import Counter
 from pydantic import BaseModel, Field
 from slowapi import Limiter
 from sqlalchemy.exc import IntegrityError
@@ -19,11 +23,14 @@ from myloware.api.dependencies import get_async_llama_client, get_vector_db_id
 from myloware.api.dependencies_async import get_async_artifact_repo, get_async_run_repo
 from myloware.api.rate_limit import key_api_key_or_ip
 from myloware.api.schemas import ErrorResponse
+from myloware.api.sse import run_events_response
 from myloware.config import settings
 from myloware.config.provider_modes import effective_remotion_provider
 from myloware.llama_clients import get_sync_client
 from myloware.observability.logging import get_logger
 from myloware.safety import check_brief_safety
+from myloware.services.run_events import RunEvent, notify_run_changed
+from myloware.storage.database import get_async_session_factory
 from myloware.storage.models import ArtifactType, RunStatus
 from myloware.storage.repositories import ArtifactRepository, JobRepository, RunRepository
 from myloware.workers.job_types import JOB_RUN_EXECUTE, idempotency_run_execute
@@ -37,6 +44,51 @@ limiter = Limiter(key_func=key_api_key_or_ip)
 
 _SAFE_VIDEO_ID = re.compile(r"^[A-Za-z0-9_-]+$")
 
+STATUS_CACHE = Counter(
+    "myloware_public_demo_status_cache_total",
+    "Public demo status view cache lookups",
+    ["result"],
+)
+RENDER_PROGRESS_LOOKUPS = Counter(
+    "myloware_public_demo_render_progress_total",
+    "Remotion render progress lookups (fetch = Remotion call, hit/shared = served from cache)",
+    ["result"],
+)
+
+# run id -> (run/artifact stamp, status view without render progress)
+_status_cache: TTLCache | None = None
+# render job id -> (render status, percent)
+_render_progress_cache: TTLCache | None = None
+_render_progress_inflight: dict[str, asyncio.Future[tuple[str | None, int | None]]] = {}
+
+
+def _get_status_cache() -> TTLCache | None:
+    global _status_cache
+    max_entries = int(getattr(settings, "public_demo_status_cache_max_entries", 0) or 0)
+    if max_entries <= 0:
+        return None
+    if _status_cache is None:
+        ttl = float(getattr(settings, "public_demo_status_cache_ttl_seconds", 300.0))
+        _status_cache = TTLCache(maxsize=max_entries, ttl=ttl)
+    return _status_cache
+
+
+def _get_render_progress_cache() -> TTLCache | None:
+    global _render_progress_cache
+    ttl = float(getattr(settings, "public_demo_render_progress_ttl_seconds", 0.0) or 0.0)
+    if ttl <= 0:
+        return None
+    if _render_progress_cache is None:
+        _render_progress_cache = TTLCache(maxsize=1024, ttl=ttl)
+    return _render_progress_cache
+
+
+def clear_public_demo_caches() -> None:
+    """Drop cached status views and render progress (tests, manual fixes)."""
+    global _status_cache, _render_progress_cache
+    _status_cache = None
+    _render_progress_cache = None
+
 
 class PublicDemoStartRequest(BaseModel):
     """Request to start a public demo run."""
@@ -104,10 +156,11 @@ def _gate_from_status(status: str | None) -> str | None:
     return None
 
 
-async def _build_public_demo_response(
+async def _build_public_demo_view(
     run: Any,
     artifact_repo: ArtifactRepository,
 ) -> PublicDemoRunResponse:
+    """Status view from the run row and its artifacts (no live render progress)."""
     max_preview_chars = 18_000
 
     published_url = None
@@ -254,43 +307,6 @@ async def _build_public_demo_response(
             render_job_id = job_id
             break
 
-    render_status: str | None = None
-    render_progress_percent: int | None = None
-    if (
-        render_job_id
-        and effective_remotion_provider(settings) == "real"
-        and getattr(settings, "remotion_service_url", None)
-    ):
-        try:
-            base_url = str(getattr(settings, "remotion_service_url") or "").rstrip("/")
-            if base_url:
-                headers: dict[str, str] = {}
-                secret = str(getattr(settings, "remotion_api_secret", "") or "").strip()
-                if secret:
-                    headers = {"Authorization": f"Bearer {secret}", "x-api-key": secret}
-                async with httpx.AsyncClient(timeout=5.0) as client:
-                    resp = await client.get(
-                        f"{base_url}/api/render/{render_job_id}",
-                        headers=headers or None,
-                    )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    status_value = data.get("status")
-                    if isinstance(status_value, str) and status_value:
-                        render_status = status_value
-                    progress_raw = data.get("progress")
-                    if progress_raw is not None:
-                        try:
-                            # Remotion returns 0..1 float; normalize to int percent for UI.
-                            render_progress_percent = int(
-                                max(0.0, min(1.0, float(progress_raw))) * 100
-                            )
-                        except Exception:
-                            render_progress_percent = None
-        except Exception:
-            render_status = None
-            render_progress_percent = None
-
     return PublicDemoRunResponse(
         status=run.status,
         current_step=run.current_step,
@@ -300,8 +316,6 @@ async def _build_public_demo_response(
         published_url=published_url,
         rendered_video_url=rendered_video_url,
         render_job_id=render_job_id,
-        render_status=render_status,
-        render_progress_percent=render_progress_percent,
         ideas_markdown=ideas_markdown,
         clip_count=clip_count,
         expected_clip_count=expected_clip_count,
@@ -312,6 +326,128 @@ async def _build_public_demo_response(
     )
 
 
+async def _fetch_render_progress(render_job_id: str) -> tuple[str | None, int | None]:
+    """Ask the Remotion service for a render's (status, percent); (None, None) on failure."""
+    render_status: str | None = None
+    render_progress_percent: int | None = None
+    try:
+        base_url = str(getattr(settings, "remotion_service_url") or "").rstrip("/")
+        if base_url:
+            headers: dict[str, str] = {}
+            secret = str(getattr(settings, "remotion_api_secret", "") or "").strip()
+            if secret:
+                headers = {"Authorization": f"Bearer {secret}", "x-api-key": secret}
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                resp = await client.get(
+                    f"{base_url}/api/render/{render_job_id}",
+                    headers=headers or None,
+                )
+            if resp.status_code == 200:
+                data = resp.json()
+                status_value = data.get("status")
+                if isinstance(status_value, str) and status_value:
+                    render_status = status_value
+                progress_raw = data.get("progress")
+                if progress_raw is not None:
+                    try:
+                        # Remotion returns 0..1 float; normalize to int percent for UI.
+                        render_progress_percent = int(max(0.0, min(1.0, float(progress_raw))) * 100)
+                    except Exception:
+                        render_progress_percent = None
+    except Exception:
+        render_status = None
+        render_progress_percent = None
+    return render_status, render_progress_percent
+
+
+async def _get_render_progress(render_job_id: str) -> tuple[str | None, int | None]:
+    """Render progress shared by all pollers for ``public_demo_render_progress_ttl_seconds``.
+
+    Concurrent cache misses for the same job wait on a single Remotion request.
+    """
+    cache = _get_render_progress_cache()
+    if cache is not None and render_job_id in cache:
+        RENDER_PROGRESS_LOOKUPS.labels(result="hit").inc()
+        return cache[render_job_id]
+
+    pending = _render_progress_inflight.get(render_job_id)
+    if pending is not None:
+        RENDER_PROGRESS_LOOKUPS.labels(result="shared").inc()
+        return await asyncio.shield(pending)
+
+    RENDER_PROGRESS_LOOKUPS.labels(result="fetch").inc()
+    pending = asyncio.ensure_future(_fetch_render_progress(render_job_id))
+    _render_progress_inflight[render_job_id] = pending
+    try:
+        result = await asyncio.shield(pending)
+    finally:
+        _render_progress_inflight.pop(render_job_id, None)
+    if cache is not None:
+        cache[render_job_id] = result
+    return result
+
+
+def _run_stamp(run: Any, artifact_stamp: tuple[int, datetime | None]) -> tuple[Any, ...]:
+    count, latest = artifact_stamp
+    return (
+        run.status,
+        run.current_step,
+        run.updated_at.isoformat() if run.updated_at else None,
+        count,
+        latest.isoformat() if latest else None,
+    )
+
+
+async def _build_public_demo_response(
+    run: Any,
+    artifact_repo: ArtifactRepository,
+) -> PublicDemoRunResponse:
+    """Status view for a run, reusing the cached view while the run and its artifacts are unchanged.
+
+    Only live Remotion render progress is looked up per call (through the shared TTL cache).
+    """
+    cache = _get_status_cache()
+    view: PublicDemoRunResponse | None = None
+    stamp: tuple[Any, ...] | None = None
+    if cache is not None:
+        stamp = _run_stamp(run, await artifact_repo.get_run_stamp_async(run.id))
+        cached = cache.get(run.id)
+        if cached is not None and cached[0] == stamp:
+            STATUS_CACHE.labels(result="hit").inc()
+            view = cached[1]
+        else:
+            STATUS_CACHE.labels(result="miss").inc()
+    if view is None:
+        view = await _build_public_demo_view(run, artifact_repo)
+        if cache is not None:
+            cache[run.id] = (stamp, view)
+
+    if (
+        view.render_job_id
+        and effective_remotion_provider(settings) == "real"
+        and getattr(settings, "remotion_service_url", None)
+    ):
+        render_status, render_progress_percent = await _get_render_progress(view.render_job_id)
+        return view.model_copy(
+            update={
+                "render_status": render_status,
+                "render_progress_percent": render_progress_percent,
+            }
+        )
+    return view
+
+
+def _response_etag(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.post(
     "/start",
     response_model=PublicDemoStartResponse,
@@ -407,13 +543,14 @@ async def public_demo_start(
 @router.get(
     "/runs/{public_token}",
     response_model=PublicDemoRunResponse,
-    responses={404: {"model": ErrorResponse}},
+    responses={304: {"description": "Not modified (If-None-Match)"}, 404: {"model": ErrorResponse}},
 )
 async def public_demo_status(
     public_token: str,
+    if_none_match: Optional[str] = Header(default=None),
     run_repo: RunRepository = Depends(get_async_run_repo),
     artifact_repo: ArtifactRepository = Depends(get_async_artifact_repo),
-) -> PublicDemoRunResponse:
+) -> Response:
     _require_public_demo_enabled()
 
     run = await run_repo.get_by_public_token_async(public_token)
@@ -425,7 +562,56 @@ async def public_demo_status(
         if datetime.now(timezone.utc) > expires_at:
             raise HTTPException(status_code=404, detail="Run not found")
 
-    return await _build_public_demo_response(run, artifact_repo)
+    payload = await _build_public_demo_response(run, artifact_repo)
+    body = payload.model_dump_json().encode()
+    etag = _response_etag(body)
+    # no-cache: clients may store the response but must revalidate with If-None-Match.
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _public_run_event(event: RunEvent) -> RunEvent:
+    """Strip internal identifiers and URIs from events sent to demo visitors."""
+    data = event.data
+    if event.event == "status":
+        return RunEvent(
+            "status",
+            {
+                "status": data.get("status"),
+                "current_step": data.get("current_step"),
+                "gate": _gate_from_status(data.get("status")),
+                "error": data.get("error"),
+                "updated_at": data.get("updated_at"),
+            },
+        )
+    if event.event == "artifact":
+        return RunEvent(
+            "artifact",
+            {"artifact_type": data.get("artifact_type"), "created_at": data.get("created_at")},
+        )
+    return RunEvent(event.event, {})
+
+
+@router.get("/runs/{public_token}/events", responses={404: {"model": ErrorResponse}})
+async def public_demo_events(request: Request, public_token: str) -> StreamingResponse:
+    """Server-sent status/artifact events for a demo run (replaces status polling)."""
+    _require_public_demo_enabled()
+
+    # Own short-lived session: a repo dependency would hold its connection until
+    # the stream ends (see runs.run_events).
+    async with get_async_session_factory()() as session:
+        run = await RunRepository(session).get_by_public_token_async(public_token)
+    if run is None or not run.public_demo:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    if run.public_expires_at is not None:
+        expires_at = run.public_expires_at.replace(tzinfo=timezone.utc)
+        if datetime.now(timezone.utc) > expires_at:
+            raise HTTPException(status_code=404, detail="Run not found")
+
+    return run_events_response(request, run.id, project=_public_run_event)
 
 
 @router.post(
@@ -483,6 +669,7 @@ async def public_demo_approve(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    notify_run_changed(run.id)
     await run_repo.session.refresh(run)
     return await _build_public_demo_response(run, artifact_repo)
 
@@ -542,6 +729,7 @@ async def public_demo_reject(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
+    notify_run_changed(run.id)
     await run_repo.session.refresh(run)
     return await _build_public_demo_response(run, artifact_repo)
 
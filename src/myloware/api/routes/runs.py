@@ -6,12 +6,12 @@ They dispatch work to LangGraph in-process (dev) or via the DB job queue (scale)
 
 from __future__ import annotations
 
-import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from llama_stack_client import AsyncLlamaStackClient
 from pydantic import BaseModel, Field
 from slowapi import Limiter
@@ -20,10 +20,12 @@ from myloware.api.dependencies import get_async_llama_client, get_vector_db_id
 from myloware.api.dependencies_async import get_async_run_repo
 from myloware.api.rate_limit import key_api_key_or_ip
 from myloware.api.schemas import ErrorResponse, RunDetailResponse
+from myloware.api.sse import run_events_response
 from myloware.config import settings
 from myloware.llama_clients import get_sync_client
 from myloware.observability.logging import get_logger
 from myloware.safety import check_brief_safety
+from myloware.storage.database import get_async_session_factory
 from myloware.storage.repositories import JobRepository, RunRepository
 from myloware.workers.job_types import JOB_RUN_EXECUTE, idempotency_run_execute
 from myloware.workflows.langgraph.workflow import run_workflow_async
@@ -90,7 +92,8 @@ async def start_run(
     Returns immediately with the run_id.
     """
     try:
-        # Simple cost/rate guard using run counts over last 24h (UTC to avoid tz drift)
+        # Simple cost/rate guard over the last 24h (UTC to avoid tz drift); counts
+        # come from hourly counters, not a COUNT(*) over the runs table.
         now = datetime.now(timezone.utc)
         window_start = now - timedelta(hours=24)
         recent_count = 0
@@ -101,6 +104,13 @@ async def start_run(
                 status_code=429,
                 detail="Run budget exceeded (max_runs_last_24h). Please retry later.",
             )
+        if settings.max_runs_per_user_last_24h and body.user_id:
+            user_count = await run_repo.count_runs_since_async(window_start, user_id=body.user_id)
+            if user_count >= settings.max_runs_per_user_last_24h:
+                raise HTTPException(
+                    status_code=429,
+                    detail="Run budget exceeded for this user (max_runs_per_user_last_24h).",
+                )
         estimated_cost = (recent_count + 1) * settings.estimated_cost_per_run_usd
         if settings.daily_cost_budget_usd and estimated_cost > settings.daily_cost_budget_usd:
             raise HTTPException(
@@ -156,38 +166,10 @@ async def start_run(
                     vector_db_id=vector_db_id,
                 )
 
-        # Commit run (+ job) before returning so it is visible to workers
+        # One commit covers the run, its budget counters and the run.execute job,
+        # so once we return the run is visible to any worker that claims the job.
         await run_repo.session.commit()
 
-        if not settings.skip_run_visibility_check:
-            # Verify the run is visible in a new async session before starting background task.
-            from myloware.storage.database import get_async_session_factory
-
-            verify_session_factory = get_async_session_factory()
-            verify_run = None
-            max_attempts = 10
-            for attempt in range(max_attempts):
-                async with verify_session_factory() as verify_session:
-                    from myloware.storage.repositories import RunRepository as VerifyRunRepo
-
-                    verify_repo = VerifyRunRepo(verify_session)
-                    verify_run = await verify_repo.get_async(run_id)
-                    if verify_run is not None:
-                        break
-                if verify_run is None and attempt < max_attempts - 1:
-                    await asyncio.sleep(0.05)
-
-            if verify_run is None:
-                logger.error(
-                    "Run %s not visible after commit after %d attempts, cannot start workflow",
-                    run_id,
-                    max_attempts,
-                )
-                raise HTTPException(
-                    status_code=500,
-                    detail="Failed to verify run creation. Please try again.",
-                )
-
         return StartRunResponse(run_id=str(run_id), status="pending")
 
     except FileNotFoundError as exc:
@@ -221,6 +203,21 @@ async def get_run(
     )
 
 
+@router.get("/{run_id}/events", responses={404: {"model": ErrorResponse}})
+async def run_events(request: Request, run_id: UUID) -> StreamingResponse:
+    """Stream run status, current step and new artifacts as server-sent events.
+
+    The run is looked up in a short-lived session rather than through
+    get_async_run_repo: a yield dependency is torn down only after the response
+    body finishes, so it would pin a pooled connection for the whole stream.
+    """
+    async with get_async_session_factory()() as session:
+        run = await RunRepository(session).get_async(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return run_events_response(request, run.id)
+
+
 __all__ = [
     "router",
     "StartRunRequest",
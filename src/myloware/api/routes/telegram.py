@@ -10,21 +10,20 @@ from uuid import UUID
 from cachetools import TTLCache  # type: ignore
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.concurrency import run_in_threadpool
-from llama_stack_client import LlamaStackClient
-
-from myloware.api.dependencies import (
-    get_artifact_repo,
-    get_llama_client,
-    get_run_repo,
-    get_vector_db_id,
-)
+from llama_stack_client import AsyncLlamaStackClient
+
+from myloware.api.dependencies import get_async_llama_client
 from myloware.api.schemas import CallbackResponse, ErrorResponse, TelegramWebhookResponse
-from myloware.agents.supervisor import create_supervisor_agent
+from myloware.agents.supervisor import create_async_supervisor_agent
 from myloware.config import settings
 from myloware.notifications.telegram import TelegramNotifier
 from myloware.observability.logging import get_logger
-from myloware.storage.repositories import ArtifactRepository, RunRepository
+from myloware.resilience.registry import get_guard
+from myloware.workflows.langgraph.agent_io import (
+    agent_session_async,
+    create_turn_collecting_tool_responses_async,
+    extract_content,
+)
 from myloware.workflows.langgraph.hitl import resume_hitl_gate
 
 logger = get_logger(__name__)
@@ -86,12 +85,13 @@ async def send_telegram_message(
 
     async def _post(active_client: httpx.AsyncClient) -> bool:
         try:
-            resp = await active_client.post(
-                f"https://api.telegram.org/bot{token}/sendMessage",
-                json=payload,
-                timeout=10,
-            )
-            resp.raise_for_status()
+            async with get_guard("telegram", "send_message").protect_async():
+                resp = await active_client.post(
+                    f"https://api.telegram.org/bot{token}/sendMessage",
+                    json=payload,
+                    timeout=10,
+                )
+                resp.raise_for_status()
             logger.info("Sent Telegram message", extra={"chat_id": _redact_chat_id(chat_id)})
             return True
         except Exception as exc:
@@ -133,7 +133,7 @@ async def _answer_callback(callback_id: str | None, text: str) -> None:
 )
 async def telegram_webhook(
     request: Request,
-    client: LlamaStackClient = Depends(get_llama_client),
+    async_client: AsyncLlamaStackClient = Depends(get_async_llama_client),
 ) -> TelegramWebhookResponse:
     """Receive and process Telegram webhook messages."""
 
@@ -182,35 +182,17 @@ async def telegram_webhook(
         return TelegramWebhookResponse(ok=True, status="ignored", reason="duplicate")
 
     try:
-        supervisor = await run_in_threadpool(create_supervisor_agent, client)
-        session_id = f"telegram-{chat_id}"
-
-        # Create session for supervisor
-        actual_session_id = await run_in_threadpool(supervisor.create_session, session_id)
-
-        try:
-            response = await run_in_threadpool(
-                supervisor.create_turn,
-                messages=[{"role": "user", "content": f"From {username}: {message_text}"}],
-                session_id=actual_session_id,
+        supervisor = create_async_supervisor_agent(async_client)
+        session_name = f"telegram-{chat_id}"
+
+        async with agent_session_async(async_client, supervisor, session_name) as session_id:
+            response, _tool_responses = await create_turn_collecting_tool_responses_async(
+                supervisor,
+                [{"role": "user", "content": f"From {username}: {message_text}"}],
+                session_id,
             )
             content = getattr(response, "completion_message", None)
-            text = getattr(content, "content", "") if content else str(response)
-        finally:
-            # Clean up session (official Llama Stack pattern)
-            try:
-                await run_in_threadpool(
-                    client.conversations.delete, conversation_id=actual_session_id
-                )
-            except Exception as cleanup_exc:
-                logger.debug(
-                    "Failed to delete conversation during cleanup",
-                    extra={
-                        "conversation_id": actual_session_id,
-                        "error": str(cleanup_exc),
-                        "error_type": type(cleanup_exc).__name__,
-                    },
-                )
+            text = getattr(content, "content", "") if content else extract_content(response)
     except Exception as exc:  # pragma: no cover - defensive
         logger.exception("Supervisor handling failed: %s", exc)
         text = "Sorry, something went wrong processing your request."
@@ -221,13 +203,7 @@ async def telegram_webhook(
 
 
 @router.post("/callback", response_model=CallbackResponse)
-async def telegram_callback(
-    request: Request,
-    run_repo: RunRepository = Depends(get_run_repo),
-    artifact_repo: ArtifactRepository = Depends(get_artifact_repo),
-    client: LlamaStackClient = Depends(get_llama_client),
-    vector_db_id: str = Depends(get_vector_db_id),
-) -> CallbackResponse:
+async def telegram_callback(request: Request) -> CallbackResponse:
     """Handle Telegram callback queries (inline button clicks)."""
 
     try:
@@ -264,12 +240,6 @@ async def telegram_callback(
                 return CallbackResponse(ok=True, error="unknown_gate")
 
             if settings.workflow_dispatcher == "db" and not settings.disable_background_workflows:
-                # Commit gate audit updates before enqueueing async resume work.
-                try:
-                    run_repo.session.commit()
-                except Exception:
-                    logger.warning("Failed to commit gate approval before enqueue", exc_info=True)
-
                 from myloware.storage.database import get_async_session_factory
                 from myloware.storage.repositories import JobRepository
                 from myloware.workers.job_types import JOB_LANGGRAPH_HITL_RESUME
@@ -333,11 +303,6 @@ async def telegram_callback(
                 return CallbackResponse(ok=True, error="unknown_gate")
 
             if settings.workflow_dispatcher == "db" and not settings.disable_background_workflows:
-                try:
-                    run_repo.session.commit()
-                except Exception:
-                    logger.warning("Failed to commit gate rejection before enqueue", exc_info=True)
-
                 from myloware.storage.database import get_async_session_factory
                 from myloware.storage.repositories import JobRepository
                 from myloware.workers.job_types import JOB_LANGGRAPH_HITL_RESUME
@@ -31,8 +31,8 @@ from myloware.config.settings import settings
 from myloware.observability.logging import get_logger
 from myloware.services.openai_videos import download_openai_video_content_to_tempfile
 from myloware.services.remotion_urls import normalize_remotion_output_url
-from myloware.services.transcode import transcode_video
-from myloware.storage.models import ArtifactType, RunStatus
+from myloware.services.transcode import clip_preview_metadata, transcode_video
+from myloware.storage.models import ArtifactKeyKind, ArtifactType, RunStatus
 from myloware.storage.repositories import ArtifactRepository, JobRepository, RunRepository
 from myloware.workers.job_types import (
     JOB_WEBHOOK_REMOTION,
@@ -180,7 +180,7 @@ async def _lookup_task_metadata(
     import json
 
     try:
-        artifacts = await artifact_repo.get_by_run_async(run_id)
+        artifacts = await artifact_repo.get_by_run_async(run_id, with_content=True)
         manifests = [
             a
             for a in artifacts
@@ -749,6 +749,7 @@ async def sora_webhook(
         if cache_meta:
             artifact_metadata.update(cache_meta)
             logger.info("Retrieved cache metadata for task %s from stored mapping", task_id)
+    artifact_metadata.update(clip_preview_metadata(run_id, video_index))
 
     await artifact_repo.create_async(
         run_id=run_id,
@@ -756,6 +757,7 @@ async def sora_webhook(
         artifact_type=ArtifactType.VIDEO_CLIP,
         uri=video_url,
         metadata=artifact_metadata,
+        keys=[(ArtifactKeyKind.CLIP_URL, video_url)],
     )
 
     run = await run_repo.get_for_update_async(run_id)
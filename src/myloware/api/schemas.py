@@ -17,6 +17,9 @@ class HealthResponse(BaseModel):
     degraded_mode: bool = False
     provider_modes: Dict[str, str] = Field(default_factory=dict)
     knowledge_base_healthy: Optional[bool] = None
+    knowledge_base_status: Optional[str] = Field(
+        None, description="Startup KB sync state: pending, ready, skipped or failed"
+    )
     shields_available: Optional[bool] = None
     vector_db_id: Optional[str] = None
     render_sandbox_enabled: Optional[bool] = None
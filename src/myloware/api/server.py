@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Awaitable, Callable
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable
 from uuid import uuid4
 
 import os
 
+import anyio
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.requests import Request
@@ -23,7 +25,7 @@ from prometheus_client import Counter, Histogram
 from myloware.api import routes
 from myloware.api.dependencies import api_key_header, verify_api_key
 from myloware.api.errors import DomainError, to_http_exception
-from myloware.api.middleware.safety import safety_shield_middleware
+from myloware.api.middleware.safety import compile_safety_policies, safety_shield_middleware
 from myloware.api.routes import admin, chat, langgraph, media, public_demo, runs, telegram, webhooks
 from myloware.api.routes import metrics as metrics_route
 from myloware.app_version import get_app_version
@@ -34,10 +36,13 @@ from myloware.knowledge.loader import (
     load_manifest,
     save_manifest,
 )
-from myloware.knowledge.setup import get_existing_vector_store, setup_project_knowledge
+from myloware.knowledge.setup import get_existing_vector_store, sync_project_knowledge
 from myloware.llama_clients import get_sync_client
+from myloware.observability.audit import start_audit_writer, stop_audit_writer
 from myloware.observability.logging import logger, request_id_var
-from myloware.storage.database import init_async_db, init_db
+from myloware.storage.database import QueryStats, init_async_db, init_db, track_queries
+from myloware.services.run_events import reset_run_event_hub
+from myloware.tools.loop import shutdown_tool_loop
 
 limiter = Limiter(key_func=key_api_key_or_ip)
 
@@ -62,6 +67,18 @@ REQUEST_LATENCY = Histogram(
     buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10),
     labelnames=["path"],
 )
+REQUEST_DB_STATEMENTS = Histogram(
+    "myloware_http_request_db_statements",
+    "SQL statements issued per HTTP request",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250),
+    labelnames=["path"],
+)
+REQUEST_DB_SECONDS = Histogram(
+    "myloware_http_request_db_seconds",
+    "Time spent executing SQL per HTTP request",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+    labelnames=["path"],
+)
 
 
 def _metrics_path(request: Request) -> str:
@@ -97,7 +114,11 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded) -> JSONRe
 
 
 def _load_knowledge_documents(project_id: str) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-    """Load knowledge docs with filters, hashing, and manifest tracking."""
+    """Load knowledge docs with filters, hashing, and manifest tracking.
+
+    The manifest is saved by the caller once the vector store has been synced,
+    so a failed ingest is retried on the next start.
+    """
 
     prev_manifest = load_manifest()
     docs, manifest = load_documents_with_manifest(
@@ -106,7 +127,6 @@ def _load_knowledge_documents(project_id: str) -> tuple[list[dict[str, Any]], di
     manifest["unchanged"] = bool(
         prev_manifest and prev_manifest.get("hash") == manifest.get("hash")
     )
-    save_manifest(manifest)
 
     doc_dicts = [
         {
@@ -124,6 +144,149 @@ def _load_knowledge_documents(project_id: str) -> tuple[list[dict[str, Any]], di
     return doc_dicts, manifest
 
 
+def _setup_knowledge_base() -> dict[str, Any]:
+    """Sync the knowledge base, register toolgroups and check shields.
+
+    Blocking (sync client, file hashing, uploads); run it in a worker thread.
+    Returns the ``app.state`` updates for the caller to apply on the event
+    loop, so an abandoned thread never touches app state. Raises if RAG cannot
+    be made available.
+    """
+    state: dict[str, Any] = {}
+    client = get_sync_client()
+    project_id = settings.project_id
+    previous_manifest = load_manifest()
+    documents, manifest = _load_knowledge_documents(project_id)
+    logger.info(
+        "KB scan complete: files=%d, docs_loaded=%d, hash=%s, unchanged=%s",
+        len(manifest.get("files", [])),
+        len(documents),
+        manifest.get("hash"),
+        manifest.get("unchanged"),
+    )
+
+    if settings.kb_skip_ingest_on_start:
+        store_name = f"project_kb_{project_id}"
+        existing_store = get_existing_vector_store(client, store_name)
+        state["vector_db_id"] = existing_store or store_name
+        state["knowledge_base_healthy"] = False
+        state["knowledge_base_error"] = "KB ingestion skipped by KB_SKIP_INGEST_ON_START"
+        logger.warning("KB ingestion skipped on start; vector_db_id=%s", state["vector_db_id"])
+    else:
+        # Only the added/changed/deleted files touch the vector store.
+        sync = sync_project_knowledge(
+            client,
+            project_id,
+            documents,
+            manifest,
+            previous=previous_manifest,
+        )
+        save_manifest(sync.manifest)
+        vector_db_id = sync.vector_store_id
+
+        state["vector_db_id"] = vector_db_id
+        state["knowledge_base_healthy"] = True
+        state["knowledge_base_error"] = None
+        logger.info("Knowledge base ready: %s (project: %s)", vector_db_id, project_id)
+
+    # Register RAG toolgroup (required for file_search tools)
+    try:
+        client.toolgroups.register(
+            toolgroup_id="builtin::rag",
+            provider_id="rag-runtime",
+        )
+        logger.info("Registered RAG toolgroup (rag-runtime)")
+    except Exception as rag_exc:
+        # RAG is a hard dependency in real environments; fail so readiness never
+        # reports a degraded state with missing file_search tooling.
+        error_msg = f"Failed to register RAG toolgroup: {rag_exc}"
+        logger.error(error_msg)
+        raise RuntimeError(error_msg) from rag_exc
+
+    # Register web search tool if Brave API key is configured
+    if settings.brave_api_key:
+        try:
+            client.toolgroups.register(
+                toolgroup_id="builtin::websearch",
+                provider_id="brave-search",
+                args={"max_results": 5},
+            )
+            logger.info("Registered web search toolgroup (brave-search)")
+        except Exception as tool_exc:
+            logger.warning("Failed to register web search toolgroup: %s", tool_exc)
+    else:
+        logger.info("Skipping web search toolgroup (BRAVE_API_KEY not set)")
+
+    # Safety shields are registered in llama_stack/run-milvus.yaml
+    # Just verify they're available
+    try:
+        shields = client.shields.list()
+        if hasattr(shields, "data"):
+            shield_list = shields.data
+        elif isinstance(shields, list):
+            shield_list = shields
+        else:
+            shield_list = []
+        expected_shield_id = settings.content_safety_shield_id
+        content_safety_exists = any(s.identifier == expected_shield_id for s in shield_list)
+        if content_safety_exists:
+            logger.info("Safety shield available: %s (registered in YAML)", expected_shield_id)
+            state["shields_available"] = True
+        else:
+            logger.warning("Safety shield not found: %s", expected_shield_id)
+            state["shields_available"] = False
+    except Exception as shield_exc:
+        logger.warning("Failed to check safety shields: %s", shield_exc)
+        state["shields_available"] = False
+
+    return state
+
+
+async def _knowledge_startup_async(app: FastAPI, *, raise_on_error: bool) -> None:
+    """Run knowledge base setup off the event loop and record its outcome.
+
+    ``app.state.knowledge_base_status`` moves from ``pending`` to ``ready`` or
+    ``skipped``; /health/ready and RAG-dependent routes read it. A failure sets
+    ``failed``: with ``raise_on_error`` it is re-raised (startup aborts),
+    otherwise setup is retried with exponential backoff until it succeeds, so
+    a transient Llama Stack outage at boot does not leave the pod unready.
+    """
+    start = time.monotonic()
+    delay = settings.kb_setup_retry_initial_seconds
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            updates = await anyio.to_thread.run_sync(_setup_knowledge_base, abandon_on_cancel=True)
+            break
+        except Exception as exc:
+            error_msg = f"Knowledge base setup failed: {exc}"
+            logger.error(error_msg)
+            app.state.vector_db_id = f"project_kb_{settings.project_id}"
+            app.state.knowledge_base_healthy = False
+            app.state.knowledge_base_error = error_msg
+            app.state.knowledge_base_status = "failed"
+            # RAG is mandatory outside of fake-provider mode; never serve RAG degraded.
+            if raise_on_error:
+                raise RuntimeError(error_msg) from exc
+        logger.warning("Retrying knowledge base setup in %.1fs (attempt %d)", delay, attempt + 1)
+        await asyncio.sleep(delay)
+        if app.state.knowledge_base_status == "ready":
+            # An /admin/kb/reload succeeded in the meantime.
+            return
+        delay = min(delay * 2, settings.kb_setup_retry_max_seconds)
+
+    for name, value in updates.items():
+        setattr(app.state, name, value)
+    app.state.knowledge_base_status = "skipped" if settings.kb_skip_ingest_on_start else "ready"
+    logger.info(
+        "Knowledge base startup finished: status=%s, attempts=%d, seconds=%.2f",
+        app.state.knowledge_base_status,
+        attempt,
+        time.monotonic() - start,
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan - setup knowledge base and LangGraph checkpointer on startup."""
@@ -132,6 +295,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     init_observability()
     logger.info("Starting MyloWare API...")
 
+    # Buffered audit log writer on this loop (drained on shutdown).
+    start_audit_writer()
+
     # LangGraph engine lifecycle (explicit; stored on app.state for handlers).
     if settings.use_langgraph_engine:
         from myloware.workflows.langgraph.graph import LangGraphEngine, set_langgraph_engine
@@ -186,6 +352,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 raise
 
     llama_mode = effective_llama_stack_provider(settings)
+    app.state.knowledge_base_task = None
 
     # Skip knowledge base setup when Llama Stack is not real (tests/dev stubs).
     if llama_mode != "real":
@@ -193,109 +360,32 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app.state.vector_db_id = f"project_kb_{settings.project_id}"
         app.state.knowledge_base_healthy = True  # Expected in dev mode
         app.state.shields_available = True  # assume dev shields mocked
+        app.state.knowledge_base_status = "ready"
+    elif settings.kb_setup_in_background:
+        # Serve non-RAG routes (health, webhooks, run status, media) right away;
+        # /health/ready and RAG routes wait for the sync to finish.
+        app.state.vector_db_id = f"project_kb_{settings.project_id}"
+        app.state.knowledge_base_status = "pending"
+        app.state.knowledge_base_task = asyncio.create_task(
+            _knowledge_startup_async(app, raise_on_error=False)
+        )
     else:
-        # Setup knowledge base - always auto-discover/create by name
-        try:
-            client = get_sync_client()
-            project_id = settings.project_id
-            documents, manifest = _load_knowledge_documents(project_id)
-            logger.info(
-                "KB scan complete: files=%d, docs_loaded=%d, hash=%s, unchanged=%s",
-                len(manifest.get("files", [])),
-                len(documents),
-                manifest.get("hash"),
-                manifest.get("unchanged"),
-            )
-
-            store_name = f"project_kb_{project_id}"
-            existing_store = get_existing_vector_store(client, store_name)
-
-            if settings.kb_skip_ingest_on_start:
-                app.state.vector_db_id = existing_store or store_name
-                app.state.knowledge_base_healthy = False
-                app.state.knowledge_base_error = "KB ingestion skipped by KB_SKIP_INGEST_ON_START"
-                logger.warning(
-                    "KB ingestion skipped on start; vector_db_id=%s", app.state.vector_db_id
-                )
-            else:
-                # If unchanged and store exists, skip ingest
-                if manifest.get("unchanged") and existing_store:
-                    vector_db_id = existing_store
-                    logger.info("KB unchanged; reusing existing vector store %s", vector_db_id)
-                else:
-                    vector_db_id = setup_project_knowledge(
-                        client, project_id, documents=documents if documents else None
-                    )
-
-                app.state.vector_db_id = vector_db_id
-                app.state.knowledge_base_healthy = True
-                logger.info("Knowledge base ready: %s (project: %s)", vector_db_id, project_id)
-
-            # Register RAG toolgroup (required for file_search tools)
-            try:
-                client.toolgroups.register(
-                    toolgroup_id="builtin::rag",
-                    provider_id="rag-runtime",
-                )
-                logger.info("Registered RAG toolgroup (rag-runtime)")
-            except Exception as rag_exc:
-                # RAG is a hard dependency in real environments; fail fast so we don't
-                # start in a degraded state with missing file_search tooling.
-                error_msg = f"Failed to register RAG toolgroup: {rag_exc}"
-                logger.error(error_msg)
-                raise RuntimeError(error_msg) from rag_exc
-
-            # Register web search tool if Brave API key is configured
-            if settings.brave_api_key:
-                try:
-                    client.toolgroups.register(
-                        toolgroup_id="builtin::websearch",
-                        provider_id="brave-search",
-                        args={"max_results": 5},
-                    )
-                    logger.info("Registered web search toolgroup (brave-search)")
-                except Exception as tool_exc:
-                    logger.warning("Failed to register web search toolgroup: %s", tool_exc)
-            else:
-                logger.info("Skipping web search toolgroup (BRAVE_API_KEY not set)")
-
-            # Safety shields are registered in llama_stack/run-milvus.yaml
-            # Just verify they're available
-            try:
-                shields = client.shields.list()
-                if hasattr(shields, "data"):
-                    shield_list = shields.data
-                elif isinstance(shields, list):
-                    shield_list = shields
-                else:
-                    shield_list = []
-                expected_shield_id = settings.content_safety_shield_id
-                content_safety_exists = any(s.identifier == expected_shield_id for s in shield_list)
-                if content_safety_exists:
-                    logger.info(
-                        "Safety shield available: %s (registered in YAML)", expected_shield_id
-                    )
-                    app.state.shields_available = True
-                else:
-                    logger.warning("Safety shield not found: %s", expected_shield_id)
-                    app.state.shields_available = False
-            except Exception as shield_exc:
-                logger.warning("Failed to check safety shields: %s", shield_exc)
-                app.state.shields_available = False
-
-        except Exception as exc:
-            error_msg = f"Knowledge base setup failed: {exc}"
-            logger.error(error_msg)
-            app.state.vector_db_id = f"project_kb_{settings.project_id}"
-            app.state.knowledge_base_error = error_msg
-
-            # RAG is mandatory outside of fake-provider mode; never continue degraded.
-            raise RuntimeError(error_msg) from exc
+        app.state.knowledge_base_status = "pending"
+        await _knowledge_startup_async(app, raise_on_error=True)
 
     yield
 
     logger.info("Shutting down MyloWare API...")
 
+    # Don't hold shutdown hostage to an unfinished KB sync.
+    kb_task = getattr(app.state, "knowledge_base_task", None)
+    if kb_task is not None and not kb_task.done():
+        kb_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await kb_task
+    app.state.knowledge_base_task = None
+    app.state.knowledge_base_status = "stopped"
+
     # Cleanup LangGraph async checkpointer
     if settings.use_langgraph_engine:
         try:
@@ -309,6 +399,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         except Exception as exc:
             logger.warning("Error closing LangGraph checkpointer: %s", exc)
 
+    # End open run event streams so their watchers stop polling
+    await reset_run_event_hub()
+
+    # Flush buffered audit events before the DB engines go away
+    await stop_audit_writer()
+
+    # Stop the sync→async tool bridge loop (no-op if no tool ever bridged)
+    await anyio.to_thread.run_sync(shutdown_tool_loop)
+
 
 app = FastAPI(
     title="MyloWare API",
@@ -327,6 +426,7 @@ if settings.public_demo_enabled and settings.public_demo_cors_origins:
         allow_headers=["*"],
     )
 
+compile_safety_policies()
 app.middleware("http")(safety_shield_middleware)
 
 
@@ -350,13 +450,10 @@ async def request_id_middleware(
     return response
 
 
-@app.middleware("http")
-async def timing_middleware(
-    request: Request,
-    call_next: Callable[[Request], Awaitable[Response]],
-) -> Response:
-    start = time.perf_counter()
-    response = await call_next(request)
+def _record_request(
+    request: Request, response: Response, start: float, db_stats: QueryStats
+) -> float:
+    """Observe request metrics and log completion; returns the duration in ms."""
     duration_ms = (time.perf_counter() - start) * 1000
     try:
         path_label = _metrics_path(request)
@@ -366,6 +463,8 @@ async def timing_middleware(
             status=response.status_code,
         ).inc()
         REQUEST_LATENCY.labels(path=path_label).observe(duration_ms / 1000.0)
+        REQUEST_DB_STATEMENTS.labels(path=path_label).observe(db_stats.statements)
+        REQUEST_DB_SECONDS.labels(path=path_label).observe(db_stats.seconds)
     except Exception as metrics_exc:  # pragma: no cover - metrics should not break requests
         logger.debug(
             "metrics_observe_failed",
@@ -379,7 +478,37 @@ async def timing_middleware(
         status=response.status_code,
         duration_ms=round(duration_ms, 2),
         request_id=request.headers.get("X-Request-ID"),
+        **db_stats.log_fields(),
     )
+    return duration_ms
+
+
+@app.middleware("http")
+async def timing_middleware(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    start = time.perf_counter()
+    with track_queries() as db_stats:
+        response = await call_next(request)
+
+    body = getattr(response, "body_iterator", None)
+    if body is not None and response.headers.get("content-type", "").startswith(
+        "text/event-stream"
+    ):
+        # The stream body runs after call_next returns (and its DB work is
+        # counted in db_stats), so observe the request once it has finished.
+        async def _observed() -> AsyncIterator[Any]:
+            try:
+                async for chunk in body:
+                    yield chunk
+            finally:
+                _record_request(request, response, start, db_stats)
+
+        response.body_iterator = _observed()  # type: ignore[attr-defined]
+        return response
+
+    duration_ms = _record_request(request, response, start, db_stats)
     response.headers["X-Response-Time-ms"] = f"{duration_ms:.2f}"
     return response
 
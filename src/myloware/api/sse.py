@@ -0,0 +1,63 @@
+"""Server-sent event responses for run event subscriptions."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Callable
+from uuid import UUID
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from myloware.config import settings
+from myloware.services.run_events import RunEvent, get_run_event_hub
+
+__all__ = ["run_events_response"]
+
+# Proxies (nginx) buffer text/event-stream unless told otherwise.
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+async def _stream(
+    request: Request,
+    run_id: UUID,
+    project: Callable[[RunEvent], RunEvent | None] | None,
+) -> AsyncIterator[str]:
+    subscription = get_run_event_hub().subscribe(run_id)
+    try:
+        yield f"retry: {int(settings.run_events_poll_interval_seconds * 1000) or 1000}\n\n"
+        while True:
+            if await request.is_disconnected():
+                break
+            try:
+                event = await subscription.get(timeout=settings.run_events_heartbeat_seconds)
+            except asyncio.TimeoutError:
+                # Keep-alive comment for SSE
+                yield ":keepalive\n\n"
+                continue
+            if event is None:
+                break
+            if project is not None:
+                event = project(event)
+                if event is None:
+                    continue
+            yield event.to_sse()
+    finally:
+        subscription.close()
+
+
+def run_events_response(
+    request: Request,
+    run_id: UUID,
+    *,
+    project: Callable[[RunEvent], RunEvent | None] | None = None,
+) -> StreamingResponse:
+    """Stream a run's ``status``/``artifact``/``end`` events as SSE.
+
+    ``project`` can rewrite or drop events (e.g. to hide fields from public clients).
+    """
+    return StreamingResponse(
+        _stream(request, run_id, project),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
@@ -12,6 +12,7 @@ from typing import Any
 
 from myloware.backends.protocols import SafetyCheckResult, VectorSearchHit
 from myloware.config import settings
+from myloware.knowledge.setup import cached_vector_search
 from myloware.llama_clients import get_async_client, get_sync_client
 
 
@@ -114,6 +115,7 @@ class LlamaStackBackend:
         search_mode: str = "vector",
         ranking_options: dict[str, Any] | None = None,
     ) -> list[VectorSearchHit]:
+        """Search a vector store; results are cached until the KB manifest changes."""
         client = self._sync()
         search_kwargs: dict[str, Any] = {
             "vector_store_id": vector_store_id,
@@ -125,25 +127,32 @@ class LlamaStackBackend:
         if ranking_options and search_mode == "hybrid":
             search_kwargs["ranking_options"] = ranking_options
 
-        response = client.vector_stores.search(**search_kwargs)  # type: ignore[attr-defined]
-        raw_results = list(getattr(response, "data", None) or [])
-
-        hits: list[VectorSearchHit] = []
-        for result in raw_results:
-            filename = getattr(result, "filename", None)
-            score = getattr(result, "score", None)
-            content = getattr(result, "content", None) or getattr(result, "text", None)
-            metadata = getattr(result, "metadata", None) or {}
-            hits.append(
-                VectorSearchHit(
-                    filename=str(filename) if filename is not None else None,
-                    score=float(score) if score is not None else None,
-                    content=str(content) if content is not None else None,
-                    metadata=dict(metadata) if isinstance(metadata, dict) else {},
-                )
-            )
-
-        return hits
+        def _search() -> list[VectorSearchHit]:
+            response = client.vector_stores.search(**search_kwargs)  # type: ignore[attr-defined]
+            return [_to_hit(result) for result in getattr(response, "data", None) or []]
+
+        return cached_vector_search(
+            _search,
+            namespace="hits",
+            vector_store_id=vector_store_id,
+            query=query,
+            max_results=max_results,
+            search_mode=search_mode,
+            ranking_options=ranking_options,
+        )
+
+
+def _to_hit(result: object) -> VectorSearchHit:
+    filename = getattr(result, "filename", None)
+    score = getattr(result, "score", None)
+    content = getattr(result, "content", None) or getattr(result, "text", None)
+    metadata = getattr(result, "metadata", None) or {}
+    return VectorSearchHit(
+        filename=str(filename) if filename is not None else None,
+        score=float(score) if score is not None else None,
+        content=str(content) if content is not None else None,
+        metadata=dict(metadata) if isinstance(metadata, dict) else {},
+    )
 
 
 def _extract_content(response: object) -> str:
@@ -64,7 +64,7 @@ def dev_test_agent(run_id: str) -> None:
 
     with get_session() as session:
         artifact_repo = ArtifactRepository(session)
-        artifacts = artifact_repo.get_by_run(run_uuid)
+        artifacts = artifact_repo.get_by_run(run_uuid, with_content=True)
 
         editor_artifacts = [
             a for a in artifacts if a.artifact_type == ArtifactType.EDITOR_OUTPUT.value
@@ -3,15 +3,18 @@
 from __future__ import annotations
 
 import builtins
+import json
 import time
 from typing import Any
 from uuid import UUID
 
 import anyio
 import click
+import httpx
 from rich.panel import Panel
 from rich.table import Table
 
+from myloware.config import settings
 from myloware.llama_clients import get_sync_client
 from myloware.storage.database import get_session
 from myloware.storage.models import ArtifactType, RunStatus
@@ -34,6 +37,43 @@ def list(limit: int) -> None:
     render_runs_table(recent_runs)
 
 
+def _watch_events(base_url: str, api_key: str, run_id: str) -> None:
+    """Follow the server's SSE stream for a run until it ends."""
+    url = f"{base_url.rstrip('/')}/v1/runs/{run_id}/events"
+    event_name = "message"
+    last_status: str | None = None
+    with httpx.stream(
+        "GET",
+        url,
+        headers={"X-API-Key": api_key, "Accept": "text/event-stream"},
+        timeout=httpx.Timeout(10.0, read=None),
+    ) as resp:
+        if resp.status_code == 404:
+            raise click.ClickException(f"Run {run_id} not found")
+        resp.raise_for_status()
+        for line in resp.iter_lines():
+            if line.startswith("event:"):
+                event_name = line.partition(":")[2].strip()
+                continue
+            if not line.startswith("data:"):
+                continue
+            data = json.loads(line.partition(":")[2])
+            if event_name == "status":
+                status = data.get("status") or ""
+                step = data.get("current_step")
+                suffix = f" [dim]({step})[/dim]" if step else ""
+                console.print(f"[bold]Status[/bold] {format_status(status)}{suffix}")
+                last_status = status
+            elif event_name == "artifact":
+                console.print(
+                    f"[dim]Artifact[/dim] {data.get('artifact_type')} "
+                    f"from {data.get('persona') or '-'}"
+                )
+            elif event_name == "end":
+                break
+    console.print(f"Run {run_id} finished with {format_status(last_status or '')}")
+
+
 @runs.command()
 @click.argument("run_id")
 @click.option(
@@ -41,10 +81,25 @@ def list(limit: int) -> None:
     default=2.0,
     show_default=True,
     type=float,
-    help="Poll interval in seconds",
+    help="Poll interval in seconds (database polling only)",
 )
-def watch(run_id: str, interval: float) -> None:
+@click.option(
+    "--base-url",
+    envvar="MYLOWARE_API_URL",
+    help="Stream events from a running API server instead of polling the database",
+)
+@click.option("--api-key", envvar="API_KEY", default=None, help="API key for --base-url")
+def watch(run_id: str, interval: float, base_url: str | None, api_key: str | None) -> None:
     """Watch a run until it reaches a terminal status."""
+    if base_url:
+        try:
+            _watch_events(base_url, api_key or settings.api_key, run_id)
+            return
+        except httpx.HTTPError as exc:
+            console.print(
+                f"[yellow]Event stream unavailable ({exc}); polling the database[/yellow]"
+            )
+
     with get_session() as session:
         repo = RunRepository(session)
         last_status: str | None = None
@@ -252,7 +307,7 @@ def artifacts(run_id: str) -> None:
 
     with get_session() as session:
         repo = ArtifactRepository(session)
-        artifacts_list = repo.get_by_run(run_uuid)
+        artifacts_list = repo.get_by_run(run_uuid, with_content=True)
 
         if not artifacts_list:
             console.print(f"[yellow]No artifacts found for run {run_id}[/yellow]")
@@ -17,6 +17,7 @@ from myloware.config.loaders import (
     load_project_config,
     load_workflow_config,
     load_agent_config,
+    clear_agent_config_cache,
     deep_merge,
     list_available_projects,
 )
@@ -40,6 +41,7 @@ __all__ = [
     "load_project_config",
     "load_workflow_config",
     "load_agent_config",
+    "clear_agent_config_cache",
     "deep_merge",
     "list_available_projects",
 ]
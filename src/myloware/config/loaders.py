@@ -6,6 +6,7 @@ from YAML files with support for base + override inheritance patterns.
 
 from __future__ import annotations
 
+import copy
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +21,7 @@ __all__ = [
     "load_project_config",
     "load_workflow_config",
     "load_agent_config",
+    "clear_agent_config_cache",
     "deep_merge",
     "DATA_PATH",
     "SHARED_PATH",
@@ -31,6 +33,17 @@ DATA_PATH = get_repo_root() / "data"
 SHARED_PATH = DATA_PATH / "shared"
 PROJECTS_PATH = DATA_PATH / "projects"
 
+# (base_path, override_path) -> ((base_mtime_ns, override_mtime_ns), merged_config)
+_agent_config_cache: dict[tuple[Path, Path], tuple[tuple[int, int | None], dict[str, Any]]] = {}
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Return the file's mtime in nanoseconds, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 
 def load_yaml(path: Path) -> dict[str, Any]:
     """Load a YAML file.
@@ -127,32 +140,49 @@ def load_agent_config(project_name: str, role: str) -> dict[str, Any]:
     then merges any project-specific override from
     data/projects/{project}/agents/{role}.yaml.
 
+    Parsed configs are cached per (project, role) and invalidated when either
+    file's mtime changes, so repeated agent creation only pays for two stat calls.
+
     Args:
         project_name: Name of the project
         role: Agent role (ideator, producer, editor, publisher, supervisor)
 
     Returns:
-        Merged agent configuration
+        Merged agent configuration (a copy; callers may mutate it)
 
     Raises:
         FileNotFoundError: If base agent config doesn't exist
     """
-    # Load base config (required)
     base_path = SHARED_PATH / "agents" / f"{role}.yaml"
-    if not base_path.exists():
+    override_path = PROJECTS_PATH / project_name / "agents" / f"{role}.yaml"
+
+    base_mtime = _mtime_ns(base_path)
+    if base_mtime is None:
         raise FileNotFoundError(f"Base agent config not found: {base_path}")
+    signature = (base_mtime, _mtime_ns(override_path))
+
+    cache_key = (base_path, override_path)
+    cached = _agent_config_cache.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return copy.deepcopy(cached[1])
 
+    # Load base config (required)
     base = load_yaml(base_path)
     logger.debug("Loaded base config for %s", role)
 
     # Load project override if exists
-    override_path = PROJECTS_PATH / project_name / "agents" / f"{role}.yaml"
-    if override_path.exists():
+    if signature[1] is not None:
         override = load_yaml(override_path)
         logger.debug("Applying override for %s/%s", project_name, role)
         base = deep_merge(base, override)
 
-    return base
+    _agent_config_cache[cache_key] = (signature, base)
+    return copy.deepcopy(base)
+
+
+def clear_agent_config_cache() -> None:
+    """Drop all cached agent configs (forces a re-read on next load)."""
+    _agent_config_cache.clear()
 
 
 def list_available_projects() -> list[str]:
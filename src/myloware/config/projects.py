@@ -93,7 +93,8 @@ class ProjectConfig(BaseModel):
         return v
 
 
-_project_cache: Dict[str, ProjectConfig] = {}
+# project name -> (config file mtime_ns, parsed config)
+_project_cache: Dict[str, tuple[int, ProjectConfig]] = {}
 
 
 def get_projects_dir() -> Path:
@@ -106,18 +107,25 @@ def get_projects_dir() -> Path:
 
 
 def load_project(project_name: str) -> ProjectConfig:
-    """Load a project configuration by name."""
+    """Load a project configuration by name.
 
-    if project_name in _project_cache:
-        return _project_cache[project_name]
+    Cached per project and re-parsed only when the JSON file's mtime changes.
+    """
 
     config_path = get_projects_dir() / f"{project_name}.json"
-    if not config_path.exists():
-        raise FileNotFoundError(f"Project not found: {project_name}")
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
+        _project_cache.pop(project_name, None)
+        raise FileNotFoundError(f"Project not found: {project_name}") from None
+
+    cached = _project_cache.get(project_name)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
 
     data = json.loads(config_path.read_text())
     config = ProjectConfig(**data)
-    _project_cache[project_name] = config
+    _project_cache[project_name] = (mtime_ns, config)
     return config
 
 
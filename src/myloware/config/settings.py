@@ -65,6 +65,10 @@ class Settings(BaseSettings):
         default=False,
         description="Use pooled connections for async engine. Disable to force NullPool (safer across event loops).",
     )
+    artifact_inline_content_max_bytes: int = Field(
+        default=4096,
+        description="Artifact content larger than this (UTF-8 bytes) is stored zlib-compressed in artifact_contents.",
+    )
 
     # API Configuration
     api_host: str = "127.0.0.1"
@@ -92,11 +96,40 @@ class Settings(BaseSettings):
         default="10/minute",
         description="Rate limit for public demo start endpoint.",
     )
+    public_demo_status_cache_max_entries: int = Field(
+        default=2048,
+        description="Public demo status responses cached per run (0 disables).",
+    )
+    public_demo_status_cache_ttl_seconds: float = Field(
+        default=300.0,
+        description="Max age (seconds) of a cached public demo status response.",
+    )
+    public_demo_render_progress_ttl_seconds: float = Field(
+        default=2.0,
+        description="How long a Remotion render progress lookup is shared across status polls.",
+    )
     public_demo_cors_origins: list[str] = Field(
         default_factory=lambda: ["https://myloware.mjames.dev"],
         description="CORS allowlist for the public demo UI.",
     )
 
+    # Chat request classifier (rule fast path + LLM result cache)
+    classifier_cache_max_entries: int = Field(
+        default=2048,
+        description="Max LLM classifications cached by normalized message (0 disables).",
+    )
+    classifier_cache_ttl_seconds: float = Field(
+        default=600.0,
+        description="TTL (seconds) for cached LLM classifications.",
+    )
+    vision_cache_cross_run: bool = Field(
+        default=False,
+        description=(
+            "Reuse analyze_media results across runs for the same media "
+            "(keyed by media hash + analysis type)."
+        ),
+    )
+
     # Rate limits (SlowAPI syntax). Defaults tuned for dev; override per env.
     run_rate_limit: str = Field(
         default="60/minute",
@@ -196,6 +229,14 @@ class Settings(BaseSettings):
             "real=call OpenAI, fake=serve local MP4 fixtures via real webhook path, off=disable."
         ),
     )
+    sora_submit_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description=(
+            "Max concurrent /v1/videos submissions per tool call "
+            "(the openai_videos adaptive limiter still applies)."
+        ),
+    )
     sora_fake_clips_dir: str = Field(
         default="fake_clips/sora",
         description="Directory of MP4 fixtures used when SORA_PROVIDER=fake.",
@@ -242,6 +283,65 @@ class Settings(BaseSettings):
         description="Enable content safety shields for write endpoints (always on).",
     )
 
+    # Cross-run safety verdict cache keyed by (shield_id, sha256(content)).
+    # system_error verdicts are never cached; violations always are.
+    safety_verdict_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse shield verdicts for identical content across runs and requests.",
+    )
+    safety_verdict_cache_max_entries: int = Field(
+        default=4096,
+        description="Max verdicts held in the in-process LRU.",
+    )
+    safety_verdict_cache_ttl_seconds: float = Field(
+        default=86400.0,
+        description="TTL (seconds) for cached safety verdicts (memory and database).",
+    )
+    safety_verdict_cache_persistent: bool = Field(
+        default=True,
+        description="Also persist verdicts in the safety_verdicts table (shared across workers).",
+    )
+    # Segmented shield checks (safety.shields.check_segmented_safety)
+    safety_segment_max_chars: int = Field(
+        default=2000,
+        description="Content longer than this is split into segments checked concurrently.",
+    )
+    safety_max_concurrency: int = Field(
+        default=8,
+        description="Max concurrent shield calls for one segmented check.",
+    )
+
+    # Buffered audit log writer (observability.audit)
+    audit_queue_max_size: int = Field(
+        default=10000,
+        description="Max audit events buffered in memory before new events are dropped.",
+    )
+    audit_batch_size: int = Field(
+        default=200,
+        description="Max audit events written per batch insert.",
+    )
+    audit_flush_interval_seconds: float = Field(
+        default=0.5,
+        description="Max time an audit event waits in the buffer before a flush.",
+    )
+
+    # Run event streams (SSE)
+    run_events_poll_interval_seconds: float = Field(
+        default=1.0,
+        description="How often the per-run event watcher checks the DB for changes.",
+    )
+    run_events_heartbeat_seconds: float = Field(
+        default=15.0,
+        description="Idle time before an SSE keep-alive comment is sent.",
+    )
+    run_events_queue_size: int = Field(
+        default=64,
+        description=(
+            "Buffered event batches (one per watcher DB check) per subscriber; slower "
+            "subscribers are disconnected."
+        ),
+    )
+
     # Startup behavior
     fail_fast_on_startup: bool = Field(
         default=True,
@@ -274,16 +374,47 @@ class Settings(BaseSettings):
     )
     kb_parallel_reads: int = Field(
         default=8,
-        description="Thread pool size for reading knowledge docs in parallel",
+        description="Thread pool size for reading and uploading knowledge docs in parallel",
     )
     kb_upload_batch_size: int = Field(
         default=100,
         description="Chunk size for batching KB uploads to the vector store",
     )
+    kb_manifest_path: str = Field(
+        default=str(Path(tempfile.gettempdir()) / "myloware" / "kb_manifest.json"),
+        description=(
+            "Where the KB sync manifest is kept (runtime state; must be writable). The manifest "
+            "is per process: replicas sharing one vector store should point this at a shared "
+            "volume, or leave ingestion to one replica (kb_skip_ingest_on_start on the rest)."
+        ),
+    )
+    kb_search_cache_max_entries: int = Field(
+        default=1024,
+        description="Max number of distinct queries with cached search results (0 disables).",
+    )
+    kb_search_cache_ttl_seconds: float = Field(
+        default=300.0,
+        description="TTL (seconds) for cached vector store search results.",
+    )
     kb_skip_ingest_on_start: bool = Field(
         default=False,
         description="If true, skip KB ingestion at startup (can reload via admin endpoint)",
     )
+    kb_setup_in_background: bool = Field(
+        default=True,
+        description=(
+            "Run KB sync and shield discovery as a background startup task so the API serves "
+            "non-RAG routes immediately; /health/ready reports 503 until it completes"
+        ),
+    )
+    kb_setup_retry_initial_seconds: float = Field(
+        default=5.0,
+        description="First backoff delay before retrying a failed background KB setup",
+    )
+    kb_setup_retry_max_seconds: float = Field(
+        default=300.0,
+        description="Cap on the (doubling) backoff delay between background KB setup retries",
+    )
     kb_chunk_max_chars: int = Field(
         default=2048,  # 512 tokens * 4 chars/token (approximate)
         description="Maximum characters per KB chunk before splitting (target: 512 tokens)",
@@ -341,12 +472,32 @@ class Settings(BaseSettings):
         default=86400,
         description="Presigned GET URL TTL used when resolving s3:// clip URIs for Remotion.",
     )
+    transcode_previews_enabled: bool = Field(
+        default=True,
+        description=(
+            "Extract keyframes, a contact sheet and a dominant-color palette next to each "
+            "transcoded clip (needs local ffmpeg; skipped otherwise)."
+        ),
+    )
+    transcode_preview_frames: int = Field(
+        default=6, description="Keyframes sampled evenly across each clip for its contact sheet."
+    )
+    transcode_preview_width: int = Field(
+        default=320, description="Width in pixels of each extracted keyframe."
+    )
+    transcode_palette_colors: int = Field(
+        default=5, description="Number of dominant colors stored in each clip's palette."
+    )
 
     # Budget / cost guards
     max_runs_last_24h: int = Field(
         default=1000,
         description="Maximum number of runs allowed in the past 24 hours (simple budget guard).",
     )
+    max_runs_per_user_last_24h: int = Field(
+        default=0,
+        description="Maximum runs one user_id may start in the past 24 hours (0 disables).",
+    )
     daily_cost_budget_usd: float = Field(
         default=200.0,
         description="Daily cost budget for guard checks (rough, per-run estimate).",
@@ -412,11 +563,6 @@ class Settings(BaseSettings):
         description="Max concurrent jobs per worker process.",
     )
 
-    skip_run_visibility_check: bool = Field(
-        default=False,
-        description="Skip verifying run visibility after commit (test helper for fake repos).",
-    )
-
     # LangGraph Configuration
     use_langgraph_engine: bool = Field(
         default=True,
@@ -436,6 +582,67 @@ class Settings(BaseSettings):
         default=30.0,
         description="Seconds to wait before attempting recovery (half-open state).",
     )
+    # Per-upstream bulkheads (resilience.registry). Keys are upstream names or
+    # "upstream:endpoint"; unlisted upstreams get 32 concurrent calls.
+    resilience_bulkhead_limits: dict[str, int] = Field(
+        default_factory=lambda: {
+            "llama_stack": 64,
+            # Streamed agent turns hold a slot for the whole turn; workers run hundreds.
+            "llama_stack:responses": 512,
+            "openai_videos": 16,
+            "remotion": 8,
+            "upload_post": 8,
+            "telegram": 16,
+            "s3": 32,
+        },
+        description="Max concurrent in-flight calls per upstream.",
+    )
+    resilience_bulkhead_max_wait_seconds: float = Field(
+        default=5.0,
+        description="How long a call waits for a bulkhead slot before being rejected.",
+    )
+    # Only providers that actually rate-limit us belong here: a limiter caps
+    # concurrency below the bulkhead before any 429 arrives. Add "llama_stack"
+    # when its model backend is a hosted, rate-limited API.
+    adaptive_concurrency_initial: dict[str, int] = Field(
+        default_factory=lambda: {"openai_videos": 4},
+        description=(
+            "Starting AIMD concurrency per provider key. Providers listed here get an "
+            "adaptive limiter that widens on success and halves on 429/Retry-After."
+        ),
+    )
+    adaptive_concurrency_min: int = Field(default=1, ge=1)
+    adaptive_concurrency_max: int = Field(
+        default=32,
+        ge=1,
+        description="Upper bound for any adaptive limiter (the bulkhead still applies).",
+    )
+    adaptive_concurrency_decrease_factor: float = Field(
+        default=0.5,
+        gt=0.0,
+        lt=1.0,
+        description="Multiplicative decrease applied to the limit on a 429.",
+    )
+    adaptive_concurrency_max_wait_seconds: float = Field(
+        default=120.0,
+        description="How long a call queues for an adaptive slot before being rejected.",
+    )
+    adaptive_concurrency_distributed: bool = Field(
+        default=False,
+        description=(
+            "Also pace calls through a Postgres token bucket shared by all processes "
+            "(rate_limit_buckets table, serialized by an advisory lock)."
+        ),
+    )
+    adaptive_concurrency_bucket_rates: dict[str, float] = Field(
+        default_factory=lambda: {"openai_videos": 1.0},
+        description="Token bucket refill rate (calls/second) per provider key.",
+    )
+    adaptive_concurrency_bucket_burst: float = Field(
+        default=5.0,
+        ge=1.0,
+        description="Token bucket capacity per provider key.",
+    )
 
     @model_validator(mode="after")
     def validate_transcode_storage(self) -> "Settings":
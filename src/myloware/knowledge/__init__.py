@@ -4,11 +4,13 @@ from myloware.knowledge.setup import (
     register_knowledge_base,
     ingest_documents,
     setup_project_knowledge,
+    sync_project_knowledge,
     DEFAULT_CHUNK_SIZE,
 )
 from myloware.knowledge.loader import (
     load_knowledge_documents,
     load_documents_with_manifest,
+    diff_manifest,
     load_manifest,
     save_manifest,
     list_knowledge_documents,
@@ -20,9 +22,11 @@ __all__ = [
     "register_knowledge_base",
     "ingest_documents",
     "setup_project_knowledge",
+    "sync_project_knowledge",
     "DEFAULT_CHUNK_SIZE",
     "load_knowledge_documents",
     "load_documents_with_manifest",
+    "diff_manifest",
     "load_manifest",
     "save_manifest",
     "list_knowledge_documents",
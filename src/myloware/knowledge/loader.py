@@ -15,10 +15,10 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Iterator, List, Tuple
 
+from myloware.config import settings
 from myloware.paths import get_repo_root
 
 ROOT = get_repo_root()
-MANIFEST_PATH = ROOT / "data" / ".kb_manifest.json"
 
 
 @dataclass
@@ -74,37 +74,133 @@ def extract_all_headings(content: str) -> list[str]:
     return headings
 
 
+def manifest_path() -> Path:
+    """Location of the KB sync manifest (``settings.kb_manifest_path``).
+
+    The manifest is runtime state and lives outside the checkout. It describes
+    what this process last synced; replicas sharing one vector store need a
+    shared path, otherwise each one adopts the store as-is on first start.
+    """
+    return Path(settings.kb_manifest_path).expanduser()
+
+
 def load_manifest() -> dict[str, Any] | None:
     """Load the last saved knowledge-base manifest, if present."""
-    if not MANIFEST_PATH.exists():
+    path = manifest_path()
+    if not path.exists():
         return None
     try:
-        return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+        return json.loads(path.read_text(encoding="utf-8"))
     except Exception:
         return None
 
 
 def save_manifest(manifest: dict[str, Any]) -> None:
     """Persist the current knowledge-base manifest for change detection."""
-    MANIFEST_PATH.parent.mkdir(parents=True, exist_ok=True)
-    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    path = manifest_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+
+
+_manifest_hash_cache: tuple[tuple[int, int], str | None] | None = None
+
+
+def current_manifest_hash() -> str | None:
+    """Hash of the saved manifest, re-read only when the file changes on disk.
+
+    Cheap enough to call per query (one stat); used to key retrieval caches so
+    that a knowledge base sync invalidates them.
+    """
+    global _manifest_hash_cache
+    try:
+        stat = manifest_path().stat()
+    except OSError:
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _manifest_hash_cache
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    manifest = load_manifest() or {}
+    value = manifest.get("hash")
+    digest = f"{value}:{manifest.get('vector_store_id', '')}" if value else None
+    _manifest_hash_cache = (signature, digest)
+    return digest
+
+
+@dataclass
+class ManifestDiff:
+    """Per-file difference between a saved manifest and the current corpus.
+
+    ``added``/``changed`` hold current manifest entries; ``removed``,
+    ``superseded`` (the old versions of changed files) and ``unchanged`` hold
+    the saved entries, which carry the uploaded ``file_id``.
+    """
 
+    added: list[dict[str, Any]] = field(default_factory=list)
+    changed: list[dict[str, Any]] = field(default_factory=list)
+    removed: list[dict[str, Any]] = field(default_factory=list)
+    superseded: list[dict[str, Any]] = field(default_factory=list)
+    unchanged: list[dict[str, Any]] = field(default_factory=list)
 
-def _compute_manifest(files: list[Path]) -> dict[str, Any]:
-    """Compute a deterministic manifest hash from file paths + stat metadata."""
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+
+def _source_path(path: Path) -> str:
+    """Repo-relative POSIX path used as a document's manifest key."""
+    return str(path.relative_to(ROOT)).replace("\\", "/")
+
+
+def content_digest(content: str) -> str:
+    """sha256 of a document's text, as stored in the manifest."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _compute_manifest(files: list[Path], digests: dict[str, str] | None = None) -> dict[str, Any]:
+    """Compute a deterministic manifest from file paths + content hashes.
+
+    With ``digests`` (source path -> content sha256) the corpus hash depends
+    only on paths and contents, so it is stable across checkouts and pods;
+    otherwise it falls back to stat metadata.
+    """
     h = hashlib.sha256()
     entries: list[dict[str, Any]] = []
     for path in sorted(files):
-        rel = str(path.relative_to(ROOT)).replace("\\", "/")
+        rel = _source_path(path)
         stat = path.stat()
-        entry = {"path": rel, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
-        entries.append(entry)
+        entry: dict[str, Any] = {"path": rel, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        digest = (digests or {}).get(rel)
         h.update(rel.encode("utf-8"))
-        h.update(str(stat.st_mtime_ns).encode("utf-8"))
-        h.update(str(stat.st_size).encode("utf-8"))
+        if digest:
+            entry["sha256"] = digest
+            h.update(digest.encode("utf-8"))
+        else:
+            h.update(str(stat.st_mtime_ns).encode("utf-8"))
+            h.update(str(stat.st_size).encode("utf-8"))
+        entries.append(entry)
     return {"hash": h.hexdigest(), "files": entries}
 
 
+def diff_manifest(previous: dict[str, Any] | None, current: dict[str, Any]) -> ManifestDiff:
+    """Compare per-file content hashes of two manifests, keyed by path."""
+    before = {
+        entry["path"]: entry for entry in (previous or {}).get("files", []) if "path" in entry
+    }
+    diff = ManifestDiff()
+    for entry in current.get("files", []):
+        old = before.pop(entry["path"], None)
+        if old is None:
+            diff.added.append(entry)
+        elif not entry.get("sha256") or old.get("sha256") != entry.get("sha256"):
+            diff.changed.append(entry)
+            diff.superseded.append(old)
+        else:
+            diff.unchanged.append(old)
+    diff.removed.extend(before.values())
+    return diff
+
+
 def _load_documents_from_dir(
     knowledge_dir: Path,
     kb_type: str = "global",
@@ -162,6 +258,7 @@ def _load_documents_from_dir(
                     "document": str(relative_path),
                     "category": category,
                     "section": first_heading if read_content else "Overview",
+                    "source_path": _source_path(doc_path),
                 },
             )
         )
@@ -194,7 +291,12 @@ def load_documents_with_manifest(
         all_docs.extend(docs)
         files.extend(used)
 
-    manifest = _compute_manifest(files)
+    digests = (
+        {doc.metadata["source_path"]: content_digest(doc.content) for doc in all_docs}
+        if read_content
+        else None
+    )
+    manifest = _compute_manifest(files, digests)
     return all_docs, manifest
 
 
@@ -282,6 +384,10 @@ def get_knowledge_stats() -> dict:
 
 __all__ = [
     "KnowledgeDocument",
+    "ManifestDiff",
+    "content_digest",
+    "current_manifest_hash",
+    "diff_manifest",
     "get_knowledge_dir",
     "get_project_knowledge_dir",
     "load_knowledge_documents",
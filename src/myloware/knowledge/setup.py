@@ -43,24 +43,39 @@ results = search_vector_store(
 
 from __future__ import annotations
 
+import json
+import math
 import os
+import threading
 import uuid
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
 
+from cachetools import TTLCache  # type: ignore
 from llama_stack_client import LlamaStackClient
-from myloware.config import settings
+from prometheus_client import Counter, Histogram
 
+from myloware.config import settings
+from myloware.knowledge.loader import current_manifest_hash, diff_manifest
 from myloware.observability.logging import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
 __all__ = [
     "register_knowledge_base",
     "ingest_documents",
     "setup_project_knowledge",
+    "sync_project_knowledge",
+    "KnowledgeSyncResult",
     "get_existing_vector_store",
     "log_knowledge_retrieval",
     "search_vector_store",
+    "cached_vector_search",
+    "clear_search_cache",
     "DEFAULT_CHUNK_SIZE",
     "DEFAULT_CHUNK_OVERLAP",
 ]
@@ -72,6 +87,35 @@ DEFAULT_CHUNK_OVERLAP = 100
 # Environment variable to force re-ingestion
 FORCE_REINGEST = os.getenv("FORCE_KNOWLEDGE_REINGEST", "false").lower() == "true"
 
+# Rough characters per token, for estimating embedding chunks per document.
+_CHARS_PER_TOKEN = 4
+
+KB_SYNC_FILES = Counter(
+    "myloware_kb_sync_files_total",
+    "Knowledge base files handled by incremental sync",
+    ["action"],  # uploaded | removed | skipped
+)
+KB_SYNC_SECONDS = Histogram(
+    "myloware_kb_sync_duration_seconds",
+    "Knowledge base sync duration",
+    ["mode"],
+    buckets=(0.1, 0.5, 1, 5, 15, 30, 60, 120, 300, 600),
+)
+KB_UPLOAD_SECONDS = Histogram(
+    "myloware_kb_upload_file_seconds",
+    "Time to upload one knowledge base document",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30),
+)
+KB_SEARCH_CACHE = Counter(
+    "myloware_kb_search_cache_total",
+    "Vector store search cache lookups",
+    ["result"],  # hit | miss
+)
+KB_EMBEDDING_CHUNKS_SAVED = Counter(
+    "myloware_kb_embedding_chunks_saved_total",
+    "Estimated embedding chunks not recomputed because their files were unchanged",
+)
+
 
 def get_existing_vector_store(client: LlamaStackClient, name: str) -> str | None:
     """Get existing vector store ID by name.
@@ -92,6 +136,92 @@ def get_existing_vector_store(client: LlamaStackClient, name: str) -> str | None
         return None
 
 
+def _document_key(doc: dict) -> str:
+    """Manifest key for a document: its source path, else its id."""
+    return str(doc.get("metadata", {}).get("source_path") or doc.get("id") or "")
+
+
+def _upload_document(client: LlamaStackClient, doc: dict) -> str | None:
+    """Upload one document to Llama Stack; returns its file ID, or None if skipped."""
+    doc_id = doc.get("id") or str(uuid.uuid4())
+
+    if "content" not in doc and "url" not in doc:
+        raise ValueError("Document must have either 'content' or 'url'")
+
+    if "content" not in doc and "url" in doc:
+        logger.warning("Document %s has url only; skipping upload", doc_id)
+        return None
+
+    content = doc["content"]
+    filename = doc.get("metadata", {}).get("filename", f"{doc_id}.txt")
+
+    try:
+        file_response = client.files.create(
+            file=(filename, content.encode("utf-8"), "text/plain"),
+            purpose="assistants",
+        )
+    except Exception as exc:
+        logger.warning("Failed to upload document %s: %s", doc_id, exc)
+        return None
+    logger.debug("Uploaded file: %s -> %s", filename, file_response.id)
+    return file_response.id
+
+
+def _kb_parallelism() -> int:
+    return max(1, int(getattr(settings, "kb_parallel_reads", 8) or 1))
+
+
+def _kb_batch_size() -> int:
+    return max(1, int(getattr(settings, "kb_upload_batch_size", 100) or 1))
+
+
+def _upload_many(
+    client: LlamaStackClient, documents: list[dict]
+) -> list[tuple[dict, str | None, float]]:
+    """Upload documents on up to ``kb_parallel_reads`` threads.
+
+    Returns ``(document, file_id or None, seconds)`` in input order.
+    """
+
+    def _timed(doc: dict) -> tuple[dict, str | None, float]:
+        start = time.perf_counter()
+        file_id = _upload_document(client, doc)
+        elapsed = time.perf_counter() - start
+        KB_UPLOAD_SECONDS.observe(elapsed)
+        logger.debug(
+            "kb_file_uploaded",
+            document=_document_key(doc),
+            file_id=file_id,
+            seconds=round(elapsed, 3),
+        )
+        return doc, file_id, elapsed
+
+    workers = min(_kb_parallelism(), len(documents))
+    if workers <= 1:
+        return [_timed(doc) for doc in documents]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kb-upload") as pool:
+        return list(pool.map(_timed, documents))
+
+
+def _upload_documents_by_key(
+    client: LlamaStackClient,
+    documents: list[dict],
+    timings: dict[str, float] | None = None,
+) -> dict[str, str]:
+    """Upload documents and map each document key (source path) to its file ID.
+
+    Per-file upload seconds are recorded into ``timings`` when given.
+    """
+    uploaded: dict[str, str] = {}
+    for doc, file_id, elapsed in _upload_many(client, documents):
+        key = _document_key(doc)
+        if timings is not None and key:
+            timings[key] = elapsed
+        if file_id is not None:
+            uploaded[key or file_id] = file_id
+    return uploaded
+
+
 def _upload_documents(
     client: LlamaStackClient,
     documents: list[dict],
@@ -100,33 +230,24 @@ def _upload_documents(
 
     This is a helper for batch vector store creation.
     """
-    file_ids = []
-
-    for doc in documents:
-        doc_id = doc.get("id") or str(uuid.uuid4())
+    return [file_id for _doc, file_id, _s in _upload_many(client, documents) if file_id]
 
-        if "content" not in doc and "url" not in doc:
-            raise ValueError("Document must have either 'content' or 'url'")
 
-        if "content" not in doc and "url" in doc:
-            logger.warning("Document %s has url only; skipping upload", doc_id)
-            continue
-
-        content = doc["content"]
-        filename = doc.get("metadata", {}).get("filename", f"{doc_id}.txt")
-
-        try:
-            file_response = client.files.create(
-                file=(filename, content.encode("utf-8"), "text/plain"),
-                purpose="assistants",
+def _attach_files(client: LlamaStackClient, vector_store_id: str, file_ids: list[str]) -> None:
+    """Add uploaded files to a vector store in ``kb_upload_batch_size`` batches."""
+    batch_size = _kb_batch_size()
+    for offset in range(0, len(file_ids), batch_size):
+        batch = file_ids[offset : offset + batch_size]
+        if len(batch) > 1:
+            client.vector_stores.file_batches.create(
+                vector_store_id=vector_store_id,
+                file_ids=batch,
+            )
+        else:
+            client.vector_stores.files.create(
+                vector_store_id=vector_store_id,
+                file_id=batch[0],
             )
-            file_ids.append(file_response.id)
-            logger.debug("Uploaded file: %s -> %s", filename, file_response.id)
-        except Exception as exc:
-            logger.warning("Failed to upload document %s: %s", doc_id, exc)
-            continue
-
-    return file_ids
 
 
 def register_knowledge_base(
@@ -196,9 +317,9 @@ def register_knowledge_base(
             "extra_body": extra_body,
         }
 
-        # Add file_ids if provided (batch creation)
+        # Add file_ids if provided (batch creation); the rest are attached in batches.
         if file_ids:
-            create_kwargs["file_ids"] = file_ids
+            create_kwargs["file_ids"] = file_ids[: _kb_batch_size()]
 
         try:
             store = client.vector_stores.create(**create_kwargs)
@@ -245,6 +366,8 @@ def register_knowledge_base(
 
         vector_store_id = store.id
         logger.info("Vector store created: name=%s, id=%s", store_name, vector_store_id)
+        if file_ids and len(file_ids) > _kb_batch_size():
+            _attach_files(client, vector_store_id, file_ids[_kb_batch_size() :])
         return vector_store_id
 
     except Exception as exc:
@@ -303,17 +426,7 @@ def ingest_documents(
 
     # Add files to vector store using batch API
     try:
-        if len(file_ids) > 1:
-            client.vector_stores.file_batches.create(
-                vector_store_id=vector_store_id,
-                file_ids=file_ids,
-            )
-        else:
-            for file_id in file_ids:
-                client.vector_stores.files.create(
-                    vector_store_id=vector_store_id,
-                    file_id=file_id,
-                )
+        _attach_files(client, vector_store_id, file_ids)
         logger.info(
             "ingest_documents_complete: file_count=%d, vector_store_id=%s",
             len(file_ids),
@@ -357,6 +470,17 @@ def log_knowledge_retrieval(
     logger.info("rag_query", **log_data)
 
 
+def _delete_vector_store(client: LlamaStackClient, store_name: str, store_id: str) -> None:
+    """Delete a vector store and wait briefly for the deletion to propagate."""
+    logger.info("Force re-ingest: deleting existing vector store %s (%s)", store_name, store_id)
+    client.vector_stores.delete(store_id)
+
+    for _attempt in range(10):
+        if get_existing_vector_store(client, store_name) is None:
+            break
+        time.sleep(0.2)
+
+
 def setup_project_knowledge(
     client: LlamaStackClient,
     project_id: str,
@@ -399,18 +523,7 @@ def setup_project_knowledge(
     if existing_id and should_force and documents:
         # Some Llama Stack deployments do not implement deleting vector-store files.
         # For a force re-ingest, delete + recreate the vector store with the same name.
-        logger.info(
-            "Force re-ingest: deleting existing vector store %s (%s)",
-            store_name,
-            existing_id,
-        )
-        client.vector_stores.delete(existing_id)
-
-        # Wait briefly for deletion to propagate before attempting to recreate.
-        for _attempt in range(10):
-            if get_existing_vector_store(client, store_name) is None:
-                break
-            time.sleep(0.2)
+        _delete_vector_store(client, store_name, existing_id)
         existing_id = None
 
     if existing_id and not should_force:
@@ -479,6 +592,270 @@ def setup_project_knowledge(
     return created_id
 
 
+@dataclass
+class KnowledgeSyncResult:
+    """Outcome of sync_project_knowledge().
+
+    ``manifest`` is the current manifest with each file's ``file_id`` and a
+    ``last_sync`` summary; persist it with loader.save_manifest().
+    """
+
+    vector_store_id: str
+    manifest: dict[str, Any]
+    mode: str  # unchanged | incremental | full | adopted
+    uploaded: int = 0
+    removed: int = 0
+    skipped: int = 0
+    elapsed_seconds: float = 0.0
+    embedding_chunks_saved: int = 0
+    failed: list[str] = field(default_factory=list)
+
+
+def _estimated_chunks(size: int, chunk_size: int, chunk_overlap: int) -> int:
+    stride = max(1, chunk_size - chunk_overlap) * _CHARS_PER_TOKEN
+    return max(1, math.ceil(max(0, size) / stride))
+
+
+def _remove_files(client: LlamaStackClient, vector_store_id: str, file_ids: list[str]) -> None:
+    """Detach files from the vector store (raises if unsupported) and delete them."""
+    for file_id in file_ids:
+        client.vector_stores.files.delete(file_id, vector_store_id=vector_store_id)
+        try:
+            client.files.delete(file_id)
+        except Exception as exc:
+            logger.debug("Failed to delete detached file %s: %s", file_id, exc)
+
+
+def sync_project_knowledge(
+    client: LlamaStackClient,
+    project_id: str,
+    documents: list[dict],
+    manifest: dict[str, Any],
+    previous: dict[str, Any] | None = None,
+    force_reingest: bool = False,
+    provider_id: str | None = None,
+    embedding_model: str = "openai/text-embedding-3-small",
+    embedding_dimension: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+) -> KnowledgeSyncResult:
+    """Bring the project vector store in line with ``manifest``, touching only the delta.
+
+    ``previous`` is the manifest saved after the last sync; it maps each file's
+    path to its content hash and uploaded ``file_id``. Added and changed files
+    are uploaded and attached, changed and deleted files are detached from the
+    store, and unchanged files are left alone. A full rebuild (delete + recreate
+    the store) happens only when forced, when the store is new, or when the
+    delta cannot be applied (a previous file_id is unknown, or the deployment
+    does not support detaching files).
+
+    If the store already exists but there is no usable previous manifest (e.g. a
+    fresh container), the store is adopted as-is, matching the old startup
+    behaviour of reusing a populated store.
+    """
+    start = time.monotonic()
+    store_name = f"project_kb_{project_id}"
+    existing_id = get_existing_vector_store(client, store_name)
+    usable_previous = (
+        previous
+        if previous
+        and existing_id
+        and previous.get("project_id") == project_id
+        and previous.get("vector_store_id") == existing_id
+        else None
+    )
+    diff = diff_manifest(usable_previous, manifest)
+    docs_by_key = {_document_key(doc): doc for doc in documents}
+    sizes = {entry["path"]: int(entry.get("size") or 0) for entry in manifest.get("files", [])}
+    file_ids: dict[str, str] = {
+        entry["path"]: entry["file_id"] for entry in diff.unchanged if entry.get("file_id")
+    }
+    failed: list[str] = []
+    timings: dict[str, float] = {}
+    uploaded = removed = 0
+    mode = "full"
+    vector_store_id = existing_id or store_name
+    should_force = force_reingest or FORCE_REINGEST
+
+    if existing_id and not should_force and usable_previous is None:
+        mode = "adopted"
+        if not vector_store_has_files(client, existing_id) and documents:
+            mode = "full"
+    elif existing_id and not should_force:
+        stale = diff.removed + diff.superseded
+        stale_ids = [str(entry["file_id"]) for entry in stale if entry.get("file_id")]
+        if len(stale_ids) != len(stale):
+            logger.info("KB sync: previous file ids incomplete; rebuilding %s", store_name)
+        else:
+            try:
+                _remove_files(client, existing_id, stale_ids)
+                removed = len(stale_ids)
+                mode = "incremental" if not diff.is_empty else "unchanged"
+            except Exception as exc:
+                logger.warning("KB sync: cannot detach files (%s); rebuilding %s", exc, store_name)
+
+    if mode == "incremental":
+        pending = [
+            docs_by_key[e["path"]] for e in diff.added + diff.changed if e["path"] in docs_by_key
+        ]
+        new_ids = _upload_documents_by_key(client, pending, timings)
+        failed = [_document_key(doc) for doc in pending if _document_key(doc) not in new_ids]
+        if new_ids:
+            _attach_files(client, vector_store_id, list(new_ids.values()))
+        file_ids.update(new_ids)
+        uploaded = len(new_ids)
+    elif mode == "full":
+        if existing_id:
+            _delete_vector_store(client, store_name, existing_id)
+        file_ids = _upload_documents_by_key(client, documents, timings)
+        failed = [_document_key(doc) for doc in documents if _document_key(doc) not in file_ids]
+        vector_store_id = register_knowledge_base(
+            client,
+            project_id,
+            provider_id=provider_id,
+            embedding_model=embedding_model,
+            embedding_dimension=embedding_dimension,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            file_ids=list(file_ids.values()) or None,
+        )
+        uploaded = len(file_ids)
+
+    elapsed = time.monotonic() - start
+    if mode == "full":
+        skipped_paths: list[str] = []
+    elif mode == "incremental":
+        skipped_paths = [entry["path"] for entry in diff.unchanged]
+    else:
+        skipped_paths = list(sizes)
+    chunks_saved = sum(
+        _estimated_chunks(sizes[p], chunk_size, chunk_overlap) for p in skipped_paths
+    )
+    prior = (previous or {}).get("last_sync") or {}
+    seconds_per_file = elapsed / uploaded if uploaded else prior.get("seconds_per_file")
+
+    # Files that failed to upload are left out so the next sync retries them.
+    entries = [
+        {**entry, **({"file_id": file_ids[entry["path"]]} if entry["path"] in file_ids else {})}
+        for entry in manifest.get("files", [])
+        if entry["path"] not in failed
+    ]
+    last_sync: dict[str, Any] = {
+        "mode": mode,
+        "uploaded": uploaded,
+        "removed": removed,
+        "skipped": len(skipped_paths),
+        "failed": failed,
+        "elapsed_seconds": round(elapsed, 3),
+        "seconds_per_file": seconds_per_file,
+        "estimated_seconds_saved": (
+            round(seconds_per_file * len(skipped_paths), 3) if seconds_per_file else None
+        ),
+        "embedding_chunks_saved": chunks_saved,
+        "parallelism": _kb_parallelism(),
+        "upload_seconds": round(sum(timings.values()), 3),
+        "slowest_files": [
+            {"path": path, "seconds": round(seconds, 3)}
+            for path, seconds in sorted(timings.items(), key=lambda item: item[1], reverse=True)[:5]
+        ],
+    }
+    synced_manifest = {
+        **manifest,
+        "files": entries,
+        "project_id": project_id,
+        "vector_store_id": vector_store_id,
+        "last_sync": last_sync,
+    }
+
+    KB_SYNC_FILES.labels(action="uploaded").inc(uploaded)
+    KB_SYNC_FILES.labels(action="removed").inc(removed)
+    KB_SYNC_FILES.labels(action="skipped").inc(len(skipped_paths))
+    KB_SYNC_SECONDS.labels(mode=mode).observe(elapsed)
+    KB_EMBEDDING_CHUNKS_SAVED.inc(chunks_saved)
+    logger.info("kb_sync_complete", vector_store_id=vector_store_id, **last_sync)
+
+    return KnowledgeSyncResult(
+        vector_store_id=vector_store_id,
+        manifest=synced_manifest,
+        mode=mode,
+        uploaded=uploaded,
+        removed=removed,
+        skipped=len(skipped_paths),
+        elapsed_seconds=elapsed,
+        embedding_chunks_saved=chunks_saved,
+        failed=failed,
+    )
+
+
+_search_cache: TTLCache | None = None
+_search_cache_lock = threading.Lock()
+
+
+def _get_search_cache() -> TTLCache | None:
+    global _search_cache
+    max_entries = int(getattr(settings, "kb_search_cache_max_entries", 0) or 0)
+    if max_entries <= 0:
+        return None
+    if _search_cache is None:
+        ttl = float(getattr(settings, "kb_search_cache_ttl_seconds", 300.0))
+        _search_cache = TTLCache(maxsize=max_entries, ttl=ttl)
+    return _search_cache
+
+
+def clear_search_cache() -> None:
+    """Drop cached vector store search results (tests, manual KB edits)."""
+    global _search_cache
+    with _search_cache_lock:
+        _search_cache = None
+
+
+def _normalize_query(query: str) -> str:
+    # Case and whitespace only: punctuation can change what a query means.
+    return " ".join(query.lower().split())
+
+
+def cached_vector_search(
+    search: Callable[[], list[T]],
+    *,
+    namespace: str,
+    vector_store_id: str,
+    query: str,
+    max_results: int,
+    search_mode: str,
+    ranking_options: dict | None,
+) -> list[T]:
+    """Return ``search()`` through the bounded (LRU + TTL) KB search cache.
+
+    Keyed by ``namespace`` (callers caching differently shaped results must
+    not share entries), store, the saved KB manifest hash, the normalized
+    query and the search options, so a knowledge base sync invalidates it.
+    Exceptions propagate and nothing is cached for them.
+    """
+    cache = _get_search_cache()
+    if cache is None:
+        return search()
+    cache_key = (
+        namespace,
+        vector_store_id,
+        current_manifest_hash(),
+        _normalize_query(query),
+        max_results,
+        search_mode,
+        json.dumps(ranking_options, sort_keys=True) if search_mode == "hybrid" else None,
+    )
+    with _search_cache_lock:
+        cached = cache.get(cache_key)
+    if cached is not None:
+        KB_SEARCH_CACHE.labels(result="hit").inc()
+        return list(cached)
+    KB_SEARCH_CACHE.labels(result="miss").inc()
+
+    results = search()
+    with _search_cache_lock:
+        cache[cache_key] = tuple(results)
+    return results
+
+
 def search_vector_store(
     client: LlamaStackClient,
     vector_store_id: str,
@@ -509,6 +886,9 @@ def search_vector_store(
     Returns:
         List of search results with content and scores
 
+    Successful results go through ``cached_vector_search``; failed searches
+    are not cached.
+
     Example:
         # Basic vector search
         results = search_vector_store(client, vs_id, "how to render video")
@@ -527,13 +907,6 @@ def search_vector_store(
             ranking_options={"ranker": {"type": "weighted", "alpha": 0.7}}
         )
     """
-    logger.info(
-        "Searching vector store: id=%s, query=%s, mode=%s",
-        vector_store_id,
-        query[:50] + "..." if len(query) > 50 else query,
-        search_mode,
-    )
-
     search_kwargs = {
         "vector_store_id": vector_store_id,
         "query": query,
@@ -548,7 +921,13 @@ def search_vector_store(
     if ranking_options and search_mode == "hybrid":
         search_kwargs["ranking_options"] = ranking_options
 
-    try:
+    def _search() -> list:
+        logger.info(
+            "Searching vector store: id=%s, query=%s, mode=%s",
+            vector_store_id,
+            query[:50] + "..." if len(query) > 50 else query,
+            search_mode,
+        )
         response = client.vector_stores.search(**search_kwargs)
         results = list(response.data) if hasattr(response, "data") else []
 
@@ -558,9 +937,18 @@ def search_vector_store(
             results=results,
             result_count=len(results),
         )
-
         return results
 
+    try:
+        return cached_vector_search(
+            _search,
+            namespace="raw",
+            vector_store_id=vector_store_id,
+            query=query,
+            max_results=max_results,
+            search_mode=search_mode,
+            ranking_options=ranking_options,
+        )
     except Exception as exc:
         logger.error("Vector store search failed: %s", exc)
         return []
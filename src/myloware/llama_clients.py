@@ -9,14 +9,18 @@ be the single surface for obtaining clients inside the app; async code should
 
 from __future__ import annotations
 
+import inspect
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from functools import lru_cache
-from typing import Any, AsyncIterator, Optional, TypeGuard
+from typing import Any, AsyncIterator, Callable, Optional, TypeGuard
 
 from llama_stack_client import AsyncLlamaStackClient, LlamaStackClient
 
 from myloware.config import settings
 from myloware.observability.logging import get_logger
+from myloware.resilience.bulkhead import BulkheadFullError
 from myloware.resilience.circuit_breaker import CircuitBreaker, CircuitBreakerError
+from myloware.resilience.registry import UpstreamGuard, get_guard
 
 logger = get_logger(__name__)
 
@@ -26,6 +30,7 @@ __all__ = [
     "clear_client_cache",
     "async_chat_complete",
     "async_chat_stream",
+    "close_stream",
     "list_models",
     "list_models_async",
     "verify_connection",
@@ -44,19 +49,35 @@ class LlamaStackConnectionError(Exception):
         super().__init__(f"{message} (url={url})")
 
 
-_llama_stack_circuit_breaker: CircuitBreaker | None = None
+# Client resources grouped into guard endpoints, so a shield or vector store
+# outage opens only its own breaker and never blocks agent turns. Anything
+# else (models, toolgroups, telemetry, ...) shares the "other" guard.
+_ENDPOINTS = {
+    "responses": "responses",
+    "agents": "responses",
+    "chat": "responses",
+    "completions": "responses",
+    "conversations": "responses",
+    "inference": "responses",
+    "safety": "safety",
+    "shields": "safety",
+    "moderations": "safety",
+    "vector_stores": "vector_io",
+    "vector_io": "vector_io",
+    "files": "vector_io",
+}
+
+
+def _endpoint_guard(resource: str) -> UpstreamGuard:
+    """Registry guard for a top-level client resource (``llama_stack:<endpoint>``)."""
+    return get_guard("llama_stack", _ENDPOINTS.get(resource, "other"))
 
 
 def _get_circuit_breaker() -> CircuitBreaker | None:
-    """Get or initialize the circuit breaker."""
-    global _llama_stack_circuit_breaker
-    if _llama_stack_circuit_breaker is None and settings.circuit_breaker_enabled:
-        _llama_stack_circuit_breaker = CircuitBreaker(
-            name="llama_stack",
-            failure_threshold=settings.circuit_breaker_failure_threshold,
-            recovery_timeout=settings.circuit_breaker_recovery_timeout,
-        )
-    return _llama_stack_circuit_breaker
+    """Return the breaker guarding Llama Stack model calls (None if disabled)."""
+    if not settings.circuit_breaker_enabled:
+        return None
+    return _endpoint_guard("responses").breaker
 
 
 def _is_proxyable_resource(value: Any) -> TypeGuard[object]:
@@ -81,72 +102,273 @@ def _is_proxyable_resource(value: Any) -> TypeGuard[object]:
     )
 
 
-class _ResilientProxy:
-    """Proxy that wraps nested resource objects so circuit breaker covers .foo.bar.baz()."""
+def _rejected(full_path: str, exc: Exception) -> LlamaStackConnectionError:
+    logger.warning("Resilience guard rejected call to %s: %s", full_path, exc)
+    reason = (
+        "Circuit breaker is open" if isinstance(exc, CircuitBreakerError) else "Bulkhead is full"
+    )
+    return LlamaStackConnectionError(
+        message=f"{reason} for {full_path}",
+        url=settings.llama_stack_url,
+        cause=exc,
+    )
 
-    def __init__(self, obj: Any, circuit_breaker: CircuitBreaker, path: str):
-        self._obj = obj
-        self._circuit_breaker = circuit_breaker
-        self._path = path
 
-    def __getattr__(self, name: str) -> Any:  # pragma: no cover - exercised via ResilientClient
-        attr = getattr(self._obj, name)
-        full_path = f"{self._path}.{name}" if self._path else name
+async def close_stream(stream: Any) -> None:
+    """Close an SDK stream (sync or async ``close``/``aclose``) if it supports it."""
+    close = getattr(stream, "close", None) or getattr(stream, "aclose", None)
+    if close is None:
+        return
+    result = close()
+    if inspect.isawaitable(result):
+        await result
+
+
+class _GuardedAsyncStream:
+    """Async stream that keeps its guard entered until exhausted, failed or closed.
+
+    ``create(stream=True)`` returns once the response starts, so releasing the
+    guard there would leave token generation unbounded and hide mid-stream
+    failures from the breaker. The slot is released, and the outcome recorded,
+    when iteration ends.
+    """
+
+    def __init__(self, stream: Any, guard_cm: AbstractAsyncContextManager[None]):
+        self._stream = stream
+        self._guard_cm = guard_cm
+        self._iterator: Any = None
+        self._settled = False
+
+    async def _settle(self, exc: BaseException | None) -> None:
+        if self._settled:
+            return
+        self._settled = True
+        if exc is None:
+            await self._guard_cm.__aexit__(None, None, None)
+        else:
+            await self._guard_cm.__aexit__(type(exc), exc, exc.__traceback__)
+
+    def __aiter__(self) -> _GuardedAsyncStream:
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._iterator is None:
+            self._iterator = self._stream.__aiter__()
+        try:
+            return await self._iterator.__anext__()
+        except StopAsyncIteration:
+            await self._settle(None)
+            raise
+        except BaseException as exc:
+            await self._settle(exc)
+            raise
+
+    async def close(self) -> None:
+        try:
+            await close_stream(self._stream)
+        finally:
+            await self._settle(None)
+
+    aclose = close
+
+    async def __aenter__(self) -> _GuardedAsyncStream:
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        await self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._stream, name)
+
+
+class _GuardedStream:
+    """Sync counterpart of _GuardedAsyncStream."""
+
+    def __init__(self, stream: Any, guard_cm: AbstractContextManager[None]):
+        self._stream = stream
+        self._guard_cm = guard_cm
+        self._iterator: Any = None
+        self._settled = False
+
+    def _settle(self, exc: BaseException | None) -> None:
+        if self._settled:
+            return
+        self._settled = True
+        if exc is None:
+            self._guard_cm.__exit__(None, None, None)
+        else:
+            self._guard_cm.__exit__(type(exc), exc, exc.__traceback__)
+
+    def __iter__(self) -> _GuardedStream:
+        return self
+
+    def __next__(self) -> Any:
+        if self._iterator is None:
+            self._iterator = iter(self._stream)
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            self._settle(None)
+            raise
+        except BaseException as exc:
+            self._settle(exc)
+            raise
+
+    def close(self) -> None:
+        try:
+            close = getattr(self._stream, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._settle(None)
+
+    def __enter__(self) -> _GuardedStream:
+        return self
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._stream, name)
+
+
+async def _open_stream_async(
+    guard: UpstreamGuard, attr: Callable[..., Any], full_path: str, *args: Any, **kwargs: Any
+) -> Any:
+    guard_cm = guard.protect_async()
+    try:
+        await guard_cm.__aenter__()
+    except (CircuitBreakerError, BulkheadFullError) as exc:
+        raise _rejected(full_path, exc) from exc
+    try:
+        stream = await attr(*args, **kwargs)
+    except BaseException as exc:
+        await guard_cm.__aexit__(type(exc), exc, exc.__traceback__)
+        raise
+    if not hasattr(stream, "__aiter__"):
+        # Some SDK/fake implementations ignore stream=True and return the response.
+        await guard_cm.__aexit__(None, None, None)
+        return stream
+    return _GuardedAsyncStream(stream, guard_cm)
+
+
+def _open_stream(
+    guard: UpstreamGuard, attr: Callable[..., Any], full_path: str, *args: Any, **kwargs: Any
+) -> Any:
+    guard_cm = guard.protect()
+    try:
+        guard_cm.__enter__()
+    except (CircuitBreakerError, BulkheadFullError) as exc:
+        raise _rejected(full_path, exc) from exc
+    try:
+        stream = attr(*args, **kwargs)
+    except BaseException as exc:
+        guard_cm.__exit__(type(exc), exc, exc.__traceback__)
+        raise
+    if not hasattr(stream, "__iter__"):
+        guard_cm.__exit__(None, None, None)
+        return stream
+    return _GuardedStream(stream, guard_cm)
+
+
+def _guarded_callable(guard: UpstreamGuard, attr: Callable[..., Any], full_path: str) -> Any:
+    """Wrap a client method; coroutine functions are awaited under the async guard.
+
+    ``stream=True`` calls return a stream wrapper that holds the guard until the
+    stream is exhausted or closed.
+    """
+    if inspect.iscoroutinefunction(attr):
+
+        async def wrapped_async(*args: Any, **kwargs: Any) -> Any:
+            if kwargs.get("stream") is True:
+                return await _open_stream_async(guard, attr, full_path, *args, **kwargs)
+            try:
+                return await guard.call_async(attr, *args, **kwargs)
+            except (CircuitBreakerError, BulkheadFullError) as exc:
+                raise _rejected(full_path, exc) from exc
+
+        return wrapped_async
+
+    def wrapped(*args: Any, **kwargs: Any) -> Any:
+        if kwargs.get("stream") is True:
+            return _open_stream(guard, attr, full_path, *args, **kwargs)
+        try:
+            return guard.call(attr, *args, **kwargs)
+        except (CircuitBreakerError, BulkheadFullError) as exc:
+            raise _rejected(full_path, exc) from exc
+
+    return wrapped
+
+
+def _resolve_guarded(
+    target: Any, guard: UpstreamGuard, name: str, full_path: str
+) -> tuple[Any, bool]:
+    """Return (wrapper, cacheable) for attribute ``name`` of ``target``."""
+    attr = getattr(target, name)
+    if callable(attr):
+        return _guarded_callable(guard, attr, full_path), True
+    if _is_proxyable_resource(attr):
+        return _ResilientProxy(attr, guard, full_path), True
+    return attr, False
 
-        if callable(attr):
 
-            def wrapped(*args: Any, **kwargs: Any) -> Any:
-                try:
-                    return self._circuit_breaker.call(attr, *args, **kwargs)
-                except CircuitBreakerError as exc:
-                    logger.warning("Circuit breaker rejected call to %s: %s", full_path, exc)
-                    raise LlamaStackConnectionError(
-                        message=f"Circuit breaker is open for {full_path}",
-                        url=settings.llama_stack_url,
-                        cause=exc,
-                    ) from exc
+class _ResilientProxy:
+    """Proxy that wraps nested resource objects so the guard covers .foo.bar.baz().
 
-            return wrapped
+    Wrappers are built once per attribute and stored on the proxy, so repeated
+    access (client.responses.create on every turn) skips __getattr__ entirely.
+    """
 
-        if _is_proxyable_resource(attr):
-            return _ResilientProxy(attr, self._circuit_breaker, full_path)
+    def __init__(self, obj: Any, guard: UpstreamGuard, path: str):
+        self._obj = obj
+        self._guard = guard
+        self._path = path
 
-        return attr
+    def __getattr__(self, name: str) -> Any:  # pragma: no cover - exercised via ResilientClient
+        full_path = f"{self._path}.{name}" if self._path else name
+        value, cacheable = _resolve_guarded(self._obj, self._guard, name, full_path)
+        if cacheable:
+            self.__dict__[name] = value
+        return value
 
 
 class ResilientClient:
-    """Wrapper around LlamaStackClient with optional circuit breaker."""
+    """Wrapper around a (sync or async) Llama Stack client with breaker + bulkhead.
 
-    def __init__(self, client: LlamaStackClient, circuit_breaker: CircuitBreaker | None = None):
+    Each top-level resource is guarded by its endpoint's registry guard
+    (responses, safety, vector_io, other). An explicit ``circuit_breaker``
+    replaces the breakers of all of them.
+    """
+
+    def __init__(self, client: Any, circuit_breaker: CircuitBreaker | None = None):
         self._client = client
-        self._circuit_breaker = circuit_breaker or _get_circuit_breaker()
+        self._guard: UpstreamGuard | None = None
+        if circuit_breaker is not None:
+            registry_guard = get_guard("llama_stack")
+            self._guard = UpstreamGuard(
+                "llama_stack", circuit_breaker, registry_guard.bulkhead, registry_guard.limiter
+            )
+        self._circuit_breaker = circuit_breaker or _endpoint_guard("responses").breaker
 
     def __getattr__(self, name: str) -> Any:  # pragma: no cover - passthrough
-        attr = getattr(self._client, name)
-        if callable(attr) and self._circuit_breaker:
-
-            def wrapped(*args: Any, **kwargs: Any) -> Any:
-                try:
-                    return self._circuit_breaker.call(attr, *args, **kwargs)
-                except CircuitBreakerError as exc:
-                    logger.warning("Circuit breaker rejected call to %s: %s", name, exc)
-                    raise LlamaStackConnectionError(
-                        message=f"Circuit breaker is open for {name}",
-                        url=settings.llama_stack_url,
-                        cause=exc,
-                    ) from exc
-
-            return wrapped
-
-        if self._circuit_breaker and _is_proxyable_resource(attr):
-            return _ResilientProxy(attr, self._circuit_breaker, name)
-
-        return attr
+        guard = self._guard or _endpoint_guard(name)
+        value, cacheable = _resolve_guarded(self._client, guard, name, name)
+        if cacheable:
+            self.__dict__[name] = value
+        return value
 
     @property
     def circuit_breaker(self) -> CircuitBreaker | None:
         return self._circuit_breaker
 
+    @property
+    def is_async(self) -> bool:
+        return isinstance(self._client, AsyncLlamaStackClient)
+
 
 @lru_cache(maxsize=1)
 def get_sync_client() -> LlamaStackClient | ResilientClient:
@@ -171,13 +393,20 @@ def get_sync_client() -> LlamaStackClient | ResilientClient:
 
 @lru_cache(maxsize=1)
 def get_async_client() -> AsyncLlamaStackClient:
-    """Cached async client for FastAPI and LangGraph."""
+    """Cached async client for FastAPI and LangGraph.
+
+    With circuit_breaker_enabled the client is wrapped in ResilientClient; its
+    coroutine methods are awaited under their llama_stack endpoint guard natively.
+    """
     logger.info("Creating async Llama Stack client for %s", settings.llama_stack_url)
     try:
-        return AsyncLlamaStackClient(
+        client = AsyncLlamaStackClient(
             base_url=settings.llama_stack_url,
             timeout=120.0,
         )
+        if settings.circuit_breaker_enabled:
+            return ResilientClient(client)  # type: ignore[return-value]
+        return client
     except Exception as exc:  # pragma: no cover - defensive logging
         logger.error("Failed to create async Llama Stack client: %s", exc)
         raise LlamaStackConnectionError(
@@ -218,10 +447,14 @@ async def async_chat_stream(
     client = client or get_async_client()
     model = model_id or settings.llama_stack_model
     stream = await client.chat.completions.create(model=model, messages=messages, stream=True)
-    async for chunk in stream:  # type: ignore[operator]
-        content = _extract_streaming_chunk(chunk)
-        if content:
-            yield content
+    try:
+        async for chunk in stream:  # type: ignore[operator]
+            content = _extract_streaming_chunk(chunk)
+            if content:
+                yield content
+    finally:
+        # Release the guard slot even if the consumer stops early.
+        await close_stream(stream)
 
 
 def _extract_content(response: Any) -> str:
@@ -9,6 +9,7 @@ import httpx
 
 from myloware.config import settings
 from myloware.observability.logging import get_logger
+from myloware.resilience.registry import get_guard
 
 logger = get_logger("notifications.telegram")
 
@@ -73,10 +74,11 @@ class TelegramNotifier:
 
         async def _post(active_client: httpx.AsyncClient) -> NotificationResult:
             try:
-                response = await active_client.post(
-                    f"{self.api_base}/sendMessage",
-                    json=payload,
-                )
+                async with get_guard("telegram", "send_message").protect_async():
+                    response = await active_client.post(
+                        f"{self.api_base}/sendMessage",
+                        json=payload,
+                    )
                 data = response.json()
 
                 if data.get("ok"):
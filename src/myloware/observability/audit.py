@@ -2,20 +2,225 @@
 
 Provides a fire-and-forget pattern that logs audit events without
 blocking request processing. Failures are logged but never propagate.
+
+In the API and worker processes a buffered writer is started on the main
+event loop (``start_audit_writer``): ``log_audit_event`` only enqueues the
+row, and a background task bulk-inserts batches once ``audit_batch_size``
+events are buffered or ``audit_flush_interval_seconds`` has passed. The queue
+is bounded; when it is full new events are dropped and counted rather than
+applying backpressure to callers. ``stop_audit_writer`` drains the queue.
+
+Without a running writer (scripts, CLI, tests) events are written
+synchronously, as before.
 """
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import insert
+
+from myloware.config import settings
 from myloware.observability.logging import get_logger
-from myloware.storage.database import get_session
+from myloware.storage.database import get_async_session_factory, get_session
+from myloware.storage.models import AuditLog
 from myloware.storage.repositories import AuditLogRepository
 
 logger = get_logger(__name__)
 
-__all__ = ["log_audit_event"]
+__all__ = ["log_audit_event", "start_audit_writer", "stop_audit_writer", "AuditWriter"]
+
+AUDIT_EVENTS = Counter(
+    "myloware_audit_events_total",
+    "Audit events by result (written, dropped, failed)",
+    ["result"],
+)
+AUDIT_QUEUE_DEPTH = Gauge(
+    "myloware_audit_queue_depth",
+    "Audit events buffered and not yet written",
+)
+AUDIT_LAG_SECONDS = Histogram(
+    "myloware_audit_lag_seconds",
+    "Time from log_audit_event() to the batch insert committing",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+AUDIT_BATCH_SIZE = Histogram(
+    "myloware_audit_batch_size",
+    "Rows per audit batch insert",
+    buckets=(1, 5, 10, 25, 50, 100, 200, 500, 1000),
+)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class AuditWriter:
+    """Bounded queue of audit rows drained by one task on its event loop."""
+
+    def __init__(
+        self,
+        *,
+        max_size: int | None = None,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+    ) -> None:
+        self.max_size = max(1, int(max_size or settings.audit_queue_max_size))
+        self.batch_size = max(1, int(batch_size or settings.audit_batch_size))
+        self.flush_interval = float(
+            flush_interval if flush_interval is not None else settings.audit_flush_interval_seconds
+        )
+        self._queue: asyncio.Queue[tuple[dict[str, Any], float] | None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done() and not self._closing
+
+    def start(self) -> None:
+        """Start the drain task on the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._closing = False
+        self._task = self._loop.create_task(self._drain(), name="myloware-audit-writer")
+
+    def submit(self, row: dict[str, Any]) -> None:
+        """Enqueue a row from any thread; never blocks."""
+        loop = self._loop
+        if loop is None:
+            return
+        item = (row, time.monotonic())
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._enqueue(item)
+        else:
+            loop.call_soon_threadsafe(self._enqueue, item)
+
+    def _enqueue(self, item: tuple[dict[str, Any], float]) -> None:
+        assert self._queue is not None
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            AUDIT_EVENTS.labels(result="dropped").inc()
+            logger.warning("audit_event_dropped", action=item[0].get("action"))
+            return
+        AUDIT_QUEUE_DEPTH.set(self._queue.qsize())
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Flush everything buffered, then stop the drain task."""
+        task = self._task
+        if task is None:
+            return
+        self._closing = True
+        if self._queue is not None:
+            try:
+                self._queue.put_nowait(None)  # type: ignore[arg-type]
+            except asyncio.QueueFull:
+                pass  # drain task is busy and will observe _closing
+        try:
+            await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "audit_writer_drain_timeout", pending=self._queue.qsize() if self._queue else 0
+            )
+            task.cancel()
+        self._task = None
+
+    async def _next_batch(self) -> list[tuple[dict[str, Any], float]]:
+        """Wait for the first event, then collect until full or the flush deadline."""
+        assert self._queue is not None
+        queue = self._queue
+        batch: list[tuple[dict[str, Any], float]] = []
+        deadline = 0.0
+        item: tuple[dict[str, Any], float] | None
+        while len(batch) < self.batch_size:
+            try:
+                item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                if self._closing:
+                    break
+                if not batch:
+                    item = await queue.get()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+            if item is None:  # stop() wake-up
+                continue
+            if not batch:
+                deadline = time.monotonic() + self.flush_interval
+            batch.append(item)
+        return batch
+
+    async def _drain(self) -> None:
+        assert self._queue is not None
+        while True:
+            batch = await self._next_batch()
+            AUDIT_QUEUE_DEPTH.set(self._queue.qsize())
+            if batch:
+                await self._write(batch)
+            elif self._closing:
+                return
+
+    async def _write(self, batch: list[tuple[dict[str, Any], float]]) -> None:
+        rows = [row for row, _ in batch]
+        try:
+            SessionLocal = get_async_session_factory()
+            async with SessionLocal() as session:
+                # One executemany for the whole batch.
+                await session.execute(insert(AuditLog), rows)
+                await session.commit()
+        except Exception as exc:
+            AUDIT_EVENTS.labels(result="failed").inc(len(rows))
+            logger.error("audit_batch_write_failed", rows=len(rows), error=str(exc))
+            return
+
+        now = time.monotonic()
+        AUDIT_EVENTS.labels(result="written").inc(len(rows))
+        AUDIT_BATCH_SIZE.observe(len(rows))
+        for _, enqueued_at in batch:
+            AUDIT_LAG_SECONDS.observe(now - enqueued_at)
+
+
+_writer: AuditWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def start_audit_writer(**kwargs: Any) -> AuditWriter:
+    """Start the process audit writer on the running loop (idempotent)."""
+    global _writer
+    with _writer_lock:
+        if _writer is not None and _writer.running:
+            return _writer
+        writer = AuditWriter(**kwargs)
+        writer.start()
+        _writer = writer
+    logger.info("Audit writer started", batch_size=writer.batch_size, max_size=writer.max_size)
+    return writer
+
+
+async def stop_audit_writer(timeout: float = 10.0) -> None:
+    """Drain and stop the process audit writer (no-op if not started)."""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        await writer.stop(timeout)
 
 
 def log_audit_event(
@@ -39,6 +244,25 @@ def log_audit_event(
         outcome: Optional outcome ("success", "failure")
         metadata: Optional additional context
     """
+    writer = _writer
+    if writer is not None and writer.running:
+        try:
+            writer.submit(
+                {
+                    "action": action,
+                    "user_id": user_id,
+                    "run_id": run_id,
+                    "duration_ms": duration_ms,
+                    "outcome": outcome,
+                    "audit_metadata": metadata or {},
+                    "created_at": _utc_now(),
+                }
+            )
+            return
+        except RuntimeError:
+            # Writer loop already closed; fall back to a direct write below.
+            pass
+
     try:
         with get_session() as session:
             repo = AuditLogRepository(session)
@@ -1,5 +1,29 @@
 """Resilience patterns for production reliability."""
 
-from myloware.resilience.circuit_breaker import CircuitBreaker
+from myloware.resilience.adaptive import (
+    AdaptiveLimiter,
+    get_adaptive_limiter,
+    reset_adaptive_limiters,
+)
+from myloware.resilience.bulkhead import Bulkhead, BulkheadFullError
+from myloware.resilience.circuit_breaker import CircuitBreaker, CircuitBreakerError
+from myloware.resilience.registry import (
+    UpstreamGuard,
+    get_guard,
+    reset_resilience_registry,
+    resilience_snapshot,
+)
 
-__all__ = ["CircuitBreaker"]
+__all__ = [
+    "AdaptiveLimiter",
+    "Bulkhead",
+    "BulkheadFullError",
+    "CircuitBreaker",
+    "CircuitBreakerError",
+    "UpstreamGuard",
+    "get_adaptive_limiter",
+    "get_guard",
+    "reset_adaptive_limiters",
+    "reset_resilience_registry",
+    "resilience_snapshot",
+]
@@ -0,0 +1,257 @@
+"""Adaptive (AIMD) concurrency limits per provider key.
+
+A fixed bulkhead protects us from a slow upstream, but the right concurrency
+for a rate-limited provider (OpenAI videos, or a hosted Llama Stack model
+backend) is not known up front and changes with account tier and load. An
+AdaptiveLimiter starts at a configured limit and:
+
+- widens additively on success (about +1 per limit's worth of successful calls),
+- halves (``decrease_factor``) on a 429, at most once per cooling interval so a
+  burst of in-flight 429s counts as one signal,
+- pauses admission for the ``Retry-After`` the provider asked for, so every
+  caller in the process backs off together instead of retrying independently.
+
+Limiters are keyed by provider, not endpoint: the Sora tool, the video poller
+and the agents all draw from the same limiter for a provider because they
+share the provider's rate limit. UpstreamGuard applies the limiter
+automatically for providers listed in ``adaptive_concurrency_initial``.
+
+With ``adaptive_concurrency_distributed`` enabled, async callers additionally
+take a token from a Postgres token bucket (rate_limit_buckets), serialized
+across processes by an advisory lock.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from prometheus_client import Counter, Gauge
+
+from myloware.config import settings
+from myloware.observability.logging import get_logger
+from myloware.resilience.bulkhead import Bulkhead
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "AdaptiveLimiter",
+    "get_adaptive_limiter",
+    "rate_limit_signal",
+    "reset_adaptive_limiters",
+]
+
+ADAPTIVE_LIMIT = Gauge(
+    "myloware_adaptive_concurrency_limit",
+    "Current AIMD concurrency limit per provider",
+    ["provider"],
+)
+ADAPTIVE_RATE_LIMITED = Counter(
+    "myloware_adaptive_rate_limited_total",
+    "429 responses observed by the adaptive limiter",
+    ["provider"],
+)
+
+_DEFAULT_RETRY_AFTER_S = 1.0
+_MAX_RETRY_AFTER_S = 300.0
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def rate_limit_signal(exc: BaseException) -> tuple[bool, float | None]:
+    """Return ``(is_rate_limited, retry_after_seconds)`` for an upstream error.
+
+    Works for httpx.HTTPStatusError and SDK errors that expose ``status_code``
+    and/or ``response`` (llama_stack_client / openai APIStatusError).
+    """
+    response: Any = getattr(exc, "response", None)
+    status = getattr(exc, "status_code", None)
+    if status is None and response is not None:
+        status = getattr(response, "status_code", None)
+    if status != 429:
+        return False, None
+    headers = getattr(response, "headers", None) or {}
+    try:
+        raw = headers.get("retry-after")
+    except AttributeError:
+        raw = None
+    return True, _parse_retry_after(raw)
+
+
+class AdaptiveLimiter(Bulkhead):
+    """Bulkhead whose limit follows additive-increase / multiplicative-decrease."""
+
+    def __init__(
+        self,
+        provider: str,
+        *,
+        initial: int,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        decrease_factor: float = 0.5,
+        max_wait: float = 120.0,
+        cooldown: float = 1.0,
+    ) -> None:
+        self.min_limit = max(1, int(min_limit))
+        self.max_limit = max(self.min_limit, int(max_limit))
+        self.decrease_factor = decrease_factor
+        self.cooldown = cooldown
+        self._limit = float(min(self.max_limit, max(self.min_limit, int(initial))))
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._state_lock = threading.Lock()
+        self.provider = provider
+        # Distinct bulkhead name so its gauges don't collide with the guard's bulkhead.
+        super().__init__(f"{provider}:adaptive", max_concurrent=int(self._limit), max_wait=max_wait)
+        ADAPTIVE_LIMIT.labels(provider=provider).set(self._limit)
+
+    @property
+    def limit(self) -> float:
+        return self._limit
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds until admission resumes after a Retry-After (0 if not paused)."""
+        return max(0.0, self._paused_until - time.monotonic())
+
+    def _apply_limit(self, limit: float) -> None:
+        self._limit = limit
+        ADAPTIVE_LIMIT.labels(provider=self.provider).set(limit)
+        if int(limit) != self.max_concurrent:
+            self.set_limit(int(limit))
+
+    def on_success(self) -> None:
+        """Additive increase: roughly +1 slot per ``limit`` successful calls."""
+        with self._state_lock:
+            if self._limit >= self.max_limit:
+                return
+            self._apply_limit(min(float(self.max_limit), self._limit + 1.0 / self._limit))
+
+    def on_rate_limited(self, retry_after: float | None = None) -> None:
+        """Multiplicative decrease and a shared pause for ``retry_after`` seconds."""
+        ADAPTIVE_RATE_LIMITED.labels(provider=self.provider).inc()
+        pause = min(
+            _MAX_RETRY_AFTER_S, retry_after if retry_after is not None else _DEFAULT_RETRY_AFTER_S
+        )
+        now = time.monotonic()
+        with self._state_lock:
+            self._paused_until = max(self._paused_until, now + pause)
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            previous = self._limit
+            self._apply_limit(max(float(self.min_limit), self._limit * self.decrease_factor))
+        logger.warning(
+            "Provider %s rate limited; concurrency %.1f -> %.1f, pausing %.1fs",
+            self.provider,
+            previous,
+            self._limit,
+            pause,
+        )
+
+    def record(self, exc: BaseException | None) -> None:
+        """Feed the outcome of one call back into the limit."""
+        if exc is None:
+            self.on_success()
+            return
+        limited, retry_after = rate_limit_signal(exc)
+        if limited:
+            self.on_rate_limited(retry_after)
+
+    def acquire(self) -> None:
+        pause = self.paused_for
+        if pause > 0:
+            time.sleep(pause)
+        super().acquire()
+
+    async def acquire_async(self) -> None:
+        pause = self.paused_for
+        if pause > 0:
+            await asyncio.sleep(pause)
+        await super().acquire_async()
+        try:
+            # A 429 may have arrived while we queued for the slot.
+            pause = self.paused_for
+            if pause > 0:
+                await asyncio.sleep(pause)
+            if getattr(settings, "adaptive_concurrency_distributed", False):
+                await self._take_distributed_token_async()
+        except BaseException:
+            self.release()
+            raise
+
+    async def _take_distributed_token_async(self) -> None:
+        rates: dict[str, float] = dict(
+            getattr(settings, "adaptive_concurrency_bucket_rates", {}) or {}
+        )
+        rate = rates.get(self.provider)
+        if not rate:
+            return
+        from myloware.storage.database import get_async_session_factory
+        from myloware.storage.repositories import RateLimitBucketRepository
+
+        burst = float(getattr(settings, "adaptive_concurrency_bucket_burst", 5.0))
+        SessionLocal = get_async_session_factory()
+        while True:
+            async with SessionLocal() as session:
+                wait = await RateLimitBucketRepository(session).take_token_async(
+                    f"provider:{self.provider}",
+                    rate=float(rate),
+                    burst=burst,
+                    now=datetime.now(timezone.utc).replace(tzinfo=None),
+                )
+                await session.commit()
+            if wait <= 0:
+                return
+            await asyncio.sleep(min(wait, _MAX_RETRY_AFTER_S))
+
+
+_lock = threading.Lock()
+_limiters: dict[str, AdaptiveLimiter] = {}
+
+
+def get_adaptive_limiter(provider: str) -> AdaptiveLimiter | None:
+    """Return the shared limiter for ``provider``, or None if it is not adaptive."""
+    limiter = _limiters.get(provider)
+    if limiter is not None:
+        return limiter
+    initial = (getattr(settings, "adaptive_concurrency_initial", {}) or {}).get(provider)
+    if initial is None:
+        return None
+    with _lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = AdaptiveLimiter(
+                provider,
+                initial=int(initial),
+                min_limit=settings.adaptive_concurrency_min,
+                max_limit=settings.adaptive_concurrency_max,
+                decrease_factor=settings.adaptive_concurrency_decrease_factor,
+                max_wait=settings.adaptive_concurrency_max_wait_seconds,
+            )
+            _limiters[provider] = limiter
+    return limiter
+
+
+def reset_adaptive_limiters() -> None:
+    """Drop all limiters (tests, or after changing settings)."""
+    with _lock:
+        _limiters.clear()
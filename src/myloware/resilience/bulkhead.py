@@ -0,0 +1,171 @@
+"""Bounded-concurrency bulkhead shared by threads and event loops.
+
+A bulkhead caps how many calls to one upstream may be in flight at once, so a
+slow dependency cannot occupy every worker slot. Callers over the limit wait
+up to ``max_wait`` seconds for a slot and are then rejected with
+BulkheadFullError.
+
+Unlike asyncio.Semaphore, a slot is process-wide: the API loop, the tool loop
+and worker threads all draw from the same counter. Released slots are handed
+directly to the oldest waiter (sync or async) so waiters cannot be starved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Callable, Iterator
+
+from myloware.observability.logging import get_logger
+from myloware.resilience.metrics import BULKHEAD_IN_FLIGHT, BULKHEAD_LIMIT, RESILIENCE_REJECTIONS
+
+logger = get_logger(__name__)
+
+__all__ = ["Bulkhead", "BulkheadFullError"]
+
+
+class BulkheadFullError(Exception):
+    """Raised when no bulkhead slot frees up within ``max_wait``."""
+
+    pass
+
+
+class _Waiter:
+    __slots__ = ("state", "notify")
+
+    def __init__(self, notify: Callable[[], None]) -> None:
+        self.state = "waiting"  # waiting -> granted | abandoned (guarded by the bulkhead lock)
+        self.notify = notify
+
+
+class Bulkhead:
+    """Process-wide concurrency limit for one upstream."""
+
+    def __init__(self, name: str, max_concurrent: int, max_wait: float = 0.0) -> None:
+        self.name = name
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.max_wait = max(0.0, float(max_wait))
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiters: deque[_Waiter] = deque()
+        BULKHEAD_LIMIT.labels(upstream=name).set(self.max_concurrent)
+        BULKHEAD_IN_FLIGHT.labels(upstream=name).set(0)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    def _try_acquire_locked(self) -> bool:
+        if self._in_flight < self.max_concurrent and not self._waiters:
+            self._in_flight += 1
+            BULKHEAD_IN_FLIGHT.labels(upstream=self.name).set(self._in_flight)
+            return True
+        return False
+
+    def _reject(self) -> BulkheadFullError:
+        RESILIENCE_REJECTIONS.labels(upstream=self.name, reason="bulkhead_full").inc()
+        logger.warning("Bulkhead %s full, rejecting call", self.name, limit=self.max_concurrent)
+        return BulkheadFullError(
+            f"Bulkhead {self.name} is full ({self.max_concurrent} calls in flight)"
+        )
+
+    def _abandon(self, waiter: _Waiter) -> bool:
+        """Withdraw a waiter; returns False if a slot was already granted to it."""
+        with self._lock:
+            if waiter.state == "granted":
+                return False
+            waiter.state = "abandoned"
+            try:
+                self._waiters.remove(waiter)
+            except ValueError:
+                pass
+            return True
+
+    def _grant_locked(self) -> None:
+        """Hand free slots to the oldest live waiters (caller holds the lock)."""
+        while self._waiters and self._in_flight < self.max_concurrent:
+            waiter = self._waiters.popleft()
+            if waiter.state != "waiting":
+                continue
+            try:
+                waiter.notify()
+            except RuntimeError:  # waiter's event loop already closed
+                waiter.state = "abandoned"
+                continue
+            waiter.state = "granted"
+            self._in_flight += 1
+        BULKHEAD_IN_FLIGHT.labels(upstream=self.name).set(self._in_flight)
+
+    def set_limit(self, max_concurrent: int) -> None:
+        """Change the concurrency limit; a higher limit admits waiters immediately."""
+        with self._lock:
+            self.max_concurrent = max(1, int(max_concurrent))
+            BULKHEAD_LIMIT.labels(upstream=self.name).set(self.max_concurrent)
+            self._grant_locked()
+
+    def release(self) -> None:
+        """Return a slot, handing it to the oldest live waiter if any."""
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._grant_locked()
+
+    def acquire(self) -> None:
+        """Take a slot, blocking the calling thread up to ``max_wait``."""
+        with self._lock:
+            if self._try_acquire_locked():
+                return
+            if self.max_wait <= 0:
+                raise self._reject()
+            event = threading.Event()
+            waiter = _Waiter(event.set)
+            self._waiters.append(waiter)
+        if not event.wait(self.max_wait) and self._abandon(waiter):
+            raise self._reject()
+
+    async def acquire_async(self) -> None:
+        """Take a slot without blocking the event loop, waiting up to ``max_wait``."""
+        with self._lock:
+            if self._try_acquire_locked():
+                return
+            if self.max_wait <= 0:
+                raise self._reject()
+            loop = asyncio.get_running_loop()
+            future: asyncio.Future[None] = loop.create_future()
+
+            def _wake() -> None:
+                if not future.done():
+                    future.set_result(None)
+
+            waiter = _Waiter(lambda: loop.call_soon_threadsafe(_wake))
+            self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.max_wait)
+        except asyncio.TimeoutError:
+            if self._abandon(waiter):
+                raise self._reject() from None
+        except asyncio.CancelledError:
+            if not self._abandon(waiter):
+                self.release()  # granted while being cancelled: give the slot back
+            raise
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def slot_async(self) -> AsyncIterator[None]:
+        await self.acquire_async()
+        try:
+            yield
+        finally:
+            self.release()
@@ -1,16 +1,21 @@
-"""Circuit breaker pattern for Llama Stack client calls.
+"""Circuit breaker pattern for upstream calls.
 
-Prevents cascading failures when Llama Stack is unavailable or slow.
+Prevents cascading failures when an upstream (Llama Stack, OpenAI Videos,
+Remotion, ...) is unavailable or slow. Breakers are thread-safe, use a
+monotonic clock, and protect both sync (``call``) and async (``call_async``)
+callables. Per-upstream instances live in myloware.resilience.registry.
 """
 
 from __future__ import annotations
 
+import threading
 import time
 from enum import Enum
-from typing import Any, Callable, TypeVar
+from typing import Any, Awaitable, Callable, TypeVar
 
 from myloware.config import settings
 from myloware.observability.logging import get_logger
+from myloware.resilience.metrics import CIRCUIT_STATE, CIRCUIT_STATE_VALUES, RESILIENCE_REJECTIONS
 
 logger = get_logger(__name__)
 
@@ -71,23 +76,79 @@ class CircuitBreaker:
         self._last_failure_time: float | None = None
         self._half_open_calls = 0
         self._success_count = 0
+        self._lock = threading.RLock()
+        self._publish_state()
+
+    def _publish_state(self) -> None:
+        CIRCUIT_STATE.labels(upstream=self.name).set(CIRCUIT_STATE_VALUES[self._state.value])
 
     @property
     def state(self) -> CircuitState:
         """Get current circuit state."""
-        # Check if we should transition from OPEN to HALF_OPEN
-        if self._state == CircuitState.OPEN and self._last_failure_time:
-            elapsed = time.time() - self._last_failure_time
-            if elapsed >= self.recovery_timeout:
-                logger.info(
-                    "Circuit breaker %s transitioning OPEN -> HALF_OPEN (recovery timeout)",
-                    self.name,
-                )
-                self._state = CircuitState.HALF_OPEN
-                self._half_open_calls = 0
-                self._success_count = 0
+        with self._lock:
+            # Check if we should transition from OPEN to HALF_OPEN
+            if self._state == CircuitState.OPEN and self._last_failure_time:
+                elapsed = time.monotonic() - self._last_failure_time
+                if elapsed >= self.recovery_timeout:
+                    logger.info(
+                        "Circuit breaker %s transitioning OPEN -> HALF_OPEN (recovery timeout)",
+                        self.name,
+                    )
+                    self._state = CircuitState.HALF_OPEN
+                    self._half_open_calls = 0
+                    self._success_count = 0
+                    self._publish_state()
+
+            return self._state
+
+    def before_call(self) -> None:
+        """Admit one call or raise CircuitBreakerError (pair with record_success/failure)."""
+        with self._lock:
+            current_state = self.state
+
+            # Reject immediately if open
+            if current_state == CircuitState.OPEN:
+                logger.warning("Circuit breaker %s is OPEN, rejecting call", self.name)
+                RESILIENCE_REJECTIONS.labels(upstream=self.name, reason="circuit_open").inc()
+                raise CircuitBreakerError(f"Circuit breaker {self.name} is OPEN")
+
+            # Limit calls in half-open state
+            if current_state == CircuitState.HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    logger.warning(
+                        "Circuit breaker %s HALF_OPEN max calls reached, opening circuit",
+                        self.name,
+                    )
+                    self._state = CircuitState.OPEN
+                    self._last_failure_time = time.monotonic()
+                    self._publish_state()
+                    RESILIENCE_REJECTIONS.labels(upstream=self.name, reason="circuit_open").inc()
+                    raise CircuitBreakerError(
+                        f"Circuit breaker {self.name} exceeded half-open limit"
+                    )
+
+                self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        """Report a successful call admitted by before_call()."""
+        with self._lock:
+            self._on_success()
 
-        return self._state
+    def record_failure(self) -> None:
+        """Report a failed call admitted by before_call()."""
+        with self._lock:
+            self._on_failure()
+
+    async def call_async(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        """Await ``func`` with circuit breaker protection (see call())."""
+        self.before_call()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
 
     def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
         """Execute function with circuit breaker protection.
@@ -103,34 +164,16 @@ class CircuitBreaker:
         Raises:
             CircuitBreakerError: If circuit is open
         """
-        current_state = self.state
-
-        # Reject immediately if open
-        if current_state == CircuitState.OPEN:
-            logger.warning("Circuit breaker %s is OPEN, rejecting call", self.name)
-            raise CircuitBreakerError(f"Circuit breaker {self.name} is OPEN")
-
-        # Limit calls in half-open state
-        if current_state == CircuitState.HALF_OPEN:
-            if self._half_open_calls >= self.half_open_max_calls:
-                logger.warning(
-                    "Circuit breaker %s HALF_OPEN max calls reached, opening circuit",
-                    self.name,
-                )
-                self._state = CircuitState.OPEN
-                self._last_failure_time = time.time()
-                raise CircuitBreakerError(f"Circuit breaker {self.name} exceeded half-open limit")
-
-            self._half_open_calls += 1
+        self.before_call()
 
         # Execute function
         try:
             result = func(*args, **kwargs)
-            self._on_success()
-            return result
         except Exception:
-            self._on_failure()
+            self.record_failure()
             raise
+        self.record_success()
+        return result
 
     def _on_success(self) -> None:
         """Handle successful call."""
@@ -146,6 +189,7 @@ class CircuitBreaker:
                 self._half_open_calls = 0
                 self._success_count = 0
                 self._last_failure_time = None
+                self._publish_state()
         else:
             # Reset failure count on success in closed state
             self._failure_count = 0
@@ -153,7 +197,7 @@ class CircuitBreaker:
     def _on_failure(self) -> None:
         """Handle failed call."""
         self._failure_count += 1
-        self._last_failure_time = time.time()
+        self._last_failure_time = time.monotonic()
 
         if self._state == CircuitState.HALF_OPEN:
             # Failure in half-open -> back to open
@@ -161,6 +205,7 @@ class CircuitBreaker:
             self._state = CircuitState.OPEN
             self._half_open_calls = 0
             self._success_count = 0
+            self._publish_state()
         elif self._failure_count >= self.failure_threshold:
             # Too many failures in closed state -> open
             logger.warning(
@@ -169,12 +214,15 @@ class CircuitBreaker:
                 self.failure_threshold,
             )
             self._state = CircuitState.OPEN
+            self._publish_state()
 
     def reset(self) -> None:
         """Manually reset circuit breaker to closed state."""
         logger.info("Circuit breaker %s manually reset to CLOSED", self.name)
-        self._state = CircuitState.CLOSED
-        self._failure_count = 0
-        self._last_failure_time = None
-        self._half_open_calls = 0
-        self._success_count = 0
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failure_count = 0
+            self._last_failure_time = None
+            self._half_open_calls = 0
+            self._success_count = 0
+            self._publish_state()
@@ -0,0 +1,36 @@
+"""Prometheus metrics shared by circuit breakers and bulkheads."""
+
+from __future__ import annotations
+
+from prometheus_client import Counter, Gauge
+
+__all__ = [
+    "CIRCUIT_STATE",
+    "CIRCUIT_STATE_VALUES",
+    "RESILIENCE_REJECTIONS",
+    "BULKHEAD_IN_FLIGHT",
+    "BULKHEAD_LIMIT",
+]
+
+CIRCUIT_STATE = Gauge(
+    "myloware_circuit_breaker_state",
+    "Circuit breaker state per upstream (0=closed, 1=half_open, 2=open)",
+    ["upstream"],
+)
+CIRCUIT_STATE_VALUES = {"closed": 0, "half_open": 1, "open": 2}
+
+RESILIENCE_REJECTIONS = Counter(
+    "myloware_resilience_rejections_total",
+    "Calls rejected before reaching an upstream (circuit_open, bulkhead_full)",
+    ["upstream", "reason"],
+)
+BULKHEAD_IN_FLIGHT = Gauge(
+    "myloware_bulkhead_in_flight",
+    "Calls currently holding a bulkhead slot",
+    ["upstream"],
+)
+BULKHEAD_LIMIT = Gauge(
+    "myloware_bulkhead_limit",
+    "Configured bulkhead concurrency limit",
+    ["upstream"],
+)
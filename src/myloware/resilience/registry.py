@@ -0,0 +1,217 @@
+"""Per-upstream resilience registry: one circuit breaker + bulkhead per dependency.
+
+Each upstream (and optionally each endpoint of it) gets its own
+CircuitBreaker and Bulkhead, so a failing or slow Remotion service opens only
+the Remotion breaker and can hold at most its own bulkhead's worth of worker
+slots. Guards are created lazily from settings and cached by name.
+
+Rate-limited providers (``adaptive_concurrency_initial``) additionally share
+one AdaptiveLimiter across all of their endpoints; 429s feed that limiter
+instead of the breaker.
+
+Usage:
+    guard = get_guard("remotion", "render")
+    async with guard.protect_async():
+        resp = await client.post(...)
+
+    result = get_guard("s3").call(client.upload_file, path, bucket, key)
+
+Upstream names in use: llama_stack (endpoints responses, safety, vector_io,
+other), openai_videos, remotion, upload_post, telegram, s3.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, TypeVar
+
+import httpx
+
+from myloware.config import settings
+from myloware.resilience.adaptive import (
+    AdaptiveLimiter,
+    get_adaptive_limiter,
+    rate_limit_signal,
+    reset_adaptive_limiters,
+)
+from myloware.resilience.bulkhead import Bulkhead
+from myloware.resilience.circuit_breaker import CircuitBreaker, CircuitState
+
+__all__ = [
+    "UpstreamGuard",
+    "get_guard",
+    "reset_resilience_registry",
+    "resilience_snapshot",
+]
+
+T = TypeVar("T")
+
+_DEFAULT_BULKHEAD_LIMIT = 32
+
+
+def counts_as_failure(exc: BaseException) -> bool:
+    """Whether ``exc`` should count against the breaker.
+
+    Client errors (4xx other than 429) mean the request was wrong, not that the
+    upstream is unhealthy, so they do not trip the breaker. Cancellation counts
+    as a failure: it is how a caller's timeout ends a hung call, and treating it
+    as a success would let a half-open probe close the breaker and keep a
+    hanging upstream from ever tripping it.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+    return isinstance(exc, (Exception, asyncio.CancelledError))
+
+
+class UpstreamGuard:
+    """Bulkhead + circuit breaker (+ adaptive limiter) for one upstream endpoint."""
+
+    def __init__(
+        self,
+        name: str,
+        breaker: CircuitBreaker,
+        bulkhead: Bulkhead,
+        limiter: AdaptiveLimiter | None = None,
+    ) -> None:
+        self.name = name
+        self.breaker = breaker
+        self.bulkhead = bulkhead
+        self.limiter = limiter
+
+    def _settle(self, exc: BaseException | None) -> None:
+        if self.limiter is not None:
+            self.limiter.record(exc)
+            if exc is not None and rate_limit_signal(exc)[0]:
+                # The limiter owns 429s: back off without moving the breaker either
+                # way (a 429 says nothing about whether the upstream recovered).
+                return
+        if exc is not None and counts_as_failure(exc):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+
+    def _fail_fast_if_open(self) -> None:
+        # Don't queue for a bulkhead slot only to be rejected by an open breaker.
+        if self.breaker.state is CircuitState.OPEN:
+            self.breaker.before_call()
+
+    @contextmanager
+    def protect(self) -> Iterator[None]:
+        """Guard a sync block: a bulkhead slot, then breaker admission."""
+        self._fail_fast_if_open()
+        with _limiter_slot(self.limiter), self.bulkhead.slot():
+            self.breaker.before_call()
+            try:
+                yield
+            except BaseException as exc:
+                self._settle(exc)
+                raise
+            self._settle(None)
+
+    @asynccontextmanager
+    async def protect_async(self) -> AsyncIterator[None]:
+        """Guard an async block without blocking the event loop."""
+        self._fail_fast_if_open()
+        async with _limiter_slot_async(self.limiter), self.bulkhead.slot_async():
+            self.breaker.before_call()
+            try:
+                yield
+            except BaseException as exc:
+                self._settle(exc)
+                raise
+            self._settle(None)
+
+    def call(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self.protect():
+            return func(*args, **kwargs)
+
+    async def call_async(self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        async with self.protect_async():
+            return await func(*args, **kwargs)
+
+
+@contextmanager
+def _limiter_slot(limiter: AdaptiveLimiter | None) -> Iterator[None]:
+    if limiter is None:
+        yield
+        return
+    with limiter.slot():
+        yield
+
+
+@asynccontextmanager
+async def _limiter_slot_async(limiter: AdaptiveLimiter | None) -> AsyncIterator[None]:
+    if limiter is None:
+        yield
+        return
+    async with limiter.slot_async():
+        yield
+
+
+_lock = threading.Lock()
+_guards: dict[str, UpstreamGuard] = {}
+
+
+def _bulkhead_limit(upstream: str, name: str) -> int:
+    limits: dict[str, int] = dict(getattr(settings, "resilience_bulkhead_limits", {}) or {})
+    return int(limits.get(name, limits.get(upstream, _DEFAULT_BULKHEAD_LIMIT)))
+
+
+def get_guard(upstream: str, endpoint: str | None = None) -> UpstreamGuard:
+    """Return the cached guard for ``upstream`` (or ``upstream:endpoint``)."""
+    name = f"{upstream}:{endpoint}" if endpoint else upstream
+    guard = _guards.get(name)
+    if guard is not None:
+        return guard
+    with _lock:
+        guard = _guards.get(name)
+        if guard is None:
+            guard = UpstreamGuard(
+                name,
+                CircuitBreaker(
+                    name=name,
+                    failure_threshold=settings.circuit_breaker_failure_threshold,
+                    recovery_timeout=settings.circuit_breaker_recovery_timeout,
+                ),
+                Bulkhead(
+                    name,
+                    max_concurrent=_bulkhead_limit(upstream, name),
+                    max_wait=float(getattr(settings, "resilience_bulkhead_max_wait_seconds", 5.0)),
+                ),
+                get_adaptive_limiter(upstream),
+            )
+            _guards[name] = guard
+    return guard
+
+
+def reset_resilience_registry() -> None:
+    """Drop all guards and adaptive limiters (tests, or after changing settings)."""
+    with _lock:
+        _guards.clear()
+    reset_adaptive_limiters()
+
+
+def resilience_snapshot() -> dict[str, dict[str, Any]]:
+    """State of every guard, for health endpoints and debugging."""
+    with _lock:
+        guards = list(_guards.values())
+    snapshot: dict[str, dict[str, Any]] = {}
+    for guard in guards:
+        entry: dict[str, Any] = {
+            "state": guard.breaker.state.value,
+            "in_flight": guard.bulkhead.in_flight,
+            "waiting": guard.bulkhead.waiting,
+            "limit": guard.bulkhead.max_concurrent,
+        }
+        if guard.limiter is not None:
+            entry["adaptive"] = {
+                "limit": round(guard.limiter.limit, 2),
+                "in_flight": guard.limiter.in_flight,
+                "waiting": guard.limiter.waiting,
+                "paused_for": round(guard.limiter.paused_for, 2),
+            }
+        snapshot[guard.name] = entry
+    return snapshot
@@ -19,11 +19,14 @@ Usage:
 
 from __future__ import annotations
 
+import json
+import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Sequence
 
 import anyio
 from llama_stack_client import AsyncLlamaStackClient, LlamaStackClient
+from prometheus_client import Histogram
 
 from myloware.config import settings
 from myloware.config.provider_modes import effective_llama_stack_provider
@@ -35,6 +38,10 @@ __all__ = [
     "SafetyResult",
     "ModerationResult",
     "check_content_safety",
+    "check_content_safety_batch",
+    "check_segmented_safety",
+    "combine_safety_results",
+    "segment_content",
     "check_brief_safety",
     "moderate_content",
     "CONTENT_SAFETY_SHIELD",
@@ -46,6 +53,16 @@ CONTENT_SAFETY_SHIELD = settings.content_safety_shield_id
 # Default moderation model
 DEFAULT_MODERATION_MODEL = "meta-llama/Llama-Guard-3-8B"
 
+SAFETY_SEGMENTS = Histogram(
+    "myloware_safety_segments",
+    "Segments per segmented safety check",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+
+# Paragraph breaks and list-item starts ("1.", "2)", "-", "*") delimit ideas/captions.
+_SEGMENT_BOUNDARY_RE = re.compile(r"\n\s*\n|\n(?=\s*(?:\d+[.)]|[-*\u2022])\s)")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+
 
 @dataclass
 class SafetyResult:
@@ -122,13 +139,18 @@ async def _run_shield(
     messages: list[dict[str, Any]],
 ) -> dict[str, Any]:
     """Run shield with sync or async client."""
+    from myloware.llama_clients import ResilientClient
+
+    is_async = isinstance(client, AsyncLlamaStackClient) or (
+        isinstance(client, ResilientClient) and client.is_async
+    )
     logger.debug(
         "_run_shield called",
         shield_id=shield_id,
         client_type=type(client).__name__,
-        is_async=isinstance(client, AsyncLlamaStackClient),
+        is_async=is_async,
     )
-    if isinstance(client, AsyncLlamaStackClient):
+    if is_async:
         logger.debug("Calling async client.safety.run_shield with shield_id: %s", shield_id)
         result = await client.safety.run_shield(
             shield_id=shield_id,
@@ -166,7 +188,9 @@ async def check_content_safety(
         shield_id: Shield to use (default: together/meta-llama/Llama-Guard-4-12B)
 
     Returns:
-        SafetyResult with safe=True if content passes, False with reason if flagged
+        SafetyResult with safe=True if content passes, False with reason if flagged.
+        Definitive verdicts are reused across runs via myloware.safety.verdict_cache
+        (system_error results are never reused).
     """
     logger.debug(
         "check_content_safety called",
@@ -178,6 +202,21 @@ async def check_content_safety(
     if effective_llama_stack_provider(settings) != "real":
         # In local/test mode we skip remote shield calls to avoid dependency on a running Llama Stack.
         return SafetyResult.passed()
+    if getattr(settings, "safety_verdict_cache_enabled", False):
+        from myloware.safety.verdict_cache import cached_shield_check
+
+        return await cached_shield_check(
+            shield_id, content, lambda: _check_content_safety_uncached(client, content, shield_id)
+        )
+    return await _check_content_safety_uncached(client, content, shield_id)
+
+
+async def _check_content_safety_uncached(
+    client: LlamaStackClient | AsyncLlamaStackClient,
+    content: str,
+    shield_id: str,
+) -> SafetyResult:
+    """Call the shield for ``content``; errors fail closed as system_error."""
     try:
         logger.debug("Calling _run_shield with shield_id: %s", shield_id)
         response = await _run_shield(
@@ -217,6 +256,162 @@ async def check_content_safety(
         )
 
 
+def _json_segments(value: Any) -> list[str]:
+    """Flatten parsed JSON into one segment per list item (ideas, overlays, captions)."""
+    if isinstance(value, list):
+        return [
+            item if isinstance(item, str) else json.dumps(item, ensure_ascii=False)
+            for item in value
+            if item not in (None, "", [], {})
+        ]
+    if isinstance(value, dict):
+        segments: list[str] = []
+        for key, item in value.items():
+            if isinstance(item, list):
+                segments.extend(_json_segments(item))
+            elif isinstance(item, str) and item.strip():
+                segments.append(f"{key}: {item}")
+            elif isinstance(item, dict):
+                segments.append(json.dumps({key: item}, ensure_ascii=False))
+        return segments
+    return [str(value)]
+
+
+def _hard_split(text: str, max_chars: int) -> Iterable[str]:
+    """Split an oversized piece at sentence (then whitespace) boundaries."""
+    current = ""
+    for sentence in _SENTENCE_END_RE.split(text):
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars)
+            cut = cut if cut > 0 else max_chars
+            if current:
+                yield current
+                current = ""
+            yield sentence[:cut]
+            sentence = sentence[cut:].lstrip()
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            yield current
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        yield current
+
+
+def segment_content(content: str, max_chars: int | None = None) -> list[str]:
+    """Split ``content`` into semantically meaningful segments for shield checks.
+
+    Content up to ``max_chars`` stays one segment. Longer content is split on
+    JSON list items or paragraph/list-item boundaries, then adjacent pieces are
+    packed back together up to ``max_chars`` so related text keeps its context
+    and the number of shield calls stays small.
+    """
+    limit = max(1, int(max_chars or settings.safety_segment_max_chars))
+    text = (content or "").strip()
+    if not text:
+        return []
+    if len(text) <= limit:
+        return [text]
+
+    pieces: list[str] | None = None
+    if text[0] in "[{":
+        try:
+            pieces = _json_segments(json.loads(text))
+        except ValueError:
+            pieces = None
+    if pieces is None:
+        pieces = _SEGMENT_BOUNDARY_RE.split(text)
+
+    segments: list[str] = []
+    current = ""
+    for piece in (p.strip() for p in pieces):
+        if not piece:
+            continue
+        for part in [piece] if len(piece) <= limit else _hard_split(piece, limit):
+            if current and len(current) + 2 + len(part) > limit:
+                segments.append(current)
+                current = part
+            else:
+                current = f"{current}\n\n{part}" if current else part
+    if current:
+        segments.append(current)
+    return segments
+
+
+def combine_safety_results(results: Iterable[SafetyResult]) -> SafetyResult:
+    """Combine per-segment verdicts, failing closed.
+
+    A definitive violation wins; otherwise any failure (system_error, or a
+    segment left unchecked) fails the whole check; all-safe passes.
+    """
+    failure: SafetyResult | None = None
+    for result in results:
+        if result.safe:
+            continue
+        if result.category not in ("system_error", "not_checked"):
+            return result
+        failure = failure or result
+    return failure or SafetyResult.passed()
+
+
+async def check_content_safety_batch(
+    client: LlamaStackClient | AsyncLlamaStackClient,
+    contents: Sequence[str],
+    shield_id: str = CONTENT_SAFETY_SHIELD,
+    max_concurrency: int | None = None,
+) -> list[SafetyResult]:
+    """Check several texts concurrently; results are returned in input order.
+
+    Identical texts share one shield call, and each call goes through
+    check_content_safety (so the cross-run verdict cache applies per text).
+    Fan-out is bounded by ``max_concurrency``. On the first definitive
+    violation the remaining calls are cancelled and reported as not_checked.
+    """
+    unique = list(dict.fromkeys(contents))
+    results: dict[str, SafetyResult] = {}
+    limiter = anyio.CapacityLimiter(max(1, int(max_concurrency or settings.safety_max_concurrency)))
+
+    async with anyio.create_task_group() as tg:
+
+        async def _check(text: str) -> None:
+            async with limiter:
+                result = await check_content_safety(client, text, shield_id)
+            results[text] = result
+            if not result.safe and result.category != "system_error":
+                tg.cancel_scope.cancel()
+
+        for text in unique:
+            tg.start_soon(_check, text)
+
+    skipped = SafetyResult.failed(
+        reason="Not checked: batch stopped at the first violation", category="not_checked"
+    )
+    return [results.get(text, skipped) for text in contents]
+
+
+async def check_segmented_safety(
+    client: LlamaStackClient | AsyncLlamaStackClient,
+    content: str | Sequence[str],
+    shield_id: str = CONTENT_SAFETY_SHIELD,
+) -> SafetyResult:
+    """Segment ``content`` (or take pre-split segments) and check them concurrently.
+
+    A long or many-item payload no longer rides on a single shield call, so one
+    slow item cannot time out the whole check. Verdicts combine fail-closed.
+    """
+    if isinstance(content, str):
+        segments = segment_content(content)
+    else:
+        segments = [s.strip() for s in content if s and s.strip()]
+    if not segments:
+        return SafetyResult.passed()
+    SAFETY_SEGMENTS.observe(len(segments))
+    if len(segments) == 1:
+        return await check_content_safety(client, segments[0], shield_id)
+    results = await check_content_safety_batch(client, segments, shield_id)
+    return combine_safety_results(results)
+
+
 async def moderate_content(
     client: LlamaStackClient,
     content: str,
@@ -314,7 +509,7 @@ async def check_agent_input(
         return SafetyResult.passed()
 
     last_user_content = user_messages[-1].get("content", "")
-    return await check_content_safety(client, last_user_content, shield_id)
+    return await check_segmented_safety(client, last_user_content, shield_id)
 
 
 async def check_agent_output(
@@ -335,4 +530,4 @@ async def check_agent_output(
     Returns:
         SafetyResult
     """
-    return await check_content_safety(client, response_content, shield_id)
+    return await check_segmented_safety(client, response_content, shield_id)
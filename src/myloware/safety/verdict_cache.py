@@ -0,0 +1,217 @@
+"""Cross-run safety verdict cache.
+
+Shield verdicts are keyed by ``(shield_id, sha256(content))`` and kept in two
+tiers: a process-local LRU (with TTL) and the ``safety_verdicts`` table, which
+is shared by every API worker and job runner. Identical briefs, prompt
+templates and chat messages therefore hit the shield once per TTL instead of
+once per run.
+
+Fail-closed rules (same as the per-run LangGraph cache):
+- No cached verdict => call the shield.
+- system_error verdicts are never stored, so a transient outage is retried.
+- Violations are stored and reused, so unsafe content is not re-submitted.
+
+Database errors only ever turn into cache misses; they never change a verdict.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from cachetools import TTLCache  # type: ignore
+from prometheus_client import Counter, Histogram
+
+from myloware.config import settings
+from myloware.observability.logging import get_logger
+
+if TYPE_CHECKING:
+    from myloware.safety.shields import SafetyResult
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "cached_shield_check",
+    "clear_verdict_cache",
+    "content_hash",
+    "verdict_cache_stats",
+]
+
+SAFETY_VERDICT_LOOKUPS = Counter(
+    "myloware_safety_verdict_cache_total",
+    "Safety verdict lookups by result (memory, database, miss)",
+    ["result"],
+)
+SAFETY_SHIELD_SECONDS = Histogram(
+    "myloware_safety_shield_seconds",
+    "Latency of uncached safety shield calls",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0),
+)
+SAFETY_SHIELD_SECONDS_SAVED = Counter(
+    "myloware_safety_shield_seconds_saved_total",
+    "Estimated shield latency avoided by verdict cache hits (mean shield latency per hit)",
+)
+
+# Verdict tuple: (safe, reason, category, severity)
+_Verdict = tuple[bool, str | None, str | None, str | None]
+
+_lock = threading.Lock()
+_memory: TTLCache | None = None
+_stats = {"hits": 0, "misses": 0, "shield_calls": 0, "shield_seconds": 0.0, "seconds_saved": 0.0}
+
+
+def content_hash(content: str) -> str:
+    """sha256 hex digest used as the cache key for ``content``."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _ttl_seconds() -> float:
+    return float(getattr(settings, "safety_verdict_cache_ttl_seconds", 86400.0))
+
+
+def _get_memory() -> TTLCache:
+    global _memory
+    if _memory is None:
+        maxsize = max(1, int(getattr(settings, "safety_verdict_cache_max_entries", 4096)))
+        _memory = TTLCache(maxsize=maxsize, ttl=_ttl_seconds())
+    return _memory
+
+
+def clear_verdict_cache() -> None:
+    """Drop the in-process LRU and reset stats (the database tier is untouched)."""
+    global _memory
+    with _lock:
+        _memory = None
+        _stats.update(hits=0, misses=0, shield_calls=0, shield_seconds=0.0, seconds_saved=0.0)
+
+
+def verdict_cache_stats() -> dict[str, float]:
+    """Shield-call reduction and latency saved since start (or last clear)."""
+    with _lock:
+        lookups = _stats["hits"] + _stats["misses"]
+        return {
+            **_stats,
+            "hit_rate": (_stats["hits"] / lookups) if lookups else 0.0,
+            "mean_shield_seconds": (
+                _stats["shield_seconds"] / _stats["shield_calls"] if _stats["shield_calls"] else 0.0
+            ),
+        }
+
+
+def _is_cacheable(result: "SafetyResult") -> bool:
+    return result.safe or result.category != "system_error"
+
+
+def _to_result(verdict: _Verdict) -> "SafetyResult":
+    from myloware.safety.shields import SafetyResult
+
+    safe, reason, category, severity = verdict
+    if safe:
+        return SafetyResult.passed()
+    return SafetyResult.failed(
+        reason=reason or "Content blocked", category=category, severity=severity
+    )
+
+
+def _record_hit(source: str) -> None:
+    SAFETY_VERDICT_LOOKUPS.labels(result=source).inc()
+    with _lock:
+        _stats["hits"] += 1
+        if _stats["shield_calls"]:
+            saved = _stats["shield_seconds"] / _stats["shield_calls"]
+            _stats["seconds_saved"] += saved
+            SAFETY_SHIELD_SECONDS_SAVED.inc(saved)
+
+
+async def _db_get(shield_id: str, digest: str) -> _Verdict | None:
+    from myloware.storage.database import get_async_session_factory
+    from myloware.storage.repositories import SafetyVerdictRepository
+
+    try:
+        SessionLocal = get_async_session_factory()
+        async with SessionLocal() as session:
+            row = await SafetyVerdictRepository(session).get_async(
+                shield_id, digest, now=_utc_now()
+            )
+            if row is None:
+                return None
+            return (bool(row.safe), row.reason, row.category, row.severity)
+    except Exception as exc:
+        logger.debug("Safety verdict lookup failed; treating as miss", exc=str(exc))
+        return None
+
+
+async def _db_put(shield_id: str, digest: str, verdict: _Verdict) -> None:
+    from myloware.storage.database import get_async_session_factory
+    from myloware.storage.repositories import SafetyVerdictRepository
+
+    safe, reason, category, severity = verdict
+    now = _utc_now()
+    try:
+        SessionLocal = get_async_session_factory()
+        async with SessionLocal() as session:
+            await SafetyVerdictRepository(session).put_async(
+                shield_id,
+                digest,
+                safe=safe,
+                reason=reason,
+                category=category,
+                severity=severity,
+                now=now,
+                expires_at=now + timedelta(seconds=_ttl_seconds()),
+            )
+            await session.commit()
+    except Exception as exc:
+        logger.debug("Safety verdict persist failed", exc=str(exc))
+
+
+async def cached_shield_check(
+    shield_id: str,
+    content: str,
+    check: Callable[[], Awaitable["SafetyResult"]],
+) -> "SafetyResult":
+    """Return a cached verdict for ``content`` or run ``check`` and cache it."""
+    digest = content_hash(content)
+    key = (shield_id, digest)
+    persistent = bool(getattr(settings, "safety_verdict_cache_persistent", True))
+
+    with _lock:
+        verdict = _get_memory().get(key)
+    if verdict is not None:
+        _record_hit("memory")
+        return _to_result(verdict)
+
+    if persistent:
+        verdict = await _db_get(shield_id, digest)
+        if verdict is not None:
+            with _lock:
+                _get_memory()[key] = verdict
+            _record_hit("database")
+            return _to_result(verdict)
+
+    SAFETY_VERDICT_LOOKUPS.labels(result="miss").inc()
+    start = time.perf_counter()
+    result = await check()
+    elapsed = time.perf_counter() - start
+    SAFETY_SHIELD_SECONDS.observe(elapsed)
+    with _lock:
+        _stats["misses"] += 1
+        _stats["shield_calls"] += 1
+        _stats["shield_seconds"] += elapsed
+
+    if not _is_cacheable(result):
+        return result
+
+    verdict = (result.safe, result.reason, result.category, result.severity)
+    with _lock:
+        _get_memory()[key] = verdict
+    if persistent:
+        await _db_put(shield_id, digest, verdict)
+    return result
@@ -0,0 +1,211 @@
+"""Keyframes, contact sheet and dominant-color palette for a transcoded clip.
+
+Vision models cannot read an MP4, and sending full-resolution frames for every
+editing question is the most expensive part of AnalyzeMediaTool. While the
+clip is still on local disk after transcoding we pull a few evenly spaced
+keyframes, tile them into one small contact sheet and compute a palette, so
+later analysis can look at a single small image (or, for colors, no image at
+all).
+
+Extraction is best-effort: without a local ffmpeg, or if any step fails, the
+clip simply has no previews.
+"""
+
+from __future__ import annotations
+
+import math
+import shutil
+import subprocess  # nosec B404
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+from myloware.observability.logging import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = ["ClipPreviews", "dominant_palette", "extract_clip_previews"]
+
+# Width the contact sheet is downscaled to before computing the palette.
+_PALETTE_SAMPLE_WIDTH = 96
+
+
+@dataclass
+class ClipPreviews:
+    """Local preview files extracted from one clip."""
+
+    keyframe_paths: list[Path] = field(default_factory=list)
+    contact_sheet_path: Optional[Path] = None
+    palette: list[dict[str, Any]] = field(default_factory=list)
+
+
+def dominant_palette(rgb: bytes, *, colors: int = 5) -> list[dict[str, Any]]:
+    """Dominant colors of raw rgb24 pixels, most common first.
+
+    Pixels are bucketed on a 8x8x8 grid (3 bits per channel); each returned
+    color is the mean of its bucket, with the share of pixels it covers.
+    """
+    total = len(rgb) // 3
+    if total == 0 or colors <= 0:
+        return []
+    buckets: dict[int, list[int]] = {}
+    for i in range(0, total * 3, 3):
+        r, g, b = rgb[i], rgb[i + 1], rgb[i + 2]
+        key = ((r >> 5) << 6) | ((g >> 5) << 3) | (b >> 5)
+        acc = buckets.get(key)
+        if acc is None:
+            buckets[key] = [1, r, g, b]
+        else:
+            acc[0] += 1
+            acc[1] += r
+            acc[2] += g
+            acc[3] += b
+    top = sorted(buckets.values(), key=lambda acc: acc[0], reverse=True)[:colors]
+    return [
+        {
+            "hex": f"#{r_sum // n:02x}{g_sum // n:02x}{b_sum // n:02x}",
+            "ratio": round(n / total, 3),
+        }
+        for n, r_sum, g_sum, b_sum in top
+    ]
+
+
+def _run(cmd: list[str], timeout: int) -> subprocess.CompletedProcess[bytes]:
+    return subprocess.run(  # nosec B603
+        cmd,
+        capture_output=True,
+        timeout=timeout,
+        shell=False,  # Security: explicitly disable shell
+    )
+
+
+def _probe_duration(video_path: Path, timeout: int) -> float | None:
+    ffprobe_bin = shutil.which("ffprobe")
+    if not ffprobe_bin:
+        return None
+    result = _run(
+        [
+            ffprobe_bin,
+            "-v",
+            "error",
+            "-show_entries",
+            "format=duration",
+            "-of",
+            "default=noprint_wrappers=1:nokey=1",
+            str(video_path),
+        ],
+        timeout,
+    )
+    try:
+        duration = float(result.stdout.decode().strip())
+    except ValueError:
+        return None
+    return duration if duration > 0 else None
+
+
+def extract_clip_previews(
+    video_path: Path,
+    output_dir: Path,
+    stem: str,
+    *,
+    frame_count: int = 6,
+    width: int = 320,
+    palette_colors: int = 5,
+    timeout: int = 60,
+) -> ClipPreviews | None:
+    """Write ``{stem}_kfNN.jpg`` keyframes and ``{stem}_sheet.jpg`` into output_dir.
+
+    Returns None if ffmpeg is unavailable or extraction fails.
+    """
+    ffmpeg_bin = shutil.which("ffmpeg")
+    if not ffmpeg_bin:
+        logger.info("Local ffmpeg not found on PATH; skipping clip previews.")
+        return None
+
+    frame_count = max(1, int(frame_count))
+    for stale in (*output_dir.glob(f"{stem}_kf*.jpg"), output_dir / f"{stem}_sheet.jpg"):
+        stale.unlink(missing_ok=True)
+
+    try:
+        duration = _probe_duration(video_path, timeout)
+        interval = duration / frame_count if duration else 1.0
+        pattern = output_dir / f"{stem}_kf%02d.jpg"
+        result = _run(
+            [
+                ffmpeg_bin,
+                "-y",
+                "-loglevel",
+                "error",
+                "-i",
+                str(video_path),
+                "-vf",
+                f"fps=1/{interval:.3f},scale={int(width)}:-2",
+                "-frames:v",
+                str(frame_count),
+                "-q:v",
+                "4",
+                str(pattern),
+            ],
+            timeout,
+        )
+        keyframes = sorted(output_dir.glob(f"{stem}_kf*.jpg"))
+        if result.returncode != 0 or not keyframes:
+            logger.warning("Keyframe extraction failed: %s", result.stderr.decode()[:200])
+            return None
+
+        cols = math.ceil(math.sqrt(len(keyframes)))
+        rows = math.ceil(len(keyframes) / cols)
+        sheet_path = output_dir / f"{stem}_sheet.jpg"
+        result = _run(
+            [
+                ffmpeg_bin,
+                "-y",
+                "-loglevel",
+                "error",
+                "-framerate",
+                "1",
+                "-i",
+                str(pattern),
+                "-vf",
+                f"tile={cols}x{rows}",
+                "-frames:v",
+                "1",
+                "-q:v",
+                "4",
+                str(sheet_path),
+            ],
+            timeout,
+        )
+        if result.returncode != 0 or not sheet_path.exists():
+            logger.warning("Contact sheet failed: %s", result.stderr.decode()[:200])
+            return ClipPreviews(keyframe_paths=keyframes)
+
+        result = _run(
+            [
+                ffmpeg_bin,
+                "-loglevel",
+                "error",
+                "-i",
+                str(sheet_path),
+                "-vf",
+                f"scale={_PALETTE_SAMPLE_WIDTH}:-2",
+                "-f",
+                "rawvideo",
+                "-pix_fmt",
+                "rgb24",
+                "-",
+            ],
+            timeout,
+        )
+        palette = (
+            dominant_palette(result.stdout, colors=palette_colors) if result.returncode == 0 else []
+        )
+        return ClipPreviews(
+            keyframe_paths=keyframes, contact_sheet_path=sheet_path, palette=palette
+        )
+    except subprocess.TimeoutExpired:
+        logger.warning("Clip preview extraction timed out after %ss", timeout)
+        return None
+    except OSError as exc:
+        logger.warning("Clip preview extraction failed: %s", exc)
+        return None
@@ -14,6 +14,7 @@ import httpx
 
 from myloware.config import settings
 from myloware.observability.logging import get_logger
+from myloware.resilience.registry import get_guard
 
 _OPENAI_VIDEO_CONTENT_TIMEOUT = httpx.Timeout(60.0, read=300.0)
 _OPENAI_VIDEO_STATUS_TIMEOUT = httpx.Timeout(10.0, read=30.0)
@@ -74,12 +75,16 @@ async def download_openai_video_content_to_tempfile(video_id: str) -> Path:
 
     url = f"https://api.openai.com/v1/videos/{video_id}/content"
     headers = {"Authorization": f"Bearer {api_key}"}
+    guard = get_guard("openai_videos", "content")
 
     last_exc: Exception | None = None
     for attempt in range(_OPENAI_VIDEO_DOWNLOAD_MAX_ATTEMPTS):
         downloaded: Path | None = None
         try:
-            async with httpx.AsyncClient(timeout=_OPENAI_VIDEO_CONTENT_TIMEOUT) as client:
+            async with (
+                guard.protect_async(),
+                httpx.AsyncClient(timeout=_OPENAI_VIDEO_CONTENT_TIMEOUT) as client,
+            ):
                 async with client.stream("GET", url, headers=headers) as resp:
                     resp.raise_for_status()
                     with tempfile.NamedTemporaryFile(
@@ -107,6 +112,8 @@ async def download_openai_video_content_to_tempfile(video_id: str) -> Path:
                     else _OPENAI_VIDEO_DOWNLOAD_BASE_DELAY_S * (2**attempt)
                 )
                 delay = min(_OPENAI_VIDEO_DOWNLOAD_MAX_DELAY_S, max(0.0, float(delay)))
+                if status_code == 429 and guard.limiter is not None:
+                    delay = 0.0  # the shared limiter already pauses for Retry-After
                 # Small jitter to avoid thundering herd when multiple clips retry.
                 delay += _retry_jitter_seconds()
                 logger.warning(
@@ -167,11 +174,15 @@ async def retrieve_openai_video_job(video_id: str) -> dict[str, Any]:
 
     url = f"https://api.openai.com/v1/videos/{video_id}"
     headers = {"Authorization": f"Bearer {api_key}"}
+    guard = get_guard("openai_videos", "status")
 
     last_exc: Exception | None = None
     for attempt in range(_OPENAI_VIDEO_DOWNLOAD_MAX_ATTEMPTS):
         try:
-            async with httpx.AsyncClient(timeout=_OPENAI_VIDEO_STATUS_TIMEOUT) as client:
+            async with (
+                guard.protect_async(),
+                httpx.AsyncClient(timeout=_OPENAI_VIDEO_STATUS_TIMEOUT) as client,
+            ):
                 resp = await client.get(url, headers=headers)
                 resp.raise_for_status()
                 payload = resp.json()
@@ -189,6 +200,8 @@ async def retrieve_openai_video_job(video_id: str) -> dict[str, Any]:
                     else _OPENAI_VIDEO_DOWNLOAD_BASE_DELAY_S * (2**attempt)
                 )
                 delay = min(_OPENAI_VIDEO_DOWNLOAD_MAX_DELAY_S, max(0.0, float(delay)))
+                if status_code == 429 and guard.limiter is not None:
+                    delay = 0.0  # the shared limiter already pauses for Retry-After
                 delay += _retry_jitter_seconds()
                 logger.warning(
                     "openai_video_status_retry",
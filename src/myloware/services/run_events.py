@@ -0,0 +1,373 @@
+"""In-process fan-out of run status and artifact events.
+
+SSE clients (the public demo UI, ``myloware runs watch``) subscribe to a run
+through the process-wide ``RunEventHub``. The hub keeps one watcher task per
+run with subscribers: it reads the run row and any artifacts created since
+its last look, then publishes ``status``/``artifact`` events to every
+subscriber queue. DB load therefore scales with the number of watched runs,
+not with the number of connected clients.
+
+The watcher checks the DB every ``run_events_poll_interval_seconds``;
+``notify_run_changed`` wakes it immediately when this process knows a run
+changed. A watcher stops once the run reaches a terminal status (after
+sending an ``end`` event) or when its last subscriber leaves.
+
+Events reach a subscriber queue in batches: a new subscriber's replay is one
+batch, and so is everything a single DB check finds. The queue therefore
+bounds how many checks a subscriber may lag, not how many artifacts a run
+has. Subscribers that fall ``run_events_queue_size`` batches behind are
+disconnected; SSE clients reconnect and receive a fresh snapshot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable
+from uuid import UUID
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from myloware.config import settings
+from myloware.observability.logging import get_logger
+from myloware.storage.database import get_async_session_factory
+from myloware.storage.models import Artifact, Run, RunStatus
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "TERMINAL_RUN_STATUSES",
+    "RunEvent",
+    "RunEventHub",
+    "RunSubscription",
+    "get_run_event_hub",
+    "notify_run_changed",
+    "reset_run_event_hub",
+]
+
+TERMINAL_RUN_STATUSES = frozenset(
+    {RunStatus.COMPLETED.value, RunStatus.FAILED.value, RunStatus.REJECTED.value}
+)
+
+RUN_EVENT_SUBSCRIBERS = Gauge(
+    "myloware_run_event_subscribers",
+    "Open run event subscriptions in this process",
+)
+RUN_EVENT_WATCHERS = Gauge(
+    "myloware_run_event_watchers",
+    "Runs with an active event watcher in this process",
+)
+RUN_EVENT_POLLS = Counter(
+    "myloware_run_event_polls_total",
+    "DB checks made by run event watchers",
+)
+RUN_EVENT_DROPPED_SUBSCRIBERS = Counter(
+    "myloware_run_event_dropped_subscribers_total",
+    "Subscribers disconnected because their event queue was full",
+)
+
+
+@dataclass(frozen=True)
+class RunEvent:
+    """A single event published to run subscribers."""
+
+    event: str  # "status" | "artifact" | "end"
+    data: dict[str, Any]
+
+    def to_sse(self) -> str:
+        return f"event: {self.event}\ndata: {json.dumps(self.data, default=str)}\n\n"
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+class RunSubscription:
+    """One subscriber's view of a run's events (async iterable)."""
+
+    def __init__(self, hub: RunEventHub, run_id: UUID, queue_size: int) -> None:
+        self.run_id = run_id
+        self._hub = hub
+        self._queue: asyncio.Queue[list[RunEvent] | None] = asyncio.Queue(maxsize=queue_size)
+        self._pending: deque[RunEvent] = deque()
+        self.closed = False
+
+    def _offer(self, events: list[RunEvent]) -> bool:
+        """Queue a batch without blocking; False when the subscriber has fallen behind."""
+        try:
+            self._queue.put_nowait(events)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    def _finish(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        RUN_EVENT_SUBSCRIBERS.dec()
+        try:
+            self._queue.put_nowait(None)
+        except asyncio.QueueFull:
+            # Make room for the sentinel; the subscriber reconnects for a fresh snapshot.
+            self._queue.get_nowait()
+            self._queue.put_nowait(None)
+
+    async def get(self, timeout: float | None = None) -> RunEvent | None:
+        """Next event, or None once the stream has ended.
+
+        Raises ``asyncio.TimeoutError`` when nothing arrives within ``timeout``.
+        """
+        if not self._pending:
+            if timeout is None:
+                batch = await self._queue.get()
+            else:
+                batch = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+            if batch is None:
+                return None
+            self._pending.extend(batch)
+        return self._pending.popleft()
+
+    def close(self) -> None:
+        self._hub._unsubscribe(self)
+
+    async def __aiter__(self) -> AsyncIterator[RunEvent]:
+        while True:
+            event = await self.get()
+            if event is None:
+                return
+            yield event
+
+    async def __aenter__(self) -> RunSubscription:
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        self.close()
+
+
+@dataclass
+class _RunWatcher:
+    run_id: UUID
+    subscribers: set[RunSubscription] = field(default_factory=set)
+    status: RunEvent | None = None
+    artifacts: list[RunEvent] = field(default_factory=list)
+    seen_artifact_ids: set[Any] = field(default_factory=set)
+    last_artifact_at: datetime | None = None
+    ended: bool = False
+    wake: asyncio.Event = field(default_factory=asyncio.Event)
+    task: asyncio.Task[None] | None = None
+
+
+class RunEventHub:
+    """Process-wide registry of run watchers and their subscribers."""
+
+    def __init__(
+        self,
+        *,
+        session_factory: Callable[[], AsyncSession] | None = None,
+        poll_interval: float | None = None,
+        queue_size: int | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._poll_interval = poll_interval
+        self._queue_size = queue_size
+        self._watchers: dict[UUID, _RunWatcher] = {}
+
+    def subscribe(self, run_id: UUID) -> RunSubscription:
+        """Register a subscriber, starting the run's watcher if needed.
+
+        A watcher that has already looked at the run replays its current
+        status and the artifacts seen so far to the new subscriber.
+        """
+        queue_size = self._queue_size or settings.run_events_queue_size
+        subscription = RunSubscription(self, run_id, queue_size)
+        RUN_EVENT_SUBSCRIBERS.inc()
+
+        watcher = self._watchers.get(run_id)
+        if watcher is None:
+            watcher = _RunWatcher(run_id=run_id)
+            self._watchers[run_id] = watcher
+            # The watcher outlives the request that started it and serves every
+            # later subscriber, so it must not inherit that request's context
+            # (query trackers, request id).
+            watcher.task = asyncio.create_task(
+                self._watch(watcher), name=f"run-events-{run_id}", context=contextvars.Context()
+            )
+            RUN_EVENT_WATCHERS.inc()
+
+        watcher.subscribers.add(subscription)
+        replay = ([watcher.status] if watcher.status else []) + watcher.artifacts
+        if replay:
+            # One batch into an empty queue: a long backlog can never overflow it.
+            subscription._offer(replay)
+        return subscription
+
+    def notify(self, run_id: UUID) -> None:
+        """Wake the run's watcher (if any) to check the DB now."""
+        watcher = self._watchers.get(run_id)
+        if watcher is not None:
+            watcher.wake.set()
+
+    def subscriber_count(self, run_id: UUID) -> int:
+        watcher = self._watchers.get(run_id)
+        return len(watcher.subscribers) if watcher else 0
+
+    async def aclose(self) -> None:
+        """Stop every watcher and end all subscriptions."""
+        watchers = list(self._watchers.values())
+        tasks = [w.task for w in watchers if w.task is not None]
+        for watcher in watchers:
+            self._stop(watcher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _unsubscribe(self, subscription: RunSubscription) -> None:
+        watcher = self._watchers.get(subscription.run_id)
+        subscription._finish()
+        if watcher is None:
+            return
+        watcher.subscribers.discard(subscription)
+        if not watcher.subscribers and not watcher.ended:
+            self._remove(watcher)
+            if watcher.task is not None:
+                watcher.task.cancel()
+
+    def _drop(self, watcher: _RunWatcher, subscription: RunSubscription) -> None:
+        RUN_EVENT_DROPPED_SUBSCRIBERS.inc()
+        logger.info("Dropping slow run event subscriber run=%s", watcher.run_id)
+        watcher.subscribers.discard(subscription)
+        subscription._finish()
+
+    def _remove(self, watcher: _RunWatcher) -> None:
+        if self._watchers.get(watcher.run_id) is watcher:
+            del self._watchers[watcher.run_id]
+            RUN_EVENT_WATCHERS.dec()
+
+    def _stop(self, watcher: _RunWatcher) -> None:
+        watcher.ended = True
+        for subscription in list(watcher.subscribers):
+            subscription._finish()
+        watcher.subscribers.clear()
+        self._remove(watcher)
+
+    def _publish(self, watcher: _RunWatcher, events: list[RunEvent]) -> None:
+        if not events:
+            return
+        for subscription in list(watcher.subscribers):
+            if not subscription._offer(events):
+                self._drop(watcher, subscription)
+
+    async def _watch(self, watcher: _RunWatcher) -> None:
+        interval = self._poll_interval or settings.run_events_poll_interval_seconds
+        try:
+            while True:
+                watcher.wake.clear()
+                terminal = await self._check(watcher)
+                if terminal or not watcher.subscribers:
+                    break
+                try:
+                    await asyncio.wait_for(watcher.wake.wait(), timeout=interval)
+                except asyncio.TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Run event watcher failed run=%s: %s", watcher.run_id, exc)
+        # Terminal, missing run or watcher error: end every open subscription.
+        self._publish(watcher, [RunEvent("end", {"run_id": str(watcher.run_id)})])
+        self._stop(watcher)
+
+    async def _check(self, watcher: _RunWatcher) -> bool:
+        """One DB look at the run; publishes changes and returns True when done."""
+        RUN_EVENT_POLLS.inc()
+        factory = self._session_factory or get_async_session_factory()
+        async with factory() as session:
+            row = (
+                await session.execute(
+                    select(Run.status, Run.current_step, Run.error, Run.updated_at).where(
+                        Run.id == watcher.run_id
+                    )
+                )
+            ).one_or_none()
+            if row is None:
+                return True
+
+            query = (
+                select(
+                    Artifact.id,
+                    Artifact.artifact_type,
+                    Artifact.persona,
+                    Artifact.uri,
+                    Artifact.created_at,
+                )
+                .where(Artifact.run_id == watcher.run_id)
+                .order_by(Artifact.created_at)
+            )
+            if watcher.last_artifact_at is not None:
+                query = query.where(Artifact.created_at >= watcher.last_artifact_at)
+            artifacts = (await session.execute(query)).all()
+
+        batch: list[RunEvent] = []
+        for artifact in artifacts:
+            if artifact.id in watcher.seen_artifact_ids:
+                continue
+            watcher.seen_artifact_ids.add(artifact.id)
+            watcher.last_artifact_at = artifact.created_at
+            event = RunEvent(
+                "artifact",
+                {
+                    "run_id": str(watcher.run_id),
+                    "artifact_id": str(artifact.id),
+                    "artifact_type": artifact.artifact_type,
+                    "persona": artifact.persona,
+                    "uri": artifact.uri,
+                    "created_at": _iso(artifact.created_at),
+                },
+            )
+            watcher.artifacts.append(event)
+            batch.append(event)
+
+        status = {
+            "run_id": str(watcher.run_id),
+            "status": row.status,
+            "current_step": row.current_step,
+            "error": row.error,
+        }
+        previous = watcher.status.data if watcher.status else None
+        if previous is None or any(previous[k] != status[k] for k in status):
+            watcher.status = RunEvent("status", {**status, "updated_at": _iso(row.updated_at)})
+            batch.append(watcher.status)
+        self._publish(watcher, batch)
+
+        return row.status in TERMINAL_RUN_STATUSES
+
+
+_hub: RunEventHub | None = None
+
+
+def get_run_event_hub() -> RunEventHub:
+    """Process-wide hub, created on first use."""
+    global _hub
+    if _hub is None:
+        _hub = RunEventHub()
+    return _hub
+
+
+def notify_run_changed(run_id: UUID) -> None:
+    """Hint that a run changed so its subscribers are updated without waiting a poll."""
+    if _hub is not None:
+        _hub.notify(run_id)
+
+
+async def reset_run_event_hub() -> None:
+    """Stop all watchers and forget the process-wide hub (shutdown/tests)."""
+    global _hub
+    hub, _hub = _hub, None
+    if hub is not None:
+        await hub.aclose()
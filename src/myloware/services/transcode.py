@@ -13,11 +13,12 @@ import tempfile
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 from uuid import UUID
 from urllib.parse import urlparse
 import ipaddress
 import asyncio
+import json
 import socket
 
 import httpx
@@ -25,6 +26,7 @@ import httpx
 from myloware.config.provider_modes import effective_sora_provider
 from myloware.config.settings import settings
 from myloware.observability.logging import get_logger
+from myloware.services.clip_previews import extract_clip_previews
 from myloware.services.fake_sora import resolve_fake_sora_clip
 
 logger = get_logger(__name__)
@@ -131,10 +133,13 @@ class TranscodeResult:
     output_url: Optional[str] = None
     output_path: Optional[Path] = None
     error: Optional[str] = None
+    previews: Optional[dict[str, Any]] = None
 
     @classmethod
-    def ok(cls, url: str, path: Path) -> "TranscodeResult":
-        return cls(success=True, output_url=url, output_path=path)
+    def ok(
+        cls, url: str, path: Path, previews: Optional[dict[str, Any]] = None
+    ) -> "TranscodeResult":
+        return cls(success=True, output_url=url, output_path=path, previews=previews)
 
     @classmethod
     def failed(cls, error: str) -> "TranscodeResult":
@@ -147,6 +152,7 @@ class TranscodeService:
     Handles:
     - Downloading source videos from URLs
     - Transcoding to H.264/AAC using ffmpeg (local or Docker)
+    - Extracting keyframes, a contact sheet and a color palette for analysis
     - Serving transcoded videos via the media endpoint
 
     Usage:
@@ -276,32 +282,10 @@ class TranscodeService:
                             "Transcode failed with both local and Docker ffmpeg"
                         )
 
-                backend = getattr(settings, "transcode_storage_backend", "local")
-                if backend == "s3":
-                    from myloware.storage.object_store import get_s3_store
-
-                    bucket = settings.transcode_s3_bucket
-                    prefix = (settings.transcode_s3_prefix or "").strip("/")
-                    key = f"{prefix}/{output_filename}" if prefix else output_filename
-
-                    uri = await get_s3_store().upload_file_async(
-                        bucket=bucket,
-                        key=key,
-                        path=output_path,
-                        content_type="video/mp4",
-                    )
-                    logger.info("Transcoded video uploaded to object storage: %s", uri)
-                    return TranscodeResult.ok(uri, output_path)
-
-                base_url = str(getattr(settings, "webhook_base_url", "") or "").rstrip("/")
-                public_url = (
-                    f"{base_url}/v1/media/transcoded/{output_filename}"
-                    if base_url
-                    else f"/v1/media/transcoded/{output_filename}"
-                )
-                logger.info("Transcoded video available at: %s", public_url)
-
-                return TranscodeResult.ok(public_url, output_path)
+                previews = await self._build_previews(output_path)
+                url = await self._publish(output_path, "video/mp4")
+                logger.info("Transcoded video available at: %s", url)
+                return TranscodeResult.ok(url, output_path, previews)
 
             except subprocess.TimeoutExpired:
                 return TranscodeResult.failed(
@@ -317,6 +301,70 @@ class TranscodeService:
                 # Best-effort GC for old outputs
                 await asyncio.to_thread(self.cleanup_old_outputs, 24 * 60 * 60)
 
+    async def _publish(self, path: Path, content_type: str) -> str:
+        """Upload an output file to object storage, or return its media endpoint URL."""
+        backend = getattr(settings, "transcode_storage_backend", "local")
+        if backend == "s3":
+            from myloware.storage.object_store import get_s3_store
+
+            bucket = settings.transcode_s3_bucket
+            prefix = (settings.transcode_s3_prefix or "").strip("/")
+            key = f"{prefix}/{path.name}" if prefix else path.name
+
+            return await get_s3_store().upload_file_async(
+                bucket=bucket,
+                key=key,
+                path=path,
+                content_type=content_type,
+            )
+
+        base_url = str(getattr(settings, "webhook_base_url", "") or "").rstrip("/")
+        return (
+            f"{base_url}/v1/media/transcoded/{path.name}"
+            if base_url
+            else f"/v1/media/transcoded/{path.name}"
+        )
+
+    async def _build_previews(self, output_path: Path) -> Optional[dict[str, Any]]:
+        """Extract and publish keyframes, contact sheet and palette (best-effort).
+
+        The result is also written next to the clip as ``<stem>.previews.json`` so
+        callers that only get the clip URL can attach it via clip_preview_metadata().
+        A sidecar from an earlier transcode of the same clip is removed first, so a
+        failed or disabled extraction never advertises previews that no longer exist.
+        """
+        _previews_sidecar(self.output_dir, output_path.stem).unlink(missing_ok=True)
+        if not bool(getattr(settings, "transcode_previews_enabled", False)):
+            return None
+        try:
+            extracted = await asyncio.to_thread(
+                extract_clip_previews,
+                output_path,
+                self.output_dir,
+                output_path.stem,
+                frame_count=int(getattr(settings, "transcode_preview_frames", 6)),
+                width=int(getattr(settings, "transcode_preview_width", 320)),
+                palette_colors=int(getattr(settings, "transcode_palette_colors", 5)),
+            )
+            if extracted is None:
+                return None
+            previews: dict[str, Any] = {
+                "keyframes": [
+                    await self._publish(path, "image/jpeg") for path in extracted.keyframe_paths
+                ],
+                "contact_sheet": (
+                    await self._publish(extracted.contact_sheet_path, "image/jpeg")
+                    if extracted.contact_sheet_path
+                    else None
+                ),
+                "palette": extracted.palette,
+            }
+            _previews_sidecar(self.output_dir, output_path.stem).write_text(json.dumps(previews))
+            return previews
+        except Exception as exc:
+            logger.warning("Clip preview extraction failed for %s: %s", output_path.name, exc)
+            return None
+
     async def _download_video(self, url: str) -> Optional[Path]:
         """Download a video from URL to a temporary file.
 
@@ -513,9 +561,14 @@ class TranscodeService:
         return True
 
     def cleanup_old_outputs(self, max_age_seconds: int = 86400) -> None:
-        """Delete transcoded output files older than max_age_seconds."""
+        """Delete transcoded output files (and their previews) older than max_age_seconds."""
         try:
-            for path in self.output_dir.glob("*.mp4"):
+            outputs = [
+                path
+                for pattern in ("*.mp4", "sora_*.jpg", "sora_*.previews.json")
+                for path in self.output_dir.glob(pattern)
+            ]
+            for path in outputs:
                 try:
                     age = path.stat().st_mtime
                 except OSError:
@@ -534,6 +587,27 @@ class TranscodeService:
                 logger.warning("Failed to cleanup temp file %s: %s", path, e)
 
 
+def _previews_sidecar(output_dir: Path, stem: str) -> Path:
+    return output_dir / f"{stem}.previews.json"
+
+
+def clip_preview_metadata(run_id: UUID, video_index: int) -> dict[str, Any]:
+    """Artifact metadata for the previews of a clip transcoded in this process.
+
+    Returns ``{"previews": {...}}`` (keyframe/contact sheet URLs and palette) or
+    an empty dict when the clip has no previews.
+    """
+    output_dir = Path(
+        getattr(settings, "transcode_output_dir", "") or TranscodeService.DEFAULT_OUTPUT_DIR
+    )
+    sidecar = _previews_sidecar(output_dir, f"sora_{run_id}_{video_index}")
+    try:
+        previews = json.loads(sidecar.read_text())
+    except (OSError, ValueError):
+        return {}
+    return {"previews": previews} if isinstance(previews, dict) else {}
+
+
 # Module-level convenience function for backward compatibility
 async def transcode_video(source_url: str, run_id: UUID, video_index: int) -> str | None:
     """Convenience function wrapping TranscodeService.
@@ -545,4 +619,4 @@ async def transcode_video(source_url: str, run_id: UUID, video_index: int) -> st
     return result.output_url if result.success else None
 
 
-__all__ = ["TranscodeService", "TranscodeResult", "transcode_video"]
+__all__ = ["TranscodeService", "TranscodeResult", "clip_preview_metadata", "transcode_video"]
@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 import asyncio
-from typing import Generator
+import time
+from typing import Any, Generator, Iterator
 
-from sqlalchemy import Engine, create_engine, text
+from sqlalchemy import Engine, create_engine, event, text
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -32,6 +35,10 @@ __all__ = [
     "get_async_session_factory",
     "init_async_db",
     "shutdown_async_db",
+    "register_long_lived_loop",
+    "dispose_loop_async_engine",
+    "QueryStats",
+    "track_queries",
 ]
 
 _engine: Engine | None = None
@@ -47,6 +54,62 @@ _async_engine_loop_id: int | None = (
 _AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
 _async_engines_to_dispose: dict[int, AsyncEngine] = {}
 
+# Long-lived loops (e.g. the tool bridge loop) keep their own engine instead of
+# sharing the default one, which is rebuilt whenever a different loop uses it.
+_long_lived_loop_ids: set[int] = set()
+_loop_async_engines: dict[int, tuple[str, AsyncEngine, async_sessionmaker[AsyncSession]]] = {}
+
+
+@dataclass
+class QueryStats:
+    """SQL statements issued (and time spent in the driver) inside ``track_queries``."""
+
+    statements: int = 0
+    seconds: float = 0.0
+
+    def log_fields(self) -> dict[str, Any]:
+        return {"db_statements": self.statements, "db_time_ms": round(self.seconds * 1000, 2)}
+
+
+# Active trackers for the current context; nested trackers all see each statement.
+_query_trackers: ContextVar[tuple[QueryStats, ...]] = ContextVar("query_trackers", default=())
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Count statements executed by this context (and tasks started from it)."""
+    stats = QueryStats()
+    token = _query_trackers.set(_query_trackers.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _query_trackers.reset(token)
+
+
+def _before_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    if context is not None and _query_trackers.get():
+        context._myloware_query_start = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool
+) -> None:
+    trackers = _query_trackers.get()
+    if not trackers:
+        return
+    started = getattr(context, "_myloware_query_start", None)
+    elapsed = time.perf_counter() - started if started is not None else 0.0
+    for stats in trackers:
+        stats.statements += 1
+        stats.seconds += elapsed
+
+
+# Registered on the Engine class so every engine (sync, async, per-loop) is counted.
+event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
 
 def _stash_engine(engine: Engine) -> None:
     """Keep a strong ref until shutdown to avoid leaked connections/threads."""
@@ -94,17 +157,7 @@ def get_engine() -> Engine:
     return _engine
 
 
-def get_async_engine() -> AsyncEngine:
-    """Get or create async engine."""
-    global _async_engine, _async_engine_url, _AsyncSessionLocal, _async_engine_loop_id
-
-    def _current_loop_id() -> int | None:
-        try:
-            return id(asyncio.get_running_loop())
-        except RuntimeError:
-            return None
-
-    curr_loop_id = _current_loop_id()
+def _async_database_url() -> str:
     url = settings.database_url
     if url.startswith("postgresql+psycopg2://"):
         url = url.replace("postgresql+psycopg2://", "postgresql+asyncpg://")
@@ -115,6 +168,94 @@ def get_async_engine() -> AsyncEngine:
     # Ensure SQLite URLs use aiosqlite driver for async
     if url.startswith("sqlite://") and not url.startswith("sqlite+aiosqlite://"):
         url = url.replace("sqlite://", "sqlite+aiosqlite://")
+    return url
+
+
+def _async_engine_kwargs(url: str, *, use_pool: bool) -> dict:
+    kw: dict = {"pool_pre_ping": True}
+
+    # SQLite specifics: share in-memory DB across connections
+    if url.startswith("sqlite"):
+        kw.setdefault("connect_args", {})
+        kw["connect_args"].setdefault("check_same_thread", False)
+        # WAL mode is enabled in init_async_db() via PRAGMA statements
+        # SQLAlchemy doesn't support setting PRAGMA in connect_args directly
+        if ":memory:" in url:
+            kw["poolclass"] = StaticPool
+        elif settings.environment == "test":
+            # pytest-asyncio uses per-test event loops by default; pooling can leak aiosqlite
+            # threads across loop teardown and cause the interpreter to hang on exit.
+            kw["poolclass"] = NullPool
+    elif not use_pool:
+        kw["poolclass"] = NullPool
+    else:
+        kw["pool_size"] = settings.db_pool_size
+        kw["max_overflow"] = settings.db_max_overflow
+    return kw
+
+
+def _current_loop_id() -> int | None:
+    try:
+        return id(asyncio.get_running_loop())
+    except RuntimeError:
+        return None
+
+
+def register_long_lived_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Give a process-lifetime event loop its own pooled async engine.
+
+    Calls made on ``loop`` reuse that engine (and its connections) instead of
+    rebuilding the shared default engine on every loop switch.
+    """
+    _long_lived_loop_ids.add(id(loop))
+
+
+async def dispose_loop_async_engine() -> None:
+    """Dispose the engine owned by the running long-lived loop (call on that loop)."""
+    loop_id = _current_loop_id()
+    if loop_id is None:
+        return
+    _long_lived_loop_ids.discard(loop_id)
+    entry = _loop_async_engines.pop(loop_id, None)
+    if entry is not None:
+        try:
+            await entry[1].dispose()
+        except Exception:  # pragma: no cover - best-effort cleanup
+            logger.debug("Failed to dispose long-lived loop engine", exc_info=True)
+
+
+def _get_loop_async_engine(
+    loop_id: int, url: str
+) -> tuple[str, AsyncEngine, async_sessionmaker[AsyncSession]]:
+    entry = _loop_async_engines.get(loop_id)
+    if entry is not None and entry[0] == url:
+        return entry
+    if entry is not None:
+        _stash_async_engine(entry[1])
+
+    logger.info("Creating async database engine for long-lived loop")
+    engine = create_async_engine(url, **_async_engine_kwargs(url, use_pool=True))
+    factory = async_sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=engine,
+        class_=AsyncSession,
+    )
+    entry = (url, engine, factory)
+    _loop_async_engines[loop_id] = entry
+    return entry
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get or create async engine."""
+    global _async_engine, _async_engine_url, _AsyncSessionLocal, _async_engine_loop_id
+
+    curr_loop_id = _current_loop_id()
+    url = _async_database_url()
+
+    if curr_loop_id is not None and curr_loop_id in _long_lived_loop_ids:
+        return _get_loop_async_engine(curr_loop_id, url)[1]
 
     # If engine was created on a different event loop, discard and rebuild to avoid
     # asyncpg cross-loop errors like "Future attached to a different loop".
@@ -146,30 +287,9 @@ def get_async_engine() -> AsyncEngine:
 
     if _async_engine is None or _async_engine_url != url:
         logger.info("Creating async database engine")
-        kw = {"pool_pre_ping": True}
-
-        # SQLite specifics: share in-memory DB across connections
-        if url.startswith("sqlite"):
-            kw.setdefault("connect_args", {})
-            kw["connect_args"].setdefault("check_same_thread", False)
-            # WAL mode is enabled in init_async_db() via PRAGMA statements
-            # SQLAlchemy doesn't support setting PRAGMA in connect_args directly
-            if ":memory:" in url:
-                kw["poolclass"] = StaticPool
-            elif settings.environment == "test":
-                # pytest-asyncio uses per-test event loops by default; pooling can leak aiosqlite
-                # threads across loop teardown and cause the interpreter to hang on exit.
-                kw["poolclass"] = NullPool
-        else:
-            # Default: prefer stability over pooling across event loops
-            use_pool = settings.async_use_pool and not loop_mismatch
-            if not use_pool:
-                kw["poolclass"] = NullPool
-            else:
-                kw["pool_size"] = settings.db_pool_size
-                kw["max_overflow"] = settings.db_max_overflow
-
-        _async_engine = create_async_engine(url, **kw)
+        # Default: prefer stability over pooling across event loops
+        use_pool = settings.async_use_pool and not loop_mismatch
+        _async_engine = create_async_engine(url, **_async_engine_kwargs(url, use_pool=use_pool))
         _async_engine_url = url
         _async_engine_loop_id = curr_loop_id
         _AsyncSessionLocal = None
@@ -192,6 +312,9 @@ def get_session_factory() -> sessionmaker[Session]:
 def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get or create async session factory."""
     global _AsyncSessionLocal
+    curr_loop_id = _current_loop_id()
+    if curr_loop_id is not None and curr_loop_id in _long_lived_loop_ids:
+        return _get_loop_async_engine(curr_loop_id, _async_database_url())[2]
     if _AsyncSessionLocal is None:
         _AsyncSessionLocal = async_sessionmaker(
             autocommit=False,
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from enum import Enum
 import uuid
+import zlib
 from typing import Any, Dict
 from uuid import UUID
 
@@ -20,9 +21,11 @@ from sqlalchemy import (
     TypeDecorator,
     BigInteger,
     Boolean,
+    Float,
+    LargeBinary,
 )
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import declarative_base, deferred, relationship
 
 
 def _utc_now() -> datetime:
@@ -74,7 +77,10 @@ __all__ = [
     "Run",
     "RunStatus",
     "Artifact",
+    "ArtifactContent",
     "ArtifactType",
+    "ArtifactKey",
+    "ArtifactKeyKind",
     "GUID",
     "Job",
     "JobStatus",
@@ -180,7 +186,15 @@ class ArtifactType(str, Enum):
 
 
 class Artifact(Base):
-    """Workflow artifact model."""
+    """Workflow artifact model.
+
+    Content bodies (transcripts, ideation markdown, manifests) are not loaded
+    with the row. Small bodies stay in the deferred ``content`` column; bodies
+    over ``artifact_inline_content_max_bytes`` are stored compressed in
+    ``artifact_contents`` and ``content_encoding`` records how. Read either
+    through ``Artifact.content``; async queries must eager-load the body first
+    (``ArtifactRepository`` does this when asked ``with_content=True``).
+    """
 
     __tablename__ = "artifacts"
 
@@ -188,17 +202,86 @@ class Artifact(Base):
     run_id = Column(GUID(), ForeignKey("runs.id"), nullable=False)
     persona = Column(String(32), nullable=False)
     artifact_type = Column(String(64), nullable=False)
-    content = Column(Text, nullable=True)
+    inline_content = deferred(Column("content", Text, nullable=True))
+    content_size = Column(Integer, nullable=True)  # UTF-8 bytes of the full body
+    content_encoding = Column(String(16), nullable=True)  # None = inline
     uri = Column(String(512), nullable=True)
     artifact_metadata = Column("metadata", JSON, default=dict)
     created_at = Column(DateTime, default=_utc_now)
 
     run = relationship("Run", back_populates="artifacts_rel")
+    body = relationship(
+        "ArtifactContent",
+        uselist=False,
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    @property
+    def content(self) -> str | None:
+        if self.content_encoding is None:
+            return self.inline_content
+        return self.body.decode() if self.body is not None else None
 
     def __repr__(self) -> str:
         return f"<Artifact id={self.id} run={self.run_id} type={self.artifact_type}>"
 
 
+class ArtifactContent(Base):
+    """Compressed out-of-line body of a large artifact."""
+
+    __tablename__ = "artifact_contents"
+
+    artifact_id = Column(GUID(), ForeignKey("artifacts.id", ondelete="CASCADE"), primary_key=True)
+    encoding = Column(String(16), nullable=False, default="zlib")
+    data = Column(LargeBinary, nullable=False)
+
+    @classmethod
+    def compress(cls, text: str) -> ArtifactContent:
+        return cls(encoding="zlib", data=zlib.compress(text.encode("utf-8")))
+
+    def decode(self) -> str:
+        if self.encoding != "zlib":
+            raise ValueError(f"Unknown artifact content encoding: {self.encoding}")
+        return zlib.decompress(self.data).decode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"<ArtifactContent artifact={self.artifact_id} bytes={len(self.data or b'')}>"
+
+
+class ArtifactKeyKind(str, Enum):
+    """Namespaces for ArtifactKey lookups."""
+
+    SORA_IDEMPOTENCY = "sora_idempotency"  # Sora submission idempotency key -> CLIP_MANIFEST
+    SORA_TASK = "sora_task"  # OpenAI video task id -> CLIP_MANIFEST (webhook run lookup)
+    PUBLISH_VIDEO_URL = "publish_video_url"  # Published video_url -> PUBLISHED_URL
+    VISION_CACHE = "vision_cache"  # analyze_media cache key -> VISION_ANALYSIS
+    VISION_MEDIA = "vision_media"  # sha256(media) + analysis type -> VISION_ANALYSIS (cross-run)
+    CLIP_URL = "clip_url"  # Transcoded clip URL -> VIDEO_CLIP (keyframes/palette for analyze_media)
+
+
+class ArtifactKey(Base):
+    """Indexed lookup key for an artifact: (run_id, kind, key) -> artifact_id.
+
+    Tools used to load every artifact of a run and scan JSON metadata for an
+    idempotency/cache key. Writing the key here alongside the artifact turns
+    those scans into one primary-key lookup; the (kind, key) index also serves
+    cross-run lookups (webhook task ids, the shared vision cache).
+    """
+
+    __tablename__ = "artifact_keys"
+    __table_args__ = (Index("ix_artifact_keys_kind_key", "kind", "key"),)
+
+    run_id = Column(GUID(), ForeignKey("runs.id"), primary_key=True)
+    kind = Column(String(64), primary_key=True)
+    key = Column(String(255), primary_key=True)
+    artifact_id = Column(GUID(), ForeignKey("artifacts.id", ondelete="CASCADE"), nullable=False)
+    created_at = Column(DateTime, default=_utc_now, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ArtifactKey run={self.run_id} kind={self.kind} key={self.key[:16]}>"
+
+
 class ChatSession(Base):
     """Chat session model for multi-worker session persistence.
 
@@ -387,3 +470,67 @@ class DeadLetter(Base):
 
     def __repr__(self) -> str:
         return f"<DeadLetter id={self.id} source={self.source} run={self.run_id} resolved={self.resolved_at is not None}>"
+
+
+class SafetyVerdict(Base):
+    """Cached safety shield verdict for a piece of content.
+
+    Keyed by (shield_id, sha256 of the content) so identical briefs, prompts and
+    chat messages are not re-sent to the shield by every run. Only definitive
+    verdicts are stored: system_error results are never cached.
+    """
+
+    __tablename__ = "safety_verdicts"
+    __table_args__ = (Index("ix_safety_verdicts_expires_at", "expires_at"),)
+
+    shield_id = Column(String(255), primary_key=True)
+    content_hash = Column(String(64), primary_key=True)
+    safe = Column(Boolean, nullable=False)
+    reason = Column(Text, nullable=True)
+    category = Column(String(128), nullable=True)
+    severity = Column(String(32), nullable=True)
+    created_at = Column(DateTime, default=_utc_now, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<SafetyVerdict shield={self.shield_id} hash={self.content_hash[:12]} safe={self.safe}>"
+
+
+class RateLimitBucket(Base):
+    """Shared token bucket for one provider key.
+
+    Lets several API/worker processes pace submissions to the same provider.
+    Rows are updated under a Postgres advisory lock keyed by ``key``, so the
+    refill-and-take step is serialized across processes.
+    """
+
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String(255), primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(DateTime, default=_utc_now, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<RateLimitBucket key={self.key} tokens={self.tokens:.2f}>"
+
+
+class RunBudgetCounter(Base):
+    """Runs created per scope per UTC hour, for O(1) rolling budget checks.
+
+    ``scope`` is ``all``, ``user:<user_id>`` or ``workflow:<name>``; the shared
+    ``all`` and ``workflow:`` scopes are striped (``all#3``) so concurrent run
+    creations do not contend on one row. Run creation bumps the matching rows in
+    the same transaction as the run insert, so the 24h budget guard sums a few
+    hundred rows at most instead of counting the runs table.
+    """
+
+    __tablename__ = "run_budget_counters"
+
+    scope = Column(String(255), primary_key=True)
+    hour = Column(DateTime, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<RunBudgetCounter scope={self.scope} hour={self.hour:%Y-%m-%dT%H} count={self.count}>"
+        )
@@ -18,6 +18,7 @@ from typing import Any
 from urllib.parse import urlparse
 
 from myloware.config import settings
+from myloware.resilience.registry import get_guard
 
 __all__ = [
     "S3ObjectRef",
@@ -82,7 +83,8 @@ class S3Store:
             raise FileNotFoundError(f"Upload source missing: {path}")
 
         def _upload() -> None:
-            self._client.upload_file(
+            get_guard("s3", "upload").call(
+                self._client.upload_file,
                 str(path),
                 bucket,
                 key,
@@ -96,6 +98,7 @@ class S3Store:
         ref = parse_s3_uri(uri)
 
         def _presign() -> str:
+            # Local signing only (no network), so no bulkhead/breaker.
             return str(
                 self._client.generate_presigned_url(
                     "get_object",
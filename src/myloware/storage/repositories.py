@@ -2,20 +2,29 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import datetime
-from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from datetime import timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select, func, update, or_, and_
+from sqlalchemy import select, func, update, or_, and_, delete, text, cast, literal
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, undefer
+from sqlalchemy.orm.util import identity_key
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm.attributes import flag_modified
+from sqlalchemy.orm.attributes import flag_modified, set_committed_value
 
+from myloware.config import settings
 from myloware.observability.logging import get_logger
 from myloware.storage.models import (
     Artifact,
+    ArtifactContent,
+    ArtifactKey,
+    ArtifactKeyKind,
     ArtifactType,
     AuditLog,
     ChatSession,
@@ -23,8 +32,11 @@ from myloware.storage.models import (
     Feedback,
     Job,
     JobStatus,
+    RateLimitBucket,
     Run,
+    RunBudgetCounter,
     RunStatus,
+    SafetyVerdict,
 )
 
 logger = get_logger(__name__)
@@ -37,6 +49,9 @@ __all__ = [
     "FeedbackRepository",
     "DeadLetterRepository",
     "JobRepository",
+    "SafetyVerdictRepository",
+    "RateLimitBucketRepository",
+    "RunBudgetRepository",
 ]
 
 
@@ -83,6 +98,9 @@ class RunRepository:
         )
         self.session.add(run)
         self.session.flush()
+        RunBudgetRepository(self.session).record_run(
+            workflow_name=workflow_name, user_id=user_id, created_at=run.created_at, run_id=run.id
+        )
         logger.info("Created run %s for workflow %s", run.id, workflow_name)
         return run
 
@@ -123,6 +141,9 @@ class RunRepository:
         )
         self.session.add(run)
         await self.session.flush()
+        await RunBudgetRepository(self.session).record_run_async(
+            workflow_name=workflow_name, user_id=user_id, created_at=run.created_at, run_id=run.id
+        )
         logger.info("Created run %s for workflow %s (async)", run.id, workflow_name)
         return run
 
@@ -190,12 +211,15 @@ class RunRepository:
     async def update_status_async(self, run_id: UUID, status: RunStatus) -> Optional[Run]:
         return await self.update_async(run_id, status=status.value)
 
-    async def count_runs_since_async(self, dt: datetime) -> int:
-        # Normalize to naive datetime because created_at is stored without tz
-        dt_naive = dt.replace(tzinfo=None) if dt.tzinfo else dt
-        stmt = select(func.count()).select_from(Run).where(Run.created_at >= dt_naive)
-        result = await self.session.execute(stmt)
-        return int(result.scalar_one() or 0)
+    async def count_runs_since_async(self, dt: datetime, *, user_id: str | None = None) -> int:
+        """Runs created since ``dt`` (globally, or for one user).
+
+        Read from the hourly run_budget_counters rather than the runs table, so
+        the cost is constant as history grows. Granularity is one hour: the
+        whole bucket containing ``dt`` counts, erring on the side of the budget.
+        """
+        scope = RunBudgetRepository.user_scope(user_id) if user_id else RUN_BUDGET_ALL
+        return await RunBudgetRepository(self.session).count_since_async(scope, dt)
 
     @staticmethod
     def _normalize_status(value: RunStatus | str) -> str:
@@ -215,7 +239,73 @@ class RunRepository:
     def update_step(self, run_id: UUID, step: str) -> Optional[Run]:
         return self.update(run_id, current_step=step)
 
+    def _artifact_patch_stmt(self, run_id: UUID, key: str, value: Any) -> Any | None:
+        """Single UPDATE that sets one ``Run.artifacts`` key in place, or None if unsupported.
+
+        The statement only carries the new entry, so its cost doesn't grow with
+        the number of keys already stored, and concurrent writers to different
+        keys of the same run can't overwrite each other.
+        """
+        payload = json.dumps(value)
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "postgresql":
+            current = func.coalesce(cast(Run.artifacts, JSONB), cast(literal("{}"), JSONB))
+            entry = func.jsonb_build_object(literal(key), cast(literal(payload), JSONB))
+            merged = cast(current.op("||")(entry), Run.artifacts.type)
+        elif dialect == "sqlite" and '"' not in key and "\\" not in key:
+            merged = func.json_set(
+                func.coalesce(Run.artifacts, literal("{}")),
+                literal(f'$."{key}"'),
+                func.json(literal(payload)),
+            )
+        else:
+            return None
+        return (
+            update(Run)
+            .where(Run.id == run_id)
+            .values(artifacts=merged)
+            .execution_options(synchronize_session=False)
+        )
+
+    def _patched_run(self, run_id: UUID, key: str, value: Any) -> Optional[Run]:
+        """The session's Run after a patch, mirroring the new key without reloading the row.
+
+        Returns None when the run isn't in the session; an expired instance
+        reloads on next access as usual.
+        """
+        session = getattr(self.session, "sync_session", self.session)
+        run = session.identity_map.get(identity_key(Run, run_id))
+        if run is not None and "artifacts" in run.__dict__:
+            artifacts = dict(run.__dict__["artifacts"] or {})
+            artifacts[key] = value
+            set_committed_value(run, "artifacts", artifacts)
+        return run
+
     def add_artifact(self, run_id: UUID, key: str, value: Any) -> Optional[Run]:
+        stmt = self._artifact_patch_stmt(run_id, key, value)
+        if stmt is None:
+            return self._add_artifact_rewrite(run_id, key, value)
+
+        # Flush pending ORM changes first so they can't clobber the patch later.
+        self.session.flush()
+        if self.session.execute(stmt).rowcount == 0:
+            return None
+        logger.info("Added artifact '%s' to run %s", key, run_id)
+        return self._patched_run(run_id, key, value) or self.session.get(Run, run_id)
+
+    async def add_artifact_async(self, run_id: UUID, key: str, value: Any) -> Optional[Run]:
+        stmt = self._artifact_patch_stmt(run_id, key, value)
+        if stmt is None:
+            return await self._add_artifact_rewrite_async(run_id, key, value)
+
+        await self.session.flush()
+        if (await self.session.execute(stmt)).rowcount == 0:
+            return None
+        logger.info("Added artifact '%s' to run %s (async)", key, run_id)
+        return self._patched_run(run_id, key, value) or await self.session.get(Run, run_id)
+
+    def _add_artifact_rewrite(self, run_id: UUID, key: str, value: Any) -> Optional[Run]:
+        """Read-modify-write fallback for databases without JSON patch support."""
         run = self.get(run_id)
         if run is None:
             return None
@@ -229,7 +319,9 @@ class RunRepository:
         logger.info("Added artifact '%s' to run %s", key, run_id)
         return run
 
-    async def add_artifact_async(self, run_id: UUID, key: str, value: Any) -> Optional[Run]:
+    async def _add_artifact_rewrite_async(
+        self, run_id: UUID, key: str, value: Any
+    ) -> Optional[Run]:
         run = await self.get_async(run_id)
         if run is None:
             return None
@@ -256,6 +348,23 @@ class RunRepository:
             query = query.filter(Run.user_id == user_id)
         return query.order_by(Run.created_at.desc()).offset(offset).limit(limit).all()
 
+    async def list_async(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        status: Optional[RunStatus] = None,
+        user_id: str | None = None,
+    ) -> List[Run]:
+        """Async: List runs, most recent first."""
+        stmt = select(Run)
+        if status:
+            stmt = stmt.where(Run.status == status.value)
+        if user_id:
+            stmt = stmt.where(Run.user_id == user_id)
+        stmt = stmt.order_by(Run.created_at.desc()).offset(offset).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
     def find_by_status_and_age(
         self,
         status: str,
@@ -294,6 +403,63 @@ class RunRepository:
         return result.scalars().all()
 
 
+def artifact_index_key(key: str) -> str:
+    """Normalize a lookup key to fit ArtifactKey.key (long keys are hashed)."""
+    if len(key) <= 255:
+        return key
+    return "sha256:" + hashlib.sha256(key.encode()).hexdigest()
+
+
+def _artifact_key_upsert(
+    dialect: str, artifact: Artifact, keys: Iterable[tuple[ArtifactKeyKind, str]]
+) -> Any | None:
+    """INSERT .. ON CONFLICT for an artifact's lookup keys (None when there are none).
+
+    A re-used key is re-pointed at the newest artifact. Doing that in one
+    statement (rather than a select-then-insert merge) keeps two writers that
+    race on the same key, e.g. identical analyses in one run, from failing on
+    the primary key.
+    """
+    rows = {
+        (kind.value, artifact_index_key(key)): {
+            "run_id": artifact.run_id,
+            "kind": kind.value,
+            "key": artifact_index_key(key),
+            "artifact_id": artifact.id,
+        }
+        for kind, key in keys
+        if key
+    }
+    if not rows:
+        return None
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = insert(ArtifactKey).values(list(rows.values()))
+    return stmt.on_conflict_do_update(
+        index_elements=[ArtifactKey.run_id, ArtifactKey.kind, ArtifactKey.key],
+        set_={"artifact_id": stmt.excluded.artifact_id, "created_at": stmt.excluded.created_at},
+    )
+
+
+# Loader options for queries whose callers read Artifact.content.
+_WITH_CONTENT = (undefer(Artifact.inline_content), joinedload(Artifact.body))
+
+
+def _artifact_content_fields(content: Optional[str]) -> Dict[str, Any]:
+    """Column values for an artifact body: inline when small, compressed out-of-line otherwise."""
+    if content is None:
+        return {"inline_content": None, "content_size": None, "content_encoding": None}
+    size = len(content.encode("utf-8"))
+    if size <= settings.artifact_inline_content_max_bytes:
+        return {"inline_content": content, "content_size": size, "content_encoding": None}
+    body = ArtifactContent.compress(content)
+    return {
+        "inline_content": None,
+        "content_size": size,
+        "content_encoding": body.encoding,
+        "body": body,
+    }
+
+
 class ArtifactRepository:
     """Repository for Artifact CRUD operations."""
 
@@ -309,8 +475,9 @@ class ArtifactRepository:
         uri: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
         trace_id: Optional[str] = None,
+        keys: Optional[Iterable[tuple[ArtifactKeyKind, str]]] = None,
     ) -> Artifact:
-        """Create a new artifact."""
+        """Create a new artifact, optionally indexing it under lookup ``keys``."""
 
         meta = metadata.copy() if metadata else {}
         if trace_id:
@@ -320,12 +487,15 @@ class ArtifactRepository:
             run_id=run_id,
             persona=persona,
             artifact_type=artifact_type.value,
-            content=content,
             uri=uri,
             artifact_metadata=meta,
+            **_artifact_content_fields(content),
         )
         self.session.add(artifact)
         self.session.flush()
+        upsert = _artifact_key_upsert(self.session.get_bind().dialect.name, artifact, keys or ())
+        if upsert is not None:
+            self.session.execute(upsert)
         logger.info(
             "Created artifact type=%s persona=%s run=%s", artifact_type.value, persona, run_id
         )
@@ -340,6 +510,7 @@ class ArtifactRepository:
         uri: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
         trace_id: Optional[str] = None,
+        keys: Optional[Iterable[tuple[ArtifactKeyKind, str]]] = None,
     ) -> Artifact:
         meta = metadata.copy() if metadata else {}
         if trace_id:
@@ -349,12 +520,15 @@ class ArtifactRepository:
             run_id=run_id,
             persona=persona,
             artifact_type=artifact_type.value,
-            content=content,
             uri=uri,
             artifact_metadata=meta,
+            **_artifact_content_fields(content),
         )
         self.session.add(artifact)
         await self.session.flush()
+        upsert = _artifact_key_upsert(self.session.get_bind().dialect.name, artifact, keys or ())
+        if upsert is not None:
+            await self.session.execute(upsert)
         logger.info(
             "Created artifact type=%s persona=%s run=%s (async)",
             artifact_type.value,
@@ -363,26 +537,62 @@ class ArtifactRepository:
         )
         return artifact
 
-    def get_by_run(self, run_id: UUID) -> List[Artifact]:
-        """Get all artifacts for a run ordered by creation time."""
-        return (
-            self.session.query(Artifact)
-            .filter(Artifact.run_id == run_id)
-            .order_by(Artifact.created_at)
-            .all()
+    def get_by_run(self, run_id: UUID, *, with_content: bool = False) -> List[Artifact]:
+        """Get all artifacts for a run ordered by creation time.
+
+        Bodies are only loaded with ``with_content=True``; otherwise reading
+        ``content`` lazy-loads it per artifact.
+        """
+        query = self.session.query(Artifact).filter(Artifact.run_id == run_id)
+        if with_content:
+            query = query.options(*_WITH_CONTENT)
+        return query.order_by(Artifact.created_at).all()
+
+    async def get_by_run_async(self, run_id: UUID, *, with_content: bool = False) -> List[Artifact]:
+        """Async: Get all artifacts for a run ordered by creation time.
+
+        Bodies are not loaded unless ``with_content=True``; pass it whenever the
+        caller reads ``Artifact.content`` (lazy loads are not possible here).
+        """
+        query = select(Artifact).where(Artifact.run_id == run_id).order_by(Artifact.created_at)
+        if with_content:
+            query = query.options(*_WITH_CONTENT)
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    async def get_by_key_async(
+        self, run_id: UUID, kind: ArtifactKeyKind, key: str
+    ) -> Optional[Artifact]:
+        """Async: the artifact indexed under (run_id, kind, key), if any."""
+        result = await self.session.execute(
+            select(Artifact)
+            .options(*_WITH_CONTENT)
+            .join(ArtifactKey, ArtifactKey.artifact_id == Artifact.id)
+            .where(ArtifactKey.run_id == run_id)
+            .where(ArtifactKey.kind == kind.value)
+            .where(ArtifactKey.key == artifact_index_key(key))
+            .limit(1)
         )
+        return result.scalar_one_or_none()
 
-    async def get_by_run_async(self, run_id: UUID) -> List[Artifact]:
-        """Async: Get all artifacts for a run ordered by creation time."""
+    async def find_by_key_async(self, kind: ArtifactKeyKind, key: str) -> Optional[Artifact]:
+        """Async: the most recent artifact indexed under (kind, key) in any run."""
         result = await self.session.execute(
-            select(Artifact).where(Artifact.run_id == run_id).order_by(Artifact.created_at)
+            select(Artifact)
+            .options(*_WITH_CONTENT)
+            .join(ArtifactKey, ArtifactKey.artifact_id == Artifact.id)
+            .where(ArtifactKey.kind == kind.value)
+            .where(ArtifactKey.key == artifact_index_key(key))
+            .order_by(Artifact.created_at.desc())
+            .limit(1)
         )
-        return result.scalars().all()
+        return result.scalar_one_or_none()
 
     def get_by_type(self, run_id: UUID, artifact_type: ArtifactType) -> Optional[Artifact]:
         """Get a single artifact by type for a run."""
         return (
             self.session.query(Artifact)
+            .options(*_WITH_CONTENT)
             .filter(Artifact.run_id == run_id)
             .filter(Artifact.artifact_type == artifact_type.value)
             .first()
@@ -394,6 +604,7 @@ class ArtifactRepository:
         """Get the most recent artifact of a specific type for a run."""
         return (
             self.session.query(Artifact)
+            .options(*_WITH_CONTENT)
             .filter(Artifact.run_id == run_id)
             .filter(Artifact.artifact_type == artifact_type.value)
             .order_by(Artifact.created_at.desc())
@@ -407,6 +618,7 @@ class ArtifactRepository:
             raise TypeError("Use get_latest_artifact_by_type() with Session")
         result = await self.session.execute(
             select(Artifact)
+            .options(*_WITH_CONTENT)
             .where(Artifact.run_id == run_id)
             .where(Artifact.artifact_type == artifact_type.value)
             .order_by(Artifact.created_at.desc())
@@ -414,6 +626,16 @@ class ArtifactRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_run_stamp_async(self, run_id: UUID) -> tuple[int, Optional[datetime]]:
+        """Async: (artifact count, newest created_at) for a run; changes when artifacts do."""
+        result = await self.session.execute(
+            select(func.count(Artifact.id), func.max(Artifact.created_at)).where(
+                Artifact.run_id == run_id
+            )
+        )
+        count, latest = result.one()
+        return int(count or 0), latest
+
     def find_cached_videos(
         self,
         topic: str,
@@ -485,6 +707,10 @@ class ArtifactRepository:
         CLIP_MANIFEST artifact that maps task_id -> metadata; this helper scans
         those manifests to recover the owning run.
 
+        The task id is normally resolved through the ArtifactKey index
+        (SORA_TASK); the manifest scan only runs for manifests written without
+        keys.
+
         Returns:
             (run_id, metadata) if found, else None.
         """
@@ -497,31 +723,43 @@ class ArtifactRepository:
         if not task_id:
             return None
 
+        def _task_meta(artifact: Artifact) -> dict[str, Any] | None:
+            meta = artifact.artifact_metadata or {}
+            if meta.get("type") != "task_metadata_mapping":
+                return None
+            try:
+                mapping = json.loads(artifact.content or "{}")
+            except (json.JSONDecodeError, TypeError, ValueError):
+                return None
+            if not isinstance(mapping, dict):
+                return None
+            task_meta = mapping.get(task_id)
+            return task_meta if isinstance(task_meta, dict) else None
+
+        indexed = await self.find_by_key_async(ArtifactKeyKind.SORA_TASK, task_id)
+        if indexed is not None:
+            task_meta = _task_meta(indexed)
+            if task_meta is not None:
+                return (UUID(str(indexed.run_id)), task_meta)
+
         needle = f'"{task_id}"'
 
         # Portable search: use LIKE on content to narrow candidates, then JSON-parse.
+        # Only inline bodies are searchable; compressed manifests are newer than
+        # the key index and always reachable through SORA_TASK keys.
         query = (
             select(Artifact)
+            .options(*_WITH_CONTENT)
             .where(Artifact.artifact_type == ArtifactType.CLIP_MANIFEST.value)
-            .where(Artifact.content.isnot(None))
-            .where(Artifact.content.contains(needle))
+            .where(Artifact.inline_content.isnot(None))
+            .where(Artifact.inline_content.contains(needle))
             .order_by(Artifact.created_at.desc())
         )
         result = await self.session.execute(query)
 
         for artifact in result.scalars().all():
-            meta = artifact.artifact_metadata or {}
-            if meta.get("type") != "task_metadata_mapping":
-                continue
-            mapping = None
-            try:
-                mapping = json.loads(artifact.content or "{}")
-            except (json.JSONDecodeError, TypeError, ValueError):
-                mapping = None
-            if not isinstance(mapping, dict):
-                continue
-            task_meta = mapping.get(task_id)
-            if isinstance(task_meta, dict):
+            task_meta = _task_meta(artifact)
+            if task_meta is not None:
                 return (UUID(str(artifact.run_id)), task_meta)
 
         return None
@@ -550,7 +788,7 @@ class ChatSessionRepository:
     replacing the in-memory session cache.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session | AsyncSession):
         self.session = session
 
     def get_session(self, user_id: str) -> Optional[str]:
@@ -560,6 +798,13 @@ class ChatSessionRepository:
         )
         return chat_session.session_id if chat_session else None
 
+    async def get_session_async(self, user_id: str) -> Optional[str]:
+        """Async: Get Llama Stack session ID for a user."""
+        result = await self.session.execute(
+            select(ChatSession.session_id).where(ChatSession.user_id == user_id).limit(1)
+        )
+        return result.scalar_one_or_none()
+
     def create_or_update_session(self, user_id: str, session_id: str) -> ChatSession:
         """Create or update a chat session for a user."""
         chat_session = (
@@ -575,12 +820,36 @@ class ChatSessionRepository:
         self.session.flush()
         return chat_session
 
+    async def create_or_update_session_async(self, user_id: str, session_id: str) -> ChatSession:
+        """Async: Create or update a chat session for a user."""
+        result = await self.session.execute(
+            select(ChatSession).where(ChatSession.user_id == user_id).limit(1)
+        )
+        chat_session = result.scalar_one_or_none()
+        if chat_session:
+            chat_session.session_id = session_id
+            logger.info("Updated chat session for user %s", user_id)
+        else:
+            chat_session = ChatSession(user_id=user_id, session_id=session_id)
+            self.session.add(chat_session)
+            logger.info("Created chat session for user %s", user_id)
+        await self.session.flush()
+        return chat_session
+
     def delete_session(self, user_id: str) -> bool:
         """Delete a chat session for a user."""
         deleted = self.session.query(ChatSession).filter(ChatSession.user_id == user_id).delete()
         self.session.flush()
         return deleted > 0
 
+    async def delete_session_async(self, user_id: str) -> bool:
+        """Async: Delete a chat session for a user."""
+        result = await self.session.execute(
+            delete(ChatSession).where(ChatSession.user_id == user_id)
+        )
+        await self.session.flush()
+        return int(result.rowcount or 0) > 0
+
 
 class AuditLogRepository:
     """Repository for AuditLog CRUD operations.
@@ -588,9 +857,27 @@ class AuditLogRepository:
     Provides audit trail storage for workflow events and gate decisions.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session | AsyncSession):
         self.session = session
 
+    @staticmethod
+    def _build(
+        action: str,
+        user_id: Optional[str],
+        run_id: Optional[UUID],
+        duration_ms: Optional[int],
+        outcome: Optional[str],
+        metadata: Optional[Dict[str, Any]],
+    ) -> AuditLog:
+        return AuditLog(
+            action=action,
+            user_id=user_id,
+            run_id=run_id,
+            duration_ms=duration_ms,
+            outcome=outcome,
+            audit_metadata=metadata or {},
+        )
+
     def create(
         self,
         action: str,
@@ -601,16 +888,31 @@ class AuditLogRepository:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> AuditLog:
         """Create an audit log entry."""
-        audit_log = AuditLog(
+        audit_log = self._build(action, user_id, run_id, duration_ms, outcome, metadata)
+        self.session.add(audit_log)
+        self.session.flush()
+        logger.info(
+            "audit_log_created",
             action=action,
             user_id=user_id,
-            run_id=run_id,
-            duration_ms=duration_ms,
+            run_id=str(run_id) if run_id else None,
             outcome=outcome,
-            audit_metadata=metadata or {},
         )
+        return audit_log
+
+    async def create_async(
+        self,
+        action: str,
+        user_id: Optional[str] = None,
+        run_id: Optional[UUID] = None,
+        duration_ms: Optional[int] = None,
+        outcome: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> AuditLog:
+        """Async: Create an audit log entry."""
+        audit_log = self._build(action, user_id, run_id, duration_ms, outcome, metadata)
         self.session.add(audit_log)
-        self.session.flush()
+        await self.session.flush()
         logger.info(
             "audit_log_created",
             action=action,
@@ -629,6 +931,13 @@ class AuditLogRepository:
             .all()
         )
 
+    async def get_by_run_id_async(self, run_id: UUID) -> List[AuditLog]:
+        """Async: Get all audit logs for a run ordered by creation time."""
+        result = await self.session.execute(
+            select(AuditLog).where(AuditLog.run_id == run_id).order_by(AuditLog.created_at)
+        )
+        return list(result.scalars().all())
+
     def get_by_user_id(self, user_id: str, limit: int = 100) -> List[AuditLog]:
         """Get audit logs for a user ordered by creation time (most recent first)."""
         return (
@@ -639,6 +948,16 @@ class AuditLogRepository:
             .all()
         )
 
+    async def get_by_user_id_async(self, user_id: str, limit: int = 100) -> List[AuditLog]:
+        """Async: Get audit logs for a user (most recent first)."""
+        result = await self.session.execute(
+            select(AuditLog)
+            .where(AuditLog.user_id == user_id)
+            .order_by(AuditLog.created_at.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
 
 class FeedbackRepository:
     """Repository for Feedback CRUD operations.
@@ -734,6 +1053,16 @@ class FeedbackRepository:
             .all()
         )
 
+    async def get_positive_feedback_async(self, limit: int = 100) -> List[Feedback]:
+        """Async: Get positive feedback entries (rating >= 4), most recent first."""
+        result = await self.session.execute(
+            select(Feedback)
+            .where(Feedback.rating >= 4)
+            .order_by(Feedback.created_at.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
 
 class DeadLetterRepository:
     """Repository for DeadLetter CRUD operations."""
@@ -1092,3 +1421,193 @@ class JobRepository:
         job.available_at = now + timedelta(seconds=float(retry_delay_seconds))
         await self.session.flush()
         return JobStatus.PENDING
+
+
+class SafetyVerdictRepository:
+    """Repository for cross-run safety verdicts keyed by (shield_id, content_hash)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_async(
+        self, shield_id: str, content_hash: str, *, now: datetime
+    ) -> Optional[SafetyVerdict]:
+        """Return the unexpired verdict for this content, if any."""
+        verdict = await self.session.get(SafetyVerdict, (shield_id, content_hash))
+        if verdict is None or verdict.expires_at <= now:
+            return None
+        return verdict
+
+    async def put_async(
+        self,
+        shield_id: str,
+        content_hash: str,
+        *,
+        safe: bool,
+        reason: str | None,
+        category: str | None,
+        severity: str | None,
+        now: datetime,
+        expires_at: datetime,
+    ) -> SafetyVerdict:
+        """Insert or refresh a verdict."""
+        verdict = await self.session.merge(
+            SafetyVerdict(
+                shield_id=shield_id,
+                content_hash=content_hash,
+                safe=safe,
+                reason=reason,
+                category=category,
+                severity=severity,
+                created_at=now,
+                expires_at=expires_at,
+            )
+        )
+        await self.session.flush()
+        return verdict
+
+    async def purge_expired_async(self, now: datetime) -> int:
+        """Delete expired verdicts; returns the number of rows removed."""
+        result = await self.session.execute(
+            delete(SafetyVerdict).where(SafetyVerdict.expires_at <= now)
+        )
+        return int(result.rowcount or 0)
+
+
+class RateLimitBucketRepository:
+    """Repository for cross-process token buckets (see RateLimitBucket)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def take_token_async(
+        self, key: str, *, rate: float, burst: float, now: datetime
+    ) -> float:
+        """Refill the bucket and take one token.
+
+        Returns 0.0 when a token was taken, otherwise the seconds until one will
+        be available. On Postgres the read-modify-write runs under a
+        transaction-scoped advisory lock on ``key``; the caller commits.
+        """
+        bind = self.session.get_bind()
+        if bind.dialect.name == "postgresql":
+            await self.session.execute(
+                text("SELECT pg_advisory_xact_lock(hashtext(:key))"), {"key": key}
+            )
+        bucket = await self.session.get(RateLimitBucket, key, populate_existing=True)
+        if bucket is None:
+            bucket = RateLimitBucket(key=key, tokens=float(burst), updated_at=now)
+            self.session.add(bucket)
+        elapsed = max(0.0, (now - bucket.updated_at).total_seconds())
+        tokens = min(float(burst), float(bucket.tokens) + elapsed * rate)
+        bucket.updated_at = now
+        if tokens >= 1.0:
+            bucket.tokens = tokens - 1.0
+            await self.session.flush()
+            return 0.0
+        bucket.tokens = tokens
+        await self.session.flush()
+        return (1.0 - tokens) / rate if rate > 0 else float("inf")
+
+
+RUN_BUDGET_ALL = "all"
+# The global and per-workflow counters are hit by every run creation; on
+# Postgres the upsert's row lock would serialize concurrent start_run
+# transactions until commit. Spreading them over stripes (picked from the run
+# id) keeps creations independent; reads sum the stripes.
+RUN_BUDGET_STRIPES = 8
+
+
+def _hour_bucket(dt: datetime) -> datetime:
+    # Counters are keyed by naive UTC hour, like the runs.created_at column.
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+class RunBudgetRepository:
+    """Hourly per-scope run counters backing the start_run budget guard.
+
+    Increments are upserts (``count = count + 1``) issued on the caller's
+    session, so they commit or roll back together with the run insert. Shared
+    scopes (``all``, ``workflow:<name>``) are written to one of
+    RUN_BUDGET_STRIPES rows (``<scope>#<n>``); per-user scopes are not striped.
+    """
+
+    def __init__(self, session: Session | AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def user_scope(user_id: str) -> str:
+        return f"user:{user_id}"[:255]
+
+    @staticmethod
+    def workflow_scope(workflow_name: str) -> str:
+        return f"workflow:{workflow_name}"[:255]
+
+    @staticmethod
+    def _stripe(scope: str, stripe: int) -> str:
+        return f"{scope[:252]}#{stripe}"
+
+    def _scopes(self, workflow_name: str, user_id: str | None, run_id: UUID | None) -> list[str]:
+        stripe = run_id.int % RUN_BUDGET_STRIPES if run_id is not None else 0
+        scopes = [
+            self._stripe(RUN_BUDGET_ALL, stripe),
+            self._stripe(self.workflow_scope(workflow_name), stripe),
+        ]
+        if user_id:
+            scopes.append(self.user_scope(user_id))
+        return scopes
+
+    def _increment_stmt(self, dialect: str, scopes: list[str], hour: datetime) -> Any:
+        rows = [{"scope": scope, "hour": hour, "count": 1} for scope in scopes]
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = insert(RunBudgetCounter).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=[RunBudgetCounter.scope, RunBudgetCounter.hour],
+            set_={"count": RunBudgetCounter.count + 1},
+        )
+
+    def record_run(
+        self,
+        *,
+        workflow_name: str,
+        user_id: str | None,
+        created_at: datetime | None,
+        run_id: UUID | None = None,
+    ) -> None:
+        hour = _hour_bucket(created_at or datetime.now(timezone.utc))
+        dialect = self.session.get_bind().dialect.name
+        self.session.execute(
+            self._increment_stmt(dialect, self._scopes(workflow_name, user_id, run_id), hour)
+        )
+
+    async def record_run_async(
+        self,
+        *,
+        workflow_name: str,
+        user_id: str | None,
+        created_at: datetime | None,
+        run_id: UUID | None = None,
+    ) -> None:
+        hour = _hour_bucket(created_at or datetime.now(timezone.utc))
+        dialect = self.session.get_bind().dialect.name
+        await self.session.execute(
+            self._increment_stmt(dialect, self._scopes(workflow_name, user_id, run_id), hour)
+        )
+
+    async def count_since_async(self, scope: str, dt: datetime) -> int:
+        # The bare scope is still summed: migration 008 backfilled unstriped rows.
+        scopes = [scope, *(self._stripe(scope, n) for n in range(RUN_BUDGET_STRIPES))]
+        stmt = select(func.coalesce(func.sum(RunBudgetCounter.count), 0)).where(
+            RunBudgetCounter.scope.in_(scopes), RunBudgetCounter.hour >= _hour_bucket(dt)
+        )
+        result = await self.session.execute(stmt)
+        return int(result.scalar_one() or 0)
+
+    async def prune_before_async(self, dt: datetime) -> int:
+        """Delete buckets older than ``dt``; returns the number of rows removed."""
+        result = await self.session.execute(
+            delete(RunBudgetCounter).where(RunBudgetCounter.hour < _hour_bucket(dt))
+        )
+        return int(result.rowcount or 0)
@@ -4,14 +4,24 @@ Uses OpenAI Vision API to analyze images/video frames and provide
 editing recommendations (colors, composition, transitions, pacing).
 
 Implements caching: identical requests (media_url + analysis_type) within a run
-are cached to reduce API costs.
+are cached to reduce API costs. With ``vision_cache_cross_run`` the cache is
+shared across runs, keyed by a hash of the media.
+
+Transcoded clips carry keyframes, a contact sheet and a dominant-color palette
+extracted at transcode time (see services/clip_previews.py). For a clip URL the
+model is shown the small contact sheet instead of the video, and ``colors``
+analyses are answered from the stored palette without a model call.
 """
 
 from __future__ import annotations
 
+import base64
+import binascii
 import hashlib
 import json
+from pathlib import Path
 from typing import Any, Dict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from uuid import UUID
 
 from openai import AsyncOpenAI
@@ -19,7 +29,7 @@ from openai import AsyncOpenAI
 from myloware.config import settings
 from myloware.observability.logging import get_logger
 from myloware.storage.database import get_async_session_factory
-from myloware.storage.models import ArtifactType
+from myloware.storage.models import ArtifactKeyKind, ArtifactType
 from myloware.storage.repositories import ArtifactRepository
 from myloware.tools.base import JSONSchema, MylowareBaseTool, format_tool_error, format_tool_success
 
@@ -27,6 +37,8 @@ logger = get_logger(__name__)
 
 __all__ = ["AnalyzeMediaTool"]
 
+_VIDEO_SUFFIXES = (".mp4", ".mov", ".m4v", ".webm")
+
 
 class AnalyzeMediaTool(MylowareBaseTool):
     """Analyze images or video frames to inform editing decisions.
@@ -62,7 +74,9 @@ class AnalyzeMediaTool(MylowareBaseTool):
         if not self.api_key:
             raise ValueError("OpenAI API key required for vision analysis")
 
-        self.openai_client = AsyncOpenAI(api_key=self.api_key)
+        # Created lazily so agent construction (which builds this tool for every
+        # editor turn) doesn't pay for an HTTP client that may never be used.
+        self._openai_client: AsyncOpenAI | None = None
 
         logger.info(
             "AnalyzeMediaTool initialized (run_id=%s, model=%s, api_key_present=%s)",
@@ -71,6 +85,17 @@ class AnalyzeMediaTool(MylowareBaseTool):
             bool(self.api_key),
         )
 
+    @property
+    def openai_client(self) -> AsyncOpenAI:
+        """OpenAI client, created on first use."""
+        if self._openai_client is None:
+            self._openai_client = AsyncOpenAI(api_key=self.api_key)
+        return self._openai_client
+
+    @openai_client.setter
+    def openai_client(self, client: AsyncOpenAI) -> None:
+        self._openai_client = client
+
     def get_name(self) -> str:
         """Return tool name."""
         return "analyze_media"
@@ -129,47 +154,85 @@ class AnalyzeMediaTool(MylowareBaseTool):
         key_str = json.dumps(key_data, sort_keys=True)
         return hashlib.sha256(key_str.encode()).hexdigest()
 
-    async def _check_cache(self, cache_key: str) -> Dict[str, Any] | None:
-        """Check if this request is cached for this run.
+    def _compute_media_key(self, media_url: str, analysis_type: str) -> str:
+        """Content key for the cross-run cache: analysis_type + sha256 of the media.
+
+        Data URIs are hashed by their decoded bytes. Remote URLs are not fetched
+        just to hash them, so they are keyed by URL with presigning parameters
+        (X-Amz-*) dropped, which keeps re-signed S3 links for the same object on
+        one key.
+        """
+        if media_url.startswith("data:") and "," in media_url:
+            header, _, payload = media_url.partition(",")
+            try:
+                data = (
+                    base64.b64decode(payload, validate=False)
+                    if header.endswith(";base64")
+                    else payload.encode()
+                )
+            except (binascii.Error, ValueError):
+                data = media_url.encode()
+        else:
+            parts = urlsplit(media_url)
+            query = [
+                (k, v)
+                for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                if not k.lower().startswith("x-amz-")
+            ]
+            data = urlunsplit(parts._replace(query=urlencode(query), fragment="")).encode()
+        return f"{analysis_type}:{hashlib.sha256(data).hexdigest()}"
+
+    async def _check_cache(
+        self, cache_key: str, media_key: str | None = None
+    ) -> Dict[str, Any] | None:
+        """Check if this request is cached for this run (or any run, if shared).
 
         Args:
             cache_key: The computed cache key
+            media_key: Optional content key for the cross-run cache
+                (used only when ``vision_cache_cross_run`` is enabled)
 
         Returns:
             Cached analysis result if found, None otherwise
         """
-        if not self.run_id:
+        cross_run = bool(media_key) and bool(getattr(settings, "vision_cache_cross_run", False))
+        if not self.run_id and not cross_run:
             return None
 
         SessionLocal = get_async_session_factory()
         async with SessionLocal() as session:
             repo = ArtifactRepository(session)
-            artifacts = await repo.get_by_run_async(UUID(self.run_id))
-
-            # Look for VISION_ANALYSIS artifacts with matching cache_key
-            for artifact in artifacts:
-                if artifact.artifact_type == ArtifactType.VISION_ANALYSIS.value:
-                    metadata = artifact.artifact_metadata or {}
-                    if metadata.get("cache_key") == cache_key and artifact.content:
-                        try:
-                            cached_result = json.loads(artifact.content)
-                            logger.info(
-                                "Found cached vision analysis (cache_key=%s, media_url=%s)",
-                                cache_key[:16],
-                                metadata.get("media_url", "unknown")[:50],
-                            )
-                            return cached_result
-                        except Exception as e:
-                            logger.warning("Failed to parse cached analysis: %s", e)
-                            return None
-
-        return None
+            artifact = None
+            if self.run_id:
+                artifact = await repo.get_by_key_async(
+                    UUID(self.run_id), ArtifactKeyKind.VISION_CACHE, cache_key
+                )
+            if artifact is None and cross_run and media_key:
+                artifact = await repo.find_by_key_async(ArtifactKeyKind.VISION_MEDIA, media_key)
+
+        if artifact is None or not artifact.content:
+            return None
+        try:
+            cached_result = json.loads(artifact.content)
+        except Exception as e:
+            logger.warning("Failed to parse cached analysis: %s", e)
+            return None
+        metadata = artifact.artifact_metadata or {}
+        logger.info(
+            "Found cached vision analysis (cache_key=%s, media_url=%s)",
+            cache_key[:16],
+            metadata.get("media_url", "unknown")[:50],
+        )
+        return cached_result
 
     async def _store_cache(
         self, cache_key: str, media_url: str, analysis_type: str, result: Dict[str, Any]
     ) -> None:
         """Store analysis result in cache for this run.
 
+        The artifact is indexed by cache_key (per run) and by media content key
+        (shared across runs when ``vision_cache_cross_run`` is enabled).
+
         Args:
             cache_key: The computed cache key
             media_url: URL to image or video frame
@@ -193,10 +256,77 @@ class AnalyzeMediaTool(MylowareBaseTool):
                     "analysis_type": analysis_type,
                     "model": self.model,
                 },
+                keys=[
+                    (ArtifactKeyKind.VISION_CACHE, cache_key),
+                    (
+                        ArtifactKeyKind.VISION_MEDIA,
+                        self._compute_media_key(media_url, analysis_type),
+                    ),
+                ],
             )
             await session.commit()
         logger.debug("Stored vision analysis in cache (cache_key=%s)", cache_key[:16])
 
+    async def _load_clip_previews(self, media_url: str) -> Dict[str, Any] | None:
+        """Previews stored on the VIDEO_CLIP artifact for a transcoded clip URL."""
+        if not urlsplit(media_url).path.lower().endswith(_VIDEO_SUFFIXES):
+            return None
+        SessionLocal = get_async_session_factory()
+        async with SessionLocal() as session:
+            artifact = await ArtifactRepository(session).find_by_key_async(
+                ArtifactKeyKind.CLIP_URL, media_url
+            )
+        if artifact is None:
+            return None
+        metadata: Dict[str, Any] = artifact.artifact_metadata or {}
+        previews = metadata.get("previews")
+        return previews if isinstance(previews, dict) else None
+
+    async def _resolve_image_url(self, url: str) -> str:
+        """Make a stored preview URL fetchable by the vision API.
+
+        s3:// URIs are presigned. Previews on the local transcode dir are inlined
+        as data URIs, since the media endpoint may be private or token-protected.
+        """
+        if url.startswith("s3://"):
+            from myloware.storage.object_store import get_s3_store
+
+            return await get_s3_store().presign_get_async(
+                uri=url,
+                expires_seconds=int(getattr(settings, "transcode_s3_presign_seconds", 86400)),
+            )
+        output_dir = str(getattr(settings, "transcode_output_dir", "") or "")
+        if output_dir and "/v1/media/transcoded/" in url:
+            path = Path(output_dir) / urlsplit(url).path.rsplit("/", 1)[-1]
+            try:
+                data = path.read_bytes()
+            except OSError:
+                return url
+            return f"data:image/jpeg;base64,{base64.b64encode(data).decode()}"
+        return url
+
+    def _palette_result(self, media_url: str, palette: list[Dict[str, Any]]) -> Dict[str, Any]:
+        """Answer a ``colors`` analysis from a clip's precomputed palette."""
+        weights = [float(entry.get("ratio") or 0.0) for entry in palette]
+        rgb = [tuple(int(str(entry["hex"])[i : i + 2], 16) for i in (1, 3, 5)) for entry in palette]
+        total = sum(weights) or 1.0
+        red = sum(w * c[0] for w, c in zip(weights, rgb)) / total
+        blue = sum(w * c[2] for w, c in zip(weights, rgb)) / total
+        colors = ", ".join(
+            f"{entry['hex']} ({round(float(entry.get('ratio') or 0.0) * 100)}%)"
+            for entry in palette
+        )
+        return {
+            "analysis": (
+                f"Dominant colors: {colors}. "
+                f"Overall color temperature: {'warm' if red >= blue else 'cool'}."
+            ),
+            "palette": palette,
+            "analysis_type": "colors",
+            "model": "local_palette",
+            "media_url": media_url,
+        }
+
     async def async_run_impl(
         self,
         media_url: str,
@@ -217,9 +347,18 @@ class AnalyzeMediaTool(MylowareBaseTool):
             Identical requests (media_url + analysis_type) within a run are cached
             to reduce API costs. Cache behavior: hash(media_url + analysis_type).
         """
+        previews = await self._load_clip_previews(media_url)
+        if analysis_type == "colors" and previews and previews.get("palette"):
+            return format_tool_success(
+                self._palette_result(media_url, previews["palette"]),
+                message="Analysis complete (clip palette) for colors",
+            )
+
         # Check cache first
         cache_key = self._compute_cache_key(media_url, analysis_type)
-        cached = await self._check_cache(cache_key)
+        cached = await self._check_cache(
+            cache_key, media_key=self._compute_media_key(media_url, analysis_type)
+        )
         if cached:
             return format_tool_success(
                 {
@@ -234,6 +373,13 @@ class AnalyzeMediaTool(MylowareBaseTool):
 
         try:
             prompt = self._build_prompt(analysis_type, editing_context)
+            image_url = media_url
+            if previews and previews.get("contact_sheet"):
+                image_url = await self._resolve_image_url(str(previews["contact_sheet"]))
+                prompt = (
+                    "This image is a contact sheet of keyframes sampled in order "
+                    f"(left to right, top to bottom) from one video clip. {prompt}"
+                )
 
             logger.info(
                 "Analyzing media (url=%s, type=%s, context=%s)",
@@ -253,7 +399,7 @@ class AnalyzeMediaTool(MylowareBaseTool):
                             {
                                 "type": "image_url",
                                 "image_url": {
-                                    "url": media_url,
+                                    "url": image_url,
                                     "detail": "high" if analysis_type == "full" else "low",
                                 },
                             },
@@ -278,8 +424,11 @@ class AnalyzeMediaTool(MylowareBaseTool):
                 "media_url": media_url,
             }
 
-            # Store in cache for future requests
-            await self._store_cache(cache_key, media_url, analysis_type, result_data)
+            # Store in cache for future requests; a failed write must not discard the result.
+            try:
+                await self._store_cache(cache_key, media_url, analysis_type, result_data)
+            except Exception as exc:
+                logger.warning("Failed to cache media analysis (key=%s): %s", cache_key, exc)
 
             return format_tool_success(
                 result_data,
@@ -17,15 +17,19 @@ It NEVER calls async_run() or async_run_impl() directly.
 
 Our MylowareBaseTool.run_impl() is the ONLY sync→async bridge:
 - Detects if subclass has overridden async_run_impl
-- If event loop is running: spins new loop in worker thread
-- Otherwise: uses asyncio.run()
+- Submits the coroutine to the process-wide tool loop (myloware.tools.loop), so
+  loop-bound resources (async DB pool, clients) are reused across calls
 - ALWAYS awaits the coroutine before returning
 
+The native myloware.agents.AsyncAgent (used by workflow nodes and chat routes)
+awaits ClientTool.async_run() → async_run_impl() on the event loop for tools that
+override async_run_impl, and runs sync-only tools via run() in a worker thread.
+
 Rules:
 1. Never call async_run_impl() directly from sync code
 2. Never return a coroutine from run_impl() - always await it
-3. Use sync Agent with tools that have working sync entrypoint (run_impl)
-4. Use AsyncAgent only if you need true async tool execution
+3. Never block the event loop inside async_run_impl() - offload sync I/O to a thread
+4. Sync Agent callers still go through run_impl(), so keep that path working
 
 The bridge handles: sync → async (creates/awaits coroutine)
 The bridge returns: plain dict/JSON (async → sync conversion)
@@ -34,11 +38,14 @@ The bridge returns: plain dict/JSON (async → sync conversion)
 from __future__ import annotations
 
 from abc import abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Self
 import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from llama_stack_client.lib.agents.client_tool import ClientTool, JSONSchema
 
 from myloware.observability.logging import get_logger
+from myloware.tools.loop import in_tool_loop_thread, run_on_tool_loop
 
 logger = get_logger(__name__)
 
@@ -86,8 +93,38 @@ class MylowareBaseTool(ClientTool):
     - get_description() -> str
     - get_input_schema() -> JSONSchema (JSON Schema format)
     - run_impl(**kwargs) -> Any (sync) or async_run_impl(**kwargs) -> Any (async)
+
+    Tools are cheap to hand out per run: build one prototype (no run_id) and
+    call bind_run() to get a shallow copy carrying the run context. The tool
+    definition (name, description, JSON schema) is computed once per prototype
+    and shared by every bound copy.
     """
 
+    run_id: str | None = None
+
+    def bind_run(self, run_id: str | None) -> Self:
+        """Return a shallow copy of this tool bound to ``run_id``.
+
+        Shared state (settings-derived config, clients, cached tool definition)
+        is reused; subclasses re-derive run-specific fields in _rebind_run_context().
+        """
+        self.get_tool_definition()  # memoize on the prototype so copies share it
+        bound = copy.copy(self)
+        bound.run_id = run_id
+        bound._rebind_run_context()
+        return bound
+
+    def _rebind_run_context(self) -> None:
+        """Hook for subclasses to recompute fields derived from ``run_id``."""
+
+    def get_tool_definition(self) -> Any:
+        """Return the tool definition, computing it once per prototype."""
+        definition = getattr(self, "_tool_definition", None)
+        if definition is None:
+            definition = super().get_tool_definition()
+            self._tool_definition = definition
+        return definition
+
     def run(self, message_history: Any) -> Any:
         """
         Override ClientTool.run() to add instrumentation.
@@ -111,8 +148,8 @@ class MylowareBaseTool(ClientTool):
         """
         Sync implementation that bridges to async_run_impl if needed.
 
-        ClientTool.run() calls this synchronously. If there's a running loop,
-        we run the async code in a thread with a new loop.
+        ClientTool.run() calls this synchronously. The async implementation runs
+        on the shared tool loop thread whether or not the caller has a loop.
         """
         logger.debug(
             "run_impl() called for %s with kwargs: %s", self.__class__.__name__, list(kwargs.keys())
@@ -131,44 +168,15 @@ class MylowareBaseTool(ClientTool):
         )
 
         if has_async:
-            import threading
-
-            try:
-                asyncio.get_running_loop()
-            except RuntimeError:
-                logger.debug("No running loop, using asyncio.run()")
-                result = asyncio.run(self.async_run_impl(**kwargs))
-                logger.debug("asyncio.run() completed, result type: %s", type(result))
-                return result
-
-            logger.debug("Detected running event loop, using thread approach")
-            result = None
-            exception: Exception | None = None
-
-            def run_in_thread() -> None:
-                nonlocal result, exception
-                logger.debug("Thread started, creating new event loop")
-                new_loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(new_loop)
-                try:
-                    logger.debug("Calling async_run_impl in thread")
-                    result = new_loop.run_until_complete(self.async_run_impl(**kwargs))
-                    logger.debug(
-                        "async_run_impl completed in thread, result type: %s", type(result)
-                    )
-                except Exception as e:
-                    logger.error("Exception in thread: %s", e, exc_info=True)
-                    exception = e
-                finally:
-                    new_loop.close()
-
-            thread = threading.Thread(target=run_in_thread)
-            thread.start()
-            thread.join()
-
-            if exception:
-                raise exception
-            logger.debug("run_impl() returning result from thread")
+            if in_tool_loop_thread():
+                # Nested bridge call from a tool already running on the tool loop:
+                # blocking on that loop would deadlock, so use a one-off loop.
+                logger.debug("run_impl() re-entered on tool loop, using a private loop")
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    return executor.submit(asyncio.run, self.async_run_impl(**kwargs)).result()
+
+            result = run_on_tool_loop(self.async_run_impl, **kwargs)
+            logger.debug("run_impl() returning result from tool loop, type: %s", type(result))
             return result
 
         raise NotImplementedError(
@@ -0,0 +1,117 @@
+"""Process-wide event loop for sync → async tool bridging.
+
+``MylowareBaseTool.run_impl`` is called synchronously by the SDK's sync Agent.
+Rather than spinning up a thread and a fresh event loop per tool call, every
+bridged call is submitted to one long-lived loop running in a daemon thread.
+Loop-bound resources created by tools (async DB engine and its pool, clients)
+therefore survive across calls instead of being torn down with a throwaway loop.
+
+The loop starts lazily on first use, is recreated after ``fork()``, and is
+stopped by ``shutdown_tool_loop()`` (registered with ``atexit``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import os
+import threading
+from typing import Any, Awaitable, Callable, TypeVar
+
+from myloware.observability.logging import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = ["run_on_tool_loop", "shutdown_tool_loop", "in_tool_loop_thread"]
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+_thread: threading.Thread | None = None
+_pid: int | None = None
+
+
+def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+    asyncio.set_event_loop(loop)
+    loop.call_soon(ready.set)
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _thread, _pid
+
+    pid = os.getpid()
+    loop = _loop
+    if loop is not None and _pid == pid and not loop.is_closed():
+        return loop
+
+    with _lock:
+        if _loop is not None and _pid == pid and not _loop.is_closed():
+            return _loop
+
+        from myloware.storage.database import register_long_lived_loop
+
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        thread = threading.Thread(
+            target=_run_loop, args=(loop, ready), name="myloware-tool-loop", daemon=True
+        )
+        thread.start()
+        ready.wait()
+        register_long_lived_loop(loop)
+
+        _loop, _thread, _pid = loop, thread, pid
+        logger.info("Started tool bridge event loop (pid=%s)", pid)
+        return loop
+
+
+def in_tool_loop_thread() -> bool:
+    """True when called from the tool loop's own thread."""
+    return _thread is not None and threading.current_thread() is _thread
+
+
+def run_on_tool_loop(fn: Callable[..., Awaitable[T]], /, *args: Any, **kwargs: Any) -> T:
+    """Run ``fn(*args, **kwargs)`` on the shared tool loop and block for the result.
+
+    Must not be called from the tool loop thread itself (it would deadlock);
+    callers check ``in_tool_loop_thread()`` first.
+    """
+    if in_tool_loop_thread():
+        raise RuntimeError("run_on_tool_loop() called from the tool loop thread")
+
+    loop = _ensure_loop()
+
+    async def _call() -> T:
+        return await fn(*args, **kwargs)
+
+    return asyncio.run_coroutine_threadsafe(_call(), loop).result()
+
+
+def shutdown_tool_loop(timeout: float = 5.0) -> None:
+    """Dispose loop-owned resources and stop the tool loop thread."""
+    global _loop, _thread, _pid
+
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop, _thread, _pid = None, None, None
+
+    if loop is None or loop.is_closed():
+        return
+
+    from myloware.storage.database import dispose_loop_async_engine
+
+    try:
+        asyncio.run_coroutine_threadsafe(dispose_loop_async_engine(), loop).result(timeout)
+    except Exception:  # pragma: no cover - best-effort cleanup
+        logger.debug("Failed to dispose tool loop resources", exc_info=True)
+
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not None:
+        thread.join(timeout)
+
+
+atexit.register(shutdown_tool_loop)
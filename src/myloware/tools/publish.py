@@ -17,8 +17,9 @@ import httpx
 from myloware.config import settings
 from myloware.config.provider_modes import effective_upload_post_provider
 from myloware.observability.logging import get_logger
+from myloware.resilience.registry import get_guard
 from myloware.storage.database import get_async_session_factory
-from myloware.storage.models import ArtifactType
+from myloware.storage.models import ArtifactKeyKind
 from myloware.storage.repositories import ArtifactRepository
 from myloware.tools.base import JSONSchema, MylowareBaseTool, format_tool_error, format_tool_success
 
@@ -143,27 +144,25 @@ class UploadPostTool(MylowareBaseTool):
         SessionLocal = get_async_session_factory()
         async with SessionLocal() as session:
             repo = ArtifactRepository(session)
-            artifacts = await repo.get_by_run_async(UUID(self.run_id))
-
-            # Look for PUBLISHED_URL artifacts with matching video_url in metadata
-            for artifact in artifacts:
-                if artifact.artifact_type == ArtifactType.PUBLISHED_URL.value:
-                    metadata = artifact.artifact_metadata or {}
-                    if metadata.get("video_url") == video_url and artifact.uri:
-                        logger.info(
-                            "Found existing publish for video_url=%s, returning published_url=%s",
-                            video_url[:50],
-                            artifact.uri,
-                        )
-                        return {
-                            "published_url": artifact.uri,
-                            "publish_id": metadata.get("publish_id"),
-                            "platform": metadata.get("platform", "tiktok"),
-                            "account_id": metadata.get("account_id"),
-                            "from_cache": True,
-                        }
-
-        return None
+            artifact = await repo.get_by_key_async(
+                UUID(self.run_id), ArtifactKeyKind.PUBLISH_VIDEO_URL, video_url
+            )
+
+        if artifact is None or not artifact.uri:
+            return None
+        metadata = artifact.artifact_metadata or {}
+        logger.info(
+            "Found existing publish for video_url=%s, returning published_url=%s",
+            video_url[:50],
+            artifact.uri,
+        )
+        return {
+            "published_url": artifact.uri,
+            "publish_id": metadata.get("publish_id"),
+            "platform": metadata.get("platform", "tiktok"),
+            "account_id": metadata.get("account_id"),
+            "from_cache": True,
+        }
 
     async def async_run_impl(
         self,
@@ -286,7 +285,10 @@ class UploadPostTool(MylowareBaseTool):
             files_and_data.append(("tags[]", (None, tag)))
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with (
+                get_guard("upload_post", "upload").protect_async(),
+                httpx.AsyncClient(timeout=self.timeout) as client,
+            ):
                 response = await client.post(
                     f"{self.base_url}/api/upload",
                     headers=headers,
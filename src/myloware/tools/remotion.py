@@ -14,6 +14,7 @@ from opentelemetry import trace
 from myloware.config import settings
 from myloware.config.provider_modes import effective_remotion_provider
 from myloware.observability.logging import get_logger
+from myloware.resilience.registry import get_guard
 from myloware.tools.base import JSONSchema, MylowareBaseTool, format_tool_success
 
 logger = get_logger(__name__)
@@ -40,12 +41,7 @@ class RemotionRenderTool(MylowareBaseTool):
         self.timeout = timeout
         self.project = project
         self.base_url = getattr(settings, "remotion_service_url", "http://localhost:3001")
-        webhook_base = getattr(settings, "webhook_base_url", "")
-        self.callback_url = (
-            f"{webhook_base}/v1/webhooks/remotion?run_id={run_id}"
-            if webhook_base and run_id
-            else None
-        )
+        self.callback_url = self._build_callback_url()
         self.provider_mode = effective_remotion_provider(settings)
         if self.provider_mode == "off":
             raise ValueError("Remotion provider is disabled (REMOTION_PROVIDER=off)")
@@ -69,6 +65,15 @@ class RemotionRenderTool(MylowareBaseTool):
         if self.provider_mode == "real" and not self.base_url:
             raise ValueError("REMOTION_SERVICE_URL must be configured")
 
+    def _build_callback_url(self) -> str | None:
+        webhook_base = getattr(settings, "webhook_base_url", "")
+        if webhook_base and self.run_id:
+            return f"{webhook_base}/v1/webhooks/remotion?run_id={self.run_id}"
+        return None
+
+    def _rebind_run_context(self) -> None:
+        self.callback_url = self._build_callback_url()
+
     def get_name(self) -> str:
         return "remotion_render"
 
@@ -271,7 +276,10 @@ class RemotionRenderTool(MylowareBaseTool):
                 "run_id": self.run_id or "",
             },
         ):
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with (
+                get_guard("remotion", "render").protect_async(),
+                httpx.AsyncClient(timeout=self.timeout) as client,
+            ):
                 response = await client.post(
                     f"{self.base_url}/api/render", json=payload, headers=headers
                 )
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 from pathlib import Path
 from typing import Any, Dict, List
 from uuid import UUID
 
+import anyio
 import httpx
 
 from myloware.config import settings
 from myloware.config.provider_modes import effective_sora_provider
 from myloware.observability.logging import get_logger
+from myloware.resilience.adaptive import rate_limit_signal
+from myloware.resilience.registry import get_guard
 from myloware.services.fake_sora import fake_sora_task_id_from_path, list_fake_sora_clips
 from myloware.storage.database import get_session
-from myloware.storage.models import ArtifactType
+from myloware.storage.models import ArtifactKeyKind, ArtifactType
 from myloware.storage.repositories import ArtifactRepository
 from myloware.tools.base import JSONSchema, MylowareBaseTool, format_tool_success
 
@@ -23,6 +27,9 @@ logger = get_logger(__name__)
 
 __all__ = ["SoraGenerationTool"]
 
+# Attempts per clip when OpenAI answers 429 (no job is created on a 429).
+_SORA_RATE_LIMIT_ATTEMPTS = 3
+
 _AISMR_GLOBAL_PROMPT_APPENDIX = (
     "GLOBAL CONSTRAINTS (AISMR): cinematic macro realism. "
     "AUDIO: NO MUSIC; NO BACKGROUND MUSIC; NO SCORE; no melody; no singing; no instruments. "
@@ -31,6 +38,16 @@ _AISMR_GLOBAL_PROMPT_APPENDIX = (
 )
 
 
+def _manifest_keys(
+    task_metadata: Dict[str, Dict[str, Any]], idempotency_key: str | None
+) -> list[tuple[ArtifactKeyKind, str]]:
+    """Index keys for a CLIP_MANIFEST: its idempotency key and each task id."""
+    keys = [(ArtifactKeyKind.SORA_TASK, task_id) for task_id in task_metadata]
+    if idempotency_key:
+        keys.append((ArtifactKeyKind.SORA_IDEMPOTENCY, idempotency_key))
+    return keys
+
+
 class SoraGenerationTool(MylowareBaseTool):
     """Generate video clips using OpenAI Sora 2 (text-to-video)."""
 
@@ -48,10 +65,7 @@ class SoraGenerationTool(MylowareBaseTool):
         self.model = model or "sora-2"
         self.timeout = timeout
 
-        webhook_base = getattr(settings, "webhook_base_url", "")
-        self.callback_url = (
-            f"{webhook_base}/v1/webhooks/sora?run_id={run_id}" if webhook_base and run_id else None
-        )
+        self.callback_url = self._build_callback_url()
 
         # Provider selection (fail-fast, no silent fallbacks)
         provider_setting_raw = getattr(settings, "sora_provider", "real")
@@ -74,13 +88,7 @@ class SoraGenerationTool(MylowareBaseTool):
         if self.provider_mode == "real" and not self.api_key:
             raise ValueError("OpenAI API key required when SORA_PROVIDER=real")
 
-        # OpenAI Sora uses Standard Webhooks configured in the dashboard; per-request callback_url
-        # is not supported. Ensure a public webhook endpoint is configured out-of-band.
-        if self.provider_mode == "real" and not self.callback_url:
-            logger.warning(
-                "WEBHOOK_BASE_URL missing; Sora webhooks are configured in the OpenAI dashboard. "
-                "Ensure a public /v1/webhooks/sora endpoint is registered."
-            )
+        self._warn_if_webhook_missing()
 
         logger.info(
             "SoraGenerationTool initialized (run_id=%s, mode=%s, webhook_configured=%s)",
@@ -89,6 +97,26 @@ class SoraGenerationTool(MylowareBaseTool):
             bool(self.callback_url),
         )
 
+    def _build_callback_url(self) -> str | None:
+        webhook_base = getattr(settings, "webhook_base_url", "")
+        if webhook_base and self.run_id:
+            return f"{webhook_base}/v1/webhooks/sora?run_id={self.run_id}"
+        return None
+
+    def _rebind_run_context(self) -> None:
+        self.callback_url = self._build_callback_url()
+        self._warn_if_webhook_missing()
+
+    def _warn_if_webhook_missing(self) -> None:
+        # OpenAI Sora uses Standard Webhooks configured in the dashboard; per-request callback_url
+        # is not supported. Ensure a public webhook endpoint is configured out-of-band.
+        # Run-agnostic prototypes have no callback URL by design, so only warn once bound.
+        if self.run_id and self.provider_mode == "real" and not self.callback_url:
+            logger.warning(
+                "WEBHOOK_BASE_URL missing; Sora webhooks are configured in the OpenAI dashboard. "
+                "Ensure a public /v1/webhooks/sora endpoint is registered."
+            )
+
     def _store_task_metadata_sync(
         self, task_metadata: Dict[str, Dict[str, Any]], idempotency_key: str | None = None
     ) -> None:
@@ -117,6 +145,7 @@ class SoraGenerationTool(MylowareBaseTool):
                 artifact_type=ArtifactType.CLIP_MANIFEST,
                 content=json.dumps(task_metadata),
                 metadata=metadata,
+                keys=_manifest_keys(task_metadata, idempotency_key),
             )
             session.commit()
         logger.info("Stored task metadata mapping for %d tasks (sync)", len(task_metadata))
@@ -174,34 +203,28 @@ class SoraGenerationTool(MylowareBaseTool):
                 )
                 return None
 
-            artifacts = await repo.get_by_run_async(run_uuid)
-
-            # Look for CLIP_MANIFEST with matching idempotency_key
-            for artifact in artifacts:
-                if (
-                    artifact.artifact_type == ArtifactType.CLIP_MANIFEST.value
-                    and artifact.artifact_metadata
-                    and artifact.artifact_metadata.get("idempotency_key") == idempotency_key
-                ):
-                    # Found existing submission - return task_ids
-                    try:
-                        task_metadata = json.loads(artifact.content or "{}")
-                        task_ids = list(task_metadata.keys())
-                        logger.info(
-                            "Found existing Sora submission with idempotency_key=%s, returning %d task_ids",
-                            idempotency_key[:16],
-                            len(task_ids),
-                        )
-                        return {
-                            "task_ids": task_ids,
-                            "task_metadata": task_metadata,
-                            "from_cache": True,
-                        }
-                    except Exception as e:
-                        logger.warning("Failed to parse existing submission: %s", e)
-                        return None
+            artifact = await repo.get_by_key_async(
+                run_uuid, ArtifactKeyKind.SORA_IDEMPOTENCY, idempotency_key
+            )
 
-        return None
+        if artifact is None or artifact.artifact_type != ArtifactType.CLIP_MANIFEST.value:
+            return None
+        try:
+            task_metadata = json.loads(artifact.content or "{}")
+            task_ids = list(task_metadata.keys())
+        except Exception as e:
+            logger.warning("Failed to parse existing submission: %s", e)
+            return None
+        logger.info(
+            "Found existing Sora submission with idempotency_key=%s, returning %d task_ids",
+            idempotency_key[:16],
+            len(task_ids),
+        )
+        return {
+            "task_ids": task_ids,
+            "task_metadata": task_metadata,
+            "from_cache": True,
+        }
 
     async def _store_task_metadata_async(
         self, task_metadata: Dict[str, Dict[str, Any]], idempotency_key: str | None = None
@@ -234,6 +257,7 @@ class SoraGenerationTool(MylowareBaseTool):
                 artifact_type=ArtifactType.CLIP_MANIFEST,
                 content=json.dumps(task_metadata),
                 metadata=metadata,
+                keys=_manifest_keys(task_metadata, idempotency_key),
             )
             await session.commit()
         logger.info("Stored task metadata mapping for %d tasks", len(task_metadata))
@@ -702,6 +726,11 @@ class SoraGenerationTool(MylowareBaseTool):
     ) -> tuple[list[str], dict[str, dict[str, Any]], str | None]:
         """Submit video generation jobs to OpenAI and return (task_ids, task_metadata).
 
+        Up to ``sora_submit_concurrency`` POSTs are in flight at once; task_ids are
+        returned in clip order regardless of completion order. On the first failure
+        no further clips are sent, and only clips that actually got a task id are
+        returned alongside the error.
+
         This helper does not persist any artifacts; callers must store task metadata for
         webhook validation/resume.
         """
@@ -724,65 +753,119 @@ class SoraGenerationTool(MylowareBaseTool):
             "Content-Type": "application/json",
         }
 
-        async with httpx.AsyncClient(timeout=self.timeout) as _client:
-            for idx, video in enumerate(videos):
-                video_index = self._coerce_video_index(video, idx)
-                visual_prompt = video.get("visual_prompt", "")
-                voice_over = video.get("voice_over", "")
+        # Build every payload up front so ordering and video_index mapping do not
+        # depend on which POST finishes first.
+        jobs: list[tuple[int, Dict[str, str], int, dict[str, Any]]] = []
+        for idx, video in enumerate(videos):
+            video_index = self._coerce_video_index(video, idx)
+            visual_prompt = video.get("visual_prompt", "")
+            voice_over = video.get("voice_over", "")
 
-                full_prompt = visual_prompt
-                if voice_over:
-                    full_prompt = f'{visual_prompt}\n\nVoice over narration: "{voice_over}"'
+            full_prompt = visual_prompt
+            if voice_over:
+                full_prompt = f'{visual_prompt}\n\nVoice over narration: "{voice_over}"'
 
-                if is_aismr and "GLOBAL CONSTRAINTS (AISMR)" not in full_prompt:
-                    full_prompt = f"{full_prompt}\n\n{_AISMR_GLOBAL_PROMPT_APPENDIX}"
+            if is_aismr and "GLOBAL CONSTRAINTS (AISMR)" not in full_prompt:
+                full_prompt = f"{full_prompt}\n\n{_AISMR_GLOBAL_PROMPT_APPENDIX}"
 
+            payload = {
+                "model": self.model,
+                "prompt": full_prompt,
+                "seconds": seconds_token,
+                "size": size,
+            }
+            jobs.append((idx, video, video_index, payload))
+
+        submitted: dict[int, str] = {}
+        limiter = anyio.CapacityLimiter(max(1, int(settings.sora_submit_concurrency)))
+
+        async def _submit_one(
+            client: httpx.AsyncClient,
+            idx: int,
+            payload: dict[str, Any],
+        ) -> None:
+            nonlocal stop_error
+            async with limiter:
+                # Fail-fast: clips still queued behind a failure are never sent.
+                # POSTs already in flight are allowed to finish so their task ids
+                # are recorded rather than orphaned at OpenAI.
+                if stop_error is not None:
+                    return
                 logger.debug(
                     "Submitting OpenAI video job %s/%s (model=%s)",
                     idx + 1,
                     len(videos),
                     self.model,
                 )
-
-                payload = {
-                    "model": self.model,
-                    "prompt": full_prompt,
-                    "seconds": seconds_token,
-                    "size": size,
-                }
-
                 try:
-                    resp = await _client.post(
-                        "https://api.openai.com/v1/videos", json=payload, headers=headers
-                    )
-                    resp.raise_for_status()
+                    resp = await self._post_video_job(client, payload, headers)
                     submit = resp.json()
                     task_id = submit.get("id")
                     if not task_id:
                         raise ValueError(f"No task id in response: {submit}")
-
-                    task_ids.append(task_id)
-                    task_metadata[task_id] = {
-                        "video_index": video_index,
-                        "size": size,
-                        "seconds": seconds_token,
-                    }
-                    for key in ("topic", "sign", "object_name"):
-                        if video.get(key):
-                            task_metadata[task_id][key] = video[key]
-
-                    logger.info(
-                        "OpenAI video task submitted: %s (dashboard webhook expected)",
-                        task_id,
-                    )
                 except Exception as exc:
-                    # Fail-fast: stop submitting further clips to avoid surprise costs.
-                    stop_error = f"Video {idx + 1}/{len(videos)}: {type(exc).__name__} - {exc}"
-                    logger.error("OpenAI video submission failed (fail-fast): %s", stop_error)
-                    break
+                    if stop_error is None:
+                        stop_error = f"Video {idx + 1}/{len(videos)}: {type(exc).__name__} - {exc}"
+                        logger.error("OpenAI video submission failed (fail-fast): %s", stop_error)
+                    return
+                submitted[idx] = task_id
+                logger.info(
+                    "OpenAI video task submitted: %s (dashboard webhook expected)",
+                    task_id,
+                )
+
+        async with httpx.AsyncClient(timeout=self.timeout) as _client:
+            async with anyio.create_task_group() as tg:
+                for idx, _video, _video_index, payload in jobs:
+                    tg.start_soon(_submit_one, _client, idx, payload)
+
+        for idx, video, video_index, _payload in jobs:
+            task_id = submitted.get(idx)
+            if task_id is None:
+                continue
+            task_ids.append(task_id)
+            task_metadata[task_id] = {
+                "video_index": video_index,
+                "size": size,
+                "seconds": seconds_token,
+            }
+            for key in ("topic", "sign", "object_name"):
+                if video.get(key):
+                    task_metadata[task_id][key] = video[key]
 
         return task_ids, task_metadata, stop_error
 
+    async def _post_video_job(
+        self, client: httpx.AsyncClient, payload: dict[str, Any], headers: dict[str, str]
+    ) -> httpx.Response:
+        """POST one video job, retrying 429s through the shared adaptive limiter.
+
+        A 429 means no job was created, so resubmitting cannot double-bill. The
+        limiter halves provider concurrency and holds every caller for the
+        Retry-After, so the retry waits there rather than sleeping here.
+        """
+        guard = get_guard("openai_videos", "create")
+        for attempt in range(_SORA_RATE_LIMIT_ATTEMPTS):
+            try:
+                async with guard.protect_async():
+                    resp = await client.post(
+                        "https://api.openai.com/v1/videos", json=payload, headers=headers
+                    )
+                    resp.raise_for_status()
+                return resp
+            except httpx.HTTPStatusError as exc:
+                limited, retry_after = rate_limit_signal(exc)
+                if not limited or attempt == _SORA_RATE_LIMIT_ATTEMPTS - 1:
+                    raise
+                logger.warning(
+                    "OpenAI video submission rate limited (attempt %s/%s)",
+                    attempt + 1,
+                    _SORA_RATE_LIMIT_ATTEMPTS,
+                )
+                if guard.limiter is None:
+                    await asyncio.sleep(retry_after if retry_after is not None else 1.0)
+        raise RuntimeError("unreachable")  # pragma: no cover
+
     async def _get_run_workflow_name_async(self) -> str | None:
         """Async lookup of the workflow name for this run.
 
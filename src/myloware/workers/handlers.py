@@ -19,8 +19,8 @@ from myloware.services.openai_videos import (
 )
 from myloware.services.render_local import LocalRemotionProvider
 from myloware.services.remotion_urls import normalize_remotion_output_url
-from myloware.services.transcode import transcode_video
-from myloware.storage.models import ArtifactType, RunStatus
+from myloware.services.transcode import clip_preview_metadata, transcode_video
+from myloware.storage.models import ArtifactKeyKind, ArtifactType, RunStatus
 from myloware.storage.repositories import ArtifactRepository, JobRepository, RunRepository
 from myloware.workers.exceptions import JobReschedule
 from myloware.workers.job_types import (
@@ -129,7 +129,7 @@ async def handle_job(
             logger.info("sora_poll_not_waiting", run_id=str(run_id), status=str(run.status))
             return
 
-        artifacts = await session_artifact_repo.get_by_run_async(run_id)
+        artifacts = await session_artifact_repo.get_by_run_async(run_id, with_content=True)
 
         # Determine task list (prefer explicit run artifact).
         pending_task_ids = []
@@ -253,7 +253,9 @@ async def handle_job(
                     "task_id": task_id,
                     "video_index": _video_index_for(task_id),
                     "source": "sora_poll",
+                    **clip_preview_metadata(run_id, _video_index_for(task_id)),
                 },
+                keys=[(ArtifactKeyKind.CLIP_URL, transcoded_url)],
             )
             existing_task_ids.add(task_id)
             completed_now += 1
@@ -694,6 +696,7 @@ async def handle_job(
         for key in ("topic", "sign", "object_name"):
             if key in metadata:
                 artifact_metadata[key] = metadata[key]
+        artifact_metadata.update(clip_preview_metadata(run_id, video_index))
 
         await session_artifact_repo.create_async(
             run_id=run_id,
@@ -701,6 +704,7 @@ async def handle_job(
             artifact_type=ArtifactType.VIDEO_CLIP,
             uri=transcoded_url,
             metadata=artifact_metadata,
+            keys=[(ArtifactKeyKind.CLIP_URL, transcoded_url)],
         )
 
         # Update run projection and enqueue resume when all clips are ready.
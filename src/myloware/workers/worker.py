@@ -8,11 +8,13 @@ from uuid import UUID
 
 import asyncio
 import anyio
+from prometheus_client import Histogram
 
 from myloware.config import settings
 from myloware.llama_clients import get_sync_client
+from myloware.observability.audit import start_audit_writer, stop_audit_writer
 from myloware.observability.logging import get_logger
-from myloware.storage.database import get_async_session_factory
+from myloware.storage.database import QueryStats, get_async_session_factory, track_queries
 from myloware.storage.models import Job, JobStatus
 from myloware.storage.repositories import (
     ArtifactRepository,
@@ -25,6 +27,19 @@ from myloware.workers.handlers import handle_job
 
 logger = get_logger(__name__)
 
+JOB_DB_STATEMENTS = Histogram(
+    "myloware_job_db_statements",
+    "SQL statements issued per job handler invocation",
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 250, 1000),
+    labelnames=["job_type"],
+)
+JOB_DB_SECONDS = Histogram(
+    "myloware_job_db_seconds",
+    "Time spent executing SQL per job handler invocation",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+    labelnames=["job_type"],
+)
+
 
 def _default_worker_id() -> str:
     host = socket.gethostname()
@@ -84,27 +99,34 @@ async def _process_one_job(job_id: UUID, worker_id: str, *, lease_seconds: float
 
         stop_event = anyio.Event()
         handler_exc: Exception | None = None
+        db_stats = QueryStats()
         async with anyio.create_task_group() as tg:
+            # Started before tracking begins, so lease renewals are not counted.
             tg.start_soon(_lease_heartbeat, job_id, worker_id, float(lease_seconds), stop_event)
             try:
-                await handle_job(
-                    job_type=job_type,
-                    run_id=run_id,
-                    payload=payload,
-                    session_run_repo=run_repo,
-                    session_artifact_repo=artifact_repo,
-                    session_job_repo=job_repo,
-                    llama_client=llama_client,
-                )
+                with track_queries() as db_stats:
+                    await handle_job(
+                        job_type=job_type,
+                        run_id=run_id,
+                        payload=payload,
+                        session_run_repo=run_repo,
+                        session_artifact_repo=artifact_repo,
+                        session_job_repo=job_repo,
+                        llama_client=llama_client,
+                    )
             except Exception as exc:
                 handler_exc = exc
             finally:
                 stop_event.set()
+        JOB_DB_STATEMENTS.labels(job_type=job_type).observe(db_stats.statements)
+        JOB_DB_SECONDS.labels(job_type=job_type).observe(db_stats.seconds)
 
         if handler_exc is None:
             await job_repo.mark_succeeded_async(job_id)
             await session.commit()
-            logger.info("job_succeeded", job_id=str(job_id), job_type=job_type)
+            logger.info(
+                "job_succeeded", job_id=str(job_id), job_type=job_type, **db_stats.log_fields()
+            )
             return
 
         # Rescheduled: treat as expected control flow (no stacktrace, no DLQ).
@@ -129,6 +151,7 @@ async def _process_one_job(job_id: UUID, worker_id: str, *, lease_seconds: float
                     attempts=int(job.attempts or 0),
                     max_attempts=int(job.max_attempts or 0),
                     error=str(handler_exc.reason),
+                    **db_stats.log_fields(),
                 )
             else:
                 logger.info(
@@ -137,6 +160,7 @@ async def _process_one_job(job_id: UUID, worker_id: str, *, lease_seconds: float
                     job_type=job_type,
                     retry_delay_seconds=float(handler_exc.retry_delay_seconds),
                     reason=str(handler_exc.reason),
+                    **db_stats.log_fields(),
                 )
             return
 
@@ -172,6 +196,7 @@ async def _process_one_job(job_id: UUID, worker_id: str, *, lease_seconds: float
             max_attempts=int(job.max_attempts or 0),
             error=str(handler_exc),
             exc_info=handler_exc,
+            **db_stats.log_fields(),
         )
 
 
@@ -245,19 +270,24 @@ async def run_worker(*, once: bool = False) -> None:
         finally:
             limiter.release()
 
-    if once:
-        jid = await _claim_job()
-        if jid is None:
-            return
-        await _process_one_job(jid, worker_id, lease_seconds=lease_seconds)
-        return
-
-    async with anyio.create_task_group() as tg:
-        while True:
-            await limiter.acquire()
+    start_audit_writer()
+    try:
+        if once:
             jid = await _claim_job()
             if jid is None:
-                limiter.release()
-                await anyio.sleep(poll_interval)
-                continue
-            tg.start_soon(_run_claimed, jid)
+                return
+            await _process_one_job(jid, worker_id, lease_seconds=lease_seconds)
+            return
+
+        async with anyio.create_task_group() as tg:
+            while True:
+                await limiter.acquire()
+                jid = await _claim_job()
+                if jid is None:
+                    limiter.release()
+                    await anyio.sleep(poll_interval)
+                    continue
+                tg.start_soon(_run_claimed, jid)
+    finally:
+        with anyio.CancelScope(shield=True):
+            await stop_audit_writer()
@@ -16,7 +16,14 @@ from myloware.workflows.langgraph.workflow import (
     continue_after_publish_approval,
     resume_run,
 )
-from myloware.workflows.cleanup import get_stuck_runs, timeout_stuck_runs
+from myloware.workflows.cleanup import (
+    get_stuck_runs,
+    get_stuck_runs_async,
+    prune_run_budget_counters_async,
+    purge_expired_safety_verdicts_async,
+    timeout_stuck_runs,
+    timeout_stuck_runs_async,
+)
 from myloware.workflows.parsers import extract_topic_from_brief, parse_structured_ideation
 from myloware.workflows.retry import RetryConfig, async_with_retry, with_retry
 from myloware.workflows.state import WorkflowResult
@@ -37,7 +44,11 @@ __all__ = [
     "extract_topic_from_brief",
     # Cleanup/Retry
     "timeout_stuck_runs",
+    "timeout_stuck_runs_async",
     "get_stuck_runs",
+    "get_stuck_runs_async",
+    "prune_run_budget_counters_async",
+    "purge_expired_safety_verdicts_async",
     "async_with_retry",
     "with_retry",
     "RetryConfig",
@@ -1,7 +1,8 @@
 """Cleanup utilities for stuck workflow runs.
 
 Provides periodic cleanup of runs that get stuck in intermediate states
-(e.g., AWAITING_VIDEO_GENERATION) due to missed webhooks or service failures.
+(e.g., AWAITING_VIDEO_GENERATION) due to missed webhooks or service failures,
+and pruning of bookkeeping tables that otherwise grow without bound.
 """
 
 from __future__ import annotations
@@ -11,16 +12,25 @@ from typing import Any
 from uuid import UUID
 
 from myloware.observability.logging import get_logger
-from myloware.storage.database import get_session
+from myloware.storage.database import get_async_session_factory, get_session
 from myloware.storage.models import RunStatus
-from myloware.storage.repositories import RunRepository
+from myloware.storage.repositories import (
+    RunBudgetRepository,
+    RunRepository,
+    SafetyVerdictRepository,
+)
 
 logger = get_logger(__name__)
 
 __all__ = [
     "timeout_stuck_runs",
+    "timeout_stuck_runs_async",
     "get_stuck_runs",
+    "get_stuck_runs_async",
+    "prune_run_budget_counters_async",
+    "purge_expired_safety_verdicts_async",
     "DEFAULT_TIMEOUT_MINUTES",
+    "RUN_BUDGET_RETENTION_HOURS",
 ]
 
 # Default timeout for runs waiting on external services
@@ -32,6 +42,9 @@ AWAITING_STATUSES = [
     RunStatus.AWAITING_RENDER.value,
 ]
 
+# The budget guard looks back 24h and counts the whole bucket containing the cutoff.
+RUN_BUDGET_RETENTION_HOURS = 25
+
 
 def get_stuck_runs(
     timeout_minutes: int = DEFAULT_TIMEOUT_MINUTES,
@@ -138,3 +151,131 @@ def timeout_stuck_runs(
         )
 
     return timed_out_ids
+
+
+def _stuck_minutes(run: Any) -> tuple[datetime, int]:
+    updated_at = run.updated_at or run.created_at
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=timezone.utc)
+    stuck_for = datetime.now(timezone.utc) - updated_at
+    return updated_at, int(stuck_for.total_seconds() / 60)
+
+
+def _naive_cutoff(timeout_minutes: int) -> datetime:
+    # Columns are TIMESTAMP WITHOUT TIME ZONE (UTC by convention); asyncpg rejects aware values.
+    return datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(minutes=timeout_minutes)
+
+
+async def get_stuck_runs_async(
+    timeout_minutes: int = DEFAULT_TIMEOUT_MINUTES,
+) -> list[dict[str, Any]]:
+    """Async variant of get_stuck_runs (used by the API health endpoints)."""
+    cutoff = _naive_cutoff(timeout_minutes)
+    stuck_runs = []
+
+    SessionLocal = get_async_session_factory()
+    async with SessionLocal() as session:
+        run_repo = RunRepository(session)
+        for status in AWAITING_STATUSES:
+            for run in await run_repo.find_by_status_and_age_async(status, cutoff):
+                updated_at, stuck_minutes = _stuck_minutes(run)
+                stuck_runs.append(
+                    {
+                        "id": run.id,
+                        "status": run.status,
+                        "updated_at": updated_at.isoformat(),
+                        "stuck_for_minutes": stuck_minutes,
+                    }
+                )
+
+    return stuck_runs
+
+
+async def timeout_stuck_runs_async(
+    timeout_minutes: int = DEFAULT_TIMEOUT_MINUTES,
+    dry_run: bool = False,
+) -> list[UUID]:
+    """Async variant of timeout_stuck_runs (used by the API health endpoints)."""
+    cutoff = _naive_cutoff(timeout_minutes)
+    timed_out_ids: list[UUID] = []
+
+    SessionLocal = get_async_session_factory()
+    async with SessionLocal() as session:
+        run_repo = RunRepository(session)
+        for status in AWAITING_STATUSES:
+            for run in await run_repo.find_by_status_and_age_async(status, cutoff):
+                _, stuck_minutes = _stuck_minutes(run)
+                if dry_run:
+                    logger.info(
+                        "[DRY RUN] Would timeout run %s (status=%s, stuck for %d minutes)",
+                        run.id,
+                        run.status,
+                        stuck_minutes,
+                    )
+                else:
+                    error_msg = (
+                        f"Run timed out after {stuck_minutes} minutes waiting in {run.status}. "
+                        "External service webhook may have been missed or failed."
+                    )
+                    previous_status = run.status
+                    await run_repo.update_async(
+                        run.id,
+                        status=RunStatus.FAILED.value,
+                        error=error_msg,
+                    )
+                    logger.warning(
+                        "Timed out stuck run %s (status=%s, stuck for %d minutes)",
+                        run.id,
+                        previous_status,
+                        stuck_minutes,
+                    )
+                timed_out_ids.append(run.id)
+
+        if not dry_run and timed_out_ids:
+            await session.commit()
+
+    if timed_out_ids:
+        logger.info(
+            "Timed out %d stuck runs (dry_run=%s)",
+            len(timed_out_ids),
+            dry_run,
+        )
+
+    return timed_out_ids
+
+
+async def prune_run_budget_counters_async(
+    retention_hours: int = RUN_BUDGET_RETENTION_HOURS,
+) -> int:
+    """Delete run budget counter buckets older than the budget window.
+
+    Returns:
+        Number of counter rows removed
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(hours=retention_hours)
+    SessionLocal = get_async_session_factory()
+    async with SessionLocal() as session:
+        pruned = await RunBudgetRepository(session).prune_before_async(cutoff)
+        await session.commit()
+
+    if pruned:
+        logger.info("Pruned %d run budget counter rows", pruned)
+    return pruned
+
+
+async def purge_expired_safety_verdicts_async() -> int:
+    """Delete safety verdicts whose TTL has passed (lookups already ignore them).
+
+    Returns:
+        Number of verdict rows removed
+    """
+    SessionLocal = get_async_session_factory()
+    async with SessionLocal() as session:
+        purged = await SafetyVerdictRepository(session).purge_expired_async(
+            datetime.now(timezone.utc).replace(tzinfo=None)
+        )
+        await session.commit()
+
+    if purged:
+        logger.info("Purged %d expired safety verdicts", purged)
+    return purged
@@ -9,10 +9,11 @@ This module holds small utilities that are shared across workflow nodes:
 
 from __future__ import annotations
 
+import inspect
 import json
 import re
-from contextlib import contextmanager
-from typing import Any, Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Generator
 from uuid import UUID
 
 from myloware.observability.logging import get_logger
@@ -23,12 +24,14 @@ logger = get_logger(__name__)
 
 __all__ = [
     "agent_session",
+    "agent_session_async",
     "extract_content",
     "_strip_noise_for_safety",
     "_maybe_store_safety_cache",
     "SimpleMessage",
     "_tool_response_contents",
     "create_turn_collecting_tool_responses",
+    "create_turn_collecting_tool_responses_async",
     "_tool_response_contents_from_payloads",
 ]
 
@@ -47,6 +50,22 @@ def agent_session(client: Any, agent: Any, session_name: str) -> Generator[str,
             logger.warning("Failed to cleanup session %s: %s", session_id, exc)
 
 
+@asynccontextmanager
+async def agent_session_async(
+    client: Any, agent: Any, session_name: str
+) -> AsyncGenerator[str, None]:
+    """Async context manager for AsyncAgent sessions with automatic cleanup."""
+    session_id = await agent.create_session(session_name)
+    try:
+        yield session_id
+    finally:
+        try:
+            await client.conversations.delete(conversation_id=session_id)
+            logger.debug("Cleaned up session: %s", session_id)
+        except Exception as exc:
+            logger.warning("Failed to cleanup session %s: %s", session_id, exc)
+
+
 def extract_content(response: Any) -> str:
     """Extract primary text from Llama Stack responses (agent or chat completions)."""
     if response is None:
@@ -258,27 +277,66 @@ def create_turn_collecting_tool_responses(
     final_response = None
 
     for chunk in stream_iter:
-        event = getattr(chunk, "event", None)
-        if getattr(event, "step_type", None) == "tool_execution":
-            result = getattr(event, "result", None)
-            responses = getattr(result, "tool_responses", None) or []
-            for tr in responses:
-                if isinstance(tr, dict):
-                    tool_responses.append(tr)
-                else:
-                    tool_responses.append(
-                        {
-                            "call_id": getattr(tr, "call_id", None),
-                            "tool_name": getattr(tr, "tool_name", None),
-                            "content": getattr(tr, "content", None),
-                            "metadata": getattr(tr, "metadata", None),
-                        }
-                    )
+        _collect_chunk_tool_responses(chunk, tool_responses)
+        response = getattr(chunk, "response", None)
+        if response is not None:
+            final_response = response
 
+    return _finish_turn(final_response, tool_responses)
+
+
+async def create_turn_collecting_tool_responses_async(
+    agent: Any, messages: list[dict[str, Any]], session_id: str
+) -> tuple[Any, list[dict[str, Any]]]:
+    """Async twin of ``create_turn_collecting_tool_responses`` for ``AsyncAgent``.
+
+    The turn streams on the event loop, so no worker thread is held while the
+    model call is in flight.
+    """
+
+    stream = agent.create_turn(messages, session_id, stream=True)
+    if inspect.isawaitable(stream):
+        stream = await stream
+
+    tool_responses: list[dict[str, Any]] = []
+    if not hasattr(stream, "__aiter__"):
+        # Fake implementations may return the final response directly.
+        return stream, _tool_response_payloads_from_response(stream)
+
+    final_response = None
+
+    async for chunk in stream:
+        _collect_chunk_tool_responses(chunk, tool_responses)
         response = getattr(chunk, "response", None)
         if response is not None:
             final_response = response
 
+    return _finish_turn(final_response, tool_responses)
+
+
+def _collect_chunk_tool_responses(chunk: Any, tool_responses: list[dict[str, Any]]) -> None:
+    event = getattr(chunk, "event", None)
+    if getattr(event, "step_type", None) != "tool_execution":
+        return
+    result = getattr(event, "result", None)
+    responses = getattr(result, "tool_responses", None) or []
+    for tr in responses:
+        if isinstance(tr, dict):
+            tool_responses.append(tr)
+        else:
+            tool_responses.append(
+                {
+                    "call_id": getattr(tr, "call_id", None),
+                    "tool_name": getattr(tr, "tool_name", None),
+                    "content": getattr(tr, "content", None),
+                    "metadata": getattr(tr, "metadata", None),
+                }
+            )
+
+
+def _finish_turn(
+    final_response: Any, tool_responses: list[dict[str, Any]]
+) -> tuple[Any, list[dict[str, Any]]]:
     if final_response is None:
         raise RuntimeError("Agent turn did not complete")
 
@@ -17,17 +17,17 @@ from langgraph.types import interrupt, RunnableConfig
 import anyio
 import httpx
 
-from myloware.agents.factory import create_agent
+from myloware.agents.factory import create_async_agent
 from myloware.config import settings
 from myloware.config.provider_modes import (
     effective_llama_stack_provider,
     effective_remotion_provider,
     effective_sora_provider,
 )
-from myloware.llama_clients import get_async_client, get_sync_client
+from myloware.llama_clients import get_async_client
 from myloware.observability.logging import get_logger
 from myloware.storage.database import get_async_session_factory  # get_session used in tests
-from myloware.storage.models import ArtifactType, RunStatus
+from myloware.storage.models import ArtifactKeyKind, ArtifactType, RunStatus
 from myloware.storage.repositories import ArtifactRepository, RunRepository
 from myloware.workflows.extractors import get_extractor
 from myloware.workflows.helpers import extract_trace_id
@@ -35,8 +35,8 @@ from myloware.workflows.langgraph.agent_io import (
     _maybe_store_safety_cache,
     _strip_noise_for_safety,
     _tool_response_contents_from_payloads,
-    agent_session,
-    create_turn_collecting_tool_responses,
+    agent_session_async,
+    create_turn_collecting_tool_responses_async,
     extract_content,
 )
 from myloware.workflows.langgraph.safety_cache import (
@@ -218,8 +218,6 @@ async def ideation_node(
     run_id = UUID(str(run_id_value))
     # Normalize run_id back into state for downstream nodes
     state["run_id"] = str(run_id)
-    # Use sync Agent in a background thread to avoid blocking the event loop
-    client = get_sync_client()
     async_client = get_async_client()
 
     # Use async session with proper cleanup
@@ -243,9 +241,9 @@ async def ideation_node(
                     "status": RunStatus.FAILED.value,
                 }
 
-            # Create ideator agent (sync Agent) but execute calls via to_thread
-            ideator = create_agent(
-                client,
+            # Create ideator agent (turns run natively on the event loop)
+            ideator = create_async_agent(
+                async_client,
                 state["project"],
                 "ideator",
                 state.get("vector_db_id"),
@@ -264,12 +262,13 @@ async def ideation_node(
                 }
 
             # Generate ideas (guard → inference)
-            with agent_session(client, ideator, f"run-{run_id}-ideator") as session_id:
-                response, _tool_response_payloads = await anyio.to_thread.run_sync(
-                    create_turn_collecting_tool_responses,
-                    ideator,
-                    input_messages,
-                    session_id,
+            async with agent_session_async(
+                async_client, ideator, f"run-{run_id}-ideator"
+            ) as session_id:
+                response, _tool_response_payloads = (
+                    await create_turn_collecting_tool_responses_async(
+                        ideator, input_messages, session_id
+                    )
                 )
 
                 ideas = extract_content(response)
@@ -402,15 +401,14 @@ async def production_node(state: VideoWorkflowState) -> dict[str, Any]:
         }
 
     run_id = UUID(state["run_id"])
-    client = get_sync_client()
     async_client = get_async_client()
 
     # Use async session with proper cleanup
     async with _get_repositories_async(state["run_id"]) as (run_repo, artifact_repo, session):
         try:
             # Create producer agent
-            producer = create_agent(
-                client,
+            producer = create_async_agent(
+                async_client,
                 state["project"],
                 "producer",
                 state.get("vector_db_id"),
@@ -504,12 +502,13 @@ async def production_node(state: VideoWorkflowState) -> dict[str, Any]:
 
             # Call producer agent to generate videos (guard → inference)
             tool_response_payloads: list[dict[str, Any]] = []
-            with agent_session(client, producer, f"run-{run_id}-producer") as session_id:
-                response, tool_response_payloads = await anyio.to_thread.run_sync(
-                    create_turn_collecting_tool_responses,
-                    producer,
-                    input_messages,
-                    session_id,
+            async with agent_session_async(
+                async_client, producer, f"run-{run_id}-producer"
+            ) as session_id:
+                response, tool_response_payloads = (
+                    await create_turn_collecting_tool_responses_async(
+                        producer, input_messages, session_id
+                    )
                 )
 
                 producer_output = extract_content(response)
@@ -588,7 +587,7 @@ async def production_node(state: VideoWorkflowState) -> dict[str, Any]:
             # Fallback: if no tool_execution was captured, try to recover task_ids from artifacts
             if not sora_tool_executed:
                 try:
-                    all_artifacts = await artifact_repo.get_by_run_async(run_id)
+                    all_artifacts = await artifact_repo.get_by_run_async(run_id, with_content=True)
                     manifest = next(
                         (
                             a
@@ -783,7 +782,6 @@ async def editing_node(state: VideoWorkflowState) -> dict[str, Any]:
         }
 
     run_id = UUID(state["run_id"])
-    client = get_sync_client()
     async_client = get_async_client()
 
     # Use async session with proper cleanup
@@ -800,8 +798,8 @@ async def editing_node(state: VideoWorkflowState) -> dict[str, Any]:
                 }
 
             # Create editor agent
-            editor = create_agent(
-                client,
+            editor = create_async_agent(
+                async_client,
                 state["project"],
                 "editor",
                 state.get("vector_db_id"),
@@ -887,10 +885,13 @@ async def editing_node(state: VideoWorkflowState) -> dict[str, Any]:
                 elif item:
                     overlay_texts.append(str(item))
 
+            # One paragraph / list item per overlay so long contexts are segmented
+            # per overlay and checked concurrently (safety.shields.segment_content).
+            overlay_lines = "\n".join(f"- {text}" for text in overlay_texts)
             editor_safety_context = (
                 f"Project: {state['project']}\n"
                 f"Creative direction:\n{creative_direction}\n\n"
-                f"Overlays:\n{json.dumps(overlay_texts, ensure_ascii=False)}\n"
+                f"Overlays:\n{overlay_lines}\n"
             )
             sanitized_prompt = _strip_noise_for_safety(editor_safety_context)
             safety_messages = [
@@ -955,12 +956,13 @@ async def editing_node(state: VideoWorkflowState) -> dict[str, Any]:
             # Real mode: call editor agent - tools are executed automatically by Llama Stack
             render_job_id = None
             tool_response_payloads: list[dict[str, Any]] = []
-            with agent_session(client, editor, f"run-{run_id}-editor") as session_id:
-                response, tool_response_payloads = await anyio.to_thread.run_sync(
-                    create_turn_collecting_tool_responses,
-                    editor,
-                    input_messages,
-                    session_id,
+            async with agent_session_async(
+                async_client, editor, f"run-{run_id}-editor"
+            ) as session_id:
+                response, tool_response_payloads = (
+                    await create_turn_collecting_tool_responses_async(
+                        editor, input_messages, session_id
+                    )
                 )
 
                 editor_output = extract_content(response)
@@ -1210,15 +1212,14 @@ async def publishing_node(state: VideoWorkflowState) -> dict[str, Any]:
         }
 
     run_id = UUID(state["run_id"])
-    client = get_sync_client()
     async_client = get_async_client()
 
     # Use async session with proper cleanup
     async with _get_repositories_async(state["run_id"]) as (run_repo, artifact_repo, session):
         try:
             # Create publisher agent
-            publisher = create_agent(
-                client,
+            publisher = create_async_agent(
+                async_client,
                 state["project"],
                 "publisher",
                 state.get("vector_db_id"),
@@ -1330,12 +1331,13 @@ async def publishing_node(state: VideoWorkflowState) -> dict[str, Any]:
             request_id = None
             tool_error: str | None = None
             tool_response_payloads: list[dict[str, Any]] = []
-            with agent_session(client, publisher, f"run-{run_id}-publisher") as session_id:
-                response, tool_response_payloads = await anyio.to_thread.run_sync(
-                    create_turn_collecting_tool_responses,
-                    publisher,
-                    input_messages,
-                    session_id,
+            async with agent_session_async(
+                async_client, publisher, f"run-{run_id}-publisher"
+            ) as session_id:
+                response, tool_response_payloads = (
+                    await create_turn_collecting_tool_responses_async(
+                        publisher, input_messages, session_id
+                    )
                 )
 
                 publisher_output = extract_content(response)
@@ -1508,6 +1510,7 @@ async def publishing_node(state: VideoWorkflowState) -> dict[str, Any]:
                             "publish_id": tool_result_data.get("publish_id") or request_id,
                             "account_id": tool_result_data.get("account_id"),
                         },
+                        keys=[(ArtifactKeyKind.PUBLISH_VIDEO_URL, video_url)],
                     )
 
                 await run_repo.update_async(
@@ -1563,6 +1566,7 @@ async def publishing_node(state: VideoWorkflowState) -> dict[str, Any]:
                                 "account_id": tool_result_data.get("account_id"),
                                 "status_url": resolved_status_url,
                             },
+                            keys=[(ArtifactKeyKind.PUBLISH_VIDEO_URL, video_url)],
                         )
 
                     await run_repo.update_async(
@@ -48,7 +48,7 @@ async def resume_after_videos(
         SessionLocal = get_async_session_factory()
         async with SessionLocal() as session:
             artifact_repo = ArtifactRepository(session)
-            artifacts = await artifact_repo.get_by_run_async(run_id)
+            artifacts = await artifact_repo.get_by_run_async(run_id, with_content=True)
 
         video_clips = select_latest_video_clip_urls(artifacts)
         if not video_clips:
@@ -8,6 +8,9 @@ Fail-closed remains intact:
 - No cache => we call the shield.
 - Cached system_error => we re-call the shield (never reused).
 - Cached violation => reused (still blocked) to avoid re-submitting unsafe content.
+
+Identical content seen by other runs is additionally served by the cross-run
+verdict cache in myloware.safety.verdict_cache (same rules).
 """
 
 from __future__ import annotations
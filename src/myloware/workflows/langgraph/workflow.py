@@ -19,7 +19,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from myloware.observability.logging import get_logger
 from myloware.storage.database import get_async_session_factory
-from myloware.storage.models import ArtifactType, RunStatus
+from myloware.storage.models import ArtifactKeyKind, ArtifactType, RunStatus
 from myloware.storage.repositories import ArtifactRepository, RunRepository
 from myloware.tools.remotion import RemotionRenderTool
 from myloware.storage.object_store import resolve_s3_uri_async
@@ -87,7 +87,7 @@ async def repair_sora_clips(
                 f"(run.status={run.status})"
             )
 
-        artifacts = await artifact_repo.get_by_run_async(run_id)
+        artifacts = await artifact_repo.get_by_run_async(run_id, with_content=True)
 
         # Latest clip manifest is the active task set.
         manifests: list[Any] = []
@@ -284,6 +284,7 @@ async def repair_sora_clips(
                 "repair": True,
                 "resubmitted_video_indexes": missing,
             },
+            keys=[(ArtifactKeyKind.SORA_TASK, task_id) for task_id in mapping],
         )
 
         await run_repo.add_artifact_async(run_id, "pending_task_ids", list(mapping.keys()))
@@ -419,7 +420,7 @@ async def repair_render(run_id: UUID, *, force: bool = False) -> WorkflowResult:
                 f"(run.status={run.status})"
             )
 
-        artifacts = await artifact_repo.get_by_run_async(run_id)
+        artifacts = await artifact_repo.get_by_run_async(run_id, with_content=True)
         editor_outputs = [
             a
             for a in artifacts
@@ -539,7 +540,7 @@ async def resume_run(
         run = await run_repo.get_async(run_id)
         if not run:
             raise ValueError(f"Run {run_id} not found")
-        artifacts = await artifact_repo.get_by_run_async(run_id)
+        artifacts = await artifact_repo.get_by_run_async(run_id, with_content=True)
 
     action = (action or "auto").strip().lower()
     message: str | None = None
@@ -748,7 +749,7 @@ async def fork_from_clips(
                     f"Run {run_id} status '{run.status}' is not replayable without force"
                 )
         artifact_repo = ArtifactRepository(session)
-        artifacts = await artifact_repo.get_by_run_async(run_id)
+        artifacts = await artifact_repo.get_by_run_async(run_id, with_content=True)
         video_urls = select_latest_video_clip_urls(artifacts)
 
     if not video_urls:
@@ -1152,7 +1153,7 @@ async def continue_after_producer(run_id: UUID) -> WorkflowResult:
 
     async with _session_ctx(SessionLocal) as session:
         artifact_repo = ArtifactRepository(session)
-        artifacts = await artifact_repo.get_by_run_async(run_id)
+        artifacts = await artifact_repo.get_by_run_async(run_id, with_content=True)
         video_clips = select_latest_video_clip_urls(artifacts)
 
         if not video_clips:
@@ -30,6 +30,8 @@ def pytest_configure(config):
     os.environ["DISABLE_BACKGROUND_WORKFLOWS"] = "true"
     os.environ["FAIL_FAST_ON_STARTUP"] = "false"
     os.environ["WEBHOOK_BASE_URL"] = "http://localhost:8000"
+    # Cross-run verdict reuse would couple otherwise independent safety tests.
+    os.environ["SAFETY_VERDICT_CACHE_ENABLED"] = "false"
     # Enable websearch tool config without making any external calls in tests (LLAMA_STACK_PROVIDER=fake).
     os.environ["BRAVE_API_KEY"] = os.environ.get("BRAVE_API_KEY") or "test-brave-key"
     # Force SQLite for tests to avoid PostgreSQL schema issues.
@@ -42,6 +44,7 @@ def pytest_configure(config):
     test_artifacts_root.mkdir(parents=True, exist_ok=True)
     run_dir = Path(tempfile.mkdtemp(prefix="run_", dir=str(test_artifacts_root)))
     os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{run_dir / 'test_default.db'}"
+    os.environ["KB_MANIFEST_PATH"] = str(run_dir / "kb_manifest.json")
 
 
 @pytest.fixture(autouse=True)
@@ -138,6 +141,36 @@ def reset_rate_limiter():
         pass
 
 
+@pytest.fixture(autouse=True)
+def reset_resilience_registry():
+    """Fresh per-upstream breakers/bulkheads so failures in one test can't open circuits in the next."""
+    from myloware.resilience.registry import reset_resilience_registry as _reset
+
+    _reset()
+    yield
+    _reset()
+
+
+@pytest.fixture(autouse=True)
+def clear_kb_search_cache():
+    """Cached vector store search results must not leak between tests."""
+    from myloware.knowledge.setup import clear_search_cache
+
+    clear_search_cache()
+    yield
+    clear_search_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_public_demo_cache():
+    """Cached public demo status views must not leak between tests."""
+    from myloware.api.routes.public_demo import clear_public_demo_caches
+
+    clear_public_demo_caches()
+    yield
+    clear_public_demo_caches()
+
+
 @pytest.fixture
 def api_headers() -> dict[str, str]:
     """Default API headers for authenticated endpoints."""
@@ -157,3 +190,46 @@ async def async_client():
         transport = ASGITransport(app=app)
         async with AsyncClient(transport=transport, base_url="http://test") as client:
             yield client
+
+
+@pytest.fixture
+async def sqlite_engine(tmp_path):
+    """Async engine on a fresh file-backed SQLite database with the full schema."""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    from myloware.storage.models import Base
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def sqlite_session_factory(sqlite_engine):
+    """Session factory over sqlite_engine, configured like the app's (expire_on_commit=False)."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    return async_sessionmaker(sqlite_engine, expire_on_commit=False)
+
+
+@pytest.fixture
+def query_budget():
+    """Fail when a block issues more SQL statements than its budget.
+
+    with query_budget(4):
+        await async_client.get(...)
+    """
+    from contextlib import contextmanager
+
+    from myloware.storage.database import track_queries
+
+    @contextmanager
+    def _budget(max_statements: int):
+        with track_queries() as stats:
+            yield stats
+        if stats.statements > max_statements:
+            pytest.fail(f"{stats.statements} SQL statements issued, budget is {max_statements}")
+
+    return _budget
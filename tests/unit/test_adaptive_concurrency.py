@@ -0,0 +1,139 @@
+"""Unit tests for AIMD adaptive concurrency and the distributed token bucket."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from myloware.resilience.adaptive import AdaptiveLimiter, get_adaptive_limiter, rate_limit_signal
+from myloware.resilience.registry import get_guard, resilience_snapshot
+from myloware.storage.repositories import RateLimitBucketRepository
+
+
+def _status_error(status: int, headers: dict[str, str] | None = None) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://api.example.test/v1/videos")
+    response = httpx.Response(status, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError("boom", request=request, response=response)
+
+
+def test_rate_limit_signal_parses_retry_after() -> None:
+    assert rate_limit_signal(_status_error(429, {"Retry-After": "7"})) == (True, 7.0)
+    assert rate_limit_signal(_status_error(429)) == (True, None)
+    assert rate_limit_signal(_status_error(500, {"Retry-After": "7"})) == (False, None)
+    assert rate_limit_signal(ValueError("nope")) == (False, None)
+
+
+def test_limiter_widens_on_success_and_halves_on_429() -> None:
+    limiter = AdaptiveLimiter("prov", initial=4, max_limit=8, cooldown=0.0)
+
+    # +1/limit per success: six successes take 4.0 past 5.0.
+    for _ in range(6):
+        limiter.on_success()
+    assert limiter.max_concurrent == 5
+
+    limiter.on_rate_limited(retry_after=0.0)
+    assert limiter.max_concurrent == 2
+
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.limit == 8.0
+
+
+def test_burst_of_429s_within_cooldown_counts_once() -> None:
+    limiter = AdaptiveLimiter("prov", initial=8, cooldown=60.0)
+
+    for _ in range(5):
+        limiter.on_rate_limited(retry_after=0.0)
+
+    assert limiter.max_concurrent == 4
+
+
+@pytest.mark.anyio
+async def test_retry_after_pauses_all_callers() -> None:
+    limiter = AdaptiveLimiter("prov", initial=4)
+    limiter.on_rate_limited(retry_after=0.2)
+
+    start = time.monotonic()
+    async with limiter.slot_async():
+        pass
+
+    assert time.monotonic() - start >= 0.15
+
+
+@pytest.mark.anyio
+async def test_raising_the_limit_admits_queued_waiters() -> None:
+    limiter = AdaptiveLimiter("prov", initial=1, max_wait=5.0)
+    await limiter.acquire_async()
+    waiter = asyncio.create_task(limiter.acquire_async())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    limiter.set_limit(2)
+    await asyncio.wait_for(waiter, 1.0)
+
+    assert limiter.in_flight == 2
+
+
+@pytest.mark.anyio
+async def test_guard_feeds_429_to_limiter_without_opening_breaker(monkeypatch) -> None:
+    from myloware.config import settings
+
+    monkeypatch.setattr(settings, "adaptive_concurrency_initial", {"provider_x": 8})
+    monkeypatch.setattr(settings, "circuit_breaker_failure_threshold", 1)
+    guard = get_guard("provider_x", "create")
+    limiter = get_adaptive_limiter("provider_x")
+
+    assert guard.limiter is limiter
+    assert get_guard("provider_x", "status").limiter is limiter
+
+    with pytest.raises(httpx.HTTPStatusError):
+        async with guard.protect_async():
+            raise _status_error(429, {"Retry-After": "0"})
+
+    assert limiter.max_concurrent == 4
+    assert guard.breaker.state.value == "closed"
+    assert resilience_snapshot()["provider_x:create"]["adaptive"]["limit"] == 4.0
+
+
+def test_only_rate_limited_providers_get_a_limiter_by_default() -> None:
+    # The Llama Stack bulkhead alone bounds agent concurrency; AIMD would cap it lower.
+    assert get_guard("llama_stack").limiter is None
+    assert get_guard("openai_videos", "create").limiter is get_adaptive_limiter("openai_videos")
+
+
+@pytest.mark.anyio
+async def test_429_does_not_reset_the_breaker_failure_streak(monkeypatch) -> None:
+    from myloware.config import settings
+
+    monkeypatch.setattr(settings, "adaptive_concurrency_initial", {"provider_x": 8})
+    monkeypatch.setattr(settings, "circuit_breaker_failure_threshold", 2)
+    guard = get_guard("provider_x", "create")
+
+    for status in (503, 429, 503):
+        with pytest.raises(httpx.HTTPStatusError):
+            async with guard.protect_async():
+                raise _status_error(status, {"Retry-After": "0"})
+
+    assert guard.breaker.state.value == "open"
+
+
+@pytest.mark.anyio
+async def test_token_bucket_refills_at_rate(sqlite_session_factory) -> None:
+    now = datetime(2026, 1, 1, 12, 0, 0)
+
+    async def take(at: datetime) -> float:
+        async with sqlite_session_factory() as session:
+            wait = await RateLimitBucketRepository(session).take_token_async(
+                "provider:test", rate=2.0, burst=2.0, now=at
+            )
+            await session.commit()
+            return wait
+
+    assert await take(now) == 0.0
+    assert await take(now) == 0.0
+    assert await take(now) == pytest.approx(0.5)
+    assert await take(now + timedelta(seconds=0.5)) == 0.0
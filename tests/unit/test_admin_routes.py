@@ -209,21 +209,74 @@ async def test_admin_reload_kb(monkeypatch, async_client, api_headers) -> None:
 
     monkeypatch.setattr(settings, "project_id", "proj")
 
+    from types import SimpleNamespace
+
+    from myloware.knowledge.loader import KnowledgeDocument
+
+    doc = KnowledgeDocument(id="d1", content="x", filename="d1.md", metadata={})
+    synced: list[tuple] = []
+    saved: list[dict] = []
+
+    def fake_sync(_client, project_id, documents, manifest, previous):  # type: ignore[no-untyped-def]
+        synced.append((project_id, documents, previous))
+        return SimpleNamespace(
+            vector_store_id="project_kb_proj",
+            manifest={**manifest, "last_sync": {"mode": "incremental", "uploaded": 1}},
+        )
+
     monkeypatch.setattr("myloware.api.routes.admin.get_sync_client", lambda: object())
     monkeypatch.setattr(
         "myloware.api.routes.admin.load_documents_with_manifest",
-        lambda *_a, **_k: ([{"id": "d1"}], {"hash": "h"}),
-    )
-    monkeypatch.setattr(
-        "myloware.api.routes.admin.setup_project_knowledge",
-        lambda *_a, **_k: "project_kb_proj",
+        lambda *_a, **_k: ([doc], {"hash": "h"}),
     )
+    monkeypatch.setattr("myloware.api.routes.admin.load_manifest", lambda: {"hash": "old"})
+    monkeypatch.setattr("myloware.api.routes.admin.save_manifest", saved.append)
+    monkeypatch.setattr("myloware.api.routes.admin.sync_project_knowledge", fake_sync)
 
     resp = await async_client.post("/admin/kb/reload", headers=api_headers)
     assert resp.status_code == 200
     payload = resp.json()
     assert payload["status"] == "reloaded"
     assert payload["vector_db_id"] == "project_kb_proj"
+    assert payload["sync"] == {"mode": "incremental", "uploaded": 1}
+    assert synced[0][1][0]["metadata"]["type"] == "knowledge"
+    assert synced[0][2] == {"hash": "old"}
+    assert saved[0]["hash"] == "h"
+
+
+@pytest.mark.anyio
+async def test_admin_full_reload_publishes_new_store(
+    monkeypatch, async_client, api_headers
+) -> None:
+    from types import SimpleNamespace
+
+    from myloware.api.server import app
+
+    def fake_sync(_client, _project_id, _documents, manifest, _previous):  # type: ignore[no-untyped-def]
+        # A full rebuild deletes the old store and creates a new one.
+        return SimpleNamespace(
+            vector_store_id="vs-rebuilt", manifest={**manifest, "last_sync": {"mode": "full"}}
+        )
+
+    monkeypatch.setattr("myloware.api.routes.admin.get_sync_client", lambda: object())
+    monkeypatch.setattr(
+        "myloware.api.routes.admin.load_documents_with_manifest", lambda *_a, **_k: ([], {})
+    )
+    monkeypatch.setattr("myloware.api.routes.admin.load_manifest", lambda: None)
+    monkeypatch.setattr("myloware.api.routes.admin.save_manifest", lambda _m: None)
+    monkeypatch.setattr("myloware.api.routes.admin.sync_project_knowledge", fake_sync)
+    app.state.vector_db_id = "vs-deleted"
+    app.state.knowledge_base_healthy = False
+    app.state.knowledge_base_error = "Knowledge base setup failed: boom"
+    app.state.knowledge_base_status = "failed"
+
+    resp = await async_client.post("/admin/kb/reload", headers=api_headers)
+
+    assert resp.status_code == 200
+    assert app.state.vector_db_id == "vs-rebuilt"
+    assert app.state.knowledge_base_healthy is True
+    assert app.state.knowledge_base_error is None
+    assert app.state.knowledge_base_status == "ready"
 
 
 @pytest.mark.anyio
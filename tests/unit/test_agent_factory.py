@@ -223,6 +223,40 @@ def test_create_agent_builds_tools_and_custom_tools(monkeypatch):
         assert call_kwargs["tools"] == ["tool1", "tool2"]
 
 
+def test_create_async_agent_builds_async_agent(monkeypatch):
+    from myloware.agents import factory
+
+    monkeypatch.setattr(
+        factory, "load_agent_config", lambda _p, _r: {"instructions": "test", "model": "m1"}
+    )
+    monkeypatch.setattr(factory, "effective_llama_stack_provider", lambda _s: "real")
+    monkeypatch.setattr(factory.settings, "environment", "development")
+    monkeypatch.delenv("LLAMA_STACK_MODEL", raising=False)
+    monkeypatch.setattr(factory, "_build_tools_from_config", lambda *_a, **_k: ["tool1"])
+
+    client = Mock()
+    with patch("myloware.agents.factory.AsyncAgent") as mock_agent_class:
+        factory.create_async_agent(client, "aismr", "ideator", custom_tools=["tool2"])
+        assert mock_agent_class.call_args.args == (client,)
+        call_kwargs = mock_agent_class.call_args.kwargs
+        assert call_kwargs == {"model": "m1", "instructions": "test", "tools": ["tool1", "tool2"]}
+
+
+@pytest.mark.anyio
+async def test_create_async_agent_fake_mode_streams_single_chunk(monkeypatch):
+    from myloware.agents import factory
+
+    monkeypatch.setattr(factory, "load_agent_config", lambda _p, _r: {"instructions": "test"})
+    monkeypatch.setattr(factory, "effective_llama_stack_provider", lambda _s: "fake")
+    monkeypatch.setattr(factory.settings, "environment", "development")
+
+    agent = factory.create_async_agent(Mock(), "aismr", "ideator")
+    assert await agent.create_session("s") == "s"
+    chunks = [chunk async for chunk in await agent.create_turn([], "s")]
+    assert len(chunks) == 1
+    assert chunks[0].response.output_text
+
+
 def test_create_tool_instance_rag_and_builtin(monkeypatch):
     from myloware.agents import factory
 
@@ -253,13 +287,78 @@ def test_build_tools_from_config_accepts_dict_tool():
 def test_create_tool_instance_custom_tools(monkeypatch):
     from myloware.agents import factory
 
-    sentinel = object()
-    monkeypatch.setattr(factory, "SoraGenerationTool", lambda run_id=None: sentinel)
-    monkeypatch.setattr(factory, "RemotionRenderTool", lambda run_id=None: sentinel)
-    monkeypatch.setattr(factory, "UploadPostTool", lambda run_id=None: sentinel)
-    monkeypatch.setattr(factory, "AnalyzeMediaTool", lambda run_id=None: sentinel)
+    class _StubTool:
+        run_id = None
+
+        def bind_run(self, run_id):  # type: ignore[no-untyped-def]
+            bound = type(self)()
+            bound.run_id = run_id
+            return bound
+
+    classes = {}
+    for attr in ("SoraGenerationTool", "RemotionRenderTool", "UploadPostTool", "AnalyzeMediaTool"):
+        classes[attr] = type(attr, (_StubTool,), {})
+        monkeypatch.setattr(factory, attr, classes[attr])
+    factory.clear_agent_cache()
+
+    for name, attr in (
+        ("sora_generate", "SoraGenerationTool"),
+        ("remotion_render", "RemotionRenderTool"),
+        ("upload_post", "UploadPostTool"),
+        ("analyze_media", "AnalyzeMediaTool"),
+    ):
+        tool = factory._create_tool_instance(name, Mock(), None, run_id="r")
+        assert isinstance(tool, classes[attr])
+        assert tool.run_id == "r"
+
+
+def test_custom_tools_share_prototype_across_runs(monkeypatch):
+    from myloware.agents import factory
+    from myloware.tools.sora import SoraGenerationTool
+
+    constructed: list[object] = []
+
+    class CountingSora(SoraGenerationTool):
+        def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+            constructed.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(factory, "SoraGenerationTool", CountingSora)
+    monkeypatch.setattr(factory.settings, "webhook_base_url", "http://hooks")
+    factory.clear_agent_cache()
+
+    first = factory._create_tool_instance("sora_generate", Mock(), None, run_id="run-a")
+    second = factory._create_tool_instance("sora_generate", Mock(), None, run_id="run-b")
+
+    assert len(constructed) == 1
+    assert first.callback_url == "http://hooks/v1/webhooks/sora?run_id=run-a"
+    assert second.callback_url == "http://hooks/v1/webhooks/sora?run_id=run-b"
+    assert first.get_tool_definition() is second.get_tool_definition()
+
+    # Settings the tools depend on are part of the prototype key.
+    monkeypatch.setattr(factory.settings, "webhook_base_url", "http://other")
+    third = factory._create_tool_instance("sora_generate", Mock(), None, run_id="run-c")
+    assert len(constructed) == 2
+    assert third.callback_url == "http://other/v1/webhooks/sora?run_id=run-c"
+
+
+def test_create_agent_reuses_cached_config(monkeypatch):
+    from myloware.agents import factory
+    from myloware.config import loaders
+
+    monkeypatch.setattr(factory, "effective_llama_stack_provider", lambda _s: "real")
+    monkeypatch.setattr(factory.settings, "environment", "development")
+    factory.clear_agent_cache()
+
+    yaml_reads: list[object] = []
+    real_load_yaml = loaders.load_yaml
+    monkeypatch.setattr(loaders, "load_yaml", lambda p: yaml_reads.append(p) or real_load_yaml(p))
+
+    with patch("myloware.agents.factory.Agent") as mock_agent_class:
+        for run_id in ("r1", "r2", "r3"):
+            factory.create_agent(Mock(), "aismr", "editor", vector_db_id="kb", run_id=run_id)
 
-    assert factory._create_tool_instance("sora_generate", Mock(), None, run_id="r") is sentinel
-    assert factory._create_tool_instance("remotion_render", Mock(), None, run_id="r") is sentinel
-    assert factory._create_tool_instance("upload_post", Mock(), None, run_id="r") is sentinel
-    assert factory._create_tool_instance("analyze_media", Mock(), None, run_id="r") is sentinel
+    assert len(yaml_reads) == 2  # base + project override, each read once
+    tool_sets = [call.kwargs["tools"] for call in mock_agent_class.call_args_list]
+    run_ids = [getattr(t, "run_id", None) for tools in tool_sets for t in tools]
+    assert {"r1", "r2", "r3"} <= set(run_ids)
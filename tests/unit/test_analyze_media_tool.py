@@ -17,16 +17,23 @@ def _fake_openai_client(create_impl):
     return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create_impl)))
 
 
-def _patch_session_factory(monkeypatch, *, session, artifacts=None, created=None):
+def _patch_session_factory(monkeypatch, *, session, artifacts=None, created=None, shared=None):
     artifacts = artifacts or []
+    shared = shared or []
     created = created if created is not None else []
 
     class FakeRepo:
         def __init__(self, _session):
             pass
 
-        async def get_by_run_async(self, _run_id):
-            return artifacts
+        async def get_by_key_async(self, _run_id, _kind, key):
+            for artifact in artifacts:
+                if (artifact.artifact_metadata or {}).get("cache_key") == key:
+                    return artifact
+            return None
+
+        async def find_by_key_async(self, _kind, _key):
+            return shared[0] if shared else None
 
         async def create_async(self, **kwargs):
             created.append(kwargs)
@@ -216,6 +223,28 @@ async def test_async_run_impl_calls_openai_and_stores_cache(monkeypatch) -> None
     tool._store_cache.assert_awaited_once()
 
 
+@pytest.mark.anyio
+async def test_async_run_impl_returns_result_when_cache_write_fails(monkeypatch) -> None:
+    from myloware.tools.analyze_media import AnalyzeMediaTool
+
+    monkeypatch.setattr("myloware.tools.analyze_media.AsyncOpenAI", lambda api_key: object())
+    tool = AnalyzeMediaTool(run_id=str(uuid4()), api_key="test")
+
+    monkeypatch.setattr(tool, "_check_cache", AsyncMock(return_value=None))
+    monkeypatch.setattr(tool, "_store_cache", AsyncMock(side_effect=RuntimeError("db locked")))
+
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="analysis text"))],
+        usage=SimpleNamespace(total_tokens=10),
+    )
+    tool.openai_client = _fake_openai_client(create_impl=AsyncMock(return_value=response))
+
+    result = await tool.async_run_impl("https://example.com/x.png", analysis_type="colors")
+
+    assert result["success"] is True
+    assert result["analysis"] == "analysis text"
+
+
 @pytest.mark.anyio
 async def test_async_run_impl_returns_structured_error(monkeypatch) -> None:
     from myloware.tools.analyze_media import AnalyzeMediaTool
@@ -232,3 +261,95 @@ async def test_async_run_impl_returns_structured_error(monkeypatch) -> None:
     assert result["success"] is False
     assert result["error"]["code"] == "analysis_failed"
     assert "boom" in result["error"]["message"]
+
+
+@pytest.mark.anyio
+async def test_check_cache_shares_results_across_runs_by_media_hash(monkeypatch) -> None:
+    monkeypatch.setattr("myloware.tools.analyze_media.AsyncOpenAI", lambda api_key: object())
+    from myloware.tools.analyze_media import AnalyzeMediaTool
+
+    tool = AnalyzeMediaTool(run_id=str(uuid4()), api_key="test")
+    url = "https://bucket.s3.amazonaws.com/frame.png?X-Amz-Signature=a&X-Amz-Expires=60"
+    resigned = "https://bucket.s3.amazonaws.com/frame.png?X-Amz-Signature=b&X-Amz-Expires=60"
+    media_key = tool._compute_media_key(url, "colors")
+    assert media_key == tool._compute_media_key(resigned, "colors")
+    assert media_key != tool._compute_media_key(url, "full")
+
+    other_run = SimpleNamespace(
+        artifact_type=ArtifactType.VISION_ANALYSIS.value,
+        artifact_metadata={"cache_key": "other-run-key"},
+        content=json.dumps({"analysis": "shared"}),
+    )
+    _patch_session_factory(monkeypatch, session=SimpleNamespace(), shared=[other_run])
+
+    monkeypatch.setattr("myloware.tools.analyze_media.settings.vision_cache_cross_run", False)
+    assert await tool._check_cache("k", media_key=media_key) is None
+
+    monkeypatch.setattr("myloware.tools.analyze_media.settings.vision_cache_cross_run", True)
+    assert await tool._check_cache("k", media_key=media_key) == {"analysis": "shared"}
+
+
+@pytest.mark.anyio
+async def test_colors_for_clip_are_answered_from_stored_palette(monkeypatch) -> None:
+    monkeypatch.setattr("myloware.tools.analyze_media.AsyncOpenAI", lambda api_key: object())
+    from myloware.tools.analyze_media import AnalyzeMediaTool
+
+    tool = AnalyzeMediaTool(run_id=str(uuid4()), api_key="test")
+    clip = SimpleNamespace(
+        artifact_type=ArtifactType.VIDEO_CLIP.value,
+        artifact_metadata={
+            "previews": {
+                "contact_sheet": "/v1/media/transcoded/sora_x_0_sheet.jpg",
+                "palette": [
+                    {"hex": "#e05020", "ratio": 0.6},
+                    {"hex": "#2040a0", "ratio": 0.4},
+                ],
+            }
+        },
+    )
+    _patch_session_factory(monkeypatch, session=SimpleNamespace(), shared=[clip])
+    tool.openai_client = _fake_openai_client(
+        create_impl=AsyncMock(side_effect=AssertionError("should not call"))
+    )
+
+    result = await tool.async_run_impl("https://api.test/clip.mp4", analysis_type="colors")
+
+    assert result["success"] is True
+    assert result["model"] == "local_palette"
+    assert result["palette"][0]["hex"] == "#e05020"
+    assert "#e05020 (60%)" in result["analysis"]
+    assert "warm" in result["analysis"]
+
+
+@pytest.mark.anyio
+async def test_clip_analysis_sends_contact_sheet_instead_of_video(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr("myloware.tools.analyze_media.AsyncOpenAI", lambda api_key: object())
+    monkeypatch.setattr(
+        "myloware.tools.analyze_media.settings.transcode_output_dir", str(tmp_path), raising=False
+    )
+    from myloware.tools.analyze_media import AnalyzeMediaTool
+
+    (tmp_path / "sora_x_0_sheet.jpg").write_bytes(b"sheet")
+    tool = AnalyzeMediaTool(run_id=str(uuid4()), api_key="test")
+    clip = SimpleNamespace(
+        artifact_type=ArtifactType.VIDEO_CLIP.value,
+        artifact_metadata={
+            "previews": {"contact_sheet": "https://api.test/v1/media/transcoded/sora_x_0_sheet.jpg"}
+        },
+    )
+    _patch_session_factory(monkeypatch, session=SimpleNamespace(), shared=[clip])
+    monkeypatch.setattr(tool, "_check_cache", AsyncMock(return_value=None))
+    monkeypatch.setattr(tool, "_store_cache", AsyncMock())
+    response = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="a beach at dusk"))],
+        usage=SimpleNamespace(total_tokens=10),
+    )
+    create = AsyncMock(return_value=response)
+    tool.openai_client = _fake_openai_client(create_impl=create)
+
+    result = await tool.async_run_impl("https://api.test/clip.mp4", analysis_type="colors")
+
+    assert result["success"] is True
+    content = create.await_args.kwargs["messages"][0]["content"]
+    assert content[1]["image_url"]["url"] == "data:image/jpeg;base64,c2hlZXQ="
+    assert "contact sheet" in content[0]["text"]
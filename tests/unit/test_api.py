@@ -95,7 +95,6 @@ def test_health_is_public():
 
 
 def test_start_run(api_client):
-    settings.skip_run_visibility_check = True
     payload = {"brief": "make video", "workflow": "aismr"}
     resp = api_client.post("/v1/runs/start", json=payload, headers={"X-API-Key": settings.api_key})
 
@@ -126,7 +125,6 @@ def test_start_run_budget_exceeded(monkeypatch, fake_run):
 
     monkeypatch.setattr(settings, "max_runs_last_24h", 1)
     monkeypatch.setattr(settings, "enable_safety_shields", False)
-    monkeypatch.setattr(settings, "skip_run_visibility_check", True)
 
     with TestClient(app) as client:
         resp = client.post(
@@ -151,7 +149,6 @@ def test_start_run_daily_cost_budget_exceeded(monkeypatch, fake_run):
     monkeypatch.setattr(settings, "daily_cost_budget_usd", 0.1)
     monkeypatch.setattr(settings, "estimated_cost_per_run_usd", 1.0)
     monkeypatch.setattr(settings, "enable_safety_shields", False)
-    monkeypatch.setattr(settings, "skip_run_visibility_check", True)
 
     with TestClient(app) as client:
         resp = client.post(
@@ -174,7 +171,6 @@ def test_start_run_safety_rejects(monkeypatch, fake_run):
     app.dependency_overrides[get_vector_db_id] = lambda: "kb"
 
     monkeypatch.setattr(settings, "enable_safety_shields", True)
-    monkeypatch.setattr(settings, "skip_run_visibility_check", True)
 
     async def fake_check(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(safe=False, reason="nope", category="policy")
@@ -192,41 +188,28 @@ def test_start_run_safety_rejects(monkeypatch, fake_run):
     app.dependency_overrides = {}
 
 
-def test_start_run_visibility_check_failure(monkeypatch, fake_run):
+def test_start_run_commits_once_without_extra_sessions(monkeypatch, fake_run):
     from myloware.api.server import app
-    from myloware.api.routes import runs as runs_mod
 
     fake_run_repo = FakeRunRepo(fake_run)
+    commits: list[int] = []
+
+    class _Session:
+        async def commit(self):  # type: ignore[no-untyped-def]
+            commits.append(1)
+
+    fake_run_repo.session = _Session()
     app.dependency_overrides[get_async_run_repo] = lambda: fake_run_repo
     app.dependency_overrides[get_async_llama_client] = lambda: object()
     app.dependency_overrides[get_vector_db_id] = lambda: "kb"
 
     monkeypatch.setattr(settings, "enable_safety_shields", False)
-    monkeypatch.setattr(settings, "skip_run_visibility_check", False)
-
-    async def no_sleep(*_a, **_k):  # type: ignore[no-untyped-def]
-        return None
-
-    monkeypatch.setattr(runs_mod.asyncio, "sleep", no_sleep)
-
-    class FakeVerifyRepo:
-        def __init__(self, _session):  # type: ignore[no-untyped-def]
-            return None
-
-        async def get_async(self, _run_id):  # type: ignore[no-untyped-def]
-            return None
+    monkeypatch.setattr(settings, "disable_background_workflows", True)
 
-    class FakeSession:
-        async def __aenter__(self):  # type: ignore[no-untyped-def]
-            return object()
+    def no_new_sessions():  # type: ignore[no-untyped-def]
+        raise AssertionError("start_run must not open extra sessions")
 
-        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
-            return None
-
-    monkeypatch.setattr(
-        "myloware.storage.database.get_async_session_factory", lambda: (lambda: FakeSession())
-    )
-    monkeypatch.setattr("myloware.storage.repositories.RunRepository", FakeVerifyRepo)
+    monkeypatch.setattr("myloware.storage.database.get_async_session_factory", no_new_sessions)
 
     with TestClient(app) as client:
         resp = client.post(
@@ -234,8 +217,9 @@ def test_start_run_visibility_check_failure(monkeypatch, fake_run):
             json={"brief": "make video", "workflow": "aismr"},
             headers={"X-API-Key": settings.api_key},
         )
-        assert resp.status_code == 500
+        assert resp.status_code == 200
 
+    assert commits == [1]
     app.dependency_overrides = {}
 
 
@@ -250,7 +234,6 @@ def test_start_run_enqueues_job(monkeypatch, fake_run):
 
     monkeypatch.setattr(settings, "disable_background_workflows", False)
     monkeypatch.setattr(settings, "workflow_dispatcher", "db")
-    monkeypatch.setattr(settings, "skip_run_visibility_check", True)
     monkeypatch.setattr(settings, "enable_safety_shields", False)
 
     class FakeJobRepo:
@@ -281,7 +264,6 @@ def test_start_run_enqueue_value_error_ignored(monkeypatch, fake_run):
 
     monkeypatch.setattr(settings, "disable_background_workflows", False)
     monkeypatch.setattr(settings, "workflow_dispatcher", "db")
-    monkeypatch.setattr(settings, "skip_run_visibility_check", True)
     monkeypatch.setattr(settings, "enable_safety_shields", False)
 
     class FakeJobRepo:
@@ -312,7 +294,6 @@ def test_start_run_in_process_adds_task(monkeypatch, fake_run):
 
     monkeypatch.setattr(settings, "disable_background_workflows", False)
     monkeypatch.setattr(settings, "workflow_dispatcher", "in_process")
-    monkeypatch.setattr(settings, "skip_run_visibility_check", True)
     monkeypatch.setattr(settings, "enable_safety_shields", False)
 
     monkeypatch.setattr(runs_mod, "run_workflow_async", lambda **_k: None)
@@ -328,47 +309,6 @@ def test_start_run_in_process_adds_task(monkeypatch, fake_run):
     app.dependency_overrides = {}
 
 
-def test_start_run_visibility_check_passes(monkeypatch, fake_run):
-    from myloware.api.server import app
-
-    fake_run_repo = FakeRunRepo(fake_run)
-    app.dependency_overrides[get_async_run_repo] = lambda: fake_run_repo
-    app.dependency_overrides[get_async_llama_client] = lambda: object()
-    app.dependency_overrides[get_vector_db_id] = lambda: "kb"
-
-    monkeypatch.setattr(settings, "enable_safety_shields", False)
-    monkeypatch.setattr(settings, "skip_run_visibility_check", False)
-
-    class FakeVerifyRepo:
-        def __init__(self, _session):  # type: ignore[no-untyped-def]
-            return None
-
-        async def get_async(self, _run_id):  # type: ignore[no-untyped-def]
-            return object()
-
-    class FakeSession:
-        async def __aenter__(self):  # type: ignore[no-untyped-def]
-            return object()
-
-        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
-            return None
-
-    monkeypatch.setattr(
-        "myloware.storage.database.get_async_session_factory", lambda: (lambda: FakeSession())
-    )
-    monkeypatch.setattr("myloware.storage.repositories.RunRepository", FakeVerifyRepo)
-
-    with TestClient(app) as client:
-        resp = client.post(
-            "/v1/runs/start",
-            json={"brief": "make video", "workflow": "aismr"},
-            headers={"X-API-Key": settings.api_key},
-        )
-        assert resp.status_code == 200
-
-    app.dependency_overrides = {}
-
-
 def test_start_run_create_async_file_not_found(monkeypatch, fake_run):
     from myloware.api.server import app
 
@@ -381,7 +321,6 @@ def test_start_run_create_async_file_not_found(monkeypatch, fake_run):
     app.dependency_overrides[get_vector_db_id] = lambda: "kb"
 
     monkeypatch.setattr(settings, "enable_safety_shields", False)
-    monkeypatch.setattr(settings, "skip_run_visibility_check", True)
 
     with TestClient(app) as client:
         resp = client.post(
@@ -406,7 +345,6 @@ def test_start_run_create_async_value_error(monkeypatch, fake_run):
     app.dependency_overrides[get_vector_db_id] = lambda: "kb"
 
     monkeypatch.setattr(settings, "enable_safety_shields", False)
-    monkeypatch.setattr(settings, "skip_run_visibility_check", True)
 
     with TestClient(app) as client:
         resp = client.post(
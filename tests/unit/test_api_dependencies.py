@@ -24,6 +24,21 @@ def test_dependency_builds_feedback_repo() -> None:
     assert repo.session is session
 
 
+@pytest.mark.anyio
+async def test_async_dependencies_build_chat_session_and_audit_repos() -> None:
+    from myloware.api.dependencies_async import (
+        get_async_audit_log_repo,
+        get_async_chat_session_repo,
+    )
+    from myloware.storage.repositories import AuditLogRepository
+
+    session = MagicMock()
+    chat_repo = await get_async_chat_session_repo(session=session)  # type: ignore[arg-type]
+    audit_repo = await get_async_audit_log_repo(session=session)  # type: ignore[arg-type]
+    assert isinstance(chat_repo, ChatSessionRepository) and chat_repo.session is session
+    assert isinstance(audit_repo, AuditLogRepository) and audit_repo.session is session
+
+
 @pytest.mark.anyio
 async def test_verify_api_key_rejects_invalid_key() -> None:
     with pytest.raises(HTTPException) as excinfo:
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from types import SimpleNamespace
 
 import pytest
 from fastapi import HTTPException, Request
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from slowapi.errors import RateLimitExceeded
 
 
@@ -79,6 +80,33 @@ async def test_request_id_and_timing_middlewares_set_headers() -> None:
     assert "X-Response-Time-ms" in resp.headers
 
 
+@pytest.mark.asyncio
+async def test_timing_middleware_observes_event_streams_after_the_body(monkeypatch) -> None:
+    from myloware.api import server
+
+    recorded: list[int] = []
+    monkeypatch.setattr(
+        server, "_record_request", lambda _req, _resp, _start, stats: recorded.append(1) or 0.0
+    )
+    scope = {"type": "http", "method": "GET", "path": "/events", "headers": []}
+    request = Request(scope)
+
+    async def _events():  # type: ignore[no-untyped-def]
+        yield "event: status\n\n"
+        yield "event: end\n\n"
+
+    async def call_next(_req: Request):  # type: ignore[no-untyped-def]
+        return StreamingResponse(_events(), media_type="text/event-stream")
+
+    resp = await server.timing_middleware(request, call_next)
+    assert recorded == []
+    assert "X-Response-Time-ms" not in resp.headers
+
+    chunks = [chunk async for chunk in resp.body_iterator]  # type: ignore[attr-defined]
+    assert len(chunks) == 2
+    assert recorded == [1]
+
+
 @pytest.mark.asyncio
 async def test_http_and_domain_error_handlers() -> None:
     from myloware.api import errors, server
@@ -129,13 +157,18 @@ async def test_lifespan_real_provider_reuses_store(monkeypatch) -> None:
         lambda *_args, **_kwargs: ([], {"hash": "h1", "files": []}),
     )
     monkeypatch.setattr(server, "save_manifest", lambda _m: None)
-    monkeypatch.setattr(server, "get_existing_vector_store", lambda *_a, **_k: "vs-1")
-    monkeypatch.setattr(server, "setup_project_knowledge", lambda *_a, **_k: "vs-2")
+    monkeypatch.setattr(
+        server,
+        "sync_project_knowledge",
+        lambda *_a, **_k: SimpleNamespace(vector_store_id="vs-1", manifest={"hash": "h1"}),
+    )
     monkeypatch.setattr("myloware.observability.init_observability", lambda: None)
 
     async with server.lifespan(server.app):
+        await server.app.state.knowledge_base_task
         assert server.app.state.vector_db_id == "vs-1"
         assert server.app.state.knowledge_base_healthy is True
+        assert server.app.state.knowledge_base_status == "ready"
 
 
 @pytest.mark.asyncio
@@ -172,8 +205,10 @@ async def test_lifespan_real_provider_skip_ingest(monkeypatch) -> None:
     monkeypatch.setattr("myloware.observability.init_observability", lambda: None)
 
     async with server.lifespan(server.app):
+        await server.app.state.knowledge_base_task
         assert server.app.state.vector_db_id == "vs-3"
         assert server.app.state.knowledge_base_healthy is False
+        assert server.app.state.knowledge_base_status == "skipped"
 
 
 @pytest.mark.asyncio
@@ -310,14 +345,37 @@ async def test_lifespan_rag_toolgroup_registration_failure_raises(monkeypatch) -
         "load_documents_with_manifest",
         lambda *_args, **_kwargs: ([], {"hash": "h1", "files": []}),
     )
-    monkeypatch.setattr(server, "get_existing_vector_store", lambda *_a, **_k: None)
-    monkeypatch.setattr(server, "setup_project_knowledge", lambda *_a, **_k: "vs-1")
+    monkeypatch.setattr(
+        server,
+        "sync_project_knowledge",
+        lambda *_a, **_k: SimpleNamespace(vector_store_id="vs-1", manifest={}),
+    )
     monkeypatch.setattr("myloware.observability.init_observability", lambda: None)
 
+    # Blocking startup keeps the old fail-fast behaviour.
+    monkeypatch.setattr(server.settings, "kb_setup_in_background", False)
     with pytest.raises(RuntimeError, match="Failed to register RAG toolgroup"):
         async with server.lifespan(server.app):
             pass
 
+    # In the background the failure is recorded, readiness stays down and the
+    # setup is retried with backoff until it succeeds.
+    monkeypatch.setattr(server.settings, "kb_setup_in_background", True)
+    monkeypatch.setattr(server.settings, "kb_setup_retry_initial_seconds", 0.01)
+    async with server.lifespan(server.app):
+        for _ in range(200):
+            if server.app.state.knowledge_base_status == "failed":
+                break
+            await asyncio.sleep(0.01)
+        assert server.app.state.knowledge_base_status == "failed"
+        assert "Failed to register RAG toolgroup" in server.app.state.knowledge_base_error
+
+        FakeToolgroups.register = lambda self, **_kwargs: None  # type: ignore[method-assign]
+        await asyncio.wait_for(server.app.state.knowledge_base_task, timeout=5)
+        assert server.app.state.knowledge_base_status == "ready"
+        assert server.app.state.knowledge_base_error is None
+        assert server.app.state.vector_db_id == "vs-1"
+
 
 @pytest.mark.asyncio
 async def test_lifespan_shields_missing_sets_flag(monkeypatch) -> None:
@@ -348,11 +406,15 @@ async def test_lifespan_shields_missing_sets_flag(monkeypatch) -> None:
         "load_documents_with_manifest",
         lambda *_args, **_kwargs: ([], {"hash": "h1", "files": []}),
     )
-    monkeypatch.setattr(server, "get_existing_vector_store", lambda *_a, **_k: None)
-    monkeypatch.setattr(server, "setup_project_knowledge", lambda *_a, **_k: "vs-1")
+    monkeypatch.setattr(
+        server,
+        "sync_project_knowledge",
+        lambda *_a, **_k: SimpleNamespace(vector_store_id="vs-1", manifest={}),
+    )
     monkeypatch.setattr("myloware.observability.init_observability", lambda: None)
 
     async with server.lifespan(server.app):
+        await server.app.state.knowledge_base_task
         assert server.app.state.shields_available is False
 
 
@@ -496,8 +558,11 @@ async def test_lifespan_websearch_registration_failure(monkeypatch) -> None:
         "load_documents_with_manifest",
         lambda *_args, **_kwargs: ([], {"hash": "h1", "files": []}),
     )
-    monkeypatch.setattr(server, "get_existing_vector_store", lambda *_a, **_k: None)
-    monkeypatch.setattr(server, "setup_project_knowledge", lambda *_a, **_k: "vs-1")
+    monkeypatch.setattr(
+        server,
+        "sync_project_knowledge",
+        lambda *_a, **_k: SimpleNamespace(vector_store_id="vs-1", manifest={}),
+    )
     monkeypatch.setattr("myloware.observability.init_observability", lambda: None)
 
     async with server.lifespan(server.app):
@@ -532,9 +597,143 @@ async def test_lifespan_shields_check_failure(monkeypatch) -> None:
         "load_documents_with_manifest",
         lambda *_args, **_kwargs: ([], {"hash": "h1", "files": []}),
     )
-    monkeypatch.setattr(server, "get_existing_vector_store", lambda *_a, **_k: None)
-    monkeypatch.setattr(server, "setup_project_knowledge", lambda *_a, **_k: "vs-1")
+    monkeypatch.setattr(
+        server,
+        "sync_project_knowledge",
+        lambda *_a, **_k: SimpleNamespace(vector_store_id="vs-1", manifest={}),
+    )
     monkeypatch.setattr("myloware.observability.init_observability", lambda: None)
 
     async with server.lifespan(server.app):
+        await server.app.state.knowledge_base_task
         assert server.app.state.shields_available is False
+
+
+@pytest.mark.asyncio
+async def test_health_serves_while_slow_kb_sync_runs_in_background(monkeypatch) -> None:
+    import threading
+    import time
+
+    import httpx
+
+    from myloware.api import server
+    from myloware.api.dependencies import get_vector_db_id
+
+    release = threading.Event()
+
+    def slow_sync(*_a, **_k):  # type: ignore[no-untyped-def]
+        release.wait(10)
+        return SimpleNamespace(vector_store_id="vs-slow", manifest={})
+
+    class FakeShields:
+        def list(self):  # type: ignore[no-untyped-def]
+            return SimpleNamespace(
+                data=[SimpleNamespace(identifier=server.settings.content_safety_shield_id)]
+            )
+
+    fake_client = SimpleNamespace(
+        toolgroups=SimpleNamespace(register=lambda **_kwargs: None), shields=FakeShields()
+    )
+
+    monkeypatch.setattr(server.settings, "llama_stack_provider", "real")
+    monkeypatch.setattr(server.settings, "use_fake_providers", False)
+    monkeypatch.setattr(server.settings, "kb_skip_ingest_on_start", False)
+    monkeypatch.setattr(server.settings, "kb_setup_in_background", True)
+    monkeypatch.setattr(server.settings, "project_id", "proj")
+    monkeypatch.setattr(server.settings, "database_url", "sqlite:///:memory:")
+    monkeypatch.setattr(server.settings, "use_langgraph_engine", False)
+    monkeypatch.setattr(server.settings, "fail_fast_on_startup", False)
+    monkeypatch.setattr(server, "get_sync_client", lambda: fake_client)
+    monkeypatch.setattr(server, "init_db", lambda: None)
+    monkeypatch.setattr(server, "load_manifest", lambda: None)
+    monkeypatch.setattr(
+        server,
+        "load_documents_with_manifest",
+        lambda *_args, **_kwargs: ([], {"hash": "h1", "files": []}),
+    )
+    monkeypatch.setattr(server, "save_manifest", lambda _m: None)
+    monkeypatch.setattr(server, "sync_project_knowledge", slow_sync)
+    monkeypatch.setattr("myloware.observability.init_observability", lambda: None)
+
+    transport = httpx.ASGITransport(app=server.app)
+    started = time.monotonic()
+    try:
+        async with server.lifespan(server.app):
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                health = await client.get("/health")
+                time_to_first_200 = time.monotonic() - started
+                ready = await client.get("/health/ready")
+
+                assert health.status_code == 200
+                assert health.json()["knowledge_base_status"] == "pending"
+                assert time_to_first_200 < 1.0
+                assert ready.status_code == 503
+                assert ready.json()["knowledge_base"] == "pending"
+                # RAG routes are held back until the sync finishes.
+                with pytest.raises(HTTPException) as exc_info:
+                    get_vector_db_id(Request({"type": "http", "app": server.app}))
+                assert exc_info.value.status_code == 503
+
+                release.set()
+                await server.app.state.knowledge_base_task
+
+                ready = await client.get("/health/ready")
+                assert ready.status_code == 200
+                assert get_vector_db_id(Request({"type": "http", "app": server.app})) == "vs-slow"
+    finally:
+        release.set()
+    assert server.app.state.knowledge_base_status == "stopped"
+
+
+@pytest.mark.asyncio
+async def test_abandoned_kb_sync_does_not_write_app_state_after_shutdown(monkeypatch) -> None:
+    import threading
+
+    from myloware.api import server
+
+    started = threading.Event()
+    release = threading.Event()
+    finished = threading.Event()
+
+    def slow_sync(*_a, **_k):  # type: ignore[no-untyped-def]
+        started.set()
+        release.wait(10)
+        finished.set()
+        return SimpleNamespace(vector_store_id="vs-late", manifest={})
+
+    fake_client = SimpleNamespace(
+        toolgroups=SimpleNamespace(register=lambda **_kwargs: None),
+        shields=SimpleNamespace(list=lambda: SimpleNamespace(data=[])),
+    )
+    monkeypatch.setattr(server.settings, "llama_stack_provider", "real")
+    monkeypatch.setattr(server.settings, "use_fake_providers", False)
+    monkeypatch.setattr(server.settings, "kb_skip_ingest_on_start", False)
+    monkeypatch.setattr(server.settings, "kb_setup_in_background", True)
+    monkeypatch.setattr(server.settings, "project_id", "proj")
+    monkeypatch.setattr(server.settings, "database_url", "sqlite:///:memory:")
+    monkeypatch.setattr(server.settings, "use_langgraph_engine", False)
+    monkeypatch.setattr(server.settings, "fail_fast_on_startup", False)
+    monkeypatch.setattr(server, "get_sync_client", lambda: fake_client)
+    monkeypatch.setattr(server, "init_db", lambda: None)
+    monkeypatch.setattr(server, "load_manifest", lambda: None)
+    monkeypatch.setattr(
+        server,
+        "load_documents_with_manifest",
+        lambda *_args, **_kwargs: ([], {"hash": "h1", "files": []}),
+    )
+    monkeypatch.setattr(server, "save_manifest", lambda _m: None)
+    monkeypatch.setattr(server, "sync_project_knowledge", slow_sync)
+    monkeypatch.setattr("myloware.observability.init_observability", lambda: None)
+
+    try:
+        async with server.lifespan(server.app):
+            assert await asyncio.to_thread(started.wait, 5)
+            server.app.state.shields_available = None
+    finally:
+        release.set()
+    assert finished.wait(5)
+    await asyncio.sleep(0.05)
+
+    assert server.app.state.knowledge_base_status == "stopped"
+    assert server.app.state.vector_db_id == "project_kb_proj"
+    assert server.app.state.shields_available is None
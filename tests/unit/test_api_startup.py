@@ -21,7 +21,8 @@ def test_load_knowledge_documents_empty_dir():
         docs, manifest = _load_knowledge_documents(project_id="proj")
         assert docs == []
         assert manifest["hash"] == "h0"
-        save_mock.assert_called_once()
+        # Saved only after the vector store sync succeeds.
+        save_mock.assert_not_called()
 
 
 def test_load_knowledge_documents_with_files():
@@ -0,0 +1,198 @@
+"""Unit tests for the native AsyncAgent turn loop."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any
+
+import anyio
+import pytest
+
+from myloware.agents.async_agent import AsyncAgent
+from myloware.tools.base import JSONSchema, MylowareBaseTool
+from myloware.workflows.langgraph.agent_io import (
+    agent_session_async,
+    create_turn_collecting_tool_responses_async,
+)
+
+
+def _text_response(response_id: str, text: str, delay: float = 0.0) -> list[Any]:
+    response = SimpleNamespace(id=response_id, output_text=text)
+    return [
+        SimpleNamespace(type="response.in_progress", response=response),
+        SimpleNamespace(type="response.output_text.delta", delta=text),
+        SimpleNamespace(type="response.completed", response=response, _delay=delay),
+    ]
+
+
+def _function_call_response(response_id: str, name: str, arguments: dict) -> list[Any]:
+    response = SimpleNamespace(id=response_id, output_text="")
+    item = SimpleNamespace(
+        type="function_call", call_id=f"call-{name}", name=name, arguments=json.dumps(arguments)
+    )
+    return [
+        SimpleNamespace(type="response.in_progress", response=response),
+        SimpleNamespace(type="response.output_item.added", item=item),
+        SimpleNamespace(type="response.output_item.done", item=item),
+        SimpleNamespace(type="response.completed", response=response),
+    ]
+
+
+class FakeAsyncClient:
+    """Scripted AsyncLlamaStackClient: each responses.create pops the next event list."""
+
+    def __init__(self, scripts: list[list[Any]]) -> None:
+        self._scripts = list(scripts)
+        self.inputs: list[Any] = []
+        self.deleted: list[str] = []
+        self.responses = SimpleNamespace(create=self._create_response)
+        self.conversations = SimpleNamespace(create=self._create_conv, delete=self._delete_conv)
+
+    async def _create_conv(self, **_kwargs: Any) -> Any:
+        return SimpleNamespace(id="conv-1")
+
+    async def _delete_conv(self, conversation_id: str) -> None:
+        self.deleted.append(conversation_id)
+
+    async def _create_response(self, **kwargs: Any) -> Any:
+        self.inputs.append(kwargs["input"])
+        events = self._scripts.pop(0)
+
+        async def _stream():
+            for event in events:
+                delay = getattr(event, "_delay", 0.0)
+                if delay:
+                    await anyio.sleep(delay)
+                yield event
+
+        return _stream()
+
+
+class AsyncEchoTool(MylowareBaseTool):
+    def __init__(self) -> None:
+        self.thread_ids: list[int] = []
+
+    def get_name(self) -> str:
+        return "echo"
+
+    def get_description(self) -> str:
+        return "Echo input"
+
+    def get_input_schema(self) -> JSONSchema:
+        return {"type": "object", "properties": {"text": {"type": "string"}}}
+
+    async def async_run_impl(self, text: str) -> dict[str, Any]:
+        self.thread_ids.append(threading.get_ident())
+        return {"echo": text}
+
+
+class SyncEchoTool(AsyncEchoTool):
+    def get_name(self) -> str:
+        return "sync_echo"
+
+    def run_impl(self, text: str) -> dict[str, Any]:
+        self.thread_ids.append(threading.get_ident())
+        return {"echo": text}
+
+    async_run_impl = MylowareBaseTool.async_run_impl  # type: ignore[assignment]
+
+
+@pytest.mark.anyio
+async def test_async_agent_runs_native_async_tool_on_event_loop() -> None:
+    tool = AsyncEchoTool()
+    client = FakeAsyncClient(
+        [
+            _function_call_response("resp-1", "echo", {"text": "hi"}),
+            _text_response("resp-2", "done"),
+        ]
+    )
+    agent = AsyncAgent(client, model="m", instructions="i", tools=[tool])
+
+    async with agent_session_async(client, agent, "s") as session_id:
+        response, payloads = await create_turn_collecting_tool_responses_async(
+            agent, [{"role": "user", "content": "go"}], session_id
+        )
+
+    assert response.output_text == "done"
+    assert payloads[0]["tool_name"] == "echo"
+    assert json.loads(payloads[0]["content"]) == {"echo": "hi"}
+    assert tool.thread_ids == [threading.get_ident()]
+    # Tool output is fed back as function_call_output on the follow-up request.
+    assert client.inputs[1] == [
+        {"type": "function_call_output", "call_id": "call-echo", "output": payloads[0]["content"]}
+    ]
+    assert client.deleted == ["conv-1"]
+
+
+@pytest.mark.anyio
+async def test_async_agent_runs_sync_only_tool_in_worker_thread() -> None:
+    tool = SyncEchoTool()
+    client = FakeAsyncClient(
+        [
+            _function_call_response("resp-1", "sync_echo", {"text": "hi"}),
+            _text_response("resp-2", "done"),
+        ]
+    )
+    agent = AsyncAgent(client, model="m", instructions="i", tools=[tool])
+
+    response, payloads = await create_turn_collecting_tool_responses_async(
+        agent, [{"role": "user", "content": "go"}], "conv-1"
+    )
+
+    assert response.output_text == "done"
+    assert json.loads(payloads[0]["content"]) == {"echo": "hi"}
+    assert tool.thread_ids and tool.thread_ids[0] != threading.get_ident()
+
+
+@pytest.mark.anyio
+async def test_async_agent_unknown_tool_and_failed_turn() -> None:
+    client = FakeAsyncClient(
+        [
+            _function_call_response("resp-1", "missing", {}),
+            [
+                SimpleNamespace(
+                    type="response.failed",
+                    response=SimpleNamespace(id="resp-2", error=SimpleNamespace(message="boom")),
+                )
+            ],
+        ]
+    )
+    agent = AsyncAgent(client, model="m", instructions="i", tools=[])
+
+    events = [chunk.event async for chunk in await agent.create_turn([], "conv-1")]
+
+    tool_step = next(
+        e
+        for e in events
+        if getattr(e, "step_type", None) == "tool_execution" and hasattr(e, "result")
+    )
+    assert "Unknown tool" in tool_step.result.tool_responses[0]["content"]
+    assert type(events[-1]).__name__ == "TurnFailed"
+    assert events[-1].error_message == "boom"
+
+
+@pytest.mark.anyio
+async def test_async_agent_turns_overlap_without_worker_threads() -> None:
+    turns = 50
+    delay = 0.05
+    client = FakeAsyncClient([_text_response(f"r{i}", f"t{i}", delay) for i in range(turns)])
+    agent = AsyncAgent(client, model="m", instructions="i")
+
+    results: list[str] = []
+
+    async def _one() -> None:
+        response = await agent.create_turn([], "conv-1", stream=False)
+        results.append(response.output_text)
+
+    start = time.perf_counter()
+    async with anyio.create_task_group() as tg:
+        for _ in range(turns):
+            tg.start_soon(_one)
+    elapsed = time.perf_counter() - start
+
+    assert len(results) == turns
+    # Serialized (or thread-limited) turns would take turns * delay.
+    assert elapsed < turns * delay / 4
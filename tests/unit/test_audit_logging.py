@@ -192,3 +192,95 @@ class TestAuditHelper:
             )
 
             mock_get_session.assert_called_once()
+
+
+@pytest.fixture
+def audit_session_factory(monkeypatch, sqlite_session_factory):
+    monkeypatch.setattr(
+        "myloware.observability.audit.get_async_session_factory", lambda: sqlite_session_factory
+    )
+    return sqlite_session_factory
+
+
+async def _audit_rows(factory) -> list[AuditLog]:
+    from sqlalchemy import select
+
+    async with factory() as session:
+        return list((await session.execute(select(AuditLog))).scalars().all())
+
+
+class TestBufferedAuditWriter:
+    """Tests for the queued, batch-inserting audit writer."""
+
+    @pytest.mark.anyio
+    async def test_events_are_batched_and_drained_on_stop(self, audit_session_factory) -> None:
+        from myloware.observability import audit
+
+        writer = audit.start_audit_writer(batch_size=50, flush_interval=60.0)
+        writes: list[int] = []
+        original_write = writer._write
+
+        async def _count_write(batch):
+            writes.append(len(batch))
+            await original_write(batch)
+
+        writer._write = _count_write  # type: ignore[method-assign]
+        run_id = uuid4()
+        with patch("myloware.observability.audit.get_session") as mock_get_session:
+            for i in range(120):
+                audit.log_audit_event(
+                    action=f"event_{i}", run_id=run_id, metadata={"i": i}, outcome="success"
+                )
+            mock_get_session.assert_not_called()  # nothing written on the caller's path
+
+        await audit.stop_audit_writer()
+
+        rows = await _audit_rows(audit_session_factory)
+        assert len(rows) == 120
+        assert {row.run_id for row in rows} == {run_id}
+        assert sorted(row.audit_metadata["i"] for row in rows) == list(range(120))
+        assert writes == [50, 50, 20]
+
+    @pytest.mark.anyio
+    async def test_flushes_on_time_threshold(self, audit_session_factory) -> None:
+        import asyncio
+
+        from myloware.observability import audit
+
+        audit.start_audit_writer(batch_size=100, flush_interval=0.05)
+        try:
+            audit.log_audit_event(action="gate_approved", user_id="u1")
+            await asyncio.sleep(0.3)
+            rows = await _audit_rows(audit_session_factory)
+            assert [row.action for row in rows] == ["gate_approved"]
+        finally:
+            await audit.stop_audit_writer()
+
+    @pytest.mark.anyio
+    async def test_full_queue_drops_instead_of_blocking(self, audit_session_factory) -> None:
+        from myloware.observability import audit
+
+        dropped = audit.AUDIT_EVENTS.labels(result="dropped")
+        before = dropped._value.get()
+        audit.start_audit_writer(max_size=5, batch_size=100, flush_interval=60.0)
+        # No await between submits: the drain task cannot run, so the queue fills.
+        for i in range(8):
+            audit.log_audit_event(action=f"event_{i}")
+        await audit.stop_audit_writer()
+
+        assert dropped._value.get() == before + 3
+        assert len(await _audit_rows(audit_session_factory)) == 5
+
+    @pytest.mark.anyio
+    async def test_events_from_worker_threads_are_queued(self, audit_session_factory) -> None:
+        import anyio
+
+        from myloware.observability import audit
+
+        audit.start_audit_writer(batch_size=10, flush_interval=0.05)
+        try:
+            await anyio.to_thread.run_sync(lambda: audit.log_audit_event(action="from_thread"))
+        finally:
+            await audit.stop_audit_writer()
+
+        assert [row.action for row in await _audit_rows(audit_session_factory)] == ["from_thread"]
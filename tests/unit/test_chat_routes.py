@@ -14,23 +14,23 @@ async def test_chat_supervisor_returns_run_id(async_client, api_headers, monkeyp
     from myloware.api.server import app
     from myloware.api.dependencies import (
         get_async_llama_client,
-        get_chat_session_repo,
         get_llama_client,
         get_vector_db_id,
     )
+    from myloware.api.dependencies_async import get_async_chat_session_repo
 
     deleted: list[str] = []
 
     class FakeConversations:
-        def delete(self, conversation_id: str) -> None:
+        async def delete(self, conversation_id: str) -> None:
             deleted.append(conversation_id)
 
-    fake_client = SimpleNamespace(conversations=FakeConversations())
-    fake_async_client = SimpleNamespace()
+    fake_client = SimpleNamespace()
+    fake_async_client = SimpleNamespace(conversations=FakeConversations())
 
     app.dependency_overrides[get_llama_client] = lambda: fake_client
     app.dependency_overrides[get_async_llama_client] = lambda: fake_async_client
-    app.dependency_overrides[get_chat_session_repo] = lambda: SimpleNamespace()
+    app.dependency_overrides[get_async_chat_session_repo] = lambda: SimpleNamespace()
     app.dependency_overrides[get_vector_db_id] = lambda: "kb"
 
     async def fake_classify_request_async(_backend, _msg):
@@ -44,18 +44,18 @@ async def test_chat_supervisor_returns_run_id(async_client, api_headers, monkeyp
     )
 
     class FakeAgent:
-        def create_session(self, _name: str) -> str:
+        async def create_session(self, _name: str) -> str:
             return "session-1"
 
     monkeypatch.setattr(
-        "myloware.api.routes.chat.create_supervisor_agent", lambda *_a, **_k: FakeAgent()
+        "myloware.api.routes.chat.create_async_supervisor_agent", lambda *_a, **_k: FakeAgent()
     )
+
+    async def fake_turn(*_a, **_k):  # type: ignore[no-untyped-def]
+        return (object(), [{"tool_name": "start_workflow", "content": {"run_id": "run-123"}}])
+
     monkeypatch.setattr(
-        "myloware.api.routes.chat.create_turn_collecting_tool_responses",
-        lambda *_a, **_k: (
-            object(),
-            [{"tool_name": "start_workflow", "content": {"run_id": "run-123"}}],
-        ),
+        "myloware.api.routes.chat.create_turn_collecting_tool_responses_async", fake_turn
     )
     monkeypatch.setattr("myloware.api.routes.chat.extract_content", lambda _r: "hello")
 
@@ -81,17 +81,20 @@ async def test_chat_supervisor_fails_closed_when_run_id_missing(
     from myloware.api.server import app
     from myloware.api.dependencies import (
         get_async_llama_client,
-        get_chat_session_repo,
         get_llama_client,
         get_vector_db_id,
     )
+    from myloware.api.dependencies_async import get_async_chat_session_repo
 
-    fake_client = SimpleNamespace(conversations=SimpleNamespace(delete=lambda **_k: None))
-    fake_async_client = SimpleNamespace()
+    async def fake_delete(**_k) -> None:  # type: ignore[no-untyped-def]
+        return None
+
+    fake_client = SimpleNamespace()
+    fake_async_client = SimpleNamespace(conversations=SimpleNamespace(delete=fake_delete))
 
     app.dependency_overrides[get_llama_client] = lambda: fake_client
     app.dependency_overrides[get_async_llama_client] = lambda: fake_async_client
-    app.dependency_overrides[get_chat_session_repo] = lambda: SimpleNamespace()
+    app.dependency_overrides[get_async_chat_session_repo] = lambda: SimpleNamespace()
     app.dependency_overrides[get_vector_db_id] = lambda: "kb"
 
     async def fake_classify_request_async(_backend, _msg):
@@ -105,15 +108,18 @@ async def test_chat_supervisor_fails_closed_when_run_id_missing(
     )
 
     class FakeAgent:
-        def create_session(self, _name: str) -> str:
+        async def create_session(self, _name: str) -> str:
             return "session-1"
 
     monkeypatch.setattr(
-        "myloware.api.routes.chat.create_supervisor_agent", lambda *_a, **_k: FakeAgent()
+        "myloware.api.routes.chat.create_async_supervisor_agent", lambda *_a, **_k: FakeAgent()
     )
+
+    async def fake_turn(*_a, **_k):  # type: ignore[no-untyped-def]
+        return (object(), [{"tool_name": "start_workflow", "content": {"nope": True}}])
+
     monkeypatch.setattr(
-        "myloware.api.routes.chat.create_turn_collecting_tool_responses",
-        lambda *_a, **_k: (object(), [{"tool_name": "start_workflow", "content": {"nope": True}}]),
+        "myloware.api.routes.chat.create_turn_collecting_tool_responses_async", fake_turn
     )
     monkeypatch.setattr("myloware.api.routes.chat.extract_content", lambda _r: "hello")
 
@@ -136,10 +142,10 @@ async def test_chat_supervisor_streaming_returns_sse(
     from myloware.api.server import app
     from myloware.api.dependencies import (
         get_async_llama_client,
-        get_chat_session_repo,
         get_llama_client,
         get_vector_db_id,
     )
+    from myloware.api.dependencies_async import get_async_chat_session_repo
 
     fake_client = SimpleNamespace()
 
@@ -164,7 +170,7 @@ async def test_chat_supervisor_streaming_returns_sse(
 
     app.dependency_overrides[get_llama_client] = lambda: fake_client
     app.dependency_overrides[get_async_llama_client] = lambda: fake_async_client
-    app.dependency_overrides[get_chat_session_repo] = lambda: SimpleNamespace()
+    app.dependency_overrides[get_async_chat_session_repo] = lambda: SimpleNamespace()
     app.dependency_overrides[get_vector_db_id] = lambda: "kb"
 
     async def fake_classify_request_async(_backend, _msg):
@@ -201,17 +207,20 @@ async def test_chat_supervisor_parses_run_id_from_json_string(
     from myloware.api.server import app
     from myloware.api.dependencies import (
         get_async_llama_client,
-        get_chat_session_repo,
         get_llama_client,
         get_vector_db_id,
     )
+    from myloware.api.dependencies_async import get_async_chat_session_repo
 
-    fake_client = SimpleNamespace(conversations=SimpleNamespace(delete=lambda **_k: None))
-    fake_async_client = SimpleNamespace()
+    async def fake_delete(**_k) -> None:  # type: ignore[no-untyped-def]
+        return None
+
+    fake_client = SimpleNamespace()
+    fake_async_client = SimpleNamespace(conversations=SimpleNamespace(delete=fake_delete))
 
     app.dependency_overrides[get_llama_client] = lambda: fake_client
     app.dependency_overrides[get_async_llama_client] = lambda: fake_async_client
-    app.dependency_overrides[get_chat_session_repo] = lambda: SimpleNamespace()
+    app.dependency_overrides[get_async_chat_session_repo] = lambda: SimpleNamespace()
     app.dependency_overrides[get_vector_db_id] = lambda: "kb"
 
     async def fake_classify_request_async(_backend, _msg):
@@ -225,7 +234,7 @@ async def test_chat_supervisor_parses_run_id_from_json_string(
     )
 
     class FakeAgent:
-        def create_session(self, _name: str) -> str:
+        async def create_session(self, _name: str) -> str:
             return "session-1"
 
     tool_responses = [
@@ -235,11 +244,14 @@ async def test_chat_supervisor_parses_run_id_from_json_string(
     ]
 
     monkeypatch.setattr(
-        "myloware.api.routes.chat.create_supervisor_agent", lambda *_a, **_k: FakeAgent()
+        "myloware.api.routes.chat.create_async_supervisor_agent", lambda *_a, **_k: FakeAgent()
     )
+
+    async def fake_turn(*_a, **_k):  # type: ignore[no-untyped-def]
+        return (object(), tool_responses)
+
     monkeypatch.setattr(
-        "myloware.api.routes.chat.create_turn_collecting_tool_responses",
-        lambda *_a, **_k: (object(), tool_responses),
+        "myloware.api.routes.chat.create_turn_collecting_tool_responses_async", fake_turn
     )
     monkeypatch.setattr("myloware.api.routes.chat.extract_content", lambda _r: "hello")
 
@@ -264,20 +276,20 @@ async def test_chat_supervisor_falls_back_to_sync_classification_and_cleanup_fai
     from myloware.api.server import app
     from myloware.api.dependencies import (
         get_async_llama_client,
-        get_chat_session_repo,
         get_llama_client,
         get_vector_db_id,
     )
+    from myloware.api.dependencies_async import get_async_chat_session_repo
 
-    def boom_delete(**_k) -> None:  # type: ignore[no-untyped-def]
+    async def boom_delete(**_k) -> None:  # type: ignore[no-untyped-def]
         raise RuntimeError("cleanup failed")
 
-    fake_client = SimpleNamespace(conversations=SimpleNamespace(delete=boom_delete))
-    fake_async_client = SimpleNamespace()
+    fake_client = SimpleNamespace()
+    fake_async_client = SimpleNamespace(conversations=SimpleNamespace(delete=boom_delete))
 
     app.dependency_overrides[get_llama_client] = lambda: fake_client
     app.dependency_overrides[get_async_llama_client] = lambda: fake_async_client
-    app.dependency_overrides[get_chat_session_repo] = lambda: SimpleNamespace()
+    app.dependency_overrides[get_async_chat_session_repo] = lambda: SimpleNamespace()
     app.dependency_overrides[get_vector_db_id] = lambda: "kb"
 
     async def fake_classify_request_async(_backend, _msg):
@@ -305,17 +317,19 @@ async def test_chat_supervisor_falls_back_to_sync_classification_and_cleanup_fai
     seen: dict[str, str] = {}
 
     class FakeAgent:
-        def create_session(self, _name: str) -> str:
+        async def create_session(self, _name: str) -> str:
             return "session-1"
 
-    def fake_turn(_agent, messages, _session_id):  # type: ignore[no-untyped-def]
+    async def fake_turn(_agent, messages, _session_id):  # type: ignore[no-untyped-def]
         seen["content"] = messages[0]["content"]
         return (object(), [{"tool_name": "start_workflow", "content": {"run_id": "run-123"}}])
 
     monkeypatch.setattr(
-        "myloware.api.routes.chat.create_supervisor_agent", lambda *_a, **_k: FakeAgent()
+        "myloware.api.routes.chat.create_async_supervisor_agent", lambda *_a, **_k: FakeAgent()
+    )
+    monkeypatch.setattr(
+        "myloware.api.routes.chat.create_turn_collecting_tool_responses_async", fake_turn
     )
-    monkeypatch.setattr("myloware.api.routes.chat.create_turn_collecting_tool_responses", fake_turn)
     monkeypatch.setattr("myloware.api.routes.chat.extract_content", lambda _r: "hello")
 
     try:
@@ -340,10 +354,10 @@ async def test_chat_supervisor_streaming_uses_message_content_when_delta_missing
     from myloware.api.server import app
     from myloware.api.dependencies import (
         get_async_llama_client,
-        get_chat_session_repo,
         get_llama_client,
         get_vector_db_id,
     )
+    from myloware.api.dependencies_async import get_async_chat_session_repo
 
     fake_client = SimpleNamespace()
 
@@ -368,7 +382,7 @@ async def test_chat_supervisor_streaming_uses_message_content_when_delta_missing
 
     app.dependency_overrides[get_llama_client] = lambda: fake_client
     app.dependency_overrides[get_async_llama_client] = lambda: fake_async_client
-    app.dependency_overrides[get_chat_session_repo] = lambda: SimpleNamespace()
+    app.dependency_overrides[get_async_chat_session_repo] = lambda: SimpleNamespace()
     app.dependency_overrides[get_vector_db_id] = lambda: "kb"
 
     async def fake_classify_request_async(_backend, _msg):
@@ -404,10 +418,10 @@ async def test_chat_supervisor_streaming_emits_stream_error_on_exception(
     from myloware.api.server import app
     from myloware.api.dependencies import (
         get_async_llama_client,
-        get_chat_session_repo,
         get_llama_client,
         get_vector_db_id,
     )
+    from myloware.api.dependencies_async import get_async_chat_session_repo
 
     fake_client = SimpleNamespace()
 
@@ -423,7 +437,7 @@ async def test_chat_supervisor_streaming_emits_stream_error_on_exception(
 
     app.dependency_overrides[get_llama_client] = lambda: fake_client
     app.dependency_overrides[get_async_llama_client] = lambda: fake_async_client
-    app.dependency_overrides[get_chat_session_repo] = lambda: SimpleNamespace()
+    app.dependency_overrides[get_async_chat_session_repo] = lambda: SimpleNamespace()
     app.dependency_overrides[get_vector_db_id] = lambda: "kb"
 
     async def fake_classify_request_async(_backend, _msg):
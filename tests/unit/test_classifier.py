@@ -7,6 +7,15 @@ from typing import Any
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def _reset_classifier_cache():
+    from myloware.agents.classifier import clear_classifier_cache
+
+    clear_classifier_cache()
+    yield
+    clear_classifier_cache()
+
+
 class FakeChatBackend:
     def __init__(self, payload: object | None = None, exc: Exception | None = None):
         self.payload = payload
@@ -28,10 +37,12 @@ class FakeAsyncChatBackend:
     def __init__(self, payload: object | None = None, exc: Exception | None = None):
         self.payload = payload
         self.exc = exc
+        self.calls = 0
 
     async def chat_json_async(
         self, *, messages: list[dict[str, Any]], model_id: str | None = None
     ) -> dict[str, Any]:
+        self.calls += 1
         if self.exc:
             raise self.exc
         assert isinstance(messages, list)
@@ -126,7 +137,7 @@ class TestLLMClassifierAsync:
         from myloware.agents.classifier import classify_request_async
 
         backend = FakeAsyncChatBackend({"intent": "help", "confidence": "medium"})
-        result = await classify_request_async(backend, "help")
+        result = await classify_request_async(backend, "how does this work")
 
         assert result.intent == "help"
         assert result.confidence == 0.7
@@ -136,7 +147,7 @@ class TestLLMClassifierAsync:
         from myloware.agents.classifier import classify_request_async
 
         backend = FakeAsyncChatBackend({"intent": "help", "confidence": 0.95})
-        result = await classify_request_async(backend, "help")
+        result = await classify_request_async(backend, "how does this work")
 
         assert result.intent == "help"
         assert result.confidence == 0.95
@@ -146,7 +157,7 @@ class TestLLMClassifierAsync:
         from myloware.agents.classifier import classify_request_async
 
         backend = FakeAsyncChatBackend({"intent": "help", "confidence": []})
-        result = await classify_request_async(backend, "help")
+        result = await classify_request_async(backend, "how does this work")
 
         assert result.intent == "help"
         assert result.confidence == 0.8
@@ -159,3 +170,99 @@ class TestLLMClassifierAsync:
 
         with pytest.raises(RuntimeError, match="API unavailable"):
             await classify_request_async(backend, "test message")
+
+    @pytest.mark.anyio
+    async def test_classify_async_caches_llm_result_by_normalized_message(self):
+        from myloware.agents.classifier import classify_request_async
+
+        backend = FakeAsyncChatBackend({"intent": "help", "confidence": 0.8})
+        first = await classify_request_async(backend, "How does this work?")
+        second = await classify_request_async(backend, "  how does   this work ")
+
+        assert backend.calls == 1
+        assert second == first
+        second.intent = "unknown"  # callers get copies, not the cached object
+        third = await classify_request_async(backend, "how does this work")
+        assert third.intent == "help"
+        assert backend.calls == 1
+
+    @pytest.mark.anyio
+    async def test_classify_async_does_not_cache_failures(self):
+        from myloware.agents.classifier import classify_request_async
+
+        backend = FakeAsyncChatBackend(exc=RuntimeError("API unavailable"))
+        with pytest.raises(RuntimeError):
+            await classify_request_async(backend, "how does this work")
+
+        backend.exc = None
+        backend.payload = {"intent": "help"}
+        result = await classify_request_async(backend, "how does this work")
+        assert result.intent == "help"
+        assert backend.calls == 2
+
+    @pytest.mark.anyio
+    async def test_classify_async_rule_hit_skips_llm(self):
+        from myloware.agents.classifier import CLASSIFIER_REQUESTS, classify_request_async
+
+        before = CLASSIFIER_REQUESTS.labels(source="rules")._value.get()
+        backend = FakeAsyncChatBackend(exc=AssertionError("LLM should not be called"))
+        result = await classify_request_async(backend, "show my runs")
+
+        assert result.intent == "list_runs"
+        assert backend.calls == 0
+        assert CLASSIFIER_REQUESTS.labels(source="rules")._value.get() == before + 1
+
+
+RUN_ID = "3f2b8c1e-9a4d-4b6f-8e2a-1c0d5e7f9a3b"
+
+
+class TestRuleClassifier:
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            ("help", {"intent": "help"}),
+            ("/help", {"intent": "help"}),
+            ("list my runs", {"intent": "list_runs"}),
+            ("approve ideation", {"intent": "approve_gate", "gate": "ideation"}),
+            (
+                f"Approve publish for run {RUN_ID.upper()}",
+                {"intent": "approve_gate", "gate": "publish", "run_id": RUN_ID},
+            ),
+            (f"status {RUN_ID}", {"intent": "check_status", "run_id": RUN_ID}),
+            (
+                f"what's the status of {RUN_ID}?",
+                {"intent": "check_status", "run_id": RUN_ID},
+            ),
+            ("motivational", {"intent": "start_run", "project": "motivational"}),
+            (
+                "make an asmr video about candles",
+                {"intent": "start_run", "project": "aismr", "custom_object": "candles"},
+            ),
+        ],
+    )
+    def test_rule_hits(self, message, expected):
+        from myloware.agents.classifier import RULE_CONFIDENCE_THRESHOLD, rule_classify
+
+        result = rule_classify(message)
+
+        assert result is not None
+        for key, value in expected.items():
+            assert getattr(result, key) == value
+        assert result.confidence >= RULE_CONFIDENCE_THRESHOLD
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "",
+            "approve",  # no gate
+            "what's the status of abc-123",  # not a run UUID
+            "make a video",  # no project
+            "don't approve ideation",
+            "help me make an asmr video about candles",
+            "make a motivational video " + "and more " * 20,
+        ],
+    )
+    def test_rule_misses_fall_through(self, message):
+        from myloware.agents.classifier import rule_classify
+
+        assert rule_classify(message) is None
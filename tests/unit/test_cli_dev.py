@@ -91,7 +91,7 @@ class _FakeArtifactRepo:
     def __init__(self, _session, artifacts: list[_FakeArtifact]):  # type: ignore[no-untyped-def]
         self._artifacts = artifacts
 
-    def get_by_run(self, _run_id):  # type: ignore[no-untyped-def]
+    def get_by_run(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
         return list(self._artifacts)
 
 
@@ -54,6 +54,52 @@ def test_runs_watch_completes(monkeypatch) -> None:
     assert "finished" in result.output.lower()
 
 
+def test_runs_watch_streams_server_events(monkeypatch) -> None:
+    lines = [
+        "retry: 1000",
+        "",
+        "event: status",
+        'data: {"status": "running", "current_step": "ideation"}',
+        "",
+        ":keepalive",
+        "event: artifact",
+        'data: {"artifact_type": "ideas", "persona": "ideator"}',
+        "",
+        "event: status",
+        'data: {"status": "completed", "current_step": null}',
+        "",
+        "event: end",
+        "data: {}",
+    ]
+    seen: dict[str, object] = {}
+
+    @contextmanager
+    def fake_stream(method: str, url: str, **kwargs):  # type: ignore[no-untyped-def]
+        seen.update(method=method, url=url, headers=kwargs["headers"])
+        yield SimpleNamespace(
+            status_code=200, raise_for_status=lambda: None, iter_lines=lambda: iter(lines)
+        )
+
+    def no_db():  # type: ignore[no-untyped-def]
+        raise AssertionError("watch should not poll the database")
+
+    monkeypatch.setattr(runs_cli.httpx, "stream", fake_stream)
+    monkeypatch.setattr(runs_cli, "get_session", no_db)
+
+    run_id = str(uuid4())
+    result = CliRunner().invoke(
+        runs_cli.runs,
+        ["watch", run_id, "--base-url", "http://api:8000/", "--api-key", "k"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert seen["url"] == f"http://api:8000/v1/runs/{run_id}/events"
+    assert seen["headers"]["X-API-Key"] == "k"
+    assert "ideation" in result.output
+    assert "ideas" in result.output
+    assert "finished" in result.output.lower()
+
+
 def test_runs_resume_wraps_anyio_errors(monkeypatch) -> None:
     def fake_anyio_run(*_a, **_kw):  # type: ignore[no-untyped-def]
         raise RuntimeError("boom")
@@ -247,7 +293,7 @@ def test_runs_artifacts_empty_and_truncation(monkeypatch) -> None:
         def __init__(self, _session):  # type: ignore[no-untyped-def]
             return None
 
-        def get_by_run(self, _run_uuid):  # type: ignore[no-untyped-def]
+        def get_by_run(self, _run_uuid, **_kwargs):  # type: ignore[no-untyped-def]
             return []
 
     monkeypatch.setattr(runs_cli, "ArtifactRepository", FakeArtifactRepoEmpty)
@@ -258,7 +304,7 @@ def test_runs_artifacts_empty_and_truncation(monkeypatch) -> None:
         def __init__(self, _session):  # type: ignore[no-untyped-def]
             return None
 
-        def get_by_run(self, _run_uuid):  # type: ignore[no-untyped-def]
+        def get_by_run(self, _run_uuid, **_kwargs):  # type: ignore[no-untyped-def]
             return [
                 SimpleNamespace(
                     artifact_type=ArtifactType.EDITOR_OUTPUT.value,
@@ -350,7 +396,7 @@ def test_runs_artifacts_editor_output_truncates(monkeypatch) -> None:
         def __init__(self, _session):  # type: ignore[no-untyped-def]
             return None
 
-        def get_by_run(self, _run_uuid):  # type: ignore[no-untyped-def]
+        def get_by_run(self, _run_uuid, **_kwargs):  # type: ignore[no-untyped-def]
             return [
                 SimpleNamespace(
                     artifact_type=ArtifactType.EDITOR_OUTPUT.value,
@@ -373,7 +419,7 @@ def test_runs_artifacts_producer_output_truncates(monkeypatch) -> None:
         def __init__(self, _session):  # type: ignore[no-untyped-def]
             return None
 
-        def get_by_run(self, _run_uuid):  # type: ignore[no-untyped-def]
+        def get_by_run(self, _run_uuid, **_kwargs):  # type: ignore[no-untyped-def]
             return [
                 SimpleNamespace(
                     artifact_type=ArtifactType.PRODUCER_OUTPUT.value,
@@ -0,0 +1,138 @@
+"""Unit tests for transcode-time keyframe, contact sheet and palette extraction."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+from uuid import UUID
+
+import pytest
+
+from myloware.services import clip_previews
+from myloware.services.clip_previews import ClipPreviews, dominant_palette, extract_clip_previews
+from myloware.services.transcode import TranscodeService, clip_preview_metadata
+
+
+def test_dominant_palette_orders_by_share() -> None:
+    pixels = bytes([250, 10, 10] * 3 + [10, 10, 240])
+
+    palette = dominant_palette(pixels, colors=5)
+
+    assert palette == [
+        {"hex": "#fa0a0a", "ratio": 0.75},
+        {"hex": "#0a0af0", "ratio": 0.25},
+    ]
+    assert dominant_palette(pixels, colors=1) == palette[:1]
+    assert dominant_palette(b"") == []
+
+
+def test_extract_clip_previews_builds_keyframes_sheet_and_palette(tmp_path, monkeypatch) -> None:
+    calls: list[list[str]] = []
+
+    def fake_run(cmd: list[str], timeout: int) -> subprocess.CompletedProcess[bytes]:
+        calls.append(cmd)
+        out = cmd[-1]
+        if out.endswith("_kf%02d.jpg"):
+            for i in range(1, 5):
+                Path(out.replace("%02d", f"{i:02d}")).write_bytes(b"jpg")
+        elif out.endswith("_sheet.jpg"):
+            Path(out).write_bytes(b"sheet")
+        stdout = bytes([0, 128, 0] * 4) if out == "-" else b""
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=b"")
+
+    monkeypatch.setattr(
+        clip_previews.shutil, "which", lambda name: "/usr/bin/ffmpeg" if name == "ffmpeg" else None
+    )
+    monkeypatch.setattr(clip_previews, "_run", fake_run)
+
+    previews = extract_clip_previews(tmp_path / "clip.mp4", tmp_path, "clip", frame_count=4)
+
+    assert previews is not None
+    assert [p.name for p in previews.keyframe_paths] == [f"clip_kf0{i}.jpg" for i in range(1, 5)]
+    assert previews.contact_sheet_path == tmp_path / "clip_sheet.jpg"
+    assert previews.palette == [{"hex": "#008000", "ratio": 1.0}]
+    # Without ffprobe the clip is sampled at 1 fps; 4 frames tile as 2x2.
+    assert "fps=1/1.000,scale=320:-2" in calls[0]
+    assert "tile=2x2" in calls[1]
+
+
+def test_extract_clip_previews_skips_without_ffmpeg(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(clip_previews.shutil, "which", lambda _name: None)
+
+    assert extract_clip_previews(tmp_path / "clip.mp4", tmp_path, "clip") is None
+
+
+@pytest.mark.asyncio
+async def test_transcode_publishes_previews_and_writes_sidecar(tmp_path, monkeypatch) -> None:
+    from myloware.config import settings
+
+    monkeypatch.setattr(settings, "transcode_output_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "transcode_storage_backend", "local")
+    monkeypatch.setattr(settings, "transcode_previews_enabled", True)
+    monkeypatch.setattr(settings, "webhook_base_url", "https://api.example.com")
+    monkeypatch.setattr(settings, "transcode_allow_file_urls", True)
+
+    run_id = UUID("00000000-0000-0000-0000-000000000039")
+    source = tmp_path / "input.mp4"
+    source.write_bytes(b"x")
+    service = TranscodeService(output_dir=str(tmp_path))
+
+    def fake_local(_in: Path, out: Path) -> bool:
+        out.write_bytes(b"y")
+        return True
+
+    def fake_extract(video_path: Path, output_dir: Path, stem: str, **_kw) -> ClipPreviews:
+        sheet = output_dir / f"{stem}_sheet.jpg"
+        sheet.write_bytes(b"sheet")
+        return ClipPreviews(
+            keyframe_paths=[output_dir / f"{stem}_kf01.jpg"],
+            contact_sheet_path=sheet,
+            palette=[{"hex": "#112233", "ratio": 1.0}],
+        )
+
+    with (
+        patch.object(service, "_transcode_with_local_ffmpeg", side_effect=fake_local),
+        patch("myloware.services.transcode.extract_clip_previews", side_effect=fake_extract),
+    ):
+        result = await service.transcode(source.as_uri(), run_id, video_index=2)
+
+    assert result.success is True
+    base = "https://api.example.com/v1/media/transcoded"
+    assert result.previews == {
+        "keyframes": [f"{base}/sora_{run_id}_2_kf01.jpg"],
+        "contact_sheet": f"{base}/sora_{run_id}_2_sheet.jpg",
+        "palette": [{"hex": "#112233", "ratio": 1.0}],
+    }
+    assert clip_preview_metadata(run_id, 2) == {"previews": result.previews}
+    assert clip_preview_metadata(run_id, 3) == {}
+
+
+@pytest.mark.asyncio
+async def test_retranscode_without_previews_drops_stale_sidecar(tmp_path, monkeypatch) -> None:
+    from myloware.config import settings
+
+    monkeypatch.setattr(settings, "transcode_output_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "transcode_storage_backend", "local")
+    monkeypatch.setattr(settings, "transcode_previews_enabled", True)
+    monkeypatch.setattr(settings, "transcode_allow_file_urls", True)
+
+    run_id = UUID("00000000-0000-0000-0000-000000000039")
+    (tmp_path / f"sora_{run_id}_2.previews.json").write_text('{"contact_sheet": "/old.jpg"}')
+    source = tmp_path / "input.mp4"
+    source.write_bytes(b"x")
+    service = TranscodeService(output_dir=str(tmp_path))
+
+    def fake_local(_in: Path, out: Path) -> bool:
+        out.write_bytes(b"y")
+        return True
+
+    with (
+        patch.object(service, "_transcode_with_local_ffmpeg", side_effect=fake_local),
+        patch("myloware.services.transcode.extract_clip_previews", return_value=None),
+    ):
+        result = await service.transcode(source.as_uri(), run_id, video_index=2)
+
+    assert result.success is True
+    assert result.previews is None
+    assert clip_preview_metadata(run_id, 2) == {}
@@ -105,3 +105,40 @@ def test_list_available_projects_includes_json_and_yaml_dirs(monkeypatch, tmp_pa
     (p1 / "config.yaml").write_text("k: v\n")
 
     assert mod.list_available_projects() == ["a", "p1"]
+
+
+def test_load_agent_config_caches_until_mtime_changes(monkeypatch, tmp_path) -> None:
+    import os
+
+    from myloware.config import loaders as mod
+
+    monkeypatch.setattr(mod, "SHARED_PATH", tmp_path / "shared")
+    monkeypatch.setattr(mod, "PROJECTS_PATH", tmp_path / "projects")
+    base_path = mod.SHARED_PATH / "agents" / "ideator.yaml"
+    base_path.parent.mkdir(parents=True)
+    base_path.write_text("instructions: v1\n")
+
+    calls: list[object] = []
+    real_load_yaml = mod.load_yaml
+    monkeypatch.setattr(mod, "load_yaml", lambda p: calls.append(p) or real_load_yaml(p))
+
+    first = mod.load_agent_config("p1", "ideator")
+    first["instructions"] = "mutated by caller"
+    assert mod.load_agent_config("p1", "ideator")["instructions"] == "v1"
+    assert len(calls) == 1
+
+    base_path.write_text("instructions: v2\n")
+    stat = base_path.stat()
+    os.utime(base_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert mod.load_agent_config("p1", "ideator")["instructions"] == "v2"
+    assert len(calls) == 2
+
+    # A newly added project override also invalidates the cached merge.
+    override_path = mod.PROJECTS_PATH / "p1" / "agents" / "ideator.yaml"
+    override_path.parent.mkdir(parents=True)
+    override_path.write_text("instructions: project\n")
+    assert mod.load_agent_config("p1", "ideator")["instructions"] == "project"
+
+    mod.clear_agent_config_cache()
+    mod.load_agent_config("p1", "ideator")
+    assert len(calls) == 6
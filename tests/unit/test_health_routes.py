@@ -61,7 +61,7 @@ async def test_health_langgraph_reports_unhealthy(async_client, monkeypatch) ->
 @pytest.mark.anyio
 async def test_health_db_reports_unhealthy_when_engine_raises(async_client, monkeypatch) -> None:
     monkeypatch.setattr(
-        "myloware.storage.database.get_engine",
+        "myloware.storage.database.get_async_engine",
         lambda: (_ for _ in ()).throw(RuntimeError("db down")),
     )
     resp = await async_client.get("/health/db")
@@ -76,20 +76,23 @@ async def test_health_db_reports_healthy_and_migrations_up_to_date(
     async_client, monkeypatch
 ) -> None:
     class FakeConn:
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def execute(self, _stmt):
+        async def execute(self, _stmt):
             return None
 
+        async def run_sync(self, fn):
+            return fn(self)
+
     class FakeEngine:
         def connect(self):
             return FakeConn()
 
-    monkeypatch.setattr("myloware.storage.database.get_engine", lambda: FakeEngine())
+    monkeypatch.setattr("myloware.storage.database.get_async_engine", lambda: FakeEngine())
 
     class FakeMigrationContext:
         @staticmethod
@@ -121,20 +124,23 @@ async def test_health_db_reports_healthy_and_migrations_up_to_date(
 @pytest.mark.anyio
 async def test_health_db_reports_pending_migrations(async_client, monkeypatch) -> None:
     class FakeConn:
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def execute(self, _stmt):
+        async def execute(self, _stmt):
             return None
 
+        async def run_sync(self, fn):
+            return fn(self)
+
     class FakeEngine:
         def connect(self):
             return FakeConn()
 
-    monkeypatch.setattr("myloware.storage.database.get_engine", lambda: FakeEngine())
+    monkeypatch.setattr("myloware.storage.database.get_async_engine", lambda: FakeEngine())
 
     class FakeMigrationContext:
         @staticmethod
@@ -164,9 +170,12 @@ async def test_health_db_reports_pending_migrations(async_client, monkeypatch) -
 
 @pytest.mark.anyio
 async def test_health_stuck_runs_endpoint(async_client, monkeypatch) -> None:
+    async def fake_get_stuck_runs(timeout_minutes=60):
+        return [{"run_id": "r1", "minutes_waiting": timeout_minutes}]
+
     monkeypatch.setattr(
-        "myloware.workflows.cleanup.get_stuck_runs",
-        lambda timeout_minutes=60: [{"run_id": "r1", "minutes_waiting": timeout_minutes}],
+        "myloware.workflows.cleanup.get_stuck_runs_async",
+        fake_get_stuck_runs,
     )
     resp = await async_client.get("/health/stuck-runs?timeout_minutes=5")
     assert resp.status_code == 200
@@ -178,15 +187,21 @@ async def test_health_stuck_runs_endpoint(async_client, monkeypatch) -> None:
 @pytest.mark.anyio
 async def test_health_cleanup_stuck_runs_endpoint(async_client, monkeypatch) -> None:
     timed_out = [uuid4()]
+
+    async def fake_timeout_stuck_runs(timeout_minutes=60, dry_run=True):
+        return timed_out
+
     monkeypatch.setattr(
-        "myloware.workflows.cleanup.timeout_stuck_runs",
-        lambda timeout_minutes=60, dry_run=True: timed_out,
+        "myloware.workflows.cleanup.timeout_stuck_runs_async",
+        fake_timeout_stuck_runs,
     )
     resp = await async_client.post("/health/cleanup-stuck-runs?timeout_minutes=1&dry_run=false")
     assert resp.status_code == 200
     payload = resp.json()
     assert payload["dry_run"] is False
     assert payload["timed_out_run_ids"] == [str(timed_out[0])]
+    assert payload["pruned_budget_counters"] == 0
+    assert payload["purged_safety_verdicts"] == 0
 
 
 @pytest.mark.anyio
@@ -207,20 +222,23 @@ async def test_health_full_returns_200_when_all_dependencies_healthy(
     app.state.knowledge_base_error = None
 
     class FakeConn:
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def execute(self, _stmt):
+        async def execute(self, _stmt):
             return None
 
+        async def run_sync(self, fn):
+            return fn(self)
+
     class FakeEngine:
         def connect(self):
             return FakeConn()
 
-    monkeypatch.setattr("myloware.storage.database.get_engine", lambda: FakeEngine())
+    monkeypatch.setattr("myloware.storage.database.get_async_engine", lambda: FakeEngine())
 
     class FakeAsyncClient:
         def __init__(self, *args, **kwargs):
@@ -250,6 +268,7 @@ async def test_health_full_returns_200_when_all_dependencies_healthy(
     assert payload["llama_stack"] == "healthy"
     assert payload["safety_shield"] == "healthy"
     assert payload["knowledge_base"] == "healthy"
+    assert "hit_rate" in payload["safety_verdict_cache"]
 
 
 @pytest.mark.anyio
@@ -273,20 +292,23 @@ async def test_health_full_returns_503_when_circuit_breaker_open(async_client, m
     monkeypatch.setattr(app.state, "knowledge_base_error", None, raising=False)
 
     class FakeConn:
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def execute(self, _stmt):
+        async def execute(self, _stmt):
             return None
 
+        async def run_sync(self, fn):
+            return fn(self)
+
     class FakeEngine:
         def connect(self):
             return FakeConn()
 
-    monkeypatch.setattr("myloware.storage.database.get_engine", lambda: FakeEngine())
+    monkeypatch.setattr("myloware.storage.database.get_async_engine", lambda: FakeEngine())
 
     class FakeAsyncClient:
         def __init__(self, *args, **kwargs):
@@ -350,7 +372,7 @@ async def test_health_full_marks_database_unhealthy(async_client, monkeypatch) -
 
     monkeypatch.setattr(httpx, "AsyncClient", FakeAsyncClient)
     monkeypatch.setattr(
-        "myloware.storage.database.get_engine",
+        "myloware.storage.database.get_async_engine",
         lambda: (_ for _ in ()).throw(RuntimeError("db down")),
     )
 
@@ -378,20 +400,23 @@ async def test_health_full_marks_llama_stack_unhealthy_for_non_200(
     monkeypatch.setattr(app.state, "knowledge_base_error", None, raising=False)
 
     class FakeConn:
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def execute(self, _stmt):
+        async def execute(self, _stmt):
             return None
 
+        async def run_sync(self, fn):
+            return fn(self)
+
     class FakeEngine:
         def connect(self):
             return FakeConn()
 
-    monkeypatch.setattr("myloware.storage.database.get_engine", lambda: FakeEngine())
+    monkeypatch.setattr("myloware.storage.database.get_async_engine", lambda: FakeEngine())
 
     class FakeAsyncClient:
         def __init__(self, *args, **kwargs):
@@ -438,20 +463,23 @@ async def test_health_full_marks_llama_stack_unreachable_on_exception(
     monkeypatch.setattr(app.state, "knowledge_base_error", None, raising=False)
 
     class FakeConn:
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def execute(self, _stmt):
+        async def execute(self, _stmt):
             return None
 
+        async def run_sync(self, fn):
+            return fn(self)
+
     class FakeEngine:
         def connect(self):
             return FakeConn()
 
-    monkeypatch.setattr("myloware.storage.database.get_engine", lambda: FakeEngine())
+    monkeypatch.setattr("myloware.storage.database.get_async_engine", lambda: FakeEngine())
 
     class FakeAsyncClient:
         def __init__(self, *args, **kwargs):
@@ -496,20 +524,23 @@ async def test_health_full_marks_shield_unhealthy_for_non_200(async_client, monk
     monkeypatch.setattr(app.state, "knowledge_base_error", None, raising=False)
 
     class FakeConn:
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def execute(self, _stmt):
+        async def execute(self, _stmt):
             return None
 
+        async def run_sync(self, fn):
+            return fn(self)
+
     class FakeEngine:
         def connect(self):
             return FakeConn()
 
-    monkeypatch.setattr("myloware.storage.database.get_engine", lambda: FakeEngine())
+    monkeypatch.setattr("myloware.storage.database.get_async_engine", lambda: FakeEngine())
 
     class FakeAsyncClient:
         def __init__(self, *args, **kwargs):
@@ -554,20 +585,23 @@ async def test_health_full_marks_shield_unreachable_on_exception(async_client, m
     monkeypatch.setattr(app.state, "knowledge_base_error", None, raising=False)
 
     class FakeConn:
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def execute(self, _stmt):
+        async def execute(self, _stmt):
             return None
 
+        async def run_sync(self, fn):
+            return fn(self)
+
     class FakeEngine:
         def connect(self):
             return FakeConn()
 
-    monkeypatch.setattr("myloware.storage.database.get_engine", lambda: FakeEngine())
+    monkeypatch.setattr("myloware.storage.database.get_async_engine", lambda: FakeEngine())
 
     class FakeAsyncClient:
         def __init__(self, *args, **kwargs):
@@ -614,20 +648,23 @@ async def test_health_full_kb_degraded_is_visible_but_does_not_fail(
     monkeypatch.setattr(app.state, "knowledge_base_error", "kb down", raising=False)
 
     class FakeConn:
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def execute(self, _stmt):
+        async def execute(self, _stmt):
             return None
 
+        async def run_sync(self, fn):
+            return fn(self)
+
     class FakeEngine:
         def connect(self):
             return FakeConn()
 
-    monkeypatch.setattr("myloware.storage.database.get_engine", lambda: FakeEngine())
+    monkeypatch.setattr("myloware.storage.database.get_async_engine", lambda: FakeEngine())
 
     class FakeAsyncClient:
         def __init__(self, *args, **kwargs):
@@ -675,20 +712,23 @@ async def test_health_full_kb_unknown_when_state_missing(async_client, monkeypat
         monkeypatch.delattr(app.state, "knowledge_base_error", raising=False)
 
     class FakeConn:
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def execute(self, _stmt):
+        async def execute(self, _stmt):
             return None
 
+        async def run_sync(self, fn):
+            return fn(self)
+
     class FakeEngine:
         def connect(self):
             return FakeConn()
 
-    monkeypatch.setattr("myloware.storage.database.get_engine", lambda: FakeEngine())
+    monkeypatch.setattr("myloware.storage.database.get_async_engine", lambda: FakeEngine())
 
     class FakeAsyncClient:
         def __init__(self, *args, **kwargs):
@@ -732,20 +772,23 @@ async def test_health_full_kb_not_checked_without_request_app(monkeypatch) -> No
     monkeypatch.setattr(settings, "content_safety_shield_id", "shield-1")
 
     class FakeConn:
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def execute(self, _stmt):
+        async def execute(self, _stmt):
             return None
 
+        async def run_sync(self, fn):
+            return fn(self)
+
     class FakeEngine:
         def connect(self):
             return FakeConn()
 
-    monkeypatch.setattr("myloware.storage.database.get_engine", lambda: FakeEngine())
+    monkeypatch.setattr("myloware.storage.database.get_async_engine", lambda: FakeEngine())
 
     class FakeAsyncClient:
         def __init__(self, *args, **kwargs):
@@ -789,20 +832,23 @@ async def test_health_full_kb_check_failed_on_state_error(monkeypatch) -> None:
     monkeypatch.setattr(settings, "content_safety_shield_id", "shield-1")
 
     class FakeConn:
-        def __enter__(self):
+        async def __aenter__(self):
             return self
 
-        def __exit__(self, exc_type, exc, tb):
+        async def __aexit__(self, exc_type, exc, tb):
             return False
 
-        def execute(self, _stmt):
+        async def execute(self, _stmt):
             return None
 
+        async def run_sync(self, fn):
+            return fn(self)
+
     class FakeEngine:
         def connect(self):
             return FakeConn()
 
-    monkeypatch.setattr("myloware.storage.database.get_engine", lambda: FakeEngine())
+    monkeypatch.setattr("myloware.storage.database.get_async_engine", lambda: FakeEngine())
 
     class FakeAsyncClient:
         def __init__(self, *args, **kwargs):
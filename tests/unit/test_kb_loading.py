@@ -51,3 +51,53 @@ def test_guardrail_summary_falls_back_to_str_for_non_dict(monkeypatch) -> None:
     monkeypatch.setattr(guardrails_mod, "load_guardrails", lambda _p: {"x": ["a", "b"]})
     summary = guardrails_mod.get_guardrail_summary("p")
     assert "['a', 'b']" in summary
+
+
+def test_diff_manifest_classifies_files_by_content_hash() -> None:
+    from myloware.knowledge.loader import diff_manifest
+
+    previous = {
+        "files": [
+            {"path": "a.md", "sha256": "1", "file_id": "f-a"},
+            {"path": "b.md", "sha256": "2", "file_id": "f-b"},
+            {"path": "c.md", "sha256": "3", "file_id": "f-c"},
+        ]
+    }
+    current = {
+        "files": [
+            {"path": "a.md", "sha256": "1"},
+            {"path": "b.md", "sha256": "2b"},
+            {"path": "d.md", "sha256": "4"},
+        ]
+    }
+
+    diff = diff_manifest(previous, current)
+
+    assert [e["path"] for e in diff.added] == ["d.md"]
+    assert [e["path"] for e in diff.changed] == ["b.md"]
+    assert [e["file_id"] for e in diff.superseded] == ["f-b"]
+    assert [e["file_id"] for e in diff.removed] == ["f-c"]
+    assert [e["file_id"] for e in diff.unchanged] == ["f-a"]
+    assert diff_manifest(current, current).is_empty
+
+
+def test_manifest_hash_tracks_content_not_mtime() -> None:
+    docs, manifest = load_documents_with_manifest(project_id=None)
+
+    assert all(entry.get("sha256") for entry in manifest["files"])
+    assert {doc.metadata["source_path"] for doc in docs} == {
+        entry["path"] for entry in manifest["files"]
+    }
+
+
+def test_manifest_is_saved_at_configured_path(monkeypatch, tmp_path) -> None:
+    from myloware.knowledge import loader
+
+    target = tmp_path / "state" / "kb_manifest.json"
+    monkeypatch.setattr(loader.settings, "kb_manifest_path", str(target))
+
+    loader.save_manifest({"hash": "abc", "files": []})
+
+    assert target.is_file()
+    assert loader.load_manifest() == {"hash": "abc", "files": []}
+    assert not (loader.ROOT / "data" / ".kb_manifest.json").exists()
@@ -1,5 +1,8 @@
 """Unit tests for knowledge base setup."""
 
+import itertools
+import threading
+import time
 from unittest.mock import Mock
 from pathlib import Path
 from types import SimpleNamespace
@@ -552,3 +555,216 @@ def test_search_vector_store_returns_empty_list_on_error(monkeypatch):
 
     results = kb_setup.search_vector_store(mock_client, "vs1", "hello")
     assert results == []
+
+
+def test_search_vector_store_caches_until_manifest_changes(monkeypatch, tmp_path):
+    from myloware.knowledge import loader
+    from myloware.knowledge import setup as kb_setup
+
+    monkeypatch.setattr(loader.settings, "kb_manifest_path", str(tmp_path / "kb_manifest.json"))
+    monkeypatch.setattr(kb_setup, "log_knowledge_retrieval", lambda **_kwargs: None)
+    loader.save_manifest({"hash": "v1", "vector_store_id": "vs1", "files": []})
+    mock_client = Mock()
+    mock_client.vector_stores.search.return_value = SimpleNamespace(data=["pacing"])
+    hits = kb_setup.KB_SEARCH_CACHE.labels(result="hit")
+    before = hits._value.get()
+
+    first = kb_setup.search_vector_store(mock_client, "vs1", "ASMR pacing guidelines")
+    again = kb_setup.search_vector_store(mock_client, "vs1", "  asmr  PACING guidelines")
+    other_store = kb_setup.search_vector_store(mock_client, "vs2", "ASMR pacing guidelines")
+    # Punctuation is part of the query.
+    question = kb_setup.search_vector_store(mock_client, "vs1", "ASMR pacing guidelines?")
+
+    assert first == again == other_store == question == ["pacing"]
+    assert mock_client.vector_stores.search.call_count == 3
+    assert hits._value.get() == before + 1
+
+    # A KB sync rewrites the manifest; the next lookup misses.
+    loader.save_manifest({"hash": "v2-longer", "vector_store_id": "vs1", "files": []})
+    kb_setup.search_vector_store(mock_client, "vs1", "ASMR pacing guidelines")
+    assert mock_client.vector_stores.search.call_count == 4
+
+    # Failures are not cached.
+    mock_client.vector_stores.search.side_effect = RuntimeError("down")
+    assert kb_setup.search_vector_store(mock_client, "vs1", "new question") == []
+    mock_client.vector_stores.search.side_effect = None
+    assert kb_setup.search_vector_store(mock_client, "vs1", "new question") == ["pacing"]
+
+
+class _FakeKBClient:
+    """In-memory files + vector store API covering what sync_project_knowledge uses."""
+
+    def __init__(self, *, supports_detach: bool = True) -> None:
+        self.stores: dict[str, dict] = {}
+        self.uploads: list[str] = []
+        self.deleted_files: list[str] = []
+        self.batches: list[int] = []
+        self._ids = itertools.count(1)
+        client = self
+
+        def _files_create(*, file, purpose):  # type: ignore[no-untyped-def]
+            client.uploads.append(file[0])
+            return SimpleNamespace(id=f"file-{next(client._ids)}")
+
+        def _store_create(*, name, file_ids=None, **_kw):  # type: ignore[no-untyped-def]
+            store_id = f"vs-{len(client.stores) + 1}"
+            client.stores[store_id] = {"name": name, "files": list(file_ids or [])}
+            return SimpleNamespace(id=store_id)
+
+        def _store_list():  # type: ignore[no-untyped-def]
+            return [SimpleNamespace(id=k, name=v["name"]) for k, v in client.stores.items()]
+
+        def _detach(file_id, *, vector_store_id):  # type: ignore[no-untyped-def]
+            if not supports_detach:
+                raise RuntimeError("not implemented")
+            client.stores[vector_store_id]["files"].remove(file_id)
+
+        def _attach_batch(*, vector_store_id, file_ids):  # type: ignore[no-untyped-def]
+            client.batches.append(len(file_ids))
+            client.stores[vector_store_id]["files"].extend(file_ids)
+
+        def _attach(*, vector_store_id, file_id):  # type: ignore[no-untyped-def]
+            client.stores[vector_store_id]["files"].append(file_id)
+
+        self.files = SimpleNamespace(create=_files_create, delete=self.deleted_files.append)
+        self.vector_stores = SimpleNamespace(
+            create=_store_create,
+            list=_store_list,
+            delete=lambda store_id: client.stores.pop(store_id),
+            files=SimpleNamespace(
+                delete=_detach,
+                create=_attach,
+                list=lambda vector_store_id: list(client.stores[vector_store_id]["files"]),
+            ),
+            file_batches=SimpleNamespace(create=_attach_batch),
+        )
+
+
+def _kb_corpus(**contents: str) -> tuple[list[dict], dict]:
+    from myloware.knowledge.loader import content_digest
+
+    docs = [
+        {
+            "id": name,
+            "content": text,
+            "metadata": {"filename": f"{name}.md", "source_path": f"data/knowledge/{name}.md"},
+        }
+        for name, text in contents.items()
+    ]
+    manifest = {
+        "hash": "|".join(f"{n}:{content_digest(t)}" for n, t in contents.items()),
+        "files": [
+            {"path": f"data/knowledge/{n}.md", "size": len(t), "sha256": content_digest(t)}
+            for n, t in contents.items()
+        ],
+    }
+    return docs, manifest
+
+
+def test_sync_project_knowledge_uploads_only_the_delta() -> None:
+    from myloware.knowledge.setup import sync_project_knowledge
+
+    client = _FakeKBClient()
+    docs, manifest = _kb_corpus(a="alpha", b="beta", c="gamma")
+    first = sync_project_knowledge(client, "proj", docs, manifest)
+    assert first.mode == "full"
+    assert first.uploaded == 3
+    store_id = first.vector_store_id
+    ids = {e["path"]: e["file_id"] for e in first.manifest["files"]}
+
+    # Edit b, delete c, add d.
+    client.uploads.clear()
+    docs, manifest = _kb_corpus(a="alpha", b="beta v2", d="delta")
+    second = sync_project_knowledge(client, "proj", docs, manifest, previous=first.manifest)
+
+    assert second.mode == "incremental"
+    assert second.vector_store_id == store_id
+    assert sorted(client.uploads) == ["b.md", "d.md"]
+    assert (second.uploaded, second.removed, second.skipped) == (2, 2, 1)
+    assert second.embedding_chunks_saved == 1
+    assert sorted(client.deleted_files) == sorted(
+        [ids["data/knowledge/b.md"], ids["data/knowledge/c.md"]]
+    )
+    new_ids = {e["path"]: e["file_id"] for e in second.manifest["files"]}
+    assert new_ids["data/knowledge/a.md"] == ids["data/knowledge/a.md"]
+    assert sorted(client.stores[store_id]["files"]) == sorted(new_ids.values())
+    assert second.manifest["last_sync"]["skipped"] == 1
+
+    client.uploads.clear()
+    third = sync_project_knowledge(client, "proj", docs, manifest, previous=second.manifest)
+    assert third.mode == "unchanged"
+    assert client.uploads == []
+
+
+def test_sync_project_knowledge_adopts_store_without_manifest() -> None:
+    from myloware.knowledge.setup import sync_project_knowledge
+
+    client = _FakeKBClient()
+    docs, manifest = _kb_corpus(a="alpha")
+    sync_project_knowledge(client, "proj", docs, manifest)
+    client.uploads.clear()
+
+    adopted = sync_project_knowledge(client, "proj", docs, manifest, previous=None)
+
+    assert adopted.mode == "adopted"
+    assert client.uploads == []
+    assert adopted.manifest["vector_store_id"] == adopted.vector_store_id
+
+
+def test_sync_project_knowledge_rebuilds_when_detach_unsupported(monkeypatch) -> None:
+    from myloware.knowledge import setup as kb_setup
+
+    monkeypatch.setattr(kb_setup.time, "sleep", lambda *_a, **_k: None)
+    client = _FakeKBClient(supports_detach=False)
+    docs, manifest = _kb_corpus(a="alpha", b="beta")
+    first = kb_setup.sync_project_knowledge(client, "proj", docs, manifest)
+    client.uploads.clear()
+
+    docs, manifest = _kb_corpus(a="alpha", b="beta v2")
+    second = kb_setup.sync_project_knowledge(
+        client, "proj", docs, manifest, previous=first.manifest
+    )
+
+    assert second.mode == "full"
+    assert sorted(client.uploads) == ["a.md", "b.md"]
+    assert list(client.stores) == [second.vector_store_id]
+
+
+def test_sync_uploads_in_parallel_and_attaches_in_batches(monkeypatch) -> None:
+    from myloware.config import settings
+    from myloware.knowledge import setup as kb_setup
+
+    monkeypatch.setattr(settings, "kb_parallel_reads", 4)
+    monkeypatch.setattr(settings, "kb_upload_batch_size", 3)
+    client = _FakeKBClient()
+    lock = threading.Lock()
+    active = peak = 0
+    upload = client.files.create
+
+    def slow_upload(**kwargs):  # type: ignore[no-untyped-def]
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return upload(**kwargs)
+
+    client.files.create = slow_upload
+    docs, manifest = _kb_corpus(**{f"d{i}": f"text {i}" for i in range(8)})
+
+    result = kb_setup.sync_project_knowledge(client, "proj", docs, manifest)
+
+    assert result.uploaded == 8
+    assert peak == 4
+    # Store created with the first batch; the rest attached batch by batch.
+    assert len(client.stores[result.vector_store_id]["files"]) == 8
+    assert client.batches == [3, 2]
+    # Per-file upload ids stay aligned with their documents despite threading.
+    ids = [e["file_id"] for e in result.manifest["files"]]
+    assert len(set(ids)) == 8
+    last_sync = result.manifest["last_sync"]
+    assert last_sync["parallelism"] == 4
+    assert len(last_sync["slowest_files"]) == 5
+    assert last_sync["slowest_files"][0]["seconds"] >= 0.02
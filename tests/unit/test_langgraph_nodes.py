@@ -52,8 +52,8 @@ def mock_agent():
 
 
 @pytest.mark.asyncio
-@patch("myloware.workflows.langgraph.nodes.get_sync_client")
-@patch("myloware.workflows.langgraph.nodes.create_agent")
+@patch("myloware.workflows.langgraph.nodes.get_async_client")
+@patch("myloware.workflows.langgraph.nodes.create_async_agent")
 @patch("myloware.workflows.langgraph.nodes.check_agent_output")
 @patch("myloware.workflows.langgraph.nodes.extract_content")
 async def test_ideation_node_success(
@@ -90,9 +90,9 @@ async def test_ideation_node_success(
         yield mock_run_repo, mock_artifact_repo, mock_db_session
 
     with patch("myloware.workflows.langgraph.nodes._get_repositories_async", fake_repos):
-        with patch("myloware.workflows.langgraph.nodes.agent_session") as mock_session_ctx:
-            mock_session_ctx.return_value.__enter__.return_value = "session-123"
-            mock_session_ctx.return_value.__exit__.return_value = None
+        with patch("myloware.workflows.langgraph.nodes.agent_session_async") as mock_session_ctx:
+            mock_session_ctx.return_value.__aenter__.return_value = "session-123"
+            mock_session_ctx.return_value.__aexit__.return_value = None
 
             result = await ideation_node(mock_state)
 
@@ -198,9 +198,8 @@ async def test_production_node_fake_success(monkeypatch):
         yield run_repo, artifact_repo, session
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *args, **kwargs: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *args, **kwargs: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
     )
@@ -238,7 +237,6 @@ async def test_production_node_no_ideas(monkeypatch):
         yield run_repo, artifact_repo, session
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
 
     result = await nodes.production_node(state)
@@ -367,9 +365,8 @@ async def test_editing_node_fake_mode_returns_final_url(monkeypatch):
         return url
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
     )
@@ -427,9 +424,8 @@ async def test_editing_node_real_mode_requires_remotion_tool(monkeypatch):
         return url
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
     )
@@ -445,18 +441,18 @@ async def test_editing_node_real_mode_requires_remotion_tool(monkeypatch):
     )
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(output_text="out", steps=[], result=None), []
 
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "out")
 
     result = await nodes.editing_node(state)
@@ -494,9 +490,8 @@ async def test_publishing_node_fake_mode_returns_published_url(monkeypatch):
         yield run_repo, artifact_repo, session
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(nodes.settings, "disable_background_workflows", True)
 
     result = await nodes.publishing_node(state)
@@ -531,9 +526,8 @@ async def test_publishing_node_real_mode_requires_upload_post(monkeypatch):
         yield run_repo, artifact_repo, session
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
     )
@@ -544,18 +538,18 @@ async def test_publishing_node_real_mode_requires_upload_post(monkeypatch):
     )
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(output_text="out", steps=[], result=None), []
 
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "out")
 
     result = await nodes.publishing_node(state)
@@ -630,10 +624,10 @@ async def test_publishing_node_real_mode_immediate_publish(monkeypatch):
         yield run_repo, artifact_repo, session
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
     tool_payloads = [
@@ -643,13 +637,12 @@ async def test_publishing_node_real_mode_immediate_publish(monkeypatch):
         }
     ]
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(output_text="out", steps=[], result=None), tool_payloads
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
     )
@@ -661,8 +654,8 @@ async def test_publishing_node_real_mode_immediate_publish(monkeypatch):
     monkeypatch.setattr(
         "myloware.workflows.langgraph.prompts.build_publisher_prompt", lambda **_k: "prompt"
     )
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "out")
 
     result = await nodes.publishing_node(state)
@@ -700,10 +693,10 @@ async def test_publishing_node_real_mode_polls_status_url(monkeypatch):
         yield run_repo, artifact_repo, session
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
     tool_payloads = [
@@ -713,16 +706,15 @@ async def test_publishing_node_real_mode_polls_status_url(monkeypatch):
         }
     ]
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(output_text="out", steps=[], result=None), tool_payloads
 
     monkeypatch.setattr(
         nodes, "_poll_upload_post_status", AsyncMock(return_value=(["https://pub"], None, {}))
     )
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
     )
@@ -734,8 +726,8 @@ async def test_publishing_node_real_mode_polls_status_url(monkeypatch):
     monkeypatch.setattr(
         "myloware.workflows.langgraph.prompts.build_publisher_prompt", lambda **_k: "prompt"
     )
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "out")
 
     result = await nodes.publishing_node(state)
@@ -773,10 +765,10 @@ async def test_publishing_node_real_mode_poll_error(monkeypatch):
         yield run_repo, artifact_repo, session
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
     tool_payloads = [
@@ -786,16 +778,15 @@ async def test_publishing_node_real_mode_poll_error(monkeypatch):
         }
     ]
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(output_text="out", steps=[], result=None), tool_payloads
 
     monkeypatch.setattr(
         nodes, "_poll_upload_post_status", AsyncMock(return_value=([], "failed", {}))
     )
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
     )
@@ -807,8 +798,8 @@ async def test_publishing_node_real_mode_poll_error(monkeypatch):
     monkeypatch.setattr(
         "myloware.workflows.langgraph.prompts.build_publisher_prompt", lambda **_k: "prompt"
     )
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "out")
 
     result = await nodes.publishing_node(state)
@@ -843,9 +834,8 @@ async def test_publishing_node_input_safety_failure(monkeypatch):
         yield run_repo, artifact_repo, session
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=False, reason="no"))
     )
@@ -884,7 +874,6 @@ async def test_ideation_node_run_not_found_uses_thread_id(monkeypatch):
         yield run_repo, artifact_repo, session
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
 
     async def fake_sleep(_t):  # type: ignore[no-untyped-def]
@@ -915,9 +904,8 @@ async def test_ideation_node_input_safety_failure(monkeypatch):
         yield run_repo, artifact_repo, session
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=False, reason="no"))
     )
@@ -957,21 +945,20 @@ async def test_production_node_tool_execution_error(monkeypatch):
         yield run_repo, artifact_repo, session
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
     tool_payloads = [{"tool_name": "sora_generate", "content": "Error when running tool: boom"}]
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(output_text="out", steps=[], result=None), tool_payloads
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
     )
@@ -980,15 +967,10 @@ async def test_production_node_tool_execution_error(monkeypatch):
     )
     monkeypatch.setattr(nodes, "effective_llama_stack_provider", lambda _s: "real")
     monkeypatch.setattr(nodes.settings, "disable_background_workflows", False)
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "out")
 
-    async def fake_run_sync(fn, *a, **k):  # type: ignore[no-untyped-def]
-        return fn(*a, **k)
-
-    monkeypatch.setattr(nodes.anyio.to_thread, "run_sync", fake_run_sync)
-
     result = await nodes.production_node(state)
     assert result["status"] == RunStatus.FAILED.value
     assert "Failed to submit" in result["error"]
@@ -1025,19 +1007,18 @@ async def test_production_node_missing_tool_execution(monkeypatch):
         yield run_repo, artifact_repo, session
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(output_text="out", steps=[], result=None), []
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
     )
@@ -1046,15 +1027,10 @@ async def test_production_node_missing_tool_execution(monkeypatch):
     )
     monkeypatch.setattr(nodes, "effective_llama_stack_provider", lambda _s: "real")
     monkeypatch.setattr(nodes.settings, "disable_background_workflows", False)
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "out")
 
-    async def fake_run_sync(fn, *a, **k):  # type: ignore[no-untyped-def]
-        return fn(*a, **k)
-
-    monkeypatch.setattr(nodes.anyio.to_thread, "run_sync", fake_run_sync)
-
     result = await nodes.production_node(state)
     assert result["status"] == RunStatus.FAILED.value
     assert "sora_generate" in result["error"]
@@ -1090,23 +1066,22 @@ async def test_publishing_node_output_safety_failure(monkeypatch):
         yield run_repo, artifact_repo, session
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
     tool_payloads = [
         {"tool_name": "upload_post", "content": '{"data": {"published_url": "https://pub"}}'}
     ]
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(output_text="out", steps=[], result=None), tool_payloads
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
     )
@@ -1120,8 +1095,8 @@ async def test_publishing_node_output_safety_failure(monkeypatch):
     monkeypatch.setattr(
         "myloware.workflows.langgraph.prompts.build_publisher_prompt", lambda **_k: "prompt"
     )
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "out")
 
     result = await nodes.publishing_node(state)
@@ -1158,24 +1133,23 @@ async def test_publishing_node_request_id_builds_status_url(monkeypatch):
         yield run_repo, artifact_repo, session
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
     tool_payloads = [{"tool_name": "upload_post", "content": {"data": {"request_id": "req"}}}]
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(output_text="out", steps=[], result=None), tool_payloads
 
     monkeypatch.setattr(
         nodes, "_poll_upload_post_status", AsyncMock(return_value=(["https://pub"], None, {}))
     )
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
     )
@@ -1187,8 +1161,8 @@ async def test_publishing_node_request_id_builds_status_url(monkeypatch):
     monkeypatch.setattr(
         "myloware.workflows.langgraph.prompts.build_publisher_prompt", lambda **_k: "prompt"
     )
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "out")
     monkeypatch.setattr(nodes.settings, "upload_post_api_url", "https://uploadpost")
 
@@ -1273,9 +1247,8 @@ async def test_editing_node_fake_success(monkeypatch):
         specs = FakeSpecs()
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *args, **kwargs: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *args, **kwargs: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
     )
@@ -1386,9 +1359,8 @@ async def test_publishing_node_fake_success(monkeypatch):
         yield run_repo, artifact_repo, session
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *args, **kwargs: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *args, **kwargs: Mock())
     monkeypatch.setattr(nodes.settings, "disable_background_workflows", True)
 
     result = await nodes.publishing_node(state)
@@ -1420,20 +1392,17 @@ async def test_production_node_real_mode_with_tool_payloads(monkeypatch):
     session.commit = AsyncMock()
     session.rollback = AsyncMock()
 
-    from contextlib import asynccontextmanager, contextmanager
+    from contextlib import asynccontextmanager
 
     @asynccontextmanager
     async def fake_repos(_run_id: str):
         yield run_repo, artifact_repo, session
 
-    @contextmanager
-    def fake_agent_session(_client, _agent, _name):
+    @asynccontextmanager
+    async def fake_agent_session(_client, _agent, _name):
         yield "session"
 
-    async def fake_run_sync(func, *args, **kwargs):
-        return func(*args, **kwargs)
-
-    def fake_turn(*_args, **_kwargs):
+    async def fake_turn(*_args, **_kwargs):
         response = Mock()
         tool_payloads = [
             {"tool_name": "sora_generate", "content": {"task_ids": ["task-1", "task-2"]}}
@@ -1441,12 +1410,10 @@ async def test_production_node_real_mode_with_tool_payloads(monkeypatch):
         return response, tool_payloads
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *args, **kwargs: Mock())
-    monkeypatch.setattr(nodes, "agent_session", fake_agent_session)
-    monkeypatch.setattr(nodes.anyio.to_thread, "run_sync", fake_run_sync)
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_turn)
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *args, **kwargs: Mock())
+    monkeypatch.setattr(nodes, "agent_session_async", fake_agent_session)
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_turn)
     monkeypatch.setattr(nodes, "extract_content", lambda _resp: "producer output")
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
@@ -1496,20 +1463,17 @@ async def test_editing_node_real_mode_remotion_fake(monkeypatch):
     session.commit = AsyncMock()
     session.rollback = AsyncMock()
 
-    from contextlib import asynccontextmanager, contextmanager
+    from contextlib import asynccontextmanager
 
     @asynccontextmanager
     async def fake_repos(_run_id: str):
         yield run_repo, artifact_repo, session
 
-    @contextmanager
-    def fake_agent_session(_client, _agent, _name):
+    @asynccontextmanager
+    async def fake_agent_session(_client, _agent, _name):
         yield "session"
 
-    async def fake_run_sync(func, *args, **kwargs):
-        return func(*args, **kwargs)
-
-    def fake_turn(*_args, **_kwargs):
+    async def fake_turn(*_args, **_kwargs):
         response = Mock()
         tool_payloads = [
             {"tool_name": "remotion_render", "content": {"data": {"job_id": "job-123"}}}
@@ -1523,12 +1487,10 @@ async def test_editing_node_real_mode_remotion_fake(monkeypatch):
         specs = FakeSpecs()
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *args, **kwargs: Mock())
-    monkeypatch.setattr(nodes, "agent_session", fake_agent_session)
-    monkeypatch.setattr(nodes.anyio.to_thread, "run_sync", fake_run_sync)
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_turn)
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *args, **kwargs: Mock())
+    monkeypatch.setattr(nodes, "agent_session_async", fake_agent_session)
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_turn)
     monkeypatch.setattr(nodes, "extract_content", lambda _resp: "editor output")
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
@@ -1580,20 +1542,17 @@ async def test_publishing_node_real_mode_immediate_url(monkeypatch):
     session.commit = AsyncMock()
     session.rollback = AsyncMock()
 
-    from contextlib import asynccontextmanager, contextmanager
+    from contextlib import asynccontextmanager
 
     @asynccontextmanager
     async def fake_repos(_run_id: str):
         yield run_repo, artifact_repo, session
 
-    @contextmanager
-    def fake_agent_session(_client, _agent, _name):
+    @asynccontextmanager
+    async def fake_agent_session(_client, _agent, _name):
         yield "session"
 
-    async def fake_run_sync(func, *args, **kwargs):
-        return func(*args, **kwargs)
-
-    def fake_turn(*_args, **_kwargs):
+    async def fake_turn(*_args, **_kwargs):
         response = Mock()
         tool_payloads = [
             {
@@ -1606,12 +1565,10 @@ async def test_publishing_node_real_mode_immediate_url(monkeypatch):
         return response, tool_payloads
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *args, **kwargs: Mock())
-    monkeypatch.setattr(nodes, "agent_session", fake_agent_session)
-    monkeypatch.setattr(nodes.anyio.to_thread, "run_sync", fake_run_sync)
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_turn)
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *args, **kwargs: Mock())
+    monkeypatch.setattr(nodes, "agent_session_async", fake_agent_session)
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_turn)
     monkeypatch.setattr(nodes, "extract_content", lambda _resp: "publisher output")
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
@@ -1655,20 +1612,17 @@ async def test_publishing_node_real_mode_status_poll(monkeypatch):
     session.commit = AsyncMock()
     session.rollback = AsyncMock()
 
-    from contextlib import asynccontextmanager, contextmanager
+    from contextlib import asynccontextmanager
 
     @asynccontextmanager
     async def fake_repos(_run_id: str):
         yield run_repo, artifact_repo, session
 
-    @contextmanager
-    def fake_agent_session(_client, _agent, _name):
+    @asynccontextmanager
+    async def fake_agent_session(_client, _agent, _name):
         yield "session"
 
-    async def fake_run_sync(func, *args, **kwargs):
-        return func(*args, **kwargs)
-
-    def fake_turn(*_args, **_kwargs):
+    async def fake_turn(*_args, **_kwargs):
         response = Mock()
         tool_payloads = [
             {
@@ -1679,12 +1633,10 @@ async def test_publishing_node_real_mode_status_poll(monkeypatch):
         return response, tool_payloads
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *args, **kwargs: Mock())
-    monkeypatch.setattr(nodes, "agent_session", fake_agent_session)
-    monkeypatch.setattr(nodes.anyio.to_thread, "run_sync", fake_run_sync)
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_turn)
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *args, **kwargs: Mock())
+    monkeypatch.setattr(nodes, "agent_session_async", fake_agent_session)
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_turn)
     monkeypatch.setattr(nodes, "extract_content", lambda _resp: "publisher output")
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
@@ -1801,25 +1753,20 @@ async def test_ideation_node_output_safety_failure(monkeypatch):
         yield run_repo, artifact_repo, session
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(), []
 
-    async def fake_run_sync(fn, *a, **k):  # type: ignore[no-untyped-def]
-        return fn(*a, **k)
-
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
-    monkeypatch.setattr(nodes.anyio.to_thread, "run_sync", fake_run_sync)
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "ideas")
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
@@ -1860,25 +1807,20 @@ async def test_ideation_node_overlay_extractor_failure_and_status_update_error(m
         yield run_repo, artifact_repo, session
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(), []
 
-    async def fake_run_sync(fn, *a, **k):  # type: ignore[no-untyped-def]
-        return fn(*a, **k)
-
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
-    monkeypatch.setattr(nodes.anyio.to_thread, "run_sync", fake_run_sync)
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "ideas")
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
@@ -1933,10 +1875,10 @@ async def test_production_node_parses_tool_response_json_string(monkeypatch):
         yield run_repo, artifact_repo, session
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
     tool_payloads = [
@@ -1946,19 +1888,14 @@ async def test_production_node_parses_tool_response_json_string(monkeypatch):
         }
     ]
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(), tool_payloads
 
-    async def fake_run_sync(fn, *a, **k):  # type: ignore[no-untyped-def]
-        return fn(*a, **k)
-
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
-    monkeypatch.setattr(nodes.anyio.to_thread, "run_sync", fake_run_sync)
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "producer output")
     monkeypatch.setattr(nodes, "_strip_noise_for_safety", lambda _t: "producer output")
     monkeypatch.setattr(
@@ -2012,27 +1949,22 @@ async def test_production_node_falls_back_to_manifest_task_ids(monkeypatch):
         yield run_repo, artifact_repo, session
 
     class _SessionCtx:
-        def __enter__(self):  # type: ignore[no-untyped-def]
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
             return "sess"
 
-        def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
             return None
 
     tool_payloads = [{"tool_name": "other", "content": "noop"}]
 
-    def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
+    async def fake_collect(*_a, **_k):  # type: ignore[no-untyped-def]
         return SimpleNamespace(), tool_payloads
 
-    async def fake_run_sync(fn, *a, **k):  # type: ignore[no-untyped-def]
-        return fn(*a, **k)
-
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
-    monkeypatch.setattr(nodes, "agent_session", lambda *_a, **_k: _SessionCtx())
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_collect)
-    monkeypatch.setattr(nodes.anyio.to_thread, "run_sync", fake_run_sync)
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "agent_session_async", lambda *_a, **_k: _SessionCtx())
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_collect)
     monkeypatch.setattr(nodes, "extract_content", lambda _r: "producer output")
     monkeypatch.setattr(nodes, "_strip_noise_for_safety", lambda _t: "producer output")
     monkeypatch.setattr(
@@ -2077,7 +2009,6 @@ async def test_editing_node_no_video_clips_in_artifacts(monkeypatch):
         yield run_repo, artifact_repo, session
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
 
     result = await nodes.editing_node(state)
@@ -2127,9 +2058,8 @@ async def test_editing_node_input_safety_failure(monkeypatch):
         specs = FakeSpecs()
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *a, **k: Mock())
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *a, **k: Mock())
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=False, reason="no"))
     )
@@ -2182,20 +2112,17 @@ async def test_editing_node_parses_render_job_id_from_json_string(monkeypatch):
     session.commit = AsyncMock()
     session.rollback = AsyncMock()
 
-    from contextlib import asynccontextmanager, contextmanager
+    from contextlib import asynccontextmanager
 
     @asynccontextmanager
     async def fake_repos(_run_id: str):
         yield run_repo, artifact_repo, session
 
-    @contextmanager
-    def fake_agent_session(_client, _agent, _name):
+    @asynccontextmanager
+    async def fake_agent_session(_client, _agent, _name):
         yield "session"
 
-    async def fake_run_sync(func, *args, **kwargs):
-        return func(*args, **kwargs)
-
-    def fake_turn(*_args, **_kwargs):
+    async def fake_turn(*_args, **_kwargs):
         response = Mock()
         tool_payloads = [
             {"tool_name": "remotion_render", "content": '{"data": {"job_id": "job-999"}}'}
@@ -2209,12 +2136,10 @@ async def test_editing_node_parses_render_job_id_from_json_string(monkeypatch):
         specs = FakeSpecs()
 
     monkeypatch.setattr(nodes, "_get_repositories_async", fake_repos)
-    monkeypatch.setattr(nodes, "get_sync_client", lambda: Mock())
     monkeypatch.setattr(nodes, "get_async_client", lambda: Mock())
-    monkeypatch.setattr(nodes, "create_agent", lambda *args, **kwargs: Mock())
-    monkeypatch.setattr(nodes, "agent_session", fake_agent_session)
-    monkeypatch.setattr(nodes.anyio.to_thread, "run_sync", fake_run_sync)
-    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses", fake_turn)
+    monkeypatch.setattr(nodes, "create_async_agent", lambda *args, **kwargs: Mock())
+    monkeypatch.setattr(nodes, "agent_session_async", fake_agent_session)
+    monkeypatch.setattr(nodes, "create_turn_collecting_tool_responses_async", fake_turn)
     monkeypatch.setattr(nodes, "extract_content", lambda _resp: "editor output")
     monkeypatch.setattr(
         nodes, "check_agent_input", AsyncMock(return_value=SimpleNamespace(safe=True))
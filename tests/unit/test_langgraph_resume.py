@@ -23,7 +23,7 @@ class FakeArtifactRepo:
     def __init__(self, artifacts: list[FakeArtifact]) -> None:
         self._artifacts = artifacts
 
-    async def get_by_run_async(self, _run_id: UUID):  # type: ignore[no-untyped-def]
+    async def get_by_run_async(self, _run_id: UUID, **_kwargs):  # type: ignore[no-untyped-def]
         return list(self._artifacts)
 
 
@@ -87,7 +87,7 @@ class FakeArtifactRepo:
     def __init__(self, _session: FakeSession, artifacts: list[FakeArtifact]) -> None:
         self._artifacts = artifacts
 
-    async def get_by_run_async(self, _run_id: UUID):  # type: ignore[no-untyped-def]
+    async def get_by_run_async(self, _run_id: UUID, **_kwargs):  # type: ignore[no-untyped-def]
         return list(self._artifacts)
 
 
@@ -1036,7 +1036,7 @@ async def test_repair_sora_clips_rejects_unsafe_run_status(monkeypatch) -> None:
     run_repo = Repo(session, run=FakeRun(id=run_id, status=RunStatus.RUNNING.value))
 
     class ArtifactRepo(FakeArtifactRepo):
-        async def get_by_run_async(self, _run_id: UUID):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id: UUID, **_kwargs):  # type: ignore[no-untyped-def]
             raise AssertionError("Should not fetch artifacts for unsafe run status")
 
     monkeypatch.setattr(wf.settings, "sora_provider", "real")
@@ -167,6 +167,35 @@ def test_search_vector_store_maps_hits():
     assert hits[1].metadata == {}
 
 
+def test_search_vector_store_caches_hits_until_manifest_changes(monkeypatch, tmp_path):
+    from myloware.knowledge import loader
+
+    monkeypatch.setattr(loader.settings, "kb_manifest_path", str(tmp_path / "kb_manifest.json"))
+    loader.save_manifest({"hash": "v1", "vector_store_id": "vs1", "files": []})
+    mock_client = MagicMock()
+    mock_client.vector_stores.search.return_value = SimpleNamespace(
+        data=[SimpleNamespace(filename="doc.md", score=0.9, content="pacing", metadata={})]
+    )
+    backend = LlamaStackBackend(sync_client=mock_client)
+
+    first = backend.search_vector_store(vector_store_id="vs1", query="ASMR pacing")
+    again = backend.search_vector_store(vector_store_id="vs1", query=" asmr  pacing ")
+    assert first == again
+    assert first[0].content == "pacing"
+    assert mock_client.vector_stores.search.call_count == 1
+
+    loader.save_manifest({"hash": "v2-longer", "vector_store_id": "vs1", "files": []})
+    backend.search_vector_store(vector_store_id="vs1", query="ASMR pacing")
+    assert mock_client.vector_stores.search.call_count == 2
+
+    # Errors propagate and are not cached.
+    mock_client.vector_stores.search.side_effect = RuntimeError("down")
+    with pytest.raises(RuntimeError):
+        backend.search_vector_store(vector_store_id="vs1", query="new question")
+    mock_client.vector_stores.search.side_effect = None
+    assert backend.search_vector_store(vector_store_id="vs1", query="new question") == first
+
+
 def test_search_vector_store_includes_search_mode_and_ranking_options():
     mock_client = MagicMock()
     mock_client.vector_stores.search.return_value = SimpleNamespace(data=[])
@@ -67,3 +67,80 @@ async def test_public_demo_gate_requires_awaiting_status(async_client, monkeypat
         json={"comment": "reject"},
     )
     assert reject.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_public_demo_status_etag_and_cached_view(async_client, monkeypatch) -> None:
+    from myloware.api.routes import public_demo
+    from myloware.config.settings import settings
+    from myloware.storage.database import get_async_session_factory
+    from myloware.storage.models import ArtifactType
+    from myloware.storage.repositories import ArtifactRepository, RunRepository
+
+    monkeypatch.setattr(settings, "public_demo_enabled", True)
+    monkeypatch.setattr(settings, "public_demo_allowed_workflows", ["motivational"])
+    builds = 0
+    build_view = public_demo._build_public_demo_view
+
+    async def counting_build(run, artifact_repo):  # type: ignore[no-untyped-def]
+        nonlocal builds
+        builds += 1
+        return await build_view(run, artifact_repo)
+
+    monkeypatch.setattr(public_demo, "_build_public_demo_view", counting_build)
+
+    resp = await async_client.post("/v1/public/demo/start", json={"brief": "Keep going."})
+    token = resp.json()["public_token"]
+
+    first = await async_client.get(f"/v1/public/demo/runs/{token}")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"] == "no-cache"
+
+    again = await async_client.get(f"/v1/public/demo/runs/{token}", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+    assert builds == 1
+
+    async with get_async_session_factory()() as session:
+        run = await RunRepository(session).get_by_public_token_async(token)
+        await ArtifactRepository(session).create_async(run.id, "ideator", ArtifactType.IDEAS)
+        await session.commit()
+
+    changed = await async_client.get(
+        f"/v1/public/demo/runs/{token}", headers={"If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["activity"][0]["type"] == ArtifactType.IDEAS.value
+    assert builds == 2
+
+
+@pytest.mark.anyio
+async def test_render_progress_is_shared_across_concurrent_pollers(monkeypatch) -> None:
+    import asyncio
+
+    from myloware.api.routes import public_demo
+    from myloware.config.settings import settings
+
+    monkeypatch.setattr(settings, "public_demo_render_progress_ttl_seconds", 60.0)
+    calls = 0
+
+    async def fake_fetch(render_job_id: str):  # type: ignore[no-untyped-def]
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "rendering", 42
+
+    monkeypatch.setattr(public_demo, "_fetch_render_progress", fake_fetch)
+
+    results = await asyncio.gather(
+        *(public_demo._get_render_progress("job-1") for _ in range(1000))
+    )
+    assert calls == 1
+    assert set(results) == {("rendering", 42)}
+
+    await asyncio.gather(*(public_demo._get_render_progress("job-1") for _ in range(1000)))
+    assert calls == 1
+    assert await public_demo._get_render_progress("job-2") == ("rendering", 42)
+    assert calls == 2
@@ -208,7 +208,7 @@ def test_publish_tool_validate_result_requires_status_url_when_processing():
 @pytest.mark.asyncio
 async def test_publish_tool_idempotent_existing_publish(monkeypatch):
     from myloware.storage.database import get_async_session_factory
-    from myloware.storage.models import ArtifactType, RunStatus
+    from myloware.storage.models import ArtifactKeyKind, ArtifactType, RunStatus
     from myloware.storage.repositories import ArtifactRepository, RunRepository
     from myloware.config import settings
 
@@ -234,6 +234,7 @@ async def test_publish_tool_idempotent_existing_publish(monkeypatch):
                 "platform": "tiktok",
                 "account_id": "AISMR",
             },
+            keys=[(ArtifactKeyKind.PUBLISH_VIDEO_URL, "https://cdn.example/v.mp4")],
         )
         await session.commit()
 
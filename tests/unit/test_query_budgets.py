@@ -0,0 +1,307 @@
+"""SQL statement budgets for the busiest routes and job handlers.
+
+Budgets are pinned at the current statement counts. Seeded runs carry a full
+set of clips so a path that starts issuing per-artifact queries (or re-reads
+the run's artifacts one more time) fails here; raise a budget deliberately.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import json
+from uuid import UUID
+
+import pytest
+
+from myloware.api.routes import webhooks
+from myloware.config import settings
+from myloware.services.render_provider import RenderJob, RenderStatus
+from myloware.storage.database import get_async_session_factory
+from myloware.storage.models import ArtifactType, RunStatus
+from myloware.storage.repositories import (
+    ArtifactRepository,
+    JobRepository,
+    RunRepository,
+)
+from myloware.workers import handlers
+from myloware.workers.exceptions import JobReschedule
+from myloware.workers.job_types import (
+    JOB_REMOTION_POLL,
+    JOB_SORA_POLL,
+    JOB_WEBHOOK_REMOTION,
+    JOB_WEBHOOK_SORA,
+)
+
+CLIPS = 8
+TASKS = CLIPS + 2  # two Sora tasks still rendering
+
+
+async def _seed_run(status: RunStatus, *, public_token: str | None = None) -> UUID:
+    """A run mid-production: manifest, most clips, editor output and a render job id."""
+    async with get_async_session_factory()() as session:
+        run = await RunRepository(session).create_async(
+            "motivational",
+            "budget",
+            status=status,
+            public_demo=public_token is not None,
+            public_token=public_token,
+        )
+        repo = ArtifactRepository(session)
+        await repo.create_async(run.id, "ideator", ArtifactType.IDEAS, content="## Ideas\n" * 200)
+        mapping = {f"task-{i}": {"video_index": i} for i in range(TASKS)}
+        await repo.create_async(
+            run.id,
+            "producer",
+            ArtifactType.CLIP_MANIFEST,
+            content=json.dumps(mapping),
+            metadata={"type": "task_metadata_mapping", "task_count": TASKS},
+        )
+        for i in range(CLIPS):
+            await repo.create_async(
+                run.id,
+                "producer",
+                ArtifactType.VIDEO_CLIP,
+                uri=f"https://cdn.test/clip_{i}.mp4",
+                metadata={"task_id": f"task-{i}", "video_index": i},
+            )
+        await repo.create_async(
+            run.id,
+            "editor",
+            ArtifactType.EDITOR_OUTPUT,
+            content="editor transcript\n" * 500,
+            metadata={"render_job_id": "render-1"},
+        )
+        await session.commit()
+        return run.id
+
+
+async def _run_job(job_type: str, run_id: UUID, payload: dict) -> None:
+    async with get_async_session_factory()() as session:
+        await handlers.handle_job(
+            job_type=job_type,
+            run_id=run_id,
+            payload=payload,
+            session_run_repo=RunRepository(session),
+            session_artifact_repo=ArtifactRepository(session),
+            session_job_repo=JobRepository(session),
+            llama_client=object(),
+        )
+        await session.commit()
+
+
+# --- Routes -----------------------------------------------------------------
+
+
+@pytest.mark.anyio
+async def test_get_run_budget(async_client, api_headers, query_budget) -> None:
+    run_id = await _seed_run(RunStatus.AWAITING_RENDER)
+    with query_budget(1):
+        resp = await async_client.get(f"/v1/runs/{run_id}", headers=api_headers)
+    assert resp.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_start_run_budget(async_client, api_headers, query_budget) -> None:
+    with query_budget(3):
+        resp = await async_client.post(
+            "/v1/runs/start", json={"project": "aismr", "brief": "budget"}, headers=api_headers
+        )
+    assert resp.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_run_events_budget(async_client, api_headers, query_budget) -> None:
+    run_id = await _seed_run(RunStatus.COMPLETED)
+    with query_budget(3):
+        resp = await async_client.get(f"/v1/runs/{run_id}/events", headers=api_headers)
+    assert resp.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_public_demo_start_budget(async_client, monkeypatch, query_budget) -> None:
+    monkeypatch.setattr(settings, "public_demo_enabled", True)
+    monkeypatch.setattr(settings, "public_demo_allowed_workflows", ["motivational"])
+    with query_budget(2):
+        resp = await async_client.post("/v1/public/demo/start", json={"brief": "budget"})
+    assert resp.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_public_demo_status_budget(async_client, monkeypatch, query_budget) -> None:
+    monkeypatch.setattr(settings, "public_demo_enabled", True)
+    await _seed_run(RunStatus.AWAITING_VIDEO_GENERATION, public_token="budget-status")
+
+    # Run, artifact stamp, three latest-by-type lookups and the body-less artifact list.
+    with query_budget(6):
+        first = await async_client.get("/v1/public/demo/runs/budget-status")
+    assert first.status_code == 200
+
+    # Revalidation with an unchanged run is served from the view cache.
+    with query_budget(2):
+        again = await async_client.get(
+            "/v1/public/demo/runs/budget-status", headers={"If-None-Match": first.headers["etag"]}
+        )
+    assert again.status_code == 304
+
+
+@pytest.mark.anyio
+async def test_public_demo_approve_budget(async_client, monkeypatch, query_budget) -> None:
+    monkeypatch.setattr(settings, "public_demo_enabled", True)
+    monkeypatch.setattr(settings, "disable_background_workflows", False)
+    monkeypatch.setattr(settings, "workflow_dispatcher", "db")
+    await _seed_run(RunStatus.AWAITING_IDEATION_APPROVAL, public_token="budget-approve")
+
+    with query_budget(8):
+        resp = await async_client.post(
+            "/v1/public/demo/runs/budget-approve/approve", json={"comment": "ok"}
+        )
+    assert resp.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_sora_webhook_budget(async_client, monkeypatch, query_budget) -> None:
+    monkeypatch.setattr(settings, "disable_background_workflows", False)
+    monkeypatch.setattr(settings, "workflow_dispatcher", "db")
+    run_id = await _seed_run(RunStatus.AWAITING_VIDEO_GENERATION)
+    payload = {
+        "code": 200,
+        "data": {
+            "taskId": "task-new",
+            "state": "success",
+            "info": {"resultUrls": ["https://cdn.test/new.mp4"]},
+            "metadata": {"videoIndex": 0},
+        },
+    }
+    # With the DB dispatcher the route only enqueues; the job does the artifact work.
+    with query_budget(1):
+        resp = await async_client.post(f"/v1/webhooks/sora?run_id={run_id}", json=payload)
+    assert resp.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_sora_webhook_inline_budget(async_client, monkeypatch, query_budget) -> None:
+    monkeypatch.setattr(settings, "disable_background_workflows", False)
+    monkeypatch.setattr(settings, "workflow_dispatcher", "inprocess")
+    run_id = await _seed_run(RunStatus.AWAITING_VIDEO_GENERATION)
+
+    async def _transcode(url: str, run_id: UUID, video_index: int) -> str:
+        return f"https://cdn.test/transcoded_{video_index}.mp4"
+
+    monkeypatch.setattr(webhooks, "transcode_video", _transcode)
+    payload = {
+        "code": 200,
+        "data": {
+            "taskId": "task-8",
+            "state": "success",
+            "info": {"resultUrls": ["https://cdn.test/new.mp4"]},
+            "metadata": {"videoIndex": 8},
+        },
+    }
+    # In-process dispatch: the route stores the clip and counts the run's clips itself.
+    with query_budget(8):
+        resp = await async_client.post(f"/v1/webhooks/sora?run_id={run_id}", json=payload)
+    assert resp.status_code == 200
+    assert resp.json()["status"] == "accepted"
+
+
+@pytest.mark.anyio
+async def test_remotion_webhook_budget(async_client, monkeypatch, query_budget) -> None:
+    monkeypatch.setattr(settings, "disable_background_workflows", False)
+    monkeypatch.setattr(settings, "workflow_dispatcher", "db")
+    monkeypatch.setattr(settings, "use_fake_providers", False)
+    monkeypatch.setattr(settings, "remotion_provider", "real")
+    monkeypatch.setattr(settings, "remotion_webhook_secret", "secret")
+    run_id = await _seed_run(RunStatus.AWAITING_RENDER)
+
+    body = json.dumps(
+        {"status": "done", "output_url": "https://cdn.test/final.mp4", "job_id": "render-1"}
+    ).encode()
+    digest = hmac.new(b"secret", body, hashlib.sha512).hexdigest()
+    with query_budget(4):
+        resp = await async_client.post(
+            f"/v1/webhooks/remotion?run_id={run_id}",
+            content=body,
+            headers={"X-Remotion-Signature": f"sha512={digest}"},
+        )
+    assert resp.status_code == 200
+
+
+@pytest.mark.anyio
+async def test_health_db_budget(async_client, query_budget) -> None:
+    # SELECT 1 plus the alembic revision lookup (two PRAGMAs on SQLite).
+    with query_budget(3):
+        resp = await async_client.get("/health/db")
+    assert resp.status_code == 200
+
+
+# --- Job handlers -----------------------------------------------------------
+
+
+@pytest.mark.anyio
+async def test_sora_poll_job_budget(async_client, monkeypatch, query_budget) -> None:
+    monkeypatch.setattr(settings, "use_fake_providers", False)
+    monkeypatch.setattr(settings, "sora_provider", "real")
+    run_id = await _seed_run(RunStatus.AWAITING_VIDEO_GENERATION)
+
+    async def _in_progress(task_id: str) -> dict:
+        return {"id": task_id, "status": "in_progress", "progress": 50}
+
+    monkeypatch.setattr(handlers, "retrieve_openai_video_job", _in_progress)
+    with query_budget(3), pytest.raises(JobReschedule):
+        await _run_job(JOB_SORA_POLL, run_id, {})
+
+
+@pytest.mark.anyio
+async def test_remotion_poll_job_budget(async_client, monkeypatch, query_budget) -> None:
+    monkeypatch.setattr(settings, "use_fake_providers", False)
+    monkeypatch.setattr(settings, "remotion_provider", "real")
+    monkeypatch.setattr(settings, "remotion_service_url", "http://remotion.test")
+    run_id = await _seed_run(RunStatus.AWAITING_RENDER)
+
+    async def _rendering(self, job_id: str) -> RenderJob:  # type: ignore[no-untyped-def]
+        return RenderJob(job_id=job_id, status=RenderStatus.RENDERING, metadata={"progress": 0.5})
+
+    monkeypatch.setattr(handlers.LocalRemotionProvider, "get_status", _rendering)
+    with query_budget(3), pytest.raises(JobReschedule):
+        await _run_job(JOB_REMOTION_POLL, run_id, {})
+
+
+@pytest.mark.anyio
+async def test_webhook_sora_job_budget(async_client, monkeypatch, query_budget) -> None:
+    run_id = await _seed_run(RunStatus.AWAITING_VIDEO_GENERATION)
+    payload = {"code": 500, "status_msg": "content policy", "task_id": "task-0"}
+    with query_budget(2):
+        await _run_job(JOB_WEBHOOK_SORA, run_id, payload)
+
+
+@pytest.mark.anyio
+async def test_webhook_sora_job_success_budget(async_client, monkeypatch, query_budget) -> None:
+    run_id = await _seed_run(RunStatus.AWAITING_VIDEO_GENERATION)
+
+    async def _transcode(url: str, run_id: UUID, video_index: int) -> str:
+        return f"https://cdn.test/transcoded_{video_index}.mp4"
+
+    monkeypatch.setattr(handlers, "transcode_video", _transcode)
+    payload = {
+        "code": 200,
+        "state": "success",
+        "task_id": "task-8",
+        "video_index": 8,
+        "video_urls": ["https://cdn.test/new.mp4"],
+        "metadata": {"video_index": 8},
+    }
+    with query_budget(5):
+        await _run_job(JOB_WEBHOOK_SORA, run_id, payload)
+
+    async with get_async_session_factory()() as session:
+        artifacts = await ArtifactRepository(session).get_by_run_async(run_id)
+    assert sum(a.artifact_type == ArtifactType.VIDEO_CLIP.value for a in artifacts) == CLIPS + 1
+
+
+@pytest.mark.anyio
+async def test_webhook_remotion_job_budget(async_client, query_budget) -> None:
+    run_id = await _seed_run(RunStatus.AWAITING_RENDER)
+    payload = {"status": "done", "output_url": "https://cdn.test/final.mp4", "job_id": "render-2"}
+    with query_budget(2):
+        await _run_job(JOB_WEBHOOK_REMOTION, run_id, payload)
@@ -8,7 +8,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
-from myloware.storage.models import ArtifactType, Base, Job, JobStatus, RunStatus
+from myloware.storage.models import ArtifactKeyKind, ArtifactType, Base, Job, JobStatus, RunStatus
 from myloware.storage.repositories import (
     ArtifactRepository,
     AuditLogRepository,
@@ -81,6 +81,34 @@ def test_add_artifact(run_repo):
     assert updated.artifacts["ideas"] == "Some ideas here"
 
 
+def test_add_artifact_patches_one_key_without_rewriting_the_rest(run_repo, db_session):
+    from sqlalchemy import event
+
+    run = run_repo.create("aismr", "Test")
+    run_id = run.id
+    for i in range(200):
+        run_repo.add_artifact(run_id, f"clip_{i}", {"url": f"https://cdn/{i}.mp4" * 4})
+    db_session.commit()
+
+    params: list[object] = []
+    listener = lambda _c, _cur, _stmt, p, *_a: params.append(p)  # noqa: E731
+    event.listen(db_session.get_bind(), "before_cursor_execute", listener)
+    try:
+        run_repo.add_artifact(run_id, "video", "https://cdn/final.mp4")
+    finally:
+        event.remove(db_session.get_bind(), "before_cursor_execute", listener)
+    db_session.commit()
+
+    # Only the new entry is sent; the 200 existing clips aren't read back or rewritten.
+    assert len(params) == 1
+    assert len(repr(params[0])) < 300
+    db_session.expire_all()
+    stored = run_repo.get(run_id).artifacts
+    assert len(stored) == 201
+    assert stored["video"] == "https://cdn/final.mp4"
+    assert stored["clip_7"] == {"url": "https://cdn/7.mp4" * 4}
+
+
 def test_list_runs(run_repo):
     run_repo.create("aismr", "Test 1")
     run_repo.create("aismr", "Test 2")
@@ -242,6 +270,9 @@ async def test_find_run_for_sora_task_async(monkeypatch):
         def all(self):
             return self._artifacts
 
+        def scalar_one_or_none(self):
+            return None  # no ArtifactKey row: exercise the manifest scan fallback
+
     class FakeAsyncSession:
         async def execute(self, _query):  # type: ignore[no-untyped-def]
             return FakeResult(artifacts)
@@ -275,6 +306,120 @@ async def async_session():
     await engine.dispose()
 
 
+@pytest.mark.asyncio
+async def test_add_artifact_async_concurrent_writers_keep_every_entry(sqlite_session_factory):
+    import asyncio
+
+    Session = sqlite_session_factory
+    async with Session() as session:
+        run = await RunRepository(session).create_async("aismr", "brief")
+        await session.commit()
+
+    start = asyncio.Event()
+
+    async def writer(i: int) -> None:
+        async with Session() as session:
+            repo = RunRepository(session)
+            # Load the run first, as webhook handlers do, to provoke lost updates.
+            await repo.get_async(run.id)
+            await start.wait()
+            await repo.add_artifact_async(run.id, f"clip_{i}", {"index": i})
+            await session.commit()
+
+    tasks = [asyncio.create_task(writer(i)) for i in range(16)]
+    await asyncio.sleep(0.05)
+    start.set()
+    await asyncio.gather(*tasks)
+
+    async with Session() as session:
+        stored = (await RunRepository(session).get_async(run.id)).artifacts
+    assert stored == {f"clip_{i}": {"index": i} for i in range(16)}
+
+
+@pytest.mark.anyio
+async def test_concurrent_writers_of_one_artifact_key_do_not_conflict(sqlite_session_factory):
+    import asyncio
+
+    from sqlalchemy import select
+
+    from myloware.storage.models import ArtifactKey, ArtifactKeyKind
+
+    async with sqlite_session_factory() as session:
+        run = await RunRepository(session).create_async("aismr", "brief")
+        await session.commit()
+
+    start = asyncio.Event()
+    created: list = []
+
+    async def writer() -> None:
+        async with sqlite_session_factory() as session:
+            # Both writers check the cache before either has stored its result.
+            repo = ArtifactRepository(session)
+            assert await repo.get_by_key_async(run.id, ArtifactKeyKind.VISION_CACHE, "k") is None
+            await start.wait()
+            artifact = await repo.create_async(
+                run.id,
+                "editor",
+                ArtifactType.VISION_ANALYSIS,
+                content="{}",
+                keys=[(ArtifactKeyKind.VISION_CACHE, "k")],
+            )
+            await session.commit()
+            created.append(artifact.id)
+
+    tasks = [asyncio.create_task(writer()) for _ in range(4)]
+    await asyncio.sleep(0.05)
+    start.set()
+    await asyncio.gather(*tasks)
+
+    async with sqlite_session_factory() as session:
+        rows = (await session.execute(select(ArtifactKey))).scalars().all()
+    assert len(created) == 4
+    assert len(rows) == 1
+    assert rows[0].artifact_id in created
+
+
+@pytest.mark.asyncio
+async def test_large_artifact_content_is_compressed_and_not_loaded_by_listing(async_session):
+    import re
+
+    from sqlalchemy import event, select
+
+    from myloware.storage.models import ArtifactContent
+
+    run = await RunRepository(async_session).create_async("aismr", "Test")
+    repo = ArtifactRepository(async_session)
+    transcript = "producer: shot list for clip\n" * 2000
+    await repo.create_async(run.id, "producer", ArtifactType.PRODUCER_OUTPUT, content=transcript)
+    await repo.create_async(run.id, "ideator", ArtifactType.IDEAS, content="short ideas")
+    await async_session.commit()
+    async_session.expunge_all()
+
+    body = (await async_session.execute(select(ArtifactContent))).scalar_one()
+    assert len(body.data) < len(transcript) // 10
+    async_session.expunge_all()
+
+    statements: list[str] = []
+    listener = lambda _c, _cur, stmt, *_a: statements.append(stmt)  # noqa: E731
+    engine = async_session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        listed = await repo.get_by_run_async(run.id)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert [a.content_size for a in listed] == [len(transcript), len("short ideas")]
+    assert all("inline_content" not in a.__dict__ and "body" not in a.__dict__ for a in listed)
+    assert len(statements) == 1
+    assert "artifact_contents" not in statements[0]
+    assert re.search(r"artifacts\.content(?!_)", statements[0]) is None
+
+    async_session.expunge_all()
+    loaded = await repo.get_by_run_async(run.id, with_content=True)
+    assert [a.content for a in loaded] == [transcript, "short ideas"]
+    assert [a.content_encoding for a in loaded] == ["zlib", None]
+
+
 def test_find_by_status_and_age(run_repo):
     run = run_repo.create("aismr", "Test")
     run_repo.update_status(run.id, RunStatus.COMPLETED)
@@ -503,6 +648,40 @@ async def test_find_run_for_sora_task_async_empty_task(async_session):
     assert await repo.find_run_for_sora_task_async("") is None
 
 
+@pytest.mark.asyncio
+async def test_artifact_key_lookups(async_session):
+    run_repo = RunRepository(async_session)
+    repo = ArtifactRepository(async_session)
+    run_a = await run_repo.create_async(workflow_name="aismr", input="a")
+    run_b = await run_repo.create_async(workflow_name="aismr", input="b")
+
+    manifest = await repo.create_async(
+        run_id=run_a.id,
+        persona="producer",
+        artifact_type=ArtifactType.CLIP_MANIFEST,
+        content='{"task_1": {"video_index": 0}}',
+        metadata={"type": "task_metadata_mapping"},
+        keys=[(ArtifactKeyKind.SORA_IDEMPOTENCY, "idem"), (ArtifactKeyKind.SORA_TASK, "task_1")],
+    )
+    long_url = "https://cdn.example/" + "v" * 400
+    await repo.create_async(
+        run_id=run_b.id,
+        persona="publisher",
+        artifact_type=ArtifactType.PUBLISHED_URL,
+        uri="https://tiktok.com/@x/1",
+        keys=[(ArtifactKeyKind.PUBLISH_VIDEO_URL, long_url)],
+    )
+
+    found = await repo.get_by_key_async(run_a.id, ArtifactKeyKind.SORA_IDEMPOTENCY, "idem")
+    assert found is not None and found.id == manifest.id
+    assert await repo.get_by_key_async(run_b.id, ArtifactKeyKind.SORA_IDEMPOTENCY, "idem") is None
+    published = await repo.get_by_key_async(run_b.id, ArtifactKeyKind.PUBLISH_VIDEO_URL, long_url)
+    assert published is not None and published.uri == "https://tiktok.com/@x/1"
+
+    resolved = await repo.find_run_for_sora_task_async("task_1")
+    assert resolved == (run_a.id, {"video_index": 0})
+
+
 def test_dead_letter_repository_get_unresolved_filters_source(db_session, run_repo):
     repo = DeadLetterRepository(db_session)
     run = run_repo.create("aismr", "Test")
@@ -534,3 +713,54 @@ async def test_job_repository_type_errors(db_session):
         await repo.mark_succeeded_async(uuid.uuid4())
     with pytest.raises(TypeError):
         await repo.mark_failed_async(uuid.uuid4(), error="err")
+
+
+@pytest.mark.asyncio
+async def test_run_repo_list_async(async_session):
+    run_repo = RunRepository(async_session)
+    first = await run_repo.create_async("aismr", "one", user_id="u1")
+    second = await run_repo.create_async("aismr", "two", user_id="u2")
+    await async_session.commit()
+
+    runs = await run_repo.list_async(limit=10)
+    assert {r.id for r in runs} == {first.id, second.id}
+    only_u1 = await run_repo.list_async(user_id="u1")
+    assert [r.id for r in only_u1] == [first.id]
+
+
+@pytest.mark.asyncio
+async def test_chat_session_repository_async(async_session):
+    repo = ChatSessionRepository(async_session)
+    assert await repo.get_session_async("user-a") is None
+
+    await repo.create_or_update_session_async("user-a", "s1")
+    await repo.create_or_update_session_async("user-a", "s2")
+    await async_session.commit()
+    assert await repo.get_session_async("user-a") == "s2"
+
+    assert await repo.delete_session_async("user-a") is True
+    assert await repo.delete_session_async("user-a") is False
+
+
+@pytest.mark.asyncio
+async def test_audit_log_and_feedback_repositories_async(async_session):
+    run_repo = RunRepository(async_session)
+    run = await run_repo.create_async("aismr", "Test")
+    await async_session.commit()
+
+    audit = AuditLogRepository(async_session)
+    await audit.create_async(action="workflow_started", user_id="u1", run_id=run.id)
+    await audit.create_async(action="gate_approved", user_id="u1", run_id=run.id)
+    await async_session.commit()
+    assert [a.action for a in await audit.get_by_run_id_async(run.id)] == [
+        "workflow_started",
+        "gate_approved",
+    ]
+    assert len(await audit.get_by_user_id_async("u1", limit=1)) == 1
+
+    feedback = FeedbackRepository(async_session)
+    await feedback.create_async(run.id, rating=5)
+    await feedback.create_async(run.id, rating=1)
+    await async_session.commit()
+    positive = await feedback.get_positive_feedback_async()
+    assert [f.rating for f in positive] == [5]
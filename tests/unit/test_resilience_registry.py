@@ -0,0 +1,301 @@
+"""Unit tests for per-upstream bulkheads, guards and the resilient client proxy."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from typing import Any
+
+import httpx
+import pytest
+
+from myloware.resilience.bulkhead import Bulkhead, BulkheadFullError
+from myloware.resilience.circuit_breaker import CircuitBreakerError, CircuitState
+from myloware.resilience.registry import get_guard, resilience_snapshot
+
+
+@pytest.mark.anyio
+async def test_bulkhead_caps_concurrency_across_tasks() -> None:
+    bulkhead = Bulkhead("test", max_concurrent=2, max_wait=5.0)
+    active = 0
+    peak = 0
+
+    async def work() -> None:
+        nonlocal active, peak
+        async with bulkhead.slot_async():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(work() for _ in range(10)))
+
+    assert peak == 2
+    assert bulkhead.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_bulkhead_rejects_after_max_wait() -> None:
+    bulkhead = Bulkhead("test", max_concurrent=1, max_wait=0.05)
+    await bulkhead.acquire_async()
+
+    with pytest.raises(BulkheadFullError):
+        await bulkhead.acquire_async()
+
+    bulkhead.release()
+    assert bulkhead.in_flight == 0
+    assert bulkhead.waiting == 0
+
+
+@pytest.mark.anyio
+async def test_bulkhead_hands_slot_from_thread_to_async_waiter() -> None:
+    bulkhead = Bulkhead("test", max_concurrent=1, max_wait=2.0)
+    bulkhead.acquire()  # held by "another thread"
+
+    timer = threading.Timer(0.05, bulkhead.release)
+    timer.start()
+    await bulkhead.acquire_async()
+
+    assert bulkhead.in_flight == 1
+    bulkhead.release()
+    assert bulkhead.in_flight == 0
+
+
+def test_bulkhead_sync_waiter_gets_released_slot() -> None:
+    bulkhead = Bulkhead("test", max_concurrent=1, max_wait=2.0)
+    bulkhead.acquire()
+    threading.Timer(0.05, bulkhead.release).start()
+
+    with bulkhead.slot():
+        assert bulkhead.in_flight == 1
+    assert bulkhead.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_guards_are_isolated_per_upstream(monkeypatch) -> None:
+    from myloware.resilience import registry
+
+    monkeypatch.setattr(registry.settings, "circuit_breaker_failure_threshold", 1)
+
+    async def boom() -> None:
+        raise RuntimeError("remotion down")
+
+    with pytest.raises(RuntimeError):
+        await get_guard("remotion", "render").call_async(boom)
+
+    with pytest.raises(CircuitBreakerError):
+        await get_guard("remotion", "render").call_async(boom)
+
+    async def ok() -> str:
+        return "ok"
+
+    assert await get_guard("telegram", "send_message").call_async(ok) == "ok"
+    snapshot = resilience_snapshot()
+    assert snapshot["remotion:render"]["state"] == "open"
+    assert snapshot["telegram:send_message"]["state"] == "closed"
+
+
+@pytest.mark.anyio
+async def test_client_errors_do_not_trip_breaker(monkeypatch) -> None:
+    from myloware.resilience import registry
+
+    monkeypatch.setattr(registry.settings, "circuit_breaker_failure_threshold", 1)
+    guard = get_guard("openai_videos", "status")
+    request = httpx.Request("GET", "https://example.test")
+
+    for status in (404, 404):
+        with pytest.raises(httpx.HTTPStatusError):
+            async with guard.protect_async():
+                raise httpx.HTTPStatusError(
+                    "nope", request=request, response=httpx.Response(status, request=request)
+                )
+    assert guard.breaker.state is CircuitState.CLOSED
+
+    with pytest.raises(httpx.HTTPStatusError):
+        async with guard.protect_async():
+            raise httpx.HTTPStatusError(
+                "down", request=request, response=httpx.Response(503, request=request)
+            )
+    assert guard.breaker.state is CircuitState.OPEN
+
+
+@pytest.mark.anyio
+async def test_cancelled_calls_count_against_breaker(monkeypatch) -> None:
+    from myloware.resilience import registry
+
+    monkeypatch.setattr(registry.settings, "circuit_breaker_failure_threshold", 2)
+    monkeypatch.setattr(registry.settings, "circuit_breaker_recovery_timeout", 0.05)
+    guard = get_guard("remotion", "status")
+
+    async def hang() -> None:
+        await asyncio.sleep(60)
+
+    # A hung upstream whose callers time out trips the breaker.
+    for _ in range(2):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(guard.call_async(hang), timeout=0.01)
+    assert guard.breaker.state is CircuitState.OPEN
+
+    # A half-open probe cancelled by a caller timeout does not close it.
+    await asyncio.sleep(0.06)
+    assert guard.breaker.state is CircuitState.HALF_OPEN
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(guard.call_async(hang), timeout=0.01)
+    assert guard.breaker.state is CircuitState.OPEN
+
+
+def test_bulkhead_limits_come_from_settings(monkeypatch) -> None:
+    from myloware.resilience import registry
+
+    monkeypatch.setattr(registry.settings, "resilience_bulkhead_limits", {"s3": 3, "s3:upload": 1})
+
+    assert get_guard("s3", "upload").bulkhead.max_concurrent == 1
+    assert get_guard("s3", "presign").bulkhead.max_concurrent == 3
+    assert get_guard("unknown").bulkhead.max_concurrent == 32
+
+
+@pytest.mark.anyio
+async def test_resilient_client_caches_wrappers_and_awaits_async_methods() -> None:
+    from myloware.llama_clients import LlamaStackConnectionError, ResilientClient
+    from myloware.resilience.circuit_breaker import CircuitBreaker
+
+    class FakeResponses:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def create(self, **_kwargs):  # noqa: ANN201 - test double
+            self.calls += 1
+            raise RuntimeError("llama down")
+
+    class FakeAsyncClient:
+        def __init__(self) -> None:
+            self.responses = FakeResponses()
+
+    breaker = CircuitBreaker(name="test_llama_async", failure_threshold=1, recovery_timeout=60.0)
+    inner = FakeAsyncClient()
+    client = ResilientClient(inner, circuit_breaker=breaker)
+
+    assert client.responses is client.responses
+    assert client.responses.create is client.responses.create
+
+    with pytest.raises(RuntimeError, match="llama down"):
+        await client.responses.create(model="m")
+    with pytest.raises(LlamaStackConnectionError, match="Circuit breaker is open"):
+        await client.responses.create(model="m")
+
+    assert inner.responses.calls == 1
+
+
+class _FakeStream:
+    def __init__(self, chunks: list[Any], fail_after: int | None = None) -> None:
+        self.chunks = chunks
+        self.fail_after = fail_after
+        self.closed = False
+
+    def __aiter__(self):  # noqa: ANN204 - test double
+        return self._iterate()
+
+    async def _iterate(self):  # noqa: ANN202 - test double
+        for index, chunk in enumerate(self.chunks):
+            if self.fail_after is not None and index == self.fail_after:
+                raise RuntimeError("stream dropped")
+            yield chunk
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _streaming_client(stream: _FakeStream):  # noqa: ANN202 - test helper
+    from myloware.llama_clients import ResilientClient
+
+    class FakeCompletions:
+        async def create(self, **_kwargs):  # noqa: ANN201 - test double
+            return stream
+
+    class FakeChat:
+        completions = FakeCompletions()
+
+    class FakeAsyncClient:
+        chat = FakeChat()
+
+    return ResilientClient(FakeAsyncClient())
+
+
+@pytest.mark.anyio
+async def test_streamed_call_holds_guard_until_exhausted() -> None:
+    guard = get_guard("llama_stack", "responses")
+    client = _streaming_client(_FakeStream(["a", "b"]))
+
+    stream = await client.chat.completions.create(model="m", stream=True)
+    assert guard.bulkhead.in_flight == 1
+
+    assert [chunk async for chunk in stream] == ["a", "b"]
+    assert guard.bulkhead.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_mid_stream_failure_reaches_breaker(monkeypatch) -> None:
+    from myloware.resilience import registry
+
+    monkeypatch.setattr(registry.settings, "circuit_breaker_failure_threshold", 1)
+    guard = get_guard("llama_stack", "responses")
+    client = _streaming_client(_FakeStream(["a", "b"], fail_after=1))
+
+    stream = await client.chat.completions.create(model="m", stream=True)
+    with pytest.raises(RuntimeError, match="stream dropped"):
+        async for _chunk in stream:
+            pass
+
+    assert guard.bulkhead.in_flight == 0
+    assert guard.breaker.state is CircuitState.OPEN
+
+
+@pytest.mark.anyio
+async def test_async_chat_stream_releases_guard_when_consumer_stops_early() -> None:
+    from myloware.llama_clients import async_chat_stream
+
+    guard = get_guard("llama_stack", "responses")
+    fake = _FakeStream([SimpleNamespace(content=text) for text in ("a", "b", "c")])
+    client = _streaming_client(fake)
+
+    chunks = async_chat_stream([{"role": "user", "content": "hi"}], "m", client=client)
+    assert await chunks.__anext__() == "a"
+    assert guard.bulkhead.in_flight == 1
+    await chunks.aclose()
+
+    assert fake.closed
+    assert guard.bulkhead.in_flight == 0
+
+
+@pytest.mark.anyio
+async def test_llama_stack_endpoints_have_separate_guards(monkeypatch) -> None:
+    from myloware.llama_clients import LlamaStackConnectionError, ResilientClient
+    from myloware.resilience import registry
+
+    monkeypatch.setattr(registry.settings, "circuit_breaker_failure_threshold", 1)
+
+    class FakeSafety:
+        async def run_shield(self, **_kwargs):  # noqa: ANN201 - test double
+            raise RuntimeError("shield down")
+
+    class FakeResponses:
+        async def create(self, **_kwargs):  # noqa: ANN201 - test double
+            return "turn"
+
+    class FakeAsyncClient:
+        safety = FakeSafety()
+        responses = FakeResponses()
+
+    client = ResilientClient(FakeAsyncClient())
+    with pytest.raises(RuntimeError, match="shield down"):
+        await client.safety.run_shield(shield_id="s")
+    with pytest.raises(LlamaStackConnectionError, match="Circuit breaker is open"):
+        await client.safety.run_shield(shield_id="s")
+
+    # Agent turns keep flowing through their own, larger bulkhead.
+    assert await client.responses.create(model="m") == "turn"
+    snapshot = resilience_snapshot()
+    assert snapshot["llama_stack:safety"]["state"] == "open"
+    assert snapshot["llama_stack:responses"]["state"] == "closed"
+    assert snapshot["llama_stack:responses"]["limit"] == 512
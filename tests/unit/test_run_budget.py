@@ -0,0 +1,177 @@
+"""Unit tests for the hourly run budget counters behind start_run."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import create_engine, event, select
+
+from myloware.storage.models import Run, RunBudgetCounter
+from myloware.storage.repositories import RunBudgetRepository, RunRepository
+
+
+@pytest.mark.anyio
+async def test_counters_follow_the_run_transaction(sqlite_session_factory) -> None:
+    since = datetime.now(timezone.utc) - timedelta(hours=24)
+
+    async with sqlite_session_factory() as session:
+        await RunRepository(session).create_async("aismr", "rolled back", user_id="u1")
+        await session.rollback()
+    async with sqlite_session_factory() as session:
+        repo = RunRepository(session)
+        assert await repo.count_runs_since_async(since) == 0
+        await repo.create_async("aismr", "one", user_id="u1")
+        await repo.create_async("aismr", "two", user_id="u1")
+        await repo.create_async("motivational", "three", user_id="u2")
+        await session.commit()
+
+    async with sqlite_session_factory() as session:
+        repo = RunRepository(session)
+        assert await repo.count_runs_since_async(since) == 3
+        assert await repo.count_runs_since_async(since, user_id="u1") == 2
+        budget = RunBudgetRepository(session)
+        assert await budget.count_since_async(budget.workflow_scope("aismr"), since) == 2
+        rows = (await session.execute(select(RunBudgetCounter))).scalars().all()
+        # all + 2 workflows + 2 users (shared scopes striped), each in the current hour.
+        assert {row.scope.split("#")[0] for row in rows} == {
+            "all",
+            "workflow:aismr",
+            "workflow:motivational",
+            "user:u1",
+            "user:u2",
+        }
+        assert sum(row.count for row in rows if row.scope.startswith("all#")) == 3
+
+
+@pytest.mark.anyio
+async def test_counters_roll_off_after_a_day(sqlite_session_factory) -> None:
+    now = datetime.now(timezone.utc)
+    async with sqlite_session_factory() as session:
+        budget = RunBudgetRepository(session)
+        await budget.record_run_async(
+            workflow_name="aismr", user_id=None, created_at=now - timedelta(hours=30)
+        )
+        await budget.record_run_async(workflow_name="aismr", user_id=None, created_at=now)
+        await session.commit()
+
+        assert await budget.count_since_async("all", now - timedelta(hours=24)) == 1
+        assert await budget.prune_before_async(now - timedelta(hours=25)) == 2
+        await session.commit()
+
+
+@pytest.mark.anyio
+async def test_shared_scopes_are_striped_by_run_id(sqlite_session_factory) -> None:
+    since = datetime.now(timezone.utc) - timedelta(hours=24)
+    async with sqlite_session_factory() as session:
+        budget = RunBudgetRepository(session)
+        for stripe in range(3):
+            await budget.record_run_async(
+                workflow_name="aismr",
+                user_id="u1",
+                created_at=None,
+                run_id=uuid.UUID(int=stripe),
+            )
+        await session.commit()
+
+        scopes = set((await session.execute(select(RunBudgetCounter.scope))).scalars())
+        assert scopes == {
+            "all#0",
+            "all#1",
+            "all#2",
+            "workflow:aismr#0",
+            "workflow:aismr#1",
+            "workflow:aismr#2",
+            "user:u1",
+        }
+        assert await budget.count_since_async("all", since) == 3
+        assert await budget.count_since_async(budget.workflow_scope("aismr"), since) == 3
+        assert await budget.count_since_async(budget.user_scope("u1"), since) == 3
+
+
+@pytest.mark.anyio
+async def test_cleanup_prunes_counters_outside_the_budget_window(
+    sqlite_session_factory, monkeypatch
+) -> None:
+    from myloware.workflows import cleanup
+
+    monkeypatch.setattr(cleanup, "get_async_session_factory", lambda: sqlite_session_factory)
+    now = datetime.now(timezone.utc)
+    async with sqlite_session_factory() as session:
+        budget = RunBudgetRepository(session)
+        await budget.record_run_async(
+            workflow_name="aismr", user_id="u1", created_at=now - timedelta(hours=48)
+        )
+        await budget.record_run_async(workflow_name="aismr", user_id="u1", created_at=now)
+        await session.commit()
+
+    assert await cleanup.prune_run_budget_counters_async() == 3
+
+    async with sqlite_session_factory() as session:
+        assert await RunRepository(session).count_runs_since_async(now - timedelta(hours=24)) == 1
+        assert len((await session.execute(select(RunBudgetCounter))).scalars().all()) == 3
+
+
+@pytest.mark.anyio
+async def test_start_run_query_count_is_constant_as_runs_grow(tmp_path, monkeypatch) -> None:
+    from myloware.api.server import app
+    from myloware.config import settings
+    from myloware.storage.database import get_async_engine, init_async_db
+
+    db_path = tmp_path / "runs.db"
+    api_key = f"test-budget-{uuid.uuid4()}"
+    monkeypatch.setattr(settings, "database_url", f"sqlite+aiosqlite:///{db_path}")
+    monkeypatch.setattr(settings, "api_key", api_key)
+    monkeypatch.setattr(settings, "llama_stack_provider", "fake")
+    monkeypatch.setattr(settings, "disable_background_workflows", True)
+    monkeypatch.setattr(settings, "enable_safety_shields", False)
+    monkeypatch.setattr(settings, "max_runs_last_24h", 1_000_000)
+    monkeypatch.setattr(settings, "daily_cost_budget_usd", 0.0)
+    await init_async_db()
+
+    statements: list[str] = []
+    engine = get_async_engine()
+    listener = lambda _c, _cur, stmt, *_a: statements.append(stmt)  # noqa: E731
+    event.listen(engine.sync_engine, "before_cursor_execute", listener)
+
+    async def start() -> list[str]:
+        statements.clear()
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            resp = await client.post(
+                "/v1/runs/start",
+                json={"workflow": "aismr", "brief": "Budget brief"},
+                headers={"X-API-Key": api_key},
+            )
+        assert resp.status_code == 200, resp.text
+        return list(statements)
+
+    try:
+        small = await start()
+
+        sync_engine = create_engine(f"sqlite:///{db_path}")
+        created_at = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(hours=1)
+        with sync_engine.begin() as conn:
+            conn.execute(
+                Run.__table__.insert(),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "workflow_name": "aismr",
+                        "input": "history",
+                        "status": "completed",
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    }
+                    for _ in range(100_000)
+                ],
+            )
+        sync_engine.dispose()
+
+        large = await start()
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+
+    assert len(large) == len(small)
+    assert not any("count(" in stmt.lower() and "from runs" in stmt.lower() for stmt in large)
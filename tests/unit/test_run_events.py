@@ -0,0 +1,267 @@
+"""Unit tests for the per-run event fan-out behind the SSE endpoints."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+
+import pytest
+from sqlalchemy import event, update
+
+from myloware.services.run_events import RunEventHub
+from myloware.storage.database import track_queries
+from myloware.storage.models import ArtifactType, Run, RunStatus
+from myloware.storage.repositories import ArtifactRepository, RunRepository
+
+
+async def _drain(subscription) -> list[str]:
+    return [event.event async for event in subscription]
+
+
+async def _fan_out(engine, session_factory, subscribers: int) -> tuple[int, list[list[str]]]:
+    """Run one status change + artifact past ``subscribers`` clients; return (queries, events)."""
+    async with session_factory() as session:
+        run = await RunRepository(session).create_async("aismr", "fan out")
+        run.status = RunStatus.RUNNING.value
+        await session.commit()
+        run_id = run.id
+
+    statements: list[str] = []
+    listener = lambda _c, _cur, stmt, *_a: statements.append(stmt)  # noqa: E731
+    event.listen(engine.sync_engine, "before_cursor_execute", listener)
+    # Long poll interval: the watcher only looks at the DB when started or notified.
+    hub = RunEventHub(session_factory=session_factory, poll_interval=60.0, queue_size=16)
+    try:
+        subscriptions = [hub.subscribe(run_id) for _ in range(subscribers)]
+        readers = [asyncio.create_task(_drain(sub)) for sub in subscriptions]
+        while hub._watchers[run_id].status is None:
+            await asyncio.sleep(0.01)
+
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+        async with session_factory() as session:
+            await ArtifactRepository(session).create_async(
+                run_id, "editor", ArtifactType.RENDERED_VIDEO, uri="https://cdn/video.mp4"
+            )
+            await session.execute(
+                update(Run)
+                .where(Run.id == run_id)
+                .values(status=RunStatus.COMPLETED.value, current_step="publish")
+            )
+            await session.commit()
+        event.listen(engine.sync_engine, "before_cursor_execute", listener)
+
+        hub.notify(run_id)
+        received = await asyncio.wait_for(asyncio.gather(*readers), timeout=10)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", listener)
+        await hub.aclose()
+    return len(statements), received
+
+
+@pytest.mark.anyio
+async def test_db_queries_do_not_scale_with_subscribers(
+    sqlite_engine, sqlite_session_factory
+) -> None:
+    one_queries, one_events = await _fan_out(sqlite_engine, sqlite_session_factory, 1)
+    many_queries, many_events = await _fan_out(sqlite_engine, sqlite_session_factory, 500)
+
+    assert one_events == [["status", "artifact", "status", "end"]]
+    assert len(many_events) == 500
+    assert all(events == one_events[0] for events in many_events)
+    # Two checks (initial + notified), each reading the run row and new artifacts.
+    assert one_queries == many_queries == 4
+
+
+@pytest.mark.anyio
+async def test_late_subscriber_gets_snapshot_and_watcher_stops_when_idle(
+    sqlite_session_factory,
+) -> None:
+    async with sqlite_session_factory() as session:
+        run = await RunRepository(session).create_async("aismr", "late")
+        await ArtifactRepository(session).create_async(run.id, "ideator", ArtifactType.IDEAS)
+        await session.commit()
+
+    hub = RunEventHub(session_factory=sqlite_session_factory, poll_interval=60.0)
+    first = hub.subscribe(run.id)
+    assert (await first.get(timeout=5)).event == "artifact"
+    assert (await first.get(timeout=5)).event == "status"
+
+    late = hub.subscribe(run.id)
+    replay = [await late.get(timeout=1), await late.get(timeout=1)]
+    assert [e.event for e in replay] == ["status", "artifact"]
+    assert replay[0].data["status"] == RunStatus.PENDING.value
+
+    first.close()
+    assert hub.subscriber_count(run.id) == 1
+    late.close()
+    assert hub.subscriber_count(run.id) == 0
+    assert await late.get(timeout=1) is None
+    await hub.aclose()
+
+
+@pytest.mark.anyio
+async def test_watcher_queries_are_not_charged_to_the_subscribing_request(
+    sqlite_engine, sqlite_session_factory
+) -> None:
+    async with sqlite_session_factory() as session:
+        run = await RunRepository(session).create_async("aismr", "tracked")
+        await session.commit()
+
+    statements: list[str] = []
+    listener = lambda _c, _cur, stmt, *_a: statements.append(stmt)  # noqa: E731
+    event.listen(sqlite_engine.sync_engine, "before_cursor_execute", listener)
+    hub = RunEventHub(session_factory=sqlite_session_factory, poll_interval=60.0)
+    try:
+        with track_queries() as stats:
+            subscription = hub.subscribe(run.id)
+        assert (await subscription.get(timeout=5)).event == "status"
+
+        # The notified check also runs after the subscribing request has finished.
+        hub.notify(run.id)
+        while len(statements) < 4:
+            await asyncio.sleep(0.01)
+        assert stats.statements == 0
+    finally:
+        event.remove(sqlite_engine.sync_engine, "before_cursor_execute", listener)
+        subscription.close()
+        await hub.aclose()
+
+
+@pytest.mark.anyio
+async def test_run_events_endpoint_streams_until_terminal(async_client, api_headers) -> None:
+    from myloware.storage.database import get_async_session_factory
+
+    async with get_async_session_factory()() as session:
+        run = await RunRepository(session).create_async("aismr", "stream me")
+        run.status = RunStatus.COMPLETED.value
+        await ArtifactRepository(session).create_async(run.id, "editor", ArtifactType.SCRIPT)
+        await session.commit()
+
+    resp = await async_client.get(f"/v1/runs/{run.id}/events", headers=api_headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+
+    events = [
+        (block.split("\n")[0].removeprefix("event: "), json.loads(block.split("data: ", 1)[1]))
+        for block in resp.text.split("\n\n")
+        if block.startswith("event: ")
+    ]
+    assert [name for name, _ in events] == ["artifact", "status", "end"]
+    assert events[1][1]["status"] == RunStatus.COMPLETED.value
+
+    missing = await async_client.get(f"/v1/runs/{uuid.uuid4()}/events", headers=api_headers)
+    assert missing.status_code == 404
+
+
+@pytest.mark.anyio
+async def test_run_with_more_artifacts_than_queue_slots_streams_to_end(
+    async_client, api_headers
+) -> None:
+    from myloware.config import settings
+    from myloware.storage.database import get_async_session_factory
+
+    count = settings.run_events_queue_size + 6
+    async with get_async_session_factory()() as session:
+        run = await RunRepository(session).create_async("aismr", "big run")
+        run.status = RunStatus.COMPLETED.value
+        repo = ArtifactRepository(session)
+        for i in range(count):
+            await repo.create_async(run.id, "producer", ArtifactType.VIDEO_CLIP, uri=f"c{i}.mp4")
+        await session.commit()
+
+    resp = await async_client.get(f"/v1/runs/{run.id}/events", headers=api_headers)
+
+    names = [
+        block.split("\n")[0].removeprefix("event: ")
+        for block in resp.text.split("\n\n")
+        if block.startswith("event: ")
+    ]
+    assert names == ["artifact"] * count + ["status", "end"]
+
+
+@pytest.mark.anyio
+async def test_late_subscriber_replay_is_not_limited_by_queue_size(
+    sqlite_session_factory,
+) -> None:
+    async with sqlite_session_factory() as session:
+        run = await RunRepository(session).create_async("aismr", "backlog")
+        repo = ArtifactRepository(session)
+        for i in range(10):
+            await repo.create_async(run.id, "producer", ArtifactType.VIDEO_CLIP, uri=f"c{i}.mp4")
+        await session.commit()
+
+    hub = RunEventHub(session_factory=sqlite_session_factory, poll_interval=60.0, queue_size=2)
+    first = hub.subscribe(run.id)
+    first_events = [(await first.get(timeout=5)).event for _ in range(11)]
+    late = hub.subscribe(run.id)
+    late_events = [(await late.get(timeout=1)).event for _ in range(11)]
+
+    assert first_events == ["artifact"] * 10 + ["status"]
+    assert late_events == ["status"] + ["artifact"] * 10
+    assert hub.subscriber_count(run.id) == 2
+    await hub.aclose()
+
+
+@pytest.mark.anyio
+async def test_open_streams_do_not_hold_db_connections(
+    async_client, api_headers, monkeypatch
+) -> None:
+    from myloware.config import settings
+    from myloware.services.run_events import get_run_event_hub, notify_run_changed
+    from myloware.storage.database import get_async_engine, get_async_session_factory
+
+    # More concurrent watchers than db_pool_size + db_max_overflow connections.
+    streams = 20
+    monkeypatch.setattr(settings, "public_demo_enabled", True)
+    monkeypatch.setattr(settings, "run_events_poll_interval_seconds", 60.0)
+    async with get_async_session_factory()() as session:
+        run = await RunRepository(session).create_async(
+            "aismr", "watched", public_demo=True, public_token="watched-token"
+        )
+        await session.commit()
+
+    checked_out = 0
+
+    def _checkout(*_args) -> None:  # type: ignore[no-untyped-def]
+        nonlocal checked_out
+        checked_out += 1
+
+    def _checkin(*_args) -> None:  # type: ignore[no-untyped-def]
+        nonlocal checked_out
+        checked_out -= 1
+
+    sync_engine = get_async_engine().sync_engine
+    event.listen(sync_engine, "checkout", _checkout)
+    event.listen(sync_engine, "checkin", _checkin)
+    hub = get_run_event_hub()
+    try:
+        requests = [
+            asyncio.create_task(async_client.get(f"/v1/runs/{run.id}/events", headers=api_headers))
+            for _ in range(streams)
+        ] + [
+            asyncio.create_task(async_client.get("/v1/public/demo/runs/watched-token/events"))
+            for _ in range(streams)
+        ]
+        async with asyncio.timeout(10):
+            while hub.subscriber_count(run.id) < 2 * streams or (
+                hub._watchers[run.id].status is None
+            ):
+                await asyncio.sleep(0.01)
+
+        # Every client is subscribed; none of them is holding a connection.
+        assert checked_out == 0
+
+        async with get_async_session_factory()() as session:
+            await session.execute(
+                update(Run).where(Run.id == run.id).values(status=RunStatus.COMPLETED.value)
+            )
+            await session.commit()
+        notify_run_changed(run.id)
+        responses = await asyncio.wait_for(asyncio.gather(*requests), timeout=10)
+    finally:
+        event.remove(sync_engine, "checkout", _checkout)
+        event.remove(sync_engine, "checkin", _checkin)
+
+    assert all(resp.status_code == 200 for resp in responses)
+    assert all("event: end" in resp.text for resp in responses)
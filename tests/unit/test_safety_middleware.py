@@ -130,3 +130,119 @@ async def test_safety_middleware_extracts_brief_for_run_start(monkeypatch):
 
     assert resp.status_code == 200
     assert seen["content"] == "hello world"
+
+
+def _app_with(handler_path: str) -> FastAPI:
+    app = FastAPI()
+    app.middleware("http")(safety.safety_shield_middleware)
+
+    @app.post(handler_path)
+    async def handler():  # type: ignore[no-untyped-def]
+        return {"ok": True}
+
+    return app
+
+
+@pytest.mark.asyncio
+async def test_safety_middleware_skip_policy_never_reads_body(monkeypatch):
+    from httpx import ASGITransport
+    from starlette.requests import Request
+
+    monkeypatch.setattr(settings, "enable_safety_shields", True)
+    monkeypatch.setattr(settings, "llama_stack_provider", "real")
+
+    async def fail_check(_content: str):
+        raise AssertionError("shield must not run for skipped routes")
+
+    async def fail_body(self):  # type: ignore[no-untyped-def]
+        raise AssertionError("body must not be read for skipped routes")
+
+    monkeypatch.setattr(safety, "check_content_safety", fail_check)
+    monkeypatch.setattr(Request, "body", fail_body)
+
+    app = _app_with("/v1/webhooks/sora")
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.post("/v1/webhooks/sora", content=b'{"note": "kill"}')
+
+    assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_safety_middleware_hitl_without_text_skips_shield(monkeypatch):
+    from httpx import ASGITransport
+
+    monkeypatch.setattr(settings, "enable_safety_shields", True)
+    monkeypatch.setattr(settings, "llama_stack_provider", "real")
+
+    async def fail_check(_content: str):
+        raise AssertionError("no free text, shield must not run")
+
+    monkeypatch.setattr(safety, "check_content_safety", fail_check)
+
+    app = _app_with("/v2/runs/{run_id}/approve")
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.post("/v2/runs/abc/approve", json={"approved": True})
+
+    assert resp.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_safety_middleware_hitl_scans_comment_and_data(monkeypatch):
+    from httpx import ASGITransport
+
+    monkeypatch.setattr(settings, "enable_safety_shields", True)
+    monkeypatch.setattr(settings, "llama_stack_provider", "real")
+    seen = {}
+
+    async def fake_check(content: str):
+        seen["content"] = content
+        return safety.SafetyVerdict(safe=True)
+
+    monkeypatch.setattr(safety, "check_content_safety", fake_check)
+
+    app = _app_with("/v2/runs/{run_id}/reject")
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.post(
+            "/v2/runs/abc/reject",
+            json={"approved": False, "comment": " too dark ", "data": {"k": "v"}},
+        )
+
+    assert resp.status_code == 200
+    assert seen["content"] == 'too dark\n\n{"k":"v"}'
+
+
+def test_resolve_safety_policy_matches_templates():
+    assert safety.resolve_safety_policy("/v1/webhooks/remotion").skip is True
+    assert safety.resolve_safety_policy("/v2/runs/123/approve/hitl").name == "run_approve_hitl"
+    assert safety.resolve_safety_policy("/v2/runs/123/approve").name == "run_approve"
+    assert safety.resolve_safety_policy("/v1/runs/123/feedback").name == "feedback"
+    assert safety.resolve_safety_policy("/v1/unknown").name == "default"
+
+
+def test_register_safety_policy_takes_precedence(monkeypatch):
+    monkeypatch.setattr(safety, "_registered", list(safety.DEFAULT_SAFETY_POLICIES))
+    safety.register_safety_policy(
+        safety.SafetyRoutePolicy("custom", "/v1/runs/start", fields=("title",))
+    )
+    try:
+        policy = safety.resolve_safety_policy("/v1/runs/start")
+        assert policy.name == "custom"
+        assert safety.extract_scan_text(policy, b'{"title": "t", "brief": "b"}') == "t"
+    finally:
+        monkeypatch.undo()
+        safety.compile_safety_policies()
+
+
+def test_extract_scan_text_handles_non_json_and_nested_fields():
+    policy = safety.SafetyRoutePolicy("nested", "/x", fields=("message.text",))
+    assert safety.extract_scan_text(policy, b"not json") is None
+    assert safety.extract_scan_text(policy, b"[1, 2]") is None
+    assert safety.extract_scan_text(policy, b'{"message": {"text": " hi "}}') == "hi"
+
+
+@pytest.mark.asyncio
+async def test_keyword_only_uses_compiled_matcher():
+    assert (await safety.keyword_only("all fine")).safe is True
+    verdict = await safety.keyword_only("This is HATE SPEECH")
+    assert verdict.safe is False
+    assert verdict.reason == "matched_keyword:hate speech"
@@ -219,3 +219,115 @@ async def test_check_brief_safety_and_agent_input_output_delegation(monkeypatch)
 
     out4 = await mod.check_agent_output(client, response_content="resp", shield_id="s")
     assert out4.safe is True
+
+
+def test_segment_content_keeps_short_content_whole() -> None:
+    from myloware.safety import shields as mod
+
+    assert mod.segment_content("  hello  ", max_chars=100) == ["hello"]
+    assert mod.segment_content("   ", max_chars=100) == []
+
+
+def test_segment_content_splits_json_items_and_packs_them() -> None:
+    import json
+
+    from myloware.safety import shields as mod
+
+    ideas = [{"title": f"idea {i}", "text": "x" * 40} for i in range(6)]
+    segments = mod.segment_content(json.dumps({"ideas": ideas}), max_chars=150)
+
+    assert len(segments) == 3
+    assert all(len(s) <= 150 for s in segments)
+    assert all("idea" in s for s in segments)
+
+
+def test_segment_content_splits_numbered_lists_and_long_sentences() -> None:
+    from myloware.safety import shields as mod
+
+    listing = "\n".join(f"{i}. " + "word " * 15 for i in range(1, 6))
+    segments = mod.segment_content(listing, max_chars=100)
+    assert len(segments) == 5
+    assert segments[2].startswith("3.")
+
+    long_text = ("This sentence is fine. " * 20).strip()
+    parts = mod.segment_content(long_text, max_chars=60)
+    assert all(len(p) <= 60 for p in parts)
+    assert " ".join(parts) == long_text
+
+
+def test_combine_safety_results_fails_closed() -> None:
+    from myloware.safety import shields as mod
+
+    ok = mod.SafetyResult.passed()
+    err = mod.SafetyResult.failed("down", category="system_error")
+    bad = mod.SafetyResult.failed("nope", category="S1")
+
+    assert mod.combine_safety_results([]).safe is True
+    assert mod.combine_safety_results([ok, ok]).safe is True
+    assert mod.combine_safety_results([ok, err]).category == "system_error"
+    assert mod.combine_safety_results([err, bad, ok]).reason == "nope"
+
+
+@pytest.mark.anyio
+async def test_check_content_safety_batch_is_concurrent_bounded_and_deduped(monkeypatch) -> None:
+    import anyio
+
+    from myloware.safety import shields as mod
+
+    active = 0
+    peak = 0
+    seen: list[str] = []
+
+    async def fake_check(_client, content, _shield_id):  # type: ignore[no-untyped-def]
+        nonlocal active, peak
+        seen.append(content)
+        active += 1
+        peak = max(peak, active)
+        await anyio.sleep(0.01)
+        active -= 1
+        return mod.SafetyResult.passed()
+
+    monkeypatch.setattr(mod, "check_content_safety", fake_check)
+
+    texts = [f"t{i}" for i in range(10)] + ["t0"]
+    results = await mod.check_content_safety_batch(MagicMock(), texts, "s", max_concurrency=3)
+
+    assert len(results) == 11 and all(r.safe for r in results)
+    assert sorted(seen) == sorted(set(texts))
+    assert peak == 3
+
+
+@pytest.mark.anyio
+async def test_check_segmented_safety_stops_at_first_violation(monkeypatch) -> None:
+    import anyio
+
+    from myloware.safety import shields as mod
+
+    async def fake_check(_client, content, _shield_id):  # type: ignore[no-untyped-def]
+        if content == "bad":
+            return mod.SafetyResult.failed("unsafe", category="S1")
+        await anyio.sleep(5)
+        return mod.SafetyResult.passed()
+
+    monkeypatch.setattr(mod, "check_content_safety", fake_check)
+
+    with anyio.fail_after(2):
+        result = await mod.check_segmented_safety(MagicMock(), ["slow", "bad", "slower"], "s")
+
+    assert result.safe is False
+    assert result.reason == "unsafe"
+
+
+@pytest.mark.anyio
+async def test_check_agent_output_segments_long_content(monkeypatch) -> None:
+    from myloware.safety import shields as mod
+
+    monkeypatch.setattr(mod.settings, "safety_segment_max_chars", 50)
+    check = AsyncMock(return_value=mod.SafetyResult.passed())
+    monkeypatch.setattr(mod, "check_content_safety", check)
+
+    ideas = "\n\n".join(f"Idea {i}: " + "calm " * 8 for i in range(4))
+    result = await mod.check_agent_output(MagicMock(), ideas, shield_id="s")
+
+    assert result.safe is True
+    assert check.await_count == 4
@@ -0,0 +1,167 @@
+"""Tests for the cross-run safety verdict cache."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from myloware.safety import verdict_cache
+from myloware.safety.shields import SafetyResult
+from myloware.storage.models import SafetyVerdict
+
+
+@pytest.fixture
+def session_factory(monkeypatch, sqlite_session_factory):
+    monkeypatch.setattr(
+        "myloware.storage.database.get_async_session_factory", lambda: sqlite_session_factory
+    )
+    return sqlite_session_factory
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.setattr(verdict_cache.settings, "safety_verdict_cache_persistent", True)
+    monkeypatch.setattr(verdict_cache.settings, "safety_verdict_cache_ttl_seconds", 3600.0)
+    verdict_cache.clear_verdict_cache()
+    yield
+    verdict_cache.clear_verdict_cache()
+
+
+def _check(result: SafetyResult) -> AsyncMock:
+    return AsyncMock(return_value=result)
+
+
+@pytest.mark.anyio
+async def test_safe_verdict_reused_from_memory(session_factory) -> None:
+    check = _check(SafetyResult.passed())
+
+    first = await verdict_cache.cached_shield_check("shield", "brief", check)
+    second = await verdict_cache.cached_shield_check("shield", "brief", check)
+
+    assert first.safe and second.safe
+    assert check.await_count == 1
+    stats = verdict_cache.verdict_cache_stats()
+    assert stats["shield_calls"] == 1
+    assert stats["hits"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+@pytest.mark.anyio
+async def test_keys_include_shield_id(session_factory) -> None:
+    check = _check(SafetyResult.passed())
+
+    await verdict_cache.cached_shield_check("shield-a", "brief", check)
+    await verdict_cache.cached_shield_check("shield-b", "brief", check)
+
+    assert check.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_violation_is_reused_and_stays_blocked(session_factory) -> None:
+    check = _check(SafetyResult.failed("nope", category="S1", severity="high"))
+
+    await verdict_cache.cached_shield_check("shield", "bad", check)
+    cached = await verdict_cache.cached_shield_check("shield", "bad", check)
+
+    assert check.await_count == 1
+    assert cached.safe is False
+    assert (cached.reason, cached.category, cached.severity) == ("nope", "S1", "high")
+
+
+@pytest.mark.anyio
+async def test_system_error_is_never_cached(session_factory) -> None:
+    check = _check(SafetyResult.failed("down", category="system_error"))
+
+    await verdict_cache.cached_shield_check("shield", "brief", check)
+    check.return_value = SafetyResult.passed()
+    result = await verdict_cache.cached_shield_check("shield", "brief", check)
+
+    assert check.await_count == 2
+    assert result.safe is True
+    async with session_factory() as session:
+        row = await session.get(SafetyVerdict, ("shield", verdict_cache.content_hash("brief")))
+    assert row is not None and row.safe is True
+
+
+@pytest.mark.anyio
+async def test_persistent_tier_shared_across_processes(session_factory) -> None:
+    check = _check(SafetyResult.passed())
+    await verdict_cache.cached_shield_check("shield", "brief", check)
+
+    # A fresh process (empty LRU) still reuses the stored verdict.
+    verdict_cache.clear_verdict_cache()
+    await verdict_cache.cached_shield_check("shield", "brief", check)
+
+    assert check.await_count == 1
+
+
+@pytest.mark.anyio
+async def test_expired_database_verdict_is_ignored(session_factory) -> None:
+    check = _check(SafetyResult.passed())
+    await verdict_cache.cached_shield_check("shield", "brief", check)
+
+    async with session_factory() as session:
+        row = await session.get(SafetyVerdict, ("shield", verdict_cache.content_hash("brief")))
+        row.expires_at = row.created_at - timedelta(seconds=1)
+        await session.commit()
+
+    verdict_cache.clear_verdict_cache()
+    await verdict_cache.cached_shield_check("shield", "brief", check)
+
+    assert check.await_count == 2
+
+
+@pytest.mark.anyio
+async def test_cleanup_purges_expired_verdicts(monkeypatch, session_factory) -> None:
+    from myloware.workflows import cleanup
+
+    monkeypatch.setattr(cleanup, "get_async_session_factory", lambda: session_factory)
+    await verdict_cache.cached_shield_check("shield", "old", _check(SafetyResult.passed()))
+    await verdict_cache.cached_shield_check("shield", "fresh", _check(SafetyResult.passed()))
+
+    async with session_factory() as session:
+        row = await session.get(SafetyVerdict, ("shield", verdict_cache.content_hash("old")))
+        row.expires_at = row.created_at - timedelta(seconds=1)
+        await session.commit()
+
+    assert await cleanup.purge_expired_safety_verdicts_async() == 1
+    async with session_factory() as session:
+        assert (
+            await session.get(SafetyVerdict, ("shield", verdict_cache.content_hash("old"))) is None
+        )
+        assert await session.get(SafetyVerdict, ("shield", verdict_cache.content_hash("fresh")))
+
+
+@pytest.mark.anyio
+async def test_database_errors_degrade_to_miss(monkeypatch) -> None:
+    def _boom():
+        raise RuntimeError("db down")
+
+    monkeypatch.setattr("myloware.storage.database.get_async_session_factory", _boom)
+    check = _check(SafetyResult.passed())
+
+    result = await verdict_cache.cached_shield_check("shield", "brief", check)
+
+    assert result.safe is True
+    assert check.await_count == 1
+
+
+@pytest.mark.anyio
+async def test_check_content_safety_uses_verdict_cache(monkeypatch, session_factory) -> None:
+    from myloware.safety import shields as mod
+
+    monkeypatch.setattr(mod.settings, "use_fake_providers", False)
+    monkeypatch.setattr(mod.settings, "llama_stack_provider", "real")
+    monkeypatch.setattr(mod.settings, "safety_verdict_cache_enabled", True)
+    run_shield = AsyncMock(return_value=SimpleNamespace(violation=None))
+    monkeypatch.setattr(mod, "_run_shield", run_shield)
+
+    for _ in range(3):
+        result = await mod.check_content_safety(MagicMock(), "same brief", shield_id="shield")
+        assert result.safe is True
+
+    run_shield.assert_awaited_once()
+    assert verdict_cache.verdict_cache_stats()["seconds_saved"] > 0
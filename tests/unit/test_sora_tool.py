@@ -251,8 +251,8 @@ async def test_sora_tool_check_existing_submission_finds_manifest(monkeypatch) -
         def __init__(self, _session):  # type: ignore[no-untyped-def]
             return None
 
-        async def get_by_run_async(self, _rid: UUID):  # type: ignore[no-untyped-def]
-            return [manifest]
+        async def get_by_key_async(self, _rid: UUID, _kind, key):  # type: ignore[no-untyped-def]
+            return manifest if manifest.artifact_metadata.get("idempotency_key") == key else None
 
     monkeypatch.setattr(
         "myloware.storage.database.get_async_session_factory", lambda: (lambda: FakeSessionCM())
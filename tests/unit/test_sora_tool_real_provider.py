@@ -22,6 +22,23 @@ def test_sora_init_real_provider_warns_when_callback_url_missing(monkeypatch) ->
     SoraGenerationTool(run_id=str(uuid4()), api_key="k", use_fake=None)
 
 
+def test_sora_prototype_defers_webhook_warning_until_bound(monkeypatch) -> None:
+    from myloware.tools import sora as sora_module
+
+    monkeypatch.setattr(settings, "sora_provider", "real")
+    monkeypatch.setattr(settings, "use_fake_providers", False)
+    monkeypatch.setattr(settings, "webhook_base_url", "")
+    warnings: list[str] = []
+    monkeypatch.setattr(sora_module.logger, "warning", lambda msg, *a, **k: warnings.append(msg))
+
+    prototype = SoraGenerationTool(api_key="k", use_fake=None)
+    assert warnings == []
+
+    prototype.bind_run(str(uuid4()))
+    assert len(warnings) == 1
+    assert "WEBHOOK_BASE_URL missing" in warnings[0]
+
+
 def test_sora_init_use_fake_providers_overrides_real(monkeypatch) -> None:
     monkeypatch.setattr(settings, "sora_provider", "real")
     monkeypatch.setattr(settings, "use_fake_providers", True)
@@ -188,8 +205,8 @@ async def test_check_existing_submission_handles_parse_failure(monkeypatch) -> N
         def __init__(self, _session):  # type: ignore[no-untyped-def]
             return None
 
-        async def get_by_run_async(self, _rid):  # type: ignore[no-untyped-def]
-            return [manifest]
+        async def get_by_key_async(self, _rid, _kind, key):  # type: ignore[no-untyped-def]
+            return manifest if manifest.artifact_metadata.get("idempotency_key") == key else None
 
     monkeypatch.setattr(
         "myloware.storage.database.get_async_session_factory", lambda: (lambda: FakeSessionCM())
@@ -232,8 +249,8 @@ async def test_check_existing_submission_returns_none_when_no_match(monkeypatch)
         def __init__(self, _session):  # type: ignore[no-untyped-def]
             return None
 
-        async def get_by_run_async(self, _rid):  # type: ignore[no-untyped-def]
-            return [manifest]
+        async def get_by_key_async(self, _rid, _kind, key):  # type: ignore[no-untyped-def]
+            return manifest if manifest.artifact_metadata.get("idempotency_key") == key else None
 
     monkeypatch.setattr(
         "myloware.storage.database.get_async_session_factory", lambda: (lambda: FakeSessionCM())
@@ -529,3 +546,113 @@ async def test_run_fake_sets_default_seconds_token_and_includes_topic(
     out = await tool._run_fake([{"visual_prompt": "x", "topic": "t"}], "9:16", "999")
     assert out["success"] is True
     assert out["n_frames"] == "8"
+
+
+@pytest.mark.anyio
+async def test_submit_openai_videos_concurrent_keeps_clip_order(monkeypatch) -> None:
+    import anyio
+
+    monkeypatch.setattr(settings, "sora_provider", "real")
+    monkeypatch.setattr(settings, "use_fake_providers", False)
+    monkeypatch.setattr(settings, "sora_submit_concurrency", 3)
+
+    tool = SoraGenerationTool(run_id=str(uuid4()), api_key="k", use_fake=None)
+    active = 0
+    peak = 0
+
+    class FakeResponse:
+        def __init__(self, task_id: str) -> None:
+            self._task_id = task_id
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self):  # type: ignore[no-untyped-def]
+            return {"id": self._task_id}
+
+    class FakeClient:
+        def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+            return None
+
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+            return None
+
+        async def post(self, _url: str, *, json, headers):  # type: ignore[no-untyped-def]
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            idx = int(json["prompt"])
+            # Later clips finish first.
+            await anyio.sleep(0.01 * (6 - idx))
+            active -= 1
+            return FakeResponse(f"task-{idx}")
+
+    monkeypatch.setattr("myloware.tools.sora.httpx.AsyncClient", FakeClient)
+
+    task_ids, task_metadata, stop_error = await tool._submit_openai_videos(
+        videos=[{"visual_prompt": str(i)} for i in range(6)],
+        aspect_ratio="9:16",
+        n_frames=8,
+    )
+
+    assert stop_error is None
+    assert peak == 3
+    assert task_ids == [f"task-{i}" for i in range(6)]
+    assert [task_metadata[t]["video_index"] for t in task_ids] == list(range(6))
+
+
+@pytest.mark.anyio
+async def test_submit_openai_videos_fail_fast_records_only_submitted(monkeypatch) -> None:
+    import anyio
+
+    monkeypatch.setattr(settings, "sora_provider", "real")
+    monkeypatch.setattr(settings, "use_fake_providers", False)
+    monkeypatch.setattr(settings, "sora_submit_concurrency", 2)
+
+    tool = SoraGenerationTool(run_id=str(uuid4()), api_key="k", use_fake=None)
+    posted: list[int] = []
+
+    class FakeResponse:
+        def __init__(self, task_id: str) -> None:
+            self._task_id = task_id
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self):  # type: ignore[no-untyped-def]
+            return {"id": self._task_id}
+
+    class FakeClient:
+        def __init__(self, *args, **kwargs):  # type: ignore[no-untyped-def]
+            return None
+
+        async def __aenter__(self):  # type: ignore[no-untyped-def]
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
+            return None
+
+        async def post(self, _url: str, *, json, headers):  # type: ignore[no-untyped-def]
+            idx = int(json["prompt"])
+            posted.append(idx)
+            if idx == 1:
+                raise RuntimeError("boom")
+            await anyio.sleep(0.02)
+            return FakeResponse(f"task-{idx}")
+
+    monkeypatch.setattr("myloware.tools.sora.httpx.AsyncClient", FakeClient)
+
+    task_ids, task_metadata, stop_error = await tool._submit_openai_videos(
+        videos=[{"visual_prompt": str(i)} for i in range(6)],
+        aspect_ratio="9:16",
+        n_frames=8,
+    )
+
+    # Clip 0 was already in flight and completes; nothing queued behind the failure is sent.
+    assert sorted(posted) == [0, 1]
+    assert task_ids == ["task-0"]
+    assert list(task_metadata) == ["task-0"]
+    assert stop_error is not None and stop_error.startswith("Video 2/6: RuntimeError")
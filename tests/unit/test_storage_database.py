@@ -19,6 +19,8 @@ def _reset_db_singletons(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(db, "_async_engine_url", None)
     monkeypatch.setattr(db, "_async_engine_loop_id", None)
     monkeypatch.setattr(db, "_AsyncSessionLocal", None)
+    monkeypatch.setattr(db, "_long_lived_loop_ids", set())
+    monkeypatch.setattr(db, "_loop_async_engines", {})
 
 
 def test_get_engine_sets_pool_size_for_non_sqlite(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -87,6 +89,37 @@ async def test_get_async_engine_uses_pool_when_enabled(monkeypatch: pytest.Monke
     assert kwargs.get("max_overflow") == 9
 
 
+@pytest.mark.asyncio
+async def test_long_lived_loop_keeps_its_own_pooled_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    monkeypatch.setattr(db.settings, "database_url", "postgresql+psycopg2://example")
+    monkeypatch.setattr(db.settings, "async_use_pool", False)
+
+    create_async_engine = Mock(
+        side_effect=lambda *_a, **_k: SimpleNamespace(
+            sync_engine=SimpleNamespace(dispose=Mock()), dispose=AsyncMock()
+        )
+    )
+    monkeypatch.setattr(db, "create_async_engine", create_async_engine)
+
+    default_engine = db.get_async_engine()
+    db.register_long_lived_loop(asyncio.get_running_loop())
+
+    loop_engine = db.get_async_engine()
+    assert loop_engine is not default_engine
+    assert db.get_async_engine() is loop_engine
+    assert db.get_async_session_factory() is db.get_async_session_factory()
+    assert create_async_engine.call_count == 2
+    # The long-lived loop's engine pools even when the default engine does not.
+    _args, kwargs = create_async_engine.call_args
+    assert "poolclass" not in kwargs
+
+    await db.dispose_loop_async_engine()
+    loop_engine.dispose.assert_awaited_once()
+    assert db._loop_async_engines == {}
+
+
 @pytest.mark.asyncio
 async def test_get_async_engine_converts_sqlite_url_to_aiosqlite(
     monkeypatch: pytest.MonkeyPatch,
@@ -142,3 +175,23 @@ def test_init_db_logs_warning_when_wal_setup_fails(monkeypatch: pytest.MonkeyPat
     monkeypatch.setattr(db, "get_engine", lambda: engine)
 
     db.init_db()
+
+
+def test_track_queries_counts_statements_for_every_active_tracker() -> None:
+    from sqlalchemy import create_engine, text
+
+    engine = create_engine("sqlite://")
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))  # untracked
+            with db.track_queries() as outer:
+                conn.execute(text("SELECT 1"))
+                with db.track_queries() as inner:
+                    conn.execute(text("SELECT 2"))
+                    conn.execute(text("SELECT 3"))
+    finally:
+        engine.dispose()
+
+    assert (outer.statements, inner.statements) == (3, 2)
+    assert outer.seconds >= inner.seconds > 0
+    assert outer.log_fields()["db_statements"] == 3
@@ -151,7 +151,7 @@ async def test_telegram_webhook_rejects_invalid_secret(async_client, monkeypatch
 @pytest.mark.anyio
 async def test_telegram_webhook_allows_chat_and_sends_reply(async_client, monkeypatch) -> None:
     from myloware.api.server import app
-    from myloware.api.dependencies import get_llama_client
+    from myloware.api.dependencies import get_async_llama_client
     from myloware.api.routes import telegram as mod
     from myloware.config import settings
 
@@ -167,24 +167,24 @@ async def test_telegram_webhook_allows_chat_and_sends_reply(async_client, monkey
     monkeypatch.setattr(mod, "send_telegram_message", fake_send)
 
     class FakeSupervisor:
-        def create_session(self, _name: str):
+        async def create_session(self, _name: str):
             return "conv-1"
 
-        def create_turn(self, messages, session_id):  # noqa: ARG002 - signature compatibility
+        async def create_turn(self, messages, session_id, stream=True):  # noqa: ARG002
             return SimpleNamespace(
                 completion_message=SimpleNamespace(content="pong"),
             )
 
-    monkeypatch.setattr(mod, "create_supervisor_agent", lambda *_a, **_k: FakeSupervisor())
+    monkeypatch.setattr(mod, "create_async_supervisor_agent", lambda *_a, **_k: FakeSupervisor())
 
     deleted: list[str] = []
 
     class FakeConversations:
-        def delete(self, conversation_id: str):
+        async def delete(self, conversation_id: str):
             deleted.append(conversation_id)
 
     fake_client = SimpleNamespace(conversations=FakeConversations())
-    app.dependency_overrides[get_llama_client] = lambda: fake_client
+    app.dependency_overrides[get_async_llama_client] = lambda: fake_client
 
     # Reset idempotency to avoid cross-test interference.
     import asyncio
@@ -262,7 +262,7 @@ async def test_telegram_webhook_invalid_json(async_client, monkeypatch) -> None:
 @pytest.mark.anyio
 async def test_telegram_webhook_cleanup_failure_is_swallowed(async_client, monkeypatch) -> None:
     from myloware.api.server import app
-    from myloware.api.dependencies import get_llama_client
+    from myloware.api.dependencies import get_async_llama_client
     from myloware.api.routes import telegram as mod
     from myloware.config import settings
 
@@ -275,20 +275,20 @@ async def test_telegram_webhook_cleanup_failure_is_swallowed(async_client, monke
     monkeypatch.setattr(mod, "send_telegram_message", fake_send)
 
     class FakeSupervisor:
-        def create_session(self, _name: str):
+        async def create_session(self, _name: str):
             return "conv-2"
 
-        def create_turn(self, messages, session_id):  # noqa: ARG002
+        async def create_turn(self, messages, session_id, stream=True):  # noqa: ARG002
             return SimpleNamespace(completion_message=SimpleNamespace(content="ok"))
 
-    monkeypatch.setattr(mod, "create_supervisor_agent", lambda *_a, **_k: FakeSupervisor())
+    monkeypatch.setattr(mod, "create_async_supervisor_agent", lambda *_a, **_k: FakeSupervisor())
 
     class BadConversations:
-        def delete(self, conversation_id: str):  # noqa: ARG002
+        async def delete(self, conversation_id: str):  # noqa: ARG002
             raise RuntimeError("fail")
 
     fake_client = SimpleNamespace(conversations=BadConversations())
-    app.dependency_overrides[get_llama_client] = lambda: fake_client
+    app.dependency_overrides[get_async_llama_client] = lambda: fake_client
 
     try:
         resp = await async_client.post(
@@ -453,30 +453,12 @@ async def test_telegram_callback_reject_unknown_gate(async_client, monkeypatch)
 
 
 @pytest.mark.anyio
-async def test_telegram_callback_db_dispatcher_handles_commit_and_enqueue_errors(
+async def test_telegram_callback_db_dispatcher_handles_enqueue_errors(
     async_client, monkeypatch
 ) -> None:
-    from myloware.api.server import app
-    from myloware.api.dependencies import (
-        get_artifact_repo,
-        get_llama_client,
-        get_run_repo,
-        get_vector_db_id,
-    )
     from myloware.api.routes import telegram as mod
     from myloware.config import settings
 
-    class FakeSession:
-        def commit(self):
-            raise RuntimeError("db")
-
-    class FakeRunRepo:
-        def __init__(self):
-            self.session = FakeSession()
-
-    class FakeArtifactRepo:
-        pass
-
     async def answer(*_a, **_k):
         return None
 
@@ -493,27 +475,19 @@ async def test_telegram_callback_db_dispatcher_handles_commit_and_enqueue_errors
 
     monkeypatch.setattr("myloware.storage.repositories.JobRepository.enqueue_async", raise_enqueue)
 
-    app.dependency_overrides[get_run_repo] = lambda: FakeRunRepo()
-    app.dependency_overrides[get_artifact_repo] = lambda: FakeArtifactRepo()
-    app.dependency_overrides[get_llama_client] = lambda: SimpleNamespace()
-    app.dependency_overrides[get_vector_db_id] = lambda: "kb"
-
     run_id = uuid4()
-    try:
-        resp = await async_client.post(
-            "/v1/telegram/callback",
-            json={
-                "callback_query": {
-                    "id": "cb",
-                    "data": f"approve:{run_id}:ideation",
-                    "message": {"chat": {"id": 1}},
-                }
-            },
-        )
-        assert resp.status_code == 200
-        assert resp.json()["ok"] is True
-    finally:
-        app.dependency_overrides.clear()
+    resp = await async_client.post(
+        "/v1/telegram/callback",
+        json={
+            "callback_query": {
+                "id": "cb",
+                "data": f"approve:{run_id}:ideation",
+                "message": {"chat": {"id": 1}},
+            }
+        },
+    )
+    assert resp.status_code == 200
+    assert resp.json()["ok"] is True
 
 
 @pytest.mark.anyio
@@ -6,6 +6,7 @@ from fastapi.testclient import TestClient
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
+from myloware.api.dependencies import get_async_llama_client
 from myloware.api.server import app
 from myloware.config import settings
 
@@ -30,11 +31,17 @@ def test_webhook_processes_message(monkeypatch):
     )
 
     fake_agent = MagicMock()
-    fake_agent.create_turn.return_value = SimpleNamespace(
-        completion_message=SimpleNamespace(content="ok")
+    fake_agent.create_session = AsyncMock(return_value="telegram-123")
+    fake_agent.create_turn = AsyncMock(
+        return_value=SimpleNamespace(completion_message=SimpleNamespace(content="ok"))
     )
     monkeypatch.setattr(
-        "myloware.api.routes.telegram.create_supervisor_agent", lambda client: fake_agent
+        "myloware.api.routes.telegram.create_async_supervisor_agent", lambda client: fake_agent
+    )
+    monkeypatch.setitem(
+        app.dependency_overrides,
+        get_async_llama_client,
+        lambda: SimpleNamespace(conversations=SimpleNamespace(delete=AsyncMock())),
     )
 
     client = TestClient(app)
@@ -85,11 +92,17 @@ def test_webhook_deduplicates(monkeypatch):
         "myloware.api.routes.telegram.send_telegram_message", AsyncMock(return_value=True)
     )
     fake_agent = MagicMock()
-    fake_agent.create_turn.return_value = SimpleNamespace(
-        completion_message=SimpleNamespace(content="ok")
+    fake_agent.create_session = AsyncMock(return_value="telegram-123")
+    fake_agent.create_turn = AsyncMock(
+        return_value=SimpleNamespace(completion_message=SimpleNamespace(content="ok"))
     )
     monkeypatch.setattr(
-        "myloware.api.routes.telegram.create_supervisor_agent", lambda client: fake_agent
+        "myloware.api.routes.telegram.create_async_supervisor_agent", lambda client: fake_agent
+    )
+    monkeypatch.setitem(
+        app.dependency_overrides,
+        get_async_llama_client,
+        lambda: SimpleNamespace(conversations=SimpleNamespace(delete=AsyncMock())),
     )
 
     client = TestClient(app)
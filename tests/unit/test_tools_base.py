@@ -212,19 +212,69 @@ def test_tool_run_propagates_exceptions(monkeypatch):
         tool.run([])
 
 
-def test_run_impl_uses_asyncio_run_when_no_loop():
+def test_run_impl_bridges_without_running_loop():
     tool = AsyncOnlyTool()
     result = tool.run_impl(value=42)
     assert result == {"value": 42}
 
 
 @pytest.mark.asyncio
-async def test_run_impl_uses_thread_when_loop_running():
+async def test_run_impl_bridges_when_loop_running():
     tool = AsyncOnlyTool()
     result = tool.run_impl(value=7)
     assert result == {"value": 7}
 
 
+class LoopProbeTool(AsyncOnlyTool):
+    async def async_run_impl(self, value: int = 0) -> dict:
+        import asyncio
+        import threading
+
+        return {"loop": id(asyncio.get_running_loop()), "thread": threading.get_ident()}
+
+
+@pytest.mark.asyncio
+async def test_run_impl_reuses_one_tool_loop_across_calls():
+    import threading
+
+    tool = LoopProbeTool()
+    first = tool.run_impl()
+    second = await asyncio_to_thread(tool.run_impl)
+    third = tool.run_impl()
+
+    assert first == second == third
+    assert first["thread"] != threading.get_ident()
+
+
+def test_run_impl_nested_on_tool_loop_does_not_deadlock():
+    class OuterTool(AsyncOnlyTool):
+        async def async_run_impl(self, value: int = 0) -> dict:
+            # A tool calling another tool's sync entrypoint from the tool loop.
+            return AsyncOnlyTool().run_impl(value=value + 1)
+
+    assert OuterTool().run_impl(value=1) == {"value": 2}
+
+
+def test_shutdown_tool_loop_restarts_lazily():
+    from myloware.tools import loop as tool_loop
+
+    tool = LoopProbeTool()
+    tool.run_impl()
+    before = tool_loop._thread
+    tool_loop.shutdown_tool_loop()
+    assert before is not None and not before.is_alive()
+
+    tool.run_impl()
+    assert tool_loop._thread is not before
+    assert tool_loop._thread is not None and tool_loop._thread.is_alive()
+
+
+async def asyncio_to_thread(fn):  # type: ignore[no-untyped-def]
+    import asyncio
+
+    return await asyncio.to_thread(fn)
+
+
 def test_run_impl_requires_override():
     tool = NoImplTool()
     with pytest.raises(NotImplementedError):
@@ -259,3 +309,21 @@ def test_get_input_schema_base_raises_not_implemented():
     tool = BadSchemaTool()
     with pytest.raises(NotImplementedError):
         tool.get_input_schema()
+
+
+def test_bind_run_returns_shallow_copy_sharing_tool_definition():
+    class RunScopedTool(TestTool):
+        def _rebind_run_context(self) -> None:
+            self.callback = f"cb?run_id={self.run_id}"
+
+    prototype = RunScopedTool()
+    definition = prototype.get_tool_definition()
+    assert definition["name"] == "test_tool"
+    assert definition["parameters"]["required"] == ["input"]
+
+    bound = prototype.bind_run("run-1")
+    assert bound is not prototype
+    assert prototype.run_id is None
+    assert bound.run_id == "run-1"
+    assert bound.callback == "cb?run_id=run-1"
+    assert bound.get_tool_definition() is definition
@@ -95,7 +95,7 @@ class DummyArtifactRepository:
         self.session.artifacts.append(artifact)
         return artifact
 
-    def get_by_run(self, run_id: UUID) -> list[DummyArtifact]:
+    def get_by_run(self, run_id: UUID, **_kwargs) -> list[DummyArtifact]:
         return list(self.session.artifacts)
 
     async def create_async(
@@ -107,10 +107,11 @@ class DummyArtifactRepository:
         uri: str | None = None,
         metadata: dict | None = None,
         trace_id: str | None = None,
+        keys: list | None = None,
     ) -> DummyArtifact:
         return self.create(run_id, persona, artifact_type, content, uri, metadata, trace_id)
 
-    async def get_by_run_async(self, run_id: UUID) -> list[DummyArtifact]:
+    async def get_by_run_async(self, run_id: UUID, **_kwargs) -> list[DummyArtifact]:
         return self.get_by_run(run_id)
 
 
@@ -334,7 +334,7 @@ async def test_expected_and_ready_clip_counts():
     from types import SimpleNamespace
 
     class Repo:
-        async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
             return [
                 SimpleNamespace(
                     artifact_type=ArtifactType.CLIP_MANIFEST.value,
@@ -356,7 +356,7 @@ async def test_expected_clip_count_defaults_when_no_manifest():
     from myloware.api.routes import webhooks as webhooks_mod
 
     class Repo:
-        async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
             return []
 
     expected = await webhooks_mod._expected_clip_count_async(Repo(), run_id=uuid.uuid4())
@@ -370,7 +370,7 @@ async def test_expected_clip_count_handles_bad_task_count():
     from types import SimpleNamespace
 
     class Repo:
-        async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
             return [
                 SimpleNamespace(
                     artifact_type=ArtifactType.CLIP_MANIFEST.value,
@@ -387,7 +387,7 @@ async def test_lookup_task_metadata_handles_exception():
     from myloware.api.routes import webhooks as webhooks_mod
 
     class Repo:
-        async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
             raise RuntimeError("db down")
 
     result = await webhooks_mod._lookup_task_metadata(Repo(), uuid.uuid4(), "task-1")
@@ -427,7 +427,7 @@ async def test_update_run_after_render_uses_latest_render(monkeypatch):
         def __init__(self, _session):  # type: ignore[no-untyped-def]
             return None
 
-        async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
             return [
                 SimpleNamespace(
                     artifact_type=ArtifactType.RENDERED_VIDEO.value,
@@ -510,7 +510,7 @@ async def test_lookup_task_metadata_returns_none_when_missing():
         content = json.dumps({"task-1": {"video_index": 0}})
 
     class FakeRepo:
-        async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
             return [FakeArtifact()]
 
     result = await webhooks_mod._lookup_task_metadata(FakeRepo(), uuid.UUID(int=1), "task-2")
@@ -540,7 +540,7 @@ async def test_sora_webhook_standard_event_direct_success(monkeypatch):
         def __init__(self):
             self.artifacts = [manifest]
 
-        async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
             return list(self.artifacts)
 
         async def create_async(self, **kwargs):  # type: ignore[no-untyped-def]
@@ -666,7 +666,7 @@ async def test_sora_webhook_legacy_result_json_dict_direct(monkeypatch):
         session = _Session()
 
     class FakeArtifactRepo:
-        async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
             return []
 
     monkeypatch.setattr(webhooks_mod.settings, "disable_background_workflows", True)
@@ -714,7 +714,7 @@ async def test_sora_webhook_progress_direct(monkeypatch):
         session = _Session()
 
     class FakeArtifactRepo:
-        async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
             return []
 
     async def fake_lookup(*_a, **_k):  # type: ignore[no-untyped-def]
@@ -763,7 +763,7 @@ async def test_sora_webhook_db_dispatcher_direct(monkeypatch):
             self.session = FakeSession()
 
     class FakeArtifactRepo:
-        async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
             return []
 
     class FakeJobRepo:
@@ -831,7 +831,7 @@ async def test_sora_webhook_missing_video_url_direct(monkeypatch):
             return SimpleNamespace(status=RunStatus.AWAITING_VIDEO_GENERATION.value)
 
     class FakeArtifactRepo:
-        async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
             return []
 
     async def fake_lookup(*_a, **_k):  # type: ignore[no-untyped-def]
@@ -884,7 +884,7 @@ async def test_remotion_webhook_direct_success(monkeypatch):
         def __init__(self):
             self.created: list[dict[str, object]] = []
 
-        async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+        async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
             return [editor_output]
 
         async def create_async(self, **kwargs):  # type: ignore[no-untyped-def]
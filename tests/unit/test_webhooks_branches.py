@@ -101,7 +101,7 @@ class FakeArtifactRepo:
         self._mapping_run_id = mapping_run_id
         self._mapping_meta = mapping_meta
 
-    async def get_by_run_async(self, _run_id):  # type: ignore[no-untyped-def]
+    async def get_by_run_async(self, _run_id, **_kwargs):  # type: ignore[no-untyped-def]
         return self._artifacts
 
     async def create_async(self, *_a, **_k):  # type: ignore[no-untyped-def]
@@ -79,7 +79,7 @@ class FakeArtifactRepo:
         self.artifacts = list(artifacts or [])
         self.creates: list[dict[str, object]] = []
 
-    async def get_by_run_async(self, _run_id: UUID) -> list[FakeArtifact]:
+    async def get_by_run_async(self, _run_id: UUID, **_kwargs) -> list[FakeArtifact]:
         return list(self.artifacts)
 
     async def create_async(self, **kwargs):  # type: ignore[no-untyped-def]
@@ -135,3 +135,76 @@ def test_timeout_stuck_runs_updates_and_commits(monkeypatch) -> None:
     assert out == [run_id]
     assert repo.updated and repo.updated[0][1]["status"] == RunStatus.FAILED.value
     assert session.commits == 1
+
+
+class FakeAsyncSession:
+    def __init__(self) -> None:
+        self.commits = 0
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def __aenter__(self) -> "FakeAsyncSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+        return None
+
+
+class FakeAsyncRunRepo(FakeRunRepo):
+    def __init__(self, runs_by_status: dict[str, list[FakeRun]]) -> None:
+        super().__init__(runs_by_status)
+        self.cutoffs: list[datetime] = []
+
+    async def find_by_status_and_age_async(self, status: str, cutoff: datetime) -> list[FakeRun]:
+        self.cutoffs.append(cutoff)
+        return self.find_by_status_and_age(status, cutoff)
+
+    async def update_async(self, run_id: object, **kwargs):  # type: ignore[no-untyped-def]
+        self.update(run_id, **kwargs)
+
+
+async def test_get_stuck_runs_async_uses_naive_cutoff(monkeypatch) -> None:
+    now = datetime.now(timezone.utc)
+    run_id = uuid4()
+    stuck = FakeRun(
+        id=run_id,
+        status=RunStatus.AWAITING_RENDER.value,
+        created_at=now - timedelta(hours=2),
+        updated_at=(now - timedelta(hours=1)).replace(tzinfo=None),
+    )
+    session = FakeAsyncSession()
+    repo = FakeAsyncRunRepo({RunStatus.AWAITING_RENDER.value: [stuck]})
+
+    monkeypatch.setattr(cleanup, "get_async_session_factory", lambda: lambda: session)
+    monkeypatch.setattr(cleanup, "RunRepository", lambda _s: repo)
+
+    runs = await cleanup.get_stuck_runs_async(timeout_minutes=30)
+
+    assert [r["id"] for r in runs] == [run_id]
+    assert runs[0]["stuck_for_minutes"] >= 59
+    # asyncpg rejects tz-aware values for TIMESTAMP WITHOUT TIME ZONE columns.
+    assert all(cutoff.tzinfo is None for cutoff in repo.cutoffs)
+
+
+async def test_timeout_stuck_runs_async_updates_and_commits(monkeypatch) -> None:
+    now = datetime.now(timezone.utc)
+    run_id = uuid4()
+    stuck = FakeRun(
+        id=run_id,
+        status=RunStatus.AWAITING_VIDEO_GENERATION.value,
+        created_at=now - timedelta(hours=2),
+        updated_at=now - timedelta(hours=1),
+    )
+    session = FakeAsyncSession()
+    repo = FakeAsyncRunRepo({RunStatus.AWAITING_VIDEO_GENERATION.value: [stuck]})
+
+    monkeypatch.setattr(cleanup, "get_async_session_factory", lambda: lambda: session)
+    monkeypatch.setattr(cleanup, "RunRepository", lambda _s: repo)
+
+    assert await cleanup.timeout_stuck_runs_async(timeout_minutes=30, dry_run=True) == [run_id]
+    assert repo.updated == [] and session.commits == 0
+
+    assert await cleanup.timeout_stuck_runs_async(timeout_minutes=30) == [run_id]
+    assert repo.updated[0][1]["status"] == RunStatus.FAILED.value
+    assert session.commits == 1
@@ -95,6 +95,8 @@
   const terminalStatuses = ["completed", "failed", "rejected"];
 
   let pollTimer = null;
+  let eventSource = null;
+  let refreshTimer = null;
   let currentToken = null;
   let currentStatus = "idle";
   let lastStatus = "idle";
@@ -569,6 +571,14 @@
       clearInterval(pollTimer);
       pollTimer = null;
     }
+    if (refreshTimer) {
+      clearTimeout(refreshTimer);
+      refreshTimer = null;
+    }
+    if (eventSource) {
+      eventSource.close();
+      eventSource = null;
+    }
   };
 
   const setButtonLoading = (button, loading, label) => {
@@ -864,7 +874,8 @@
   const pollStatus = async () => {
     if (!currentToken) return;
     try {
-      const resp = await fetchApi(`/v1/public/demo/runs/${currentToken}`);
+      // Always revalidate: the server answers 304 (ETag) when nothing changed.
+      const resp = await fetchApi(`/v1/public/demo/runs/${currentToken}`, { cache: "no-cache" });
       if (!resp.ok) {
         const err = await resp.json().catch(() => ({}));
         showToast({
@@ -878,7 +889,12 @@
       const data = await resp.json();
       hideToastIfStale();
       applyRunState(data);
-      if (terminalStatuses.includes(data.status)) stopPolling();
+      if (terminalStatuses.includes(data.status)) {
+        stopPolling();
+      } else if (eventSource && data.render_job_id && !renderFinished(data.render_status)) {
+        // Remotion progress isn't a run event; keep refreshing it while rendering.
+        scheduleRefresh(5000);
+      }
     } catch (err) {
       showToast({ kind: "error", message: "Network error while checking status." });
       stopPolling();
@@ -886,11 +902,56 @@
     }
   };
 
+  const renderFinished = (status) =>
+    ["done", "completed", "failed", "error"].includes(String(status || "").toLowerCase());
+
+  const scheduleRefresh = (delayMs) => {
+    if (refreshTimer) return;
+    refreshTimer = setTimeout(async () => {
+      refreshTimer = null;
+      await pollStatus();
+    }, delayMs);
+  };
+
+  const fallBackToPolling = () => {
+    if (!currentToken || pollTimer) return;
+    pollTimer = setInterval(pollStatus, 5000);
+  };
+
+  // Server-sent events replace the 5s poll: the server pushes status/artifact
+  // changes and we refetch the full run view only when something changed.
+  const subscribeToEvents = () => {
+    if (typeof EventSource !== "function") return false;
+    let source;
+    try {
+      source = new EventSource(`${apiBase}/v1/public/demo/runs/${currentToken}/events`);
+    } catch (err) {
+      return false;
+    }
+    eventSource = source;
+    const onChange = () => scheduleRefresh(250);
+    source.addEventListener("status", onChange);
+    source.addEventListener("artifact", onChange);
+    source.addEventListener("end", () => {
+      source.close();
+      if (eventSource === source) eventSource = null;
+      scheduleRefresh(0);
+    });
+    source.onerror = () => {
+      // EventSource reconnects on its own unless the server refused the stream.
+      if (source.readyState !== EventSource.CLOSED || eventSource !== source) return;
+      eventSource = null;
+      fallBackToPolling();
+    };
+    return true;
+  };
+
   const startPolling = async () => {
     if (!currentToken) return;
     stopPolling();
-    pollTimer = setInterval(pollStatus, 5000);
     await pollStatus();
+    if (!currentToken || terminalStatuses.includes(currentStatus)) return;
+    if (!subscribeToEvents()) fallBackToPolling();
   };
 
   const handleStart = async (brief) => {